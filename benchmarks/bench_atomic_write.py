@@ -0,0 +1,175 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Compares the cost of direct, atomic and atomic + backup table writes.
+
+Usage:
+    python benchmarks/bench_atomic_write.py [--entries 1000 10000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any, Final
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from studyfrog.utils.files import write_file_json  # noqa: E402
+
+
+# ---------- Constants ---------- #
+
+MODES: Final[dict[str, dict[str, bool]]] = {
+    "direct": {
+        "atomic": False,
+        "backup": False,
+    },
+    "atomic": {
+        "atomic": True,
+        "backup": False,
+    },
+    "atomic+backup": {
+        "atomic": True,
+        "backup": True,
+    },
+}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _get_table_data(entries: int) -> dict[str, Any]:
+    """
+    Returns a synthetic flashcards table with the passed number of entries.
+
+    Args:
+        entries (int): The number of entries of the table.
+
+    Returns:
+        dict[str, Any]: The table data dictionary.
+    """
+
+    return {
+        "entries": {
+            "entries": {
+                str(index): {
+                    "back": f"Answer {index} " * 4,
+                    "difficulty": "DIFFICULTY_1",
+                    "front": f"Question {index} " * 4,
+                    "identifiable": {
+                        "id": index,
+                        "key": f"FLASHCARD_{index}",
+                        "uuid": f"00000000-0000-0000-0000-{index:012d}",
+                    },
+                    "next_view_on": "2026-01-01",
+                    "priority": "PRIORITY_2",
+                    "tags": ["chemistry", "exam"],
+                }
+                for index in range(entries)
+            },
+            "total": entries,
+        },
+        "metadata": {
+            "next_id": entries,
+        },
+    }
+
+
+def _measure(
+    atomic: bool,
+    backup: bool,
+    file: Path,
+    repeat: int,
+    table_data: dict[str, Any],
+) -> list[float]:
+    """
+    Returns the durations (in milliseconds) of repeatedly writing a table.
+
+    Args:
+        atomic (bool): Whether to write atomically.
+        backup (bool): Whether to keep a backup of the previous version.
+        file (Path): The file to write to.
+        repeat (int): The number of writes to measure.
+        table_data (dict[str, Any]): The table to write.
+
+    Returns:
+        list[float]: The duration of each write.
+    """
+
+    durations: list[float] = []
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+
+        write_file_json(
+            atomic=atomic,
+            backup=backup,
+            data=table_data,
+            file=file,
+        )
+
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return durations
+
+
+# ---------- Functions ---------- #
+
+
+def main() -> int:
+    """
+    Runs the benchmark and prints the median and p95 write duration per mode and table size.
+
+    Args:
+        None
+
+    Returns:
+        int: The exit code. (0 for success)
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", default=[1_000, 10_000], nargs="+", type=int)
+    parser.add_argument("--repeat", default=20, type=int)
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    print(f"{'entries':>8}  {'mode':<14}  {'median ms':>10}  {'p95 ms':>8}  {'vs direct':>9}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for entries in arguments.entries:
+            table_data: dict[str, Any] = _get_table_data(entries=entries)
+
+            direct_median: float = 0.0
+
+            for (
+                mode,
+                options,
+            ) in MODES.items():
+                durations: list[float] = _measure(
+                    file=Path(directory) / f"{mode}-{entries}.json",
+                    repeat=arguments.repeat,
+                    table_data=table_data,
+                    **options,
+                )
+
+                median: float = statistics.median(durations)
+                p95: float = sorted(durations)[max(0, int(len(durations) * 0.95) - 1)]
+
+                if mode == "direct":
+                    direct_median = median
+
+                print(
+                    f"{entries:>8}  {mode:<14}  {median:>10.2f}  {p95:>8.2f}  {median / direct_median:>8.2f}x"
+                )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Compares dispatches per second of the pre-sorted dispatcher, its lean mode and the previous sort-per-dispatch path.
+
+Usage:
+    python benchmarks/bench_dispatcher.py [--dispatches 100000] [--subscribers 5] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from studyfrog.utils.common import get_now  # noqa: E402
+from studyfrog.utils.dispatcher import (  # noqa: E402
+    SUBSCRIBERS,
+    dispatch,
+    dispatch_lean,
+    subscribe,
+)
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _dispatch_sorting(
+    *args: Any,
+    event: str,
+    namespace: str,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Dispatches an event the way 'dispatch' did before subscriptions were kept sorted.
+
+    Args:
+        event (str): The event to dispatch.
+        namespace (str): The namespace in which to dispatch the event.
+        *args (Any): The positional arguments to pass to the subscribers.
+        **kwargs (Any): The keyword arguments to pass to the subscribers.
+
+    Returns:
+        dict[str, Any]: The result of the dispatch.
+    """
+
+    event = event.upper()
+    namespace = namespace.upper()
+
+    result: dict[str, Any] = {
+        "args": args,
+        "kwargs": kwargs,
+        "event": event,
+        "namespace": namespace,
+        "start": get_now(),
+    }
+
+    subscriptions: list[dict[str, Any]] = list(
+        sorted(
+            list(SUBSCRIBERS[event][namespace].values()),
+            key=lambda x: x["priority"],
+            reverse=True,
+        )
+    )
+
+    for subscription in subscriptions:
+        if subscription["function"]["name"] not in result:
+            result[subscription["function"]["name"]] = []
+
+        result[subscription["function"]["name"]].append(
+            {
+                "result": subscription["function"]["function"](
+                    *args,
+                    **kwargs,
+                ),
+                "uuid": subscription["uuid"],
+            }
+        )
+
+    result["end"] = get_now()
+    result["duration"] = (result["end"] - result["start"]).total_seconds()
+
+    result["start"] = result["start"].isoformat()
+    result["end"] = result["end"].isoformat()
+
+    return result
+
+
+def _measure(
+    dispatches: int,
+    function: Callable[..., Any],
+    repeat: int,
+) -> list[float]:
+    """
+    Returns the durations (in seconds) of repeatedly dispatching the benchmark event.
+
+    Args:
+        dispatches (int): The number of dispatches per round.
+        function (Callable[..., Any]): The dispatch function to measure.
+        repeat (int): The number of rounds to measure.
+
+    Returns:
+        list[float]: The duration of each round.
+    """
+
+    durations: list[float] = []
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+
+        for index in range(dispatches):
+            function(
+                event="benchmark_event",
+                index=index,
+                namespace="benchmark",
+            )
+
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def _subscriber(**kwargs: Any) -> int:
+    """
+    Serves as the subscribed function, doing next to no work.
+
+    Args:
+        **kwargs (Any): The dispatched keyword arguments.
+
+    Returns:
+        int: The dispatched index.
+    """
+
+    return kwargs["index"]
+
+
+# ---------- Functions ---------- #
+
+
+def main() -> int:
+    """
+    Runs the benchmark and prints the median dispatches per second per path.
+
+    Args:
+        None
+
+    Returns:
+        int: The exit code. (0 for success)
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dispatches", default=100_000, type=int)
+    parser.add_argument("--repeat", default=5, type=int)
+    parser.add_argument("--subscribers", default=5, type=int)
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    for priority in range(arguments.subscribers):
+        subscribe(
+            event="benchmark_event",
+            function=_subscriber,
+            namespace="benchmark",
+            persistent=True,
+            priority=priority,
+        )
+
+    print(f"{'path':<10}  {'dispatches/s':>12}  {'speed-up':>8}")
+
+    baseline: float = 0.0
+
+    for (
+        path,
+        function,
+    ) in (
+        ("sorting", _dispatch_sorting),
+        ("dispatch", dispatch),
+        ("lean", dispatch_lean),
+    ):
+        median: float = statistics.median(
+            _measure(
+                dispatches=arguments.dispatches,
+                function=function,
+                repeat=arguments.repeat,
+            )
+        )
+
+        if path == "sorting":
+            baseline = median
+
+        print(f"{path:<10}  {arguments.dispatches / median:>12.0f}  {baseline / median:>7.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Compares hydrating stored flashcards through the planned 'get_model' with the previous per-call signature inspection.
+
+Usage:
+    python benchmarks/bench_model_factory.py [--entries 10000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import statistics
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Final
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from studyfrog.models.factory import get_flashcard_model, get_model  # noqa: E402
+from studyfrog.models.models import Model  # noqa: E402
+
+
+# ---------- Constants ---------- #
+
+REFERENCE_DATE: Final[str] = "2026-01-01"
+
+REFERENCE_DATETIME: Final[str] = "2026-01-01T10:00:00"
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _get_entries(entries: int) -> list[dict[str, Any]]:
+    """
+    Returns synthetic stored flashcard dictionaries, as read from a table.
+
+    Args:
+        entries (int): The number of flashcards.
+
+    Returns:
+        list[dict[str, Any]]: The stored flashcard dictionaries.
+    """
+
+    return [
+        {
+            "back": f"Answer {index}",
+            "difficulty": "DIFFICULTY_1",
+            "front": f"Question {index}",
+            "identifiable": {
+                "id": index,
+                "key": f"FLASHCARD_{index}",
+                "uuid": f"00000000-0000-0000-0000-{index:012d}",
+            },
+            "metadata": {
+                "author": "",
+                "created_at": REFERENCE_DATETIME,
+                "created_on": REFERENCE_DATE,
+                "fields": {},
+                "type": "FLASHCARD",
+                "updated_at": REFERENCE_DATETIME,
+                "updated_on": REFERENCE_DATE,
+            },
+            "next_view_on": REFERENCE_DATE,
+            "priority": "PRIORITY_2",
+            "tags": ["chemistry", "exam"],
+        }
+        for index in range(entries)
+    ]
+
+
+def _get_model_inspecting(
+    type_: str,
+    **kwargs: Any,
+) -> Model:
+    """
+    Builds a flashcard the way 'get_model' did before construction plans were introduced.
+
+    The handler dictionary is rebuilt, the stored dictionary rewritten step by step and
+    the factory's signature inspected on every call.
+
+    Args:
+        type_ (str): The model type.
+        **kwargs: The stored model dictionary.
+
+    Returns:
+        Model: The flashcard.
+    """
+
+    dictionary: dict[str, Callable[..., Model]] = {
+        "flashcard": get_flashcard_model,
+    }
+
+    kwargs.update(**kwargs.pop("identifiable"))
+    kwargs.update(**kwargs.pop("metadata"))
+    kwargs["id_"] = kwargs.pop("id")
+    kwargs["uuid_"] = kwargs.pop("uuid")
+
+    handler: Callable[..., Model] = dictionary[type_.lower()]
+
+    parameters: list[str] = list(inspect.signature(handler).parameters.keys())
+
+    return handler(**{key: value for (key, value) in kwargs.items() if key in parameters})
+
+
+def _measure(
+    entries: list[dict[str, Any]],
+    function: Callable[..., Model],
+    repeat: int,
+) -> list[float]:
+    """
+    Returns the durations (in milliseconds) of repeatedly hydrating all entries.
+
+    Args:
+        entries (list[dict[str, Any]]): The stored flashcard dictionaries.
+        function (Callable[..., Model]): The function building a model from a dictionary.
+        repeat (int): The number of rounds to measure.
+
+    Returns:
+        list[float]: The duration of each round.
+    """
+
+    durations: list[float] = []
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+
+        for entry in entries:
+            function(
+                type_="flashcard",
+                **{
+                    **entry,
+                    "identifiable": dict(entry["identifiable"]),
+                    "metadata": dict(entry["metadata"]),
+                },
+            )
+
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return durations
+
+
+# ---------- Functions ---------- #
+
+
+def main() -> int:
+    """
+    Runs the benchmark and prints the median duration and throughput per path.
+
+    Args:
+        None
+
+    Returns:
+        int: The exit code. (0 for success)
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", default=10_000, type=int)
+    parser.add_argument("--repeat", default=5, type=int)
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    entries: list[dict[str, Any]] = _get_entries(entries=arguments.entries)
+
+    print(f"{'path':<12}  {'median ms':>10}  {'models/s':>10}  {'speed-up':>8}")
+
+    baseline: float = 0.0
+
+    for (
+        path,
+        function,
+    ) in (
+        ("inspecting", _get_model_inspecting),
+        ("planned", get_model),
+    ):
+        median: float = statistics.median(
+            _measure(
+                entries=entries,
+                function=function,
+                repeat=arguments.repeat,
+            )
+        )
+
+        if path == "inspecting":
+            baseline = median
+
+        print(
+            f"{path:<12}  {median:>10.2f}  {len(entries) / (median / 1000):>10.0f}  {baseline / median:>7.2f}x"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
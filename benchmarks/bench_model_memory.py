@@ -0,0 +1,108 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Measures the memory held by flashcard models, as loaded for analytics.
+
+Usage:
+    python benchmarks/bench_model_memory.py [--entries 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from studyfrog.models.factory import get_flashcard_model  # noqa: E402
+from studyfrog.models.models import Model  # noqa: E402
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _get_flashcards(entries: int) -> list[Model]:
+    """
+    Returns freshly created flashcard models.
+
+    Args:
+        entries (int): The number of flashcards.
+
+    Returns:
+        list[Model]: The flashcard models.
+    """
+
+    return [
+        get_flashcard_model(
+            back=f"Answer {index}",
+            difficulty="DIFFICULTY_1",
+            front=f"Question {index}",
+            id_=index,
+            key=f"FLASHCARD_{index}",
+            priority="PRIORITY_2",
+            tags=[
+                "chemistry",
+                "exam",
+            ],
+        )
+        for index in range(entries)
+    ]
+
+
+# ---------- Functions ---------- #
+
+
+def main() -> int:
+    """
+    Runs the benchmark and prints the memory held by the models and the serialization time.
+
+    Args:
+        None
+
+    Returns:
+        int: The exit code. (0 for success)
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", default=100_000, type=int)
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    # Warm up caches populated on first use (e.g. model construction plans).
+    _get_flashcards(entries=1)[0].to_json_dict()
+
+    gc.collect()
+    tracemalloc.start()
+
+    flashcards: list[Model] = _get_flashcards(entries=arguments.entries)
+
+    (
+        current,
+        peak,
+    ) = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    start: float = time.perf_counter()
+
+    dictionaries: list[dict[str, Any]] = [flashcard.to_json_dict() for flashcard in flashcards]
+
+    duration: float = (time.perf_counter() - start) * 1000
+
+    print(f"flashcards        {len(flashcards):>12}")
+    print(f"held MiB          {current / 1024 / 1024:>12.2f}")
+    print(f"peak MiB          {peak / 1024 / 1024:>12.2f}")
+    print(f"bytes per model   {current / len(flashcards):>12.0f}")
+    print(f"to_json_dict ms   {duration:>12.2f}  ({len(dictionaries)} dictionaries)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,616 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Runs the storage, model factory and dispatcher benchmark suite on synthetic decks and writes the results as JSON.
+
+Every benchmark runs against a throw-away data directory per deck size and kind
+(flashcards, notes and questions). Whole-table reads are measured cold, i.e. after
+dropping the table cache; single-entry operations run against a table of the deck size.
+The JSON results of two runs (e.g. of two commits) can be compared with '--compare'.
+
+On the "json" backend every single-entry write rewrites the whole table, so the
+'add_entry' and 'update_entry' rounds on the 100k decks take minutes; narrow '--sizes'
+or pick another '--backend' for quick runs.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 1000 10000 100000] [--kinds flashcards notes questions]
+                                        [--operations 20] [--repeat 3] [--backend json]
+                                        [--output results.json] [--compare previous.json] [--threshold 0.9]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Final, Optional
+
+ROOT: Final[Path] = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT / "src"))
+
+from studyfrog.models.factory import (  # noqa: E402
+    get_flashcard_model,
+    get_model,
+    get_note_model,
+    get_question_model,
+)
+from studyfrog.models.models import Model  # noqa: E402
+from studyfrog.utils import storage  # noqa: E402
+from studyfrog.utils.config import set_config_value  # noqa: E402
+from studyfrog.utils.dispatcher import dispatch, subscribe  # noqa: E402
+from studyfrog.utils.logging import set_log_level  # noqa: E402
+
+
+# ---------- Constants ---------- #
+
+DIFFICULTIES: Final[tuple[str, ...]] = (
+    "DIFFICULTY_1",
+    "DIFFICULTY_2",
+    "DIFFICULTY_3",
+)
+
+KINDS: Final[dict[str, str]] = {
+    "flashcards": "flashcard",
+    "notes": "note",
+    "questions": "question",
+}
+
+PRIORITIES: Final[tuple[str, ...]] = (
+    "PRIORITY_1",
+    "PRIORITY_2",
+    "PRIORITY_3",
+)
+
+RESULTS_DIR: Final[Path] = ROOT / "benchmarks" / "results"
+
+SUBSCRIBERS: Final[int] = 5
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _get_commit() -> Optional[str]:
+    """
+    Returns the abbreviated hash of the checked out commit.
+
+    Args:
+        None
+
+    Returns:
+        Optional[str]: The commit hash, or None if it cannot be determined.
+    """
+
+    try:
+        return subprocess.run(
+            [
+                "git",
+                "rev-parse",
+                "--short",
+                "HEAD",
+            ],
+            capture_output=True,
+            check=True,
+            cwd=ROOT,
+            text=True,
+        ).stdout.strip()
+    except (
+        OSError,
+        subprocess.CalledProcessError,
+    ):
+        return None
+
+
+def _get_deck(
+    kind: str,
+    size: int,
+) -> list[Model]:
+    """
+    Returns a synthetic deck of freshly created (unsaved) models.
+
+    Difficulties, priorities and tags rotate, so a third of the deck matches any single difficulty.
+
+    Args:
+        kind (str): The kind of deck: "flashcards", "notes" or "questions".
+        size (int): The number of models.
+
+    Returns:
+        list[Model]: The models.
+    """
+
+    factories: dict[str, Callable[[int], Model]] = {
+        "flashcards": lambda index: get_flashcard_model(
+            back=f"Answer {index} " * 4,
+            difficulty=DIFFICULTIES[index % 3],
+            front=f"Question {index} " * 4,
+            priority=PRIORITIES[index % 3],
+            tags=[
+                "chemistry",
+                f"chapter-{index % 20}",
+            ],
+        ),
+        "notes": lambda index: get_note_model(
+            difficulty=DIFFICULTIES[index % 3],
+            priority=PRIORITIES[index % 3],
+            tags=[
+                "history",
+                f"chapter-{index % 20}",
+            ],
+            text=f"Note text {index} " * 8,
+            title=f"Note {index}",
+        ),
+        "questions": lambda index: get_question_model(
+            answers=[
+                f"ANSWER_{index * 2}",
+                f"ANSWER_{index * 2 + 1}",
+            ],
+            difficulty=DIFFICULTIES[index % 3],
+            priority=PRIORITIES[index % 3],
+            tags=[
+                "biology",
+                f"chapter-{index % 20}",
+            ],
+            text=f"Question text {index} " * 4,
+        ),
+    }
+
+    return [factories[kind](index) for index in range(size)]
+
+
+def _measure(
+    function: Callable[[], Any],
+    repeat: int,
+    setup: Optional[Callable[[], Any]] = None,
+) -> list[float]:
+    """
+    Returns the durations (in seconds) of repeatedly calling a function.
+
+    Args:
+        function (Callable[[], Any]): The function to measure.
+        repeat (int): The number of rounds to measure.
+        setup (Optional[Callable[[], Any]]): A function called before every round, outside
+                                             of the measurement. Defaults to None.
+
+    Returns:
+        list[float]: The duration of each round.
+    """
+
+    durations: list[float] = []
+
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start: float = time.perf_counter()
+
+        function()
+
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def _print_comparison(
+    previous: dict[str, Any],
+    results: list[dict[str, Any]],
+    threshold: float,
+) -> int:
+    """
+    Prints the throughput of every benchmark relative to a previous run.
+
+    Args:
+        previous (dict[str, Any]): The JSON results of the previous run.
+        results (list[dict[str, Any]]): The results of this run.
+        threshold (float): The relative throughput below which a benchmark counts as regressed.
+
+    Returns:
+        int: The number of regressed benchmarks.
+    """
+
+    baselines: dict[tuple[str, str, int], dict[str, Any]] = {
+        (
+            result["benchmark"],
+            result["kind"],
+            result["size"],
+        ): result
+        for result in previous["results"]
+    }
+
+    print(f"\ncompared to {previous.get('commit') or 'previous run'} (regression below {threshold:.2f}x)")
+
+    regressions: int = 0
+
+    for result in results:
+        baseline: Optional[dict[str, Any]] = baselines.get(
+            (
+                result["benchmark"],
+                result["kind"],
+                result["size"],
+            )
+        )
+
+        if baseline is None:
+            continue
+
+        ratio: float = result["ops_per_s"] / baseline["ops_per_s"]
+
+        if ratio < threshold:
+            regressions += 1
+
+        print(
+            f"{result['benchmark']:<16}  {result['kind']:<10}  {result['size']:>7}  {ratio:>7.2f}x{'  REGRESSED' if ratio < threshold else ''}"
+        )
+
+    return regressions
+
+
+def _run_deck(
+    kind: str,
+    operations: int,
+    repeat: int,
+    size: int,
+    workspace: Path,
+) -> list[dict[str, Any]]:
+    """
+    Runs the storage and model benchmarks on one deck.
+
+    Args:
+        kind (str): The kind of deck: "flashcards", "notes" or "questions".
+        operations (int): The number of single-entry operations per round.
+        repeat (int): The number of rounds to measure.
+        size (int): The number of models in the deck.
+        workspace (Path): The directory to create the data directories in.
+
+    Returns:
+        list[dict[str, Any]]: The results.
+    """
+
+    deck: list[Model] = _get_deck(
+        kind=kind,
+        size=size,
+    )
+
+    results: list[dict[str, Any]] = []
+
+    def use_data_dir(name: str) -> None:
+        storage.DATA_DIR = workspace / f"{kind}-{size}-{name}-{time.perf_counter_ns()}"
+        storage.clear_table_cache()
+
+    def record(
+        benchmark: str,
+        durations: list[float],
+        count: int,
+    ) -> None:
+        median: float = statistics.median(durations)
+
+        results.append(
+            {
+                "benchmark": benchmark,
+                "kind": kind,
+                "median_s": median,
+                "operations": count,
+                "ops_per_s": count / median if median else 0.0,
+                "repeat": len(durations),
+                "size": size,
+            }
+        )
+
+        print(
+            f"{benchmark:<16}  {kind:<10}  {size:>7}  {count:>7}  {median * 1000:>10.2f}  {results[-1]['ops_per_s']:>12.0f}"
+        )
+
+    record(
+        benchmark="add_entries",
+        count=size,
+        durations=_measure(
+            function=lambda: storage.add_entries(
+                models=deck,
+                table_name=kind,
+            ),
+            repeat=repeat,
+            setup=lambda: use_data_dir(name="add_entries"),
+        ),
+    )
+
+    # The last round left a table of the deck size behind: the remaining benchmarks use it.
+
+    ids: list[int] = random.Random(size).sample(
+        range(size),
+        k=min(
+            operations,
+            size,
+        ),
+    )
+
+    record(
+        benchmark="get_all_entries",
+        count=size,
+        durations=_measure(
+            function=lambda: storage.get_all_entries(table_name=kind),
+            repeat=repeat,
+            setup=lambda: storage.clear_table_cache(),
+        ),
+    )
+
+    record(
+        benchmark="filter_entries",
+        count=size,
+        durations=_measure(
+            function=lambda: storage.filter_entries(
+                difficulty=DIFFICULTIES[0],
+                table_name=kind,
+            ),
+            repeat=repeat,
+            setup=lambda: storage.clear_table_cache(),
+        ),
+    )
+
+    record(
+        benchmark="get_entry",
+        count=len(ids),
+        durations=_measure(
+            function=lambda: [
+                storage.get_entry(
+                    id_=id_,
+                    table_name=kind,
+                )
+                for id_ in ids
+            ],
+            repeat=repeat,
+        ),
+    )
+
+    models: list[Model] = [
+        storage.get_entry(
+            id_=id_,
+            table_name=kind,
+        )
+        for id_ in ids
+    ]
+
+    record(
+        benchmark="update_entry",
+        count=len(models),
+        durations=_measure(
+            function=lambda: [
+                storage.update_entry(
+                    model=model,
+                    table_name=kind,
+                )
+                for model in models
+            ],
+            repeat=repeat,
+        ),
+    )
+
+    extra: list[Model] = _get_deck(
+        kind=kind,
+        size=operations,
+    )
+
+    record(
+        benchmark="add_entry",
+        count=len(extra),
+        durations=_measure(
+            function=lambda: [
+                storage.add_entry(
+                    model=model,
+                    table_name=kind,
+                )
+                for model in extra
+            ],
+            repeat=repeat,
+        ),
+    )
+
+    entries: list[dict[str, Any]] = [model.to_json_dict() for model in deck]
+
+    record(
+        benchmark="get_model",
+        count=size,
+        durations=_measure(
+            function=lambda: [
+                get_model(
+                    type_=KINDS[kind],
+                    **{
+                        **entry,
+                        "identifiable": dict(entry["identifiable"]),
+                        "metadata": dict(entry["metadata"]),
+                    },
+                )
+                for entry in entries
+            ],
+            repeat=repeat,
+        ),
+    )
+
+    record(
+        benchmark="to_json_dict",
+        count=size,
+        durations=_measure(
+            function=lambda: [model.to_json_dict() for model in deck],
+            repeat=repeat,
+        ),
+    )
+
+    return results
+
+
+def _run_dispatch(
+    repeat: int,
+    size: int,
+) -> dict[str, Any]:
+    """
+    Runs the dispatch benchmark: one event with several persistent subscribers.
+
+    Args:
+        repeat (int): The number of rounds to measure.
+        size (int): The number of dispatches per round.
+
+    Returns:
+        dict[str, Any]: The result.
+    """
+
+    durations: list[float] = _measure(
+        function=lambda: [
+            dispatch(
+                event="benchmark_event",
+                index=index,
+                namespace="benchmark",
+            )
+            for index in range(size)
+        ],
+        repeat=repeat,
+    )
+
+    median: float = statistics.median(durations)
+
+    print(
+        f"{'dispatch':<16}  {'-':<10}  {size:>7}  {size:>7}  {median * 1000:>10.2f}  {size / median:>12.0f}"
+    )
+
+    return {
+        "benchmark": "dispatch",
+        "kind": "-",
+        "median_s": median,
+        "operations": size,
+        "ops_per_s": size / median if median else 0.0,
+        "repeat": len(durations),
+        "size": size,
+    }
+
+
+def _subscriber(**kwargs: Any) -> int:
+    """
+    Serves as the subscribed function of the dispatch benchmark, doing next to no work.
+
+    Args:
+        **kwargs (Any): The dispatched keyword arguments.
+
+    Returns:
+        int: The dispatched index.
+    """
+
+    return kwargs["index"]
+
+
+# ---------- Functions ---------- #
+
+
+def main() -> int:
+    """
+    Runs the benchmark suite, prints a table and writes the results as JSON.
+
+    Args:
+        None
+
+    Returns:
+        int: The exit code. (0 for success, 1 if a benchmark regressed compared to '--compare')
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--backend", default="json", type=str)
+    parser.add_argument("--compare", default=None, type=Path)
+    parser.add_argument("--kinds", choices=list(KINDS), default=list(KINDS), nargs="+")
+    parser.add_argument("--operations", default=20, type=int)
+    parser.add_argument("--output", default=None, type=Path)
+    parser.add_argument("--repeat", default=3, type=int)
+    parser.add_argument("--sizes", default=[1_000, 10_000, 100_000], nargs="+", type=int)
+    parser.add_argument("--threshold", default=0.9, type=float)
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    set_config_value(
+        key="storage.backend",
+        value=arguments.backend,
+    )
+    set_log_level(level="ERROR")
+
+    for priority in range(SUBSCRIBERS):
+        subscribe(
+            event="benchmark_event",
+            function=_subscriber,
+            namespace="benchmark",
+            persistent=True,
+            priority=priority,
+        )
+
+    print(f"{'benchmark':<16}  {'kind':<10}  {'size':>7}  {'ops':>7}  {'median ms':>10}  {'ops/s':>12}")
+
+    results: list[dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory(prefix="studyfrog-benchmarks-") as directory:
+        for size in arguments.sizes:
+            for kind in arguments.kinds:
+                results.extend(
+                    _run_deck(
+                        kind=kind,
+                        operations=arguments.operations,
+                        repeat=arguments.repeat,
+                        size=size,
+                        workspace=Path(directory),
+                    )
+                )
+
+            results.append(
+                _run_dispatch(
+                    repeat=arguments.repeat,
+                    size=size,
+                )
+            )
+
+    commit: Optional[str] = _get_commit()
+    created_at: datetime = datetime.now()
+
+    output: Path = arguments.output or RESULTS_DIR / (
+        f"{created_at.strftime('%Y%m%d-%H%M%S')}{f'-{commit}' if commit else ''}.json"
+    )
+    output.parent.mkdir(
+        exist_ok=True,
+        parents=True,
+    )
+    output.write_text(
+        json.dumps(
+            {
+                "backend": arguments.backend,
+                "commit": commit,
+                "created_at": created_at.isoformat(),
+                "operations": arguments.operations,
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "repeat": arguments.repeat,
+                "results": results,
+            },
+            indent=4,
+        ),
+        encoding="utf-8",
+    )
+
+    print(f"\nresults written to {output}")
+
+    if arguments.compare is None:
+        return 0
+
+    regressions: int = _print_comparison(
+        previous=json.loads(arguments.compare.read_text(encoding="utf-8")),
+        results=results,
+        threshold=arguments.threshold,
+    )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,601 +1,655 @@
 from __future__ import annotations
 
-# Import all constants from individual modules
+from typing import Any, Final
 
-# Common constants
-from studyfrog.constants.common import (
-    APP_NAME,
-    APP_VERSION,
-    GLOBAL,
-    PATTERNS,
-    PLATFORM,
-    QUESTION_TYPES,
+from studyfrog.utils.lazy import (
+    get_lazy_attribute,
+    get_lazy_attribute_names,
+    register_lazy_imports,
 )
 
-# Default values
-from studyfrog.constants.defaults import (
-    DEFAULT_EASY_DIFFICULTY,
-    DEFAULT_HARD_DIFFICULTY,
-    DEFAULT_MEDIUM_DIFFICULTY,
-    DEFAULT_HIGH_PRIORITY,
-    DEFAULT_HIGHEST_PRIORITY,
-    DEFAULT_LOW_PRIORITY,
-    DEFAULT_LOWEST_PRIORITY,
-    DEFAULT_MEDIUM_PRIORITY,
-    DEFAULT_USER,
-)
-
-# Directory constants
-from studyfrog.constants.directories import (
-    ASSETS_DIR,
-    CONFIG_DIR,
-    DATA_DIR,
-    EXPORTS_DIR,
-    HOME,
-    IMPORTS_DIR,
-    LOGS_DIR,
-    RESOURCES_DIR,
-    TEMP_DIR,
-)
-
-# Event constants
-from studyfrog.constants.events import (
-    ADD_ANSWERS_TO_DB,
-    ADD_ANSWER_TO_DB,
-    ADD_ASSOCIATION_TO_DB,
-    ADD_ASSOCIATIONS_TO_DB,
-    ADD_CUSTOMFIELDS_TO_DB,
-    ADD_CUSTOMFIELD_TO_DB,
-    ADD_DIFFICULTIES_TO_DB,
-    ADD_DIFFICULTY_TO_DB,
-    ADD_FLASHCARDS_TO_DB,
-    ADD_FLASHCARD_TO_DB,
-    ADD_IMAGES_TO_DB,
-    ADD_IMAGE_TO_DB,
-    ADD_NOTES_TO_DB,
-    ADD_NOTE_TO_DB,
-    ADD_OPTIONS_TO_DB,
-    ADD_OPTION_TO_DB,
-    ADD_PRIORITIES_TO_DB,
-    ADD_PRIORITY_TO_DB,
-    ADD_QUESTIONS_TO_DB,
-    ADD_QUESTION_TO_DB,
-    ADD_REHEARSAL_RUNS_TO_DB,
-    ADD_REHEARSAL_RUN_ITEMS_TO_DB,
-    ADD_REHEARSAL_RUN_ITEM_TO_DB,
-    ADD_REHEARSAL_RUN_TO_DB,
-    ADD_STACKS_TO_DB,
-    ADD_STACK_TO_DB,
-    ADD_SUBJECTS_TO_DB,
-    ADD_SUBJECT_TO_DB,
-    ADD_TAGS_TO_DB,
-    ADD_TAG_TO_DB,
-    ADD_TEACHERS_TO_DB,
-    ADD_TEACHER_TO_DB,
-    ADD_USERS_TO_DB,
-    ADD_USER_TO_DB,
-    ALL_ANSWERS_DELETED,
-    ALL_ANSWERS_RETRIEVED,
-    ALL_ASSOCIATIONS_DELETED,
-    ALL_ASSOCIATIONS_RETRIEVED,
-    ALL_CUSTOMFIELDS_DELETED,
-    ALL_CUSTOMFIELDS_RETRIEVED,
-    ALL_DIFFICULTIES_DELETED,
-    ALL_DIFFICULTIES_RETRIEVED,
-    ALL_FLASHCARDS_DELETED,
-    ALL_FLASHCARDS_RETRIEVED,
-    ALL_IMAGES_DELETED,
-    ALL_IMAGES_RETRIEVED,
-    ALL_NOTES_DELETED,
-    ALL_NOTES_RETRIEVED,
-    ALL_OPTIONS_DELETED,
-    ALL_OPTIONS_RETRIEVED,
-    ALL_PRIORITIES_DELETED,
-    ALL_PRIORITIES_RETRIEVED,
-    ALL_QUESTIONS_DELETED,
-    ALL_QUESTIONS_RETRIEVED,
-    ALL_REHEARSAL_RUNS_DELETED,
-    ALL_REHEARSAL_RUNS_RETRIEVED,
-    ALL_REHEARSAL_RUN_ITEMS_DELETED,
-    ALL_REHEARSAL_RUN_ITEMS_RETRIEVED,
-    ALL_STACKS_DELETED,
-    ALL_STACKS_RETRIEVED,
-    ALL_SUBJECTS_DELETED,
-    ALL_SUBJECTS_RETRIEVED,
-    ALL_TAGS_DELETED,
-    ALL_TAGS_RETRIEVED,
-    ALL_TEACHERS_DELETED,
-    ALL_TEACHERS_RETRIEVED,
-    ALL_USERS_DELETED,
-    ALL_USERS_RETRIEVED,
-    ANSWERS_ADDED,
-    ANSWERS_DELETED,
-    ANSWERS_RETRIEVED,
-    ANSWERS_UPDATED,
-    ANSWER_ADDED,
-    ANSWER_DELETED,
-    ANSWER_RETRIEVED,
-    ANSWER_UPDATED,
-    APPLICATION_STARTED,
-    APPLICATION_STARTING,
-    APPLICATION_STOPPED,
-    APPLICATION_STOPPING,
-    ASSOCIATION_ADDED,
-    ASSOCIATIONS_ADDED,
-    CLEAR_CREATE_FORM,
-    CLEAR_REHEARSAL_RUN_SETUP_FORM,
-    CLICKED_CANCEL_BUTTON,
-    CLICKED_EASY_BUTTON,
-    CLICKED_EDIT_BUTTON,
-    CLICKED_MEDIUM_BUTTON,
-    CLICKED_HARD_BUTTON,
-    CLICKED_NEXT_BUTTON,
-    CLICKED_PREVIOUS_BUTTON,
-    COUNT_WIDGET_CHILDREN,
-    CUSTOMFIELDS_ADDED,
-    CUSTOMFIELDS_DELETED,
-    CUSTOMFIELDS_RETRIEVED,
-    CUSTOMFIELDS_UPDATED,
-    CUSTOMFIELD_ADDED,
-    CUSTOMFIELD_DELETED,
-    CUSTOMFIELD_RETRIEVED,
-    CUSTOMFIELD_UPDATED,
-    DB_OPERATION_FAILURE,
-    DB_OPERATION_SUCCESS,
-    DELETE_ALL_ANSWERS_FROM_DB,
-    DELETE_ALL_ASSOCIATIONS_FROM_DB,
-    DELETE_ALL_CUSTOMFIELDS_FROM_DB,
-    DELETE_ALL_DIFFICULTIES_FROM_DB,
-    DELETE_ALL_FLASHCARDS_FROM_DB,
-    DELETE_ALL_IMAGES_FROM_DB,
-    DELETE_ALL_NOTES_FROM_DB,
-    DELETE_ALL_OPTIONS_FROM_DB,
-    DELETE_ALL_PRIORITIES_FROM_DB,
-    DELETE_ALL_QUESTIONS_FROM_DB,
-    DELETE_ALL_REHEARSAL_RUNS_FROM_DB,
-    DELETE_ALL_REHEARSAL_RUN_ITEMS_FROM_DB,
-    DELETE_ALL_STACKS_FROM_DB,
-    DELETE_ALL_SUBJECTS_FROM_DB,
-    DELETE_ALL_TAGS_FROM_DB,
-    DELETE_ALL_TEACHERS_FROM_DB,
-    DELETE_ALL_USERS_FROM_DB,
-    DELETE_ANSWERS_FROM_DB,
-    DELETE_ANSWER_FROM_DB,
-    DELETE_ASSOCIATIONS_FROM_DB,
-    DELETE_ASSOCIATION_FROM_DB,
-    DELETE_CUSTOMFIELDS_FROM_DB,
-    DELETE_CUSTOMFIELD_FROM_DB,
-    DELETE_DIFFICULTIES_FROM_DB,
-    DELETE_DIFFICULTY_FROM_DB,
-    DELETE_FLASHCARDS_FROM_DB,
-    DELETE_FLASHCARD_FROM_DB,
-    DELETE_IMAGES_FROM_DB,
-    DELETE_IMAGE_FROM_DB,
-    DELETE_NOTES_FROM_DB,
-    DELETE_NOTE_FROM_DB,
-    DELETE_OPTIONS_FROM_DB,
-    DELETE_OPTION_FROM_DB,
-    DELETE_PRIORITIES_FROM_DB,
-    DELETE_PRIORITY_FROM_DB,
-    DELETE_QUESTIONS_FROM_DB,
-    DELETE_QUESTION_FROM_DB,
-    DELETE_REHEARSAL_RUNS_FROM_DB,
-    DELETE_REHEARSAL_RUN_FROM_DB,
-    DELETE_REHEARSAL_RUN_ITEMS_FROM_DB,
-    DELETE_REHEARSAL_RUN_ITEM_FROM_DB,
-    DELETE_STACKS_FROM_DB,
-    DELETE_STACK_FROM_DB,
-    DELETE_SUBJECTS_FROM_DB,
-    DELETE_SUBJECT_FROM_DB,
-    DELETE_TAGS_FROM_DB,
-    DELETE_TAG_FROM_DB,
-    DELETE_TEACHERS_FROM_DB,
-    DELETE_TEACHER_FROM_DB,
-    DELETE_USERS_FROM_DB,
-    DELETE_USER_FROM_DB,
-    DESTROY_ANSWER_CHOICE_CREATE_FORM,
-    DESTROY_ANSWER_CREATE_FORM,
-    DESTROY_ANSWER_EDIT_FORM,
-    DESTROY_ANSWER_OPEN_ENDED_CREATE_FORM,
-    DESTROY_ANSWER_TRUE_FALSE_CREATE_FORM,
-    DESTROY_ANSWER_VIEW_FORM,
-    DESTROY_CREATE_VIEW,
-    DESTROY_DASHBOARD_VIEW,
-    DESTROY_DELETE_CONFIRMATION_VIEW,
-    DESTROY_EDIT_VIEW,
-    DESTROY_FLASHCARD_CREATE_FORM,
-    DESTROY_FLASHCARD_EDIT_FORM,
-    DESTROY_FLASHCARD_REHEARSAL_VIEW,
-    DESTROY_FLASHCARD_VIEW_FORM,
-    DESTROY_NOTE_CREATE_FORM,
-    DESTROY_NOTE_EDIT_FORM,
-    DESTROY_NOTE_REHEARSAL_VIEW,
-    DESTROY_NOTE_VIEW_FORM,
-    DESTROY_QUESTION_CREATE_FORM,
-    DESTROY_QUESTION_EDIT_FORM,
-    DESTROY_QUESTION_REHEARSAL_VIEW,
-    DESTROY_QUESTION_VIEW_FORM,
-    DESTROY_REHEARSAL_RUN_RESULT_VIEW,
-    DESTROY_REHEARSAL_RUN_SETUP_VIEW,
-    DESTROY_REHEARSAL_RUN_VIEW,
-    DESTROY_SEARCH_VIEW,
-    DESTROY_SETTINGS_VIEW,
-    DESTROY_STACK_CREATE_FORM,
-    DESTROY_STACK_EDIT_FORM,
-    DESTROY_STACK_VIEW_FORM,
-    DESTROY_SUBJECT_EDIT_FORM,
-    DESTROY_SUBJECT_VIEW_FORM,
-    DESTROY_TEACHER_EDIT_FORM,
-    DESTROY_TEACHER_VIEW_FORM,
-    DESTROY_VIEW_VIEW,
-    DESTROY_WIDGET_CHILDREN,
-    DIFFICULTIES_ADDED,
-    DIFFICULTIES_DELETED,
-    DIFFICULTIES_RETRIEVED,
-    DIFFICULTIES_UPDATED,
-    DIFFICULTY_ADDED,
-    DIFFICULTY_DELETED,
-    DIFFICULTY_RETRIEVED,
-    DIFFICULTY_UPDATED,
-    FILTER_ANSWERS_FROM_DB,
-    FILTER_ASSOCIATIONS_FROM_DB,
-    FILTER_CUSTOMFIELDS_FROM_DB,
-    FILTER_DIFFICULTIES_FROM_DB,
-    FILTER_FLASHCARDS_FROM_DB,
-    FILTER_IMAGES_FROM_DB,
-    FILTER_NOTES_FROM_DB,
-    FILTER_OPTIONS_FROM_DB,
-    FILTER_QUESTIONS_FROM_DB,
-    FILTER_REHEARSAL_RUNS_FROM_DB,
-    FILTER_REHEARSAL_RUN_ITEMS_FROM_DB,
-    FILTER_STACKS_FROM_DB,
-    FILTER_SUBJECTS_FROM_DB,
-    FILTER_TAGS_FROM_DB,
-    FILTER_TEACHERS_FROM_DB,
-    FILTER_USERS_FROM_DB,
-    FLASHCARDS_ADDED,
-    FLASHCARDS_DELETED,
-    FLASHCARD_FLIPPED,
-    FLASHCARDS_RETRIEVED,
-    FLASHCARDS_UPDATED,
-    FLASHCARD_ADDED,
-    FLASHCARD_DELETED,
-    FLASHCARD_RETRIEVED,
-    FLASHCARD_UPDATED,
-    GET_ALL_ANSWERS_FROM_DB,
-    GET_ALL_ASSOCIATIONS_FROM_DB,
-    GET_ALL_CUSTOMFIELDS_FROM_DB,
-    GET_ALL_DIFFICULTIES_FROM_DB,
-    GET_ALL_FLASHCARDS_FROM_DB,
-    GET_ALL_IMAGES_FROM_DB,
-    GET_ALL_NOTES_FROM_DB,
-    GET_ALL_OPTIONS_FROM_DB,
-    GET_ALL_PRIORITIES_FROM_DB,
-    GET_ALL_QUESTIONS_FROM_DB,
-    GET_ALL_REHEARSAL_RUNS_FROM_DB,
-    GET_ALL_REHEARSAL_RUN_ITEMS_FROM_DB,
-    GET_ALL_STACKS_FROM_DB,
-    GET_ALL_SUBJECTS_FROM_DB,
-    GET_ALL_TAGS_FROM_DB,
-    GET_ALL_TEACHERS_FROM_DB,
-    GET_ALL_USERS_FROM_DB,
-    GET_ANSWER_CHOICE_CREATE_FORM,
-    GET_ANSWER_CREATE_FORM,
-    GET_ANSWERS_FROM_DB,
-    GET_ANSWER_EDIT_FORM,
-    GET_ANSWER_FROM_DB,
-    GET_ANSWER_MODEL,
-    GET_ANSWER_OPEN_ENDED_CREATE_FORM,
-    GET_ANSWER_TRUE_FALSE_CREATE_FORM,
-    GET_ANSWER_VIEW_FORM,
-    GET_ASSOCIATION_FROM_DB,
-    GET_ASSOCIATION_MODEL,
-    GET_ASSOCIATIONS_FROM_DB,
-    GET_CREATE_FORM,
-    GET_CREATE_VIEW,
-    GET_CUSTOMFIELDS_FROM_DB,
-    GET_CUSTOMFIELD_FROM_DB,
-    GET_DASHBOARD_VIEW,
-    GET_DELETE_CONFIRMATION_VIEW,
-    GET_DIFFICULTIES_FROM_DB,
-    GET_DIFFICULTY_FROM_DB,
-    GET_EDIT_FORM,
-    GET_EDIT_VIEW,
-    GET_ERROR_TOAST,
-    GET_FLASHCARDS_FROM_DB,
-    GET_FLASHCARD_CREATE_FORM,
-    GET_FLASHCARD_EDIT_FORM,
-    GET_FLASHCARD_FROM_DB,
-    GET_FLASHCARD_MODEL,
-    GET_FLASHCARD_REHEARSAL_VIEW,
-    GET_FLASHCARD_VIEW_FORM,
-    GET_IMAGES_FROM_DB,
-    GET_IMAGE_FROM_DB,
-    GET_INFO_TOAST,
-    GET_NOTES_FROM_DB,
-    GET_NOTE_CREATE_FORM,
-    GET_NOTE_EDIT_FORM,
-    GET_NOTE_FROM_DB,
-    GET_NOTE_MODEL,
-    GET_NOTE_REHEARSAL_VIEW,
-    GET_NOTE_VIEW_FORM,
-    GET_OBSERVABLE_MODEL,
-    GET_OPTIONS_FROM_DB,
-    GET_OPTION_FROM_DB,
-    GET_PRIORITIES_FROM_DB,
-    GET_PRIORITY_FROM_DB,
-    GET_QUESTIONS_FROM_DB,
-    GET_QUESTION_CREATE_FORM,
-    GET_QUESTION_EDIT_FORM,
-    GET_QUESTION_FROM_DB,
-    GET_QUESTION_MODEL,
-    GET_QUESTION_REHEARSAL_VIEW,
-    GET_QUESTION_VIEW_FORM,
-    GET_REHEARSAL_RUN_MODEL,
-    GET_REHEARSAL_RUNS_FROM_DB,
-    GET_REHEARSAL_RUN_FROM_DB,
-    GET_REHEARSAL_RUN_ITEMS_FROM_DB,
-    GET_REHEARSAL_RUN_ITEM_FROM_DB,
-    GET_REHEARSAL_RUN_ITEM_MODEL,
-    GET_REHEARSAL_RUN_RESULT_VIEW,
-    GET_REHEARSAL_RUN_SETUP_FORM,
-    GET_REHEARSAL_RUN_SETUP_VIEW,
-    GET_REHEARSAL_RUN_VIEW,
-    GET_SEARCH_VIEW,
-    GET_SETTINGS_VIEW,
-    GET_STACK_CREATE_FORM,
-    GET_STACK_EDIT_FORM,
-    GET_STACK_FROM_DB,
-    GET_STACK_MODEL,
-    GET_STACK_VIEW_FORM,
-    GET_STACKS_FROM_DB,
-    GET_SUBJECTS_FROM_DB,
-    GET_SUBJECT_EDIT_FORM,
-    GET_SUBJECT_FROM_DB,
-    GET_SUBJECT_VIEW_FORM,
-    GET_SUCCESS_TOAST,
-    GET_TAGS_FROM_DB,
-    GET_TAG_FROM_DB,
-    GET_TEACHERS_FROM_DB,
-    GET_TEACHER_EDIT_FORM,
-    GET_TEACHER_FROM_DB,
-    GET_TEACHER_VIEW_FORM,
-    GET_USER_FROM_DB,
-    GET_USERS_FROM_DB,
-    GET_VIEW_VIEW,
-    GET_WARNING_TOAST,
-    GET_WIDGET_CHILDREN,
-    IMAGES_ADDED,
-    IMAGES_DELETED,
-    IMAGES_RETRIEVED,
-    IMAGES_UPDATED,
-    IMAGE_ADDED,
-    IMAGE_DELETED,
-    IMAGE_RETRIEVED,
-    IMAGE_UPDATED,
-    LOAD_REHEARSAL_VIEW_FORM,
-    NOTES_ADDED,
-    NOTES_DELETED,
-    NOTES_RETRIEVED,
-    NOTES_UPDATED,
-    NOTE_ADDED,
-    NOTE_DELETED,
-    NOTE_RETRIEVED,
-    NOTE_UPDATED,
-    OPTIONS_ADDED,
-    OPTIONS_DELETED,
-    OPTIONS_RETRIEVED,
-    OPTIONS_UPDATED,
-    OPTION_ADDED,
-    OPTION_DELETED,
-    OPTION_RETRIEVED,
-    OPTION_UPDATED,
-    PRIORITIES_ADDED,
-    PRIORITIES_DELETED,
-    PRIORITIES_RETRIEVED,
-    PRIORITIES_UPDATED,
-    PRIORITY_ADDED,
-    PRIORITY_DELETED,
-    PRIORITY_RETRIEVED,
-    PRIORITY_UPDATED,
-    QUESTIONS_ADDED,
-    QUESTIONS_DELETED,
-    QUESTIONS_RETRIEVED,
-    QUESTIONS_UPDATED,
-    QUESTION_ADDED,
-    QUESTION_DELETED,
-    QUESTION_RETRIEVED,
-    QUESTION_UPDATED,
-    REHEARSAL_RUNS_ADDED,
-    REHEARSAL_RUNS_DELETED,
-    REHEARSAL_RUNS_RETRIEVED,
-    REHEARSAL_RUNS_UPDATED,
-    REHEARSAL_RUN_ADDED,
-    REHEARSAL_RUN_DELETED,
-    REHEARSAL_RUN_INDEX_DECREMENTED,
-    REHEARSAL_RUN_INDEX_INCREMENTED,
-    REHEARSAL_RUN_INDEX_MAX_REACHED,
-    REHEARSAL_RUN_INDEX_MIN_REACHED,
-    REHEARSAL_RUN_ITEMS_ADDED,
-    REHEARSAL_RUN_ITEMS_DELETED,
-    REHEARSAL_RUN_ITEMS_RETRIEVED,
-    REHEARSAL_RUN_ITEMS_UPDATED,
-    REHEARSAL_RUN_ITEM_ADDED,
-    REHEARSAL_RUN_ITEM_DELETED,
-    REHEARSAL_RUN_ITEM_RETRIEVED,
-    REHEARSAL_RUN_ITEM_UPDATED,
-    REHEARSAL_RUN_RETRIEVED,
-    REHEARSAL_RUN_UPDATED,
-    RESET_CREATE_FORM,
-    RESET_OBSERVABLE_MODEL,
-    SET_CREATE_FORM,
-    SET_EDIT_FORM,
-    SET_OBSERVABLE_MODEL,
-    SET_VIEW_FORM,
-    STACKS_ADDED,
-    STACKS_DELETED,
-    STACKS_RETRIEVED,
-    STACKS_UPDATED,
-    STACK_ADDED,
-    STACK_DELETED,
-    STACK_RETRIEVED,
-    STACK_UPDATED,
-    SUBJECTS_ADDED,
-    SUBJECTS_DELETED,
-    SUBJECTS_RETRIEVED,
-    SUBJECTS_UPDATED,
-    SUBJECT_ADDED,
-    SUBJECT_DELETED,
-    SUBJECT_RETRIEVED,
-    SUBJECT_UPDATED,
-    TAGS_ADDED,
-    TAGS_DELETED,
-    TAGS_RETRIEVED,
-    TAGS_UPDATED,
-    TAG_ADDED,
-    TAG_DELETED,
-    TAG_RETRIEVED,
-    TAG_UPDATED,
-    TEACHERS_ADDED,
-    TEACHERS_DELETED,
-    TEACHERS_RETRIEVED,
-    TEACHERS_UPDATED,
-    TEACHER_ADDED,
-    TEACHER_DELETED,
-    TEACHER_RETRIEVED,
-    TEACHER_UPDATED,
-    UPDATE_ANSWERS_IN_DB,
-    UPDATE_ANSWER_IN_DB,
-    UPDATE_ASSOCIATIONS_IN_DB,
-    UPDATE_ASSOCIATION_IN_DB,
-    UPDATE_CUSTOMFIELDS_IN_DB,
-    UPDATE_CUSTOMFIELD_IN_DB,
-    UPDATE_DIFFICULTIES_IN_DB,
-    UPDATE_DIFFICULTY_IN_DB,
-    UPDATE_FLASHCARDS_IN_DB,
-    UPDATE_FLASHCARD_IN_DB,
-    UPDATE_IMAGES_IN_DB,
-    UPDATE_IMAGE_IN_DB,
-    UPDATE_NOTES_IN_DB,
-    UPDATE_NOTE_IN_DB,
-    UPDATE_OBSERVABLE_MODEL,
-    UPDATE_OPTIONS_IN_DB,
-    UPDATE_OPTION_IN_DB,
-    UPDATE_PRIORITIES_IN_DB,
-    UPDATE_PRIORITY_IN_DB,
-    UPDATE_QUESTIONS_IN_DB,
-    UPDATE_QUESTION_IN_DB,
-    UPDATE_REHEARSAL_RUNS_IN_DB,
-    UPDATE_REHEARSAL_RUN_IN_DB,
-    UPDATE_REHEARSAL_RUN_ITEMS_IN_DB,
-    UPDATE_REHEARSAL_RUN_ITEM_IN_DB,
-    UPDATE_STACKS_IN_DB,
-    UPDATE_STACK_IN_DB,
-    UPDATE_SUBJECTS_IN_DB,
-    UPDATE_SUBJECT_IN_DB,
-    UPDATE_TAGS_IN_DB,
-    UPDATE_TAG_IN_DB,
-    UPDATE_TEACHERS_IN_DB,
-    UPDATE_TEACHER_IN_DB,
-    UPDATE_USERS_IN_DB,
-    UPDATE_USER_IN_DB,
-    USERS_ADDED,
-    USERS_DELETED,
-    USERS_RETRIEVED,
-    USERS_UPDATED,
-    USER_ADDED,
-    USER_DELETED,
-    USER_RETRIEVED,
-    USER_UPDATED,
-    get_all_events,
-    get_answer_events,
-    get_customfield_events,
-    get_difficulty_events,
-    get_event_by_name,
-    get_events_by_names,
-    get_events_by_prefix,
-    get_events_by_prefixes,
-    get_flashcard_events,
-    get_image_events,
-    get_note_events,
-    get_option_events,
-    get_priority_events,
-    get_rehearsal_run_events,
-    get_rehearsal_run_item_events,
-    get_stack_events,
-    get_subject_events,
-    get_tag_events,
-    get_teacher_events,
-    get_user_events,
-    get_utility_events,
-)
-
-# File constants
-from studyfrog.constants.files import (
-    ANSWERS_DB_JSON,
-    ASSOCIATIONS_DB_JSON,
-    CONFIG_DB_JSON,
-    CUSTOMFIELDS_DB_JSON,
-    DIFFICULTIES_DB_JSON,
-    FLASHCARDS_DB_JSON,
-    IMAGES_DB_JSON,
-    NOTES_DB_JSON,
-    OPTIONS_DB_JSON,
-    PRIORITIES_DB_JSON,
-    QUESTIONS_DB_JSON,
-    REHEARSAL_RUN_DB_JSON,
-    REHEARSAL_RUN_ITEM_DB_JSON,
-    STACKS_DB_JSON,
-    SUBJECTS_DB_JSON,
-    TAGS_DB_JSON,
-    TEACHERS_DB_JSON,
-    USERS_DB_JSON,
-)
-
-# GUI constants
-from studyfrog.constants.gui import (
-    READONLY,
-    TOPLEVEL_GEOMETRY,
-    WINDOW_GEOMETRY,
-    WINDOW_TITLE,
-)
 
-# Logging constants
-from studyfrog.constants.logging import (
-    CRITICAL_FG,
-    DEBUG_FG,
-    ERROR_FG,
-    INFO_FG,
-    RESET,
-    SUCCESS_FG,
-    TRACE_FG,
-    WARNING_FG,
-)
-
-# Namespace constants
-from studyfrog.constants.namespaces import (
-    GLOBAL_NAMESPACE,
-)
+# Import all constants from individual modules (lazily, on first access)
+_LAZY_IMPORTS: Final[dict[str, tuple[str, ...]]] = {
+    # Common constants
+    "studyfrog.constants.common": (
+        "APP_NAME",
+        "APP_VERSION",
+        "GLOBAL",
+        "PATTERNS",
+        "PLATFORM",
+        "QUESTION_TYPES",
+    ),
+    # Default values
+    "studyfrog.constants.defaults": (
+        "DEFAULT_EASY_DIFFICULTY",
+        "DEFAULT_HARD_DIFFICULTY",
+        "DEFAULT_MEDIUM_DIFFICULTY",
+        "DEFAULT_HIGH_PRIORITY",
+        "DEFAULT_HIGHEST_PRIORITY",
+        "DEFAULT_LOW_PRIORITY",
+        "DEFAULT_LOWEST_PRIORITY",
+        "DEFAULT_MEDIUM_PRIORITY",
+        "DEFAULT_USER",
+    ),
+    # Directory constants
+    "studyfrog.constants.directories": (
+        "ASSETS_DIR",
+        "CONFIG_DIR",
+        "DATA_DIR",
+        "EXPORTS_DIR",
+        "HOME",
+        "IMPORTS_DIR",
+        "LOGS_DIR",
+        "RESOURCES_DIR",
+        "TEMP_DIR",
+    ),
+    # Event constants
+    "studyfrog.constants.events": (
+        "ADD_ANSWERS_TO_DB",
+        "ADD_ANSWER_TO_DB",
+        "ADD_ASSOCIATION_TO_DB",
+        "ADD_ASSOCIATIONS_TO_DB",
+        "ADD_CUSTOMFIELDS_TO_DB",
+        "ADD_CUSTOMFIELD_TO_DB",
+        "ADD_DIFFICULTIES_TO_DB",
+        "ADD_DIFFICULTY_TO_DB",
+        "ADD_FLASHCARDS_TO_DB",
+        "ADD_FLASHCARD_TO_DB",
+        "ADD_IMAGES_TO_DB",
+        "ADD_IMAGE_TO_DB",
+        "ADD_NOTES_TO_DB",
+        "ADD_NOTE_TO_DB",
+        "ADD_OPTIONS_TO_DB",
+        "ADD_OPTION_TO_DB",
+        "ADD_PRIORITIES_TO_DB",
+        "ADD_PRIORITY_TO_DB",
+        "ADD_QUESTIONS_TO_DB",
+        "ADD_QUESTION_TO_DB",
+        "ADD_REHEARSAL_RUNS_TO_DB",
+        "ADD_REHEARSAL_RUN_ITEMS_TO_DB",
+        "ADD_REHEARSAL_RUN_ITEM_TO_DB",
+        "ADD_REHEARSAL_RUN_TO_DB",
+        "ADD_STACKS_TO_DB",
+        "ADD_STACK_TO_DB",
+        "ADD_SUBJECTS_TO_DB",
+        "ADD_SUBJECT_TO_DB",
+        "ADD_TAGS_TO_DB",
+        "ADD_TAG_TO_DB",
+        "ADD_TEACHERS_TO_DB",
+        "ADD_TEACHER_TO_DB",
+        "ADD_USERS_TO_DB",
+        "ADD_USER_TO_DB",
+        "ALL_ANSWERS_DELETED",
+        "ALL_ANSWERS_RETRIEVED",
+        "ANSWERS_PAGE_RETRIEVED",
+        "ALL_ASSOCIATIONS_DELETED",
+        "ALL_ASSOCIATIONS_RETRIEVED",
+        "ALL_CUSTOMFIELDS_DELETED",
+        "ALL_CUSTOMFIELDS_RETRIEVED",
+        "CUSTOMFIELDS_PAGE_RETRIEVED",
+        "ALL_DIFFICULTIES_DELETED",
+        "ALL_DIFFICULTIES_RETRIEVED",
+        "DIFFICULTIES_PAGE_RETRIEVED",
+        "ALL_FLASHCARDS_DELETED",
+        "ALL_FLASHCARDS_RETRIEVED",
+        "FLASHCARDS_PAGE_RETRIEVED",
+        "ALL_IMAGES_DELETED",
+        "ALL_IMAGES_RETRIEVED",
+        "IMAGES_PAGE_RETRIEVED",
+        "ALL_NOTES_DELETED",
+        "ALL_NOTES_RETRIEVED",
+        "NOTES_PAGE_RETRIEVED",
+        "ALL_OPTIONS_DELETED",
+        "ALL_OPTIONS_RETRIEVED",
+        "OPTIONS_PAGE_RETRIEVED",
+        "ALL_PRIORITIES_DELETED",
+        "ALL_PRIORITIES_RETRIEVED",
+        "PRIORITIES_PAGE_RETRIEVED",
+        "ALL_QUESTIONS_DELETED",
+        "ALL_QUESTIONS_RETRIEVED",
+        "QUESTIONS_PAGE_RETRIEVED",
+        "ALL_REHEARSAL_ACTIONS_DELETED",
+        "ALL_REHEARSAL_ACTIONS_RETRIEVED",
+        "REHEARSAL_ACTIONS_PAGE_RETRIEVED",
+        "ALL_REHEARSAL_RUNS_DELETED",
+        "ALL_REHEARSAL_RUNS_RETRIEVED",
+        "REHEARSAL_RUNS_PAGE_RETRIEVED",
+        "ALL_REHEARSAL_RUN_ITEMS_DELETED",
+        "ALL_REHEARSAL_RUN_ITEMS_RETRIEVED",
+        "REHEARSAL_RUN_ITEMS_PAGE_RETRIEVED",
+        "ALL_STACKS_DELETED",
+        "ALL_STACKS_RETRIEVED",
+        "STACKS_PAGE_RETRIEVED",
+        "ALL_SUBJECTS_DELETED",
+        "ALL_SUBJECTS_RETRIEVED",
+        "SUBJECTS_PAGE_RETRIEVED",
+        "ALL_TAGS_DELETED",
+        "ALL_TAGS_RETRIEVED",
+        "TAGS_PAGE_RETRIEVED",
+        "ALL_TEACHERS_DELETED",
+        "ALL_TEACHERS_RETRIEVED",
+        "TEACHERS_PAGE_RETRIEVED",
+        "ALL_USERS_DELETED",
+        "ALL_USERS_RETRIEVED",
+        "USERS_PAGE_RETRIEVED",
+        "ANSWERS_ADDED",
+        "ANSWERS_DELETED",
+        "ANSWERS_RETRIEVED",
+        "ANSWERS_UPDATED",
+        "ANSWER_ADDED",
+        "ANSWER_DELETED",
+        "ANSWER_RETRIEVED",
+        "ANSWER_UPDATED",
+        "APPLICATION_STARTED",
+        "APPLICATION_STARTING",
+        "APPLICATION_STOPPED",
+        "APPLICATION_STOPPING",
+        "ASSOCIATION_ADDED",
+        "ASSOCIATIONS_ADDED",
+        "CLEAR_CREATE_FORM",
+        "CLEAR_REHEARSAL_RUN_SETUP_FORM",
+        "CLICKED_CANCEL_BUTTON",
+        "CLICKED_EASY_BUTTON",
+        "CLICKED_EDIT_BUTTON",
+        "CLICKED_MEDIUM_BUTTON",
+        "CLICKED_HARD_BUTTON",
+        "CLICKED_NEXT_BUTTON",
+        "CLICKED_PREVIOUS_BUTTON",
+        "COUNT_WIDGET_CHILDREN",
+        "CUSTOMFIELDS_ADDED",
+        "CUSTOMFIELDS_DELETED",
+        "CUSTOMFIELDS_RETRIEVED",
+        "CUSTOMFIELDS_UPDATED",
+        "CUSTOMFIELD_ADDED",
+        "CUSTOMFIELD_DELETED",
+        "CUSTOMFIELD_RETRIEVED",
+        "CUSTOMFIELD_UPDATED",
+        "DB_OPERATION_FAILURE",
+        "DB_OPERATION_SUCCESS",
+        "DELETE_ALL_ANSWERS_FROM_DB",
+        "DELETE_ALL_ASSOCIATIONS_FROM_DB",
+        "DELETE_ALL_CUSTOMFIELDS_FROM_DB",
+        "DELETE_ALL_DIFFICULTIES_FROM_DB",
+        "DELETE_ALL_FLASHCARDS_FROM_DB",
+        "DELETE_ALL_IMAGES_FROM_DB",
+        "DELETE_ALL_NOTES_FROM_DB",
+        "DELETE_ALL_OPTIONS_FROM_DB",
+        "DELETE_ALL_PRIORITIES_FROM_DB",
+        "DELETE_ALL_QUESTIONS_FROM_DB",
+        "DELETE_ALL_REHEARSAL_RUNS_FROM_DB",
+        "DELETE_ALL_REHEARSAL_RUN_ITEMS_FROM_DB",
+        "DELETE_ALL_STACKS_FROM_DB",
+        "DELETE_ALL_SUBJECTS_FROM_DB",
+        "DELETE_ALL_TAGS_FROM_DB",
+        "DELETE_ALL_TEACHERS_FROM_DB",
+        "DELETE_ALL_USERS_FROM_DB",
+        "DELETE_ANSWERS_FROM_DB",
+        "DELETE_ANSWER_FROM_DB",
+        "DELETE_ASSOCIATIONS_FROM_DB",
+        "DELETE_ASSOCIATION_FROM_DB",
+        "DELETE_CUSTOMFIELDS_FROM_DB",
+        "DELETE_CUSTOMFIELD_FROM_DB",
+        "DELETE_DIFFICULTIES_FROM_DB",
+        "DELETE_DIFFICULTY_FROM_DB",
+        "DELETE_FLASHCARDS_FROM_DB",
+        "DELETE_FLASHCARD_FROM_DB",
+        "DELETE_IMAGES_FROM_DB",
+        "DELETE_IMAGE_FROM_DB",
+        "DELETE_NOTES_FROM_DB",
+        "DELETE_NOTE_FROM_DB",
+        "DELETE_OPTIONS_FROM_DB",
+        "DELETE_OPTION_FROM_DB",
+        "DELETE_PRIORITIES_FROM_DB",
+        "DELETE_PRIORITY_FROM_DB",
+        "DELETE_QUESTIONS_FROM_DB",
+        "DELETE_QUESTION_FROM_DB",
+        "DELETE_REHEARSAL_RUNS_FROM_DB",
+        "DELETE_REHEARSAL_RUN_FROM_DB",
+        "DELETE_REHEARSAL_RUN_ITEMS_FROM_DB",
+        "DELETE_REHEARSAL_RUN_ITEM_FROM_DB",
+        "DELETE_STACKS_FROM_DB",
+        "DELETE_STACK_FROM_DB",
+        "DELETE_SUBJECTS_FROM_DB",
+        "DELETE_SUBJECT_FROM_DB",
+        "DELETE_TAGS_FROM_DB",
+        "DELETE_TAG_FROM_DB",
+        "DELETE_TEACHERS_FROM_DB",
+        "DELETE_TEACHER_FROM_DB",
+        "DELETE_USERS_FROM_DB",
+        "DELETE_USER_FROM_DB",
+        "DESTROY_ANSWER_CHOICE_CREATE_FORM",
+        "DESTROY_ANSWER_CREATE_FORM",
+        "DESTROY_ANSWER_EDIT_FORM",
+        "DESTROY_ANSWER_OPEN_ENDED_CREATE_FORM",
+        "DESTROY_ANSWER_TRUE_FALSE_CREATE_FORM",
+        "DESTROY_ANSWER_VIEW_FORM",
+        "DESTROY_CREATE_VIEW",
+        "DESTROY_DASHBOARD_VIEW",
+        "DESTROY_DELETE_CONFIRMATION_VIEW",
+        "DESTROY_EDIT_VIEW",
+        "DESTROY_FLASHCARD_CREATE_FORM",
+        "DESTROY_FLASHCARD_EDIT_FORM",
+        "DESTROY_FLASHCARD_REHEARSAL_VIEW",
+        "DESTROY_FLASHCARD_VIEW_FORM",
+        "DESTROY_NOTE_CREATE_FORM",
+        "DESTROY_NOTE_EDIT_FORM",
+        "DESTROY_NOTE_REHEARSAL_VIEW",
+        "DESTROY_NOTE_VIEW_FORM",
+        "DESTROY_QUESTION_CREATE_FORM",
+        "DESTROY_QUESTION_EDIT_FORM",
+        "DESTROY_QUESTION_REHEARSAL_VIEW",
+        "DESTROY_QUESTION_VIEW_FORM",
+        "DESTROY_REHEARSAL_RUN_RESULT_VIEW",
+        "DESTROY_REHEARSAL_RUN_SETUP_VIEW",
+        "DESTROY_REHEARSAL_RUN_VIEW",
+        "DESTROY_SEARCH_VIEW",
+        "DESTROY_SETTINGS_VIEW",
+        "DESTROY_STACK_CREATE_FORM",
+        "DESTROY_STACK_EDIT_FORM",
+        "DESTROY_STACK_VIEW_FORM",
+        "DESTROY_SUBJECT_EDIT_FORM",
+        "DESTROY_SUBJECT_VIEW_FORM",
+        "DESTROY_TEACHER_EDIT_FORM",
+        "DESTROY_TEACHER_VIEW_FORM",
+        "DESTROY_VIEW_VIEW",
+        "DESTROY_WIDGET_CHILDREN",
+        "DIFFICULTIES_ADDED",
+        "DIFFICULTIES_DELETED",
+        "DIFFICULTIES_RETRIEVED",
+        "DIFFICULTIES_UPDATED",
+        "DIFFICULTY_ADDED",
+        "DIFFICULTY_DELETED",
+        "DIFFICULTY_RETRIEVED",
+        "DIFFICULTY_UPDATED",
+        "DUMP_DISPATCH_TRACE",
+        "FILTER_ANSWERS_FROM_DB",
+        "FILTER_ASSOCIATIONS_FROM_DB",
+        "FILTER_CUSTOMFIELDS_FROM_DB",
+        "FILTER_DIFFICULTIES_FROM_DB",
+        "FILTER_FLASHCARDS_FROM_DB",
+        "FILTER_IMAGES_FROM_DB",
+        "FILTER_NOTES_FROM_DB",
+        "FILTER_OPTIONS_FROM_DB",
+        "FILTER_QUESTIONS_FROM_DB",
+        "FILTER_REHEARSAL_RUNS_FROM_DB",
+        "FILTER_REHEARSAL_RUN_ITEMS_FROM_DB",
+        "FILTER_STACKS_FROM_DB",
+        "FILTER_SUBJECTS_FROM_DB",
+        "FILTER_TAGS_FROM_DB",
+        "FILTER_TEACHERS_FROM_DB",
+        "FILTER_USERS_FROM_DB",
+        "FLASHCARDS_ADDED",
+        "FLASHCARDS_DELETED",
+        "FLASHCARD_FLIPPED",
+        "FLASHCARDS_RETRIEVED",
+        "FLASHCARDS_UPDATED",
+        "FLASHCARD_ADDED",
+        "FLASHCARD_DELETED",
+        "FLASHCARD_RETRIEVED",
+        "FLASHCARD_UPDATED",
+        "GET_ALL_ANSWERS_FROM_DB",
+        "GET_PAGE_OF_ANSWERS_FROM_DB",
+        "GET_ALL_ASSOCIATIONS_FROM_DB",
+        "GET_ALL_CUSTOMFIELDS_FROM_DB",
+        "GET_PAGE_OF_CUSTOMFIELDS_FROM_DB",
+        "GET_ALL_DIFFICULTIES_FROM_DB",
+        "GET_PAGE_OF_DIFFICULTIES_FROM_DB",
+        "GET_ALL_FLASHCARDS_FROM_DB",
+        "GET_PAGE_OF_FLASHCARDS_FROM_DB",
+        "GET_ALL_IMAGES_FROM_DB",
+        "GET_PAGE_OF_IMAGES_FROM_DB",
+        "GET_ALL_NOTES_FROM_DB",
+        "GET_PAGE_OF_NOTES_FROM_DB",
+        "GET_ALL_OPTIONS_FROM_DB",
+        "GET_PAGE_OF_OPTIONS_FROM_DB",
+        "GET_ALL_PRIORITIES_FROM_DB",
+        "GET_PAGE_OF_PRIORITIES_FROM_DB",
+        "GET_ALL_QUESTIONS_FROM_DB",
+        "GET_PAGE_OF_QUESTIONS_FROM_DB",
+        "GET_ALL_REHEARSAL_RUNS_FROM_DB",
+        "GET_PAGE_OF_REHEARSAL_RUNS_FROM_DB",
+        "GET_ALL_REHEARSAL_RUN_ITEMS_FROM_DB",
+        "GET_PAGE_OF_REHEARSAL_RUN_ITEMS_FROM_DB",
+        "GET_ALL_STACKS_FROM_DB",
+        "GET_PAGE_OF_STACKS_FROM_DB",
+        "GET_ALL_SUBJECTS_FROM_DB",
+        "GET_PAGE_OF_SUBJECTS_FROM_DB",
+        "GET_ALL_TAGS_FROM_DB",
+        "GET_PAGE_OF_TAGS_FROM_DB",
+        "GET_ALL_TEACHERS_FROM_DB",
+        "GET_PAGE_OF_TEACHERS_FROM_DB",
+        "GET_ALL_USERS_FROM_DB",
+        "GET_PAGE_OF_USERS_FROM_DB",
+        "GET_ANSWER_CHOICE_CREATE_FORM",
+        "GET_ANSWER_CREATE_FORM",
+        "GET_ANSWERS_FROM_DB",
+        "GET_ANSWER_EDIT_FORM",
+        "GET_ANSWER_FROM_DB",
+        "GET_ANSWER_MODEL",
+        "GET_ANSWER_OPEN_ENDED_CREATE_FORM",
+        "GET_ANSWER_TRUE_FALSE_CREATE_FORM",
+        "GET_ANSWER_VIEW_FORM",
+        "GET_ASSOCIATION_FROM_DB",
+        "GET_ASSOCIATION_MODEL",
+        "GET_ASSOCIATIONS_FROM_DB",
+        "GET_CREATE_FORM",
+        "GET_CREATE_VIEW",
+        "GET_CUSTOMFIELDS_FROM_DB",
+        "GET_CUSTOMFIELD_FROM_DB",
+        "GET_DASHBOARD_VIEW",
+        "GET_DELETE_CONFIRMATION_VIEW",
+        "GET_DIFFICULTIES_FROM_DB",
+        "GET_DIFFICULTY_FROM_DB",
+        "GET_EDIT_FORM",
+        "GET_EDIT_VIEW",
+        "GET_ERROR_TOAST",
+        "GET_FLASHCARDS_FROM_DB",
+        "GET_FLASHCARD_CREATE_FORM",
+        "GET_FLASHCARD_EDIT_FORM",
+        "GET_FLASHCARD_FROM_DB",
+        "GET_FLASHCARD_MODEL",
+        "GET_FLASHCARD_REHEARSAL_VIEW",
+        "GET_FLASHCARD_VIEW_FORM",
+        "GET_IMAGES_FROM_DB",
+        "GET_IMAGE_FROM_DB",
+        "GET_INFO_TOAST",
+        "GET_NOTES_FROM_DB",
+        "GET_NOTE_CREATE_FORM",
+        "GET_NOTE_EDIT_FORM",
+        "GET_NOTE_FROM_DB",
+        "GET_NOTE_MODEL",
+        "GET_NOTE_REHEARSAL_VIEW",
+        "GET_NOTE_VIEW_FORM",
+        "GET_OBSERVABLE_MODEL",
+        "GET_OPTIONS_FROM_DB",
+        "GET_OPTION_FROM_DB",
+        "GET_PRIORITIES_FROM_DB",
+        "GET_PRIORITY_FROM_DB",
+        "GET_QUESTIONS_FROM_DB",
+        "GET_QUESTION_CREATE_FORM",
+        "GET_QUESTION_EDIT_FORM",
+        "GET_QUESTION_FROM_DB",
+        "GET_QUESTION_MODEL",
+        "GET_QUESTION_REHEARSAL_VIEW",
+        "GET_QUESTION_VIEW_FORM",
+        "GET_REHEARSAL_RUN_MODEL",
+        "GET_REHEARSAL_RUNS_FROM_DB",
+        "GET_REHEARSAL_RUN_FROM_DB",
+        "GET_REHEARSAL_RUN_ITEMS_FROM_DB",
+        "GET_REHEARSAL_RUN_ITEM_FROM_DB",
+        "GET_REHEARSAL_RUN_ITEM_MODEL",
+        "GET_REHEARSAL_RUN_RESULT_VIEW",
+        "GET_REHEARSAL_RUN_SETUP_FORM",
+        "GET_REHEARSAL_RUN_SETUP_VIEW",
+        "GET_REHEARSAL_RUN_VIEW",
+        "GET_SEARCH_VIEW",
+        "GET_SETTINGS_VIEW",
+        "GET_STACK_CREATE_FORM",
+        "GET_STACK_EDIT_FORM",
+        "GET_STACK_FROM_DB",
+        "GET_STACK_MODEL",
+        "GET_STACK_VIEW_FORM",
+        "GET_STACKS_FROM_DB",
+        "GET_SUBJECTS_FROM_DB",
+        "GET_SUBJECT_EDIT_FORM",
+        "GET_SUBJECT_FROM_DB",
+        "GET_SUBJECT_VIEW_FORM",
+        "GET_SUCCESS_TOAST",
+        "GET_TAGS_FROM_DB",
+        "GET_TAG_FROM_DB",
+        "GET_TEACHERS_FROM_DB",
+        "GET_TEACHER_EDIT_FORM",
+        "GET_TEACHER_FROM_DB",
+        "GET_TEACHER_VIEW_FORM",
+        "GET_USER_FROM_DB",
+        "GET_USERS_FROM_DB",
+        "GET_VIEW_VIEW",
+        "GET_WARNING_TOAST",
+        "GET_WIDGET_CHILDREN",
+        "IMAGES_ADDED",
+        "IMAGES_DELETED",
+        "IMAGES_RETRIEVED",
+        "IMAGES_UPDATED",
+        "IMAGE_ADDED",
+        "IMAGE_DELETED",
+        "IMAGE_RETRIEVED",
+        "IMAGE_UPDATED",
+        "LOAD_REHEARSAL_VIEW_FORM",
+        "NOTES_ADDED",
+        "NOTES_DELETED",
+        "NOTES_RETRIEVED",
+        "NOTES_UPDATED",
+        "NOTE_ADDED",
+        "NOTE_DELETED",
+        "NOTE_RETRIEVED",
+        "NOTE_UPDATED",
+        "OPTIONS_ADDED",
+        "OPTIONS_DELETED",
+        "OPTIONS_RETRIEVED",
+        "OPTIONS_UPDATED",
+        "OPTION_ADDED",
+        "OPTION_DELETED",
+        "OPTION_RETRIEVED",
+        "OPTION_UPDATED",
+        "PRIORITIES_ADDED",
+        "PRIORITIES_DELETED",
+        "PRIORITIES_RETRIEVED",
+        "PRIORITIES_UPDATED",
+        "PRIORITY_ADDED",
+        "PRIORITY_DELETED",
+        "PRIORITY_RETRIEVED",
+        "PRIORITY_UPDATED",
+        "QUESTIONS_ADDED",
+        "QUESTIONS_DELETED",
+        "QUESTIONS_RETRIEVED",
+        "QUESTIONS_UPDATED",
+        "QUESTION_ADDED",
+        "QUESTION_DELETED",
+        "QUESTION_RETRIEVED",
+        "QUESTION_UPDATED",
+        "REHEARSAL_ACTIONS_ADDED",
+        "REHEARSAL_ACTIONS_DELETED",
+        "REHEARSAL_ACTIONS_RETRIEVED",
+        "REHEARSAL_ACTIONS_UPDATED",
+        "REHEARSAL_ACTION_ADDED",
+        "REHEARSAL_ACTION_DELETED",
+        "REHEARSAL_ACTION_RETRIEVED",
+        "REHEARSAL_ACTION_UPDATED",
+        "REHEARSAL_RUNS_ADDED",
+        "REHEARSAL_RUNS_DELETED",
+        "REHEARSAL_RUNS_RETRIEVED",
+        "REHEARSAL_RUNS_UPDATED",
+        "REHEARSAL_RUN_ADDED",
+        "REHEARSAL_RUN_DELETED",
+        "REHEARSAL_RUN_INDEX_DECREMENTED",
+        "REHEARSAL_RUN_INDEX_INCREMENTED",
+        "REHEARSAL_RUN_INDEX_MAX_REACHED",
+        "REHEARSAL_RUN_INDEX_MIN_REACHED",
+        "REHEARSAL_RUN_ITEMS_ADDED",
+        "REHEARSAL_RUN_ITEMS_DELETED",
+        "REHEARSAL_RUN_ITEMS_RETRIEVED",
+        "REHEARSAL_RUN_ITEMS_UPDATED",
+        "REHEARSAL_RUN_ITEM_ADDED",
+        "REHEARSAL_RUN_ITEM_DELETED",
+        "REHEARSAL_RUN_ITEM_RETRIEVED",
+        "REHEARSAL_RUN_ITEM_UPDATED",
+        "REHEARSAL_RUN_RETRIEVED",
+        "REHEARSAL_RUN_UPDATED",
+        "RESET_CREATE_FORM",
+        "RESET_OBSERVABLE_MODEL",
+        "SET_CREATE_FORM",
+        "SET_EDIT_FORM",
+        "SET_OBSERVABLE_MODEL",
+        "SET_VIEW_FORM",
+        "STACKS_ADDED",
+        "STACKS_DELETED",
+        "STACKS_RETRIEVED",
+        "STACKS_UPDATED",
+        "STACK_ADDED",
+        "STACK_DELETED",
+        "STACK_RETRIEVED",
+        "STACK_UPDATED",
+        "SUBJECTS_ADDED",
+        "SUBJECTS_DELETED",
+        "SUBJECTS_RETRIEVED",
+        "SUBJECTS_UPDATED",
+        "SUBJECT_ADDED",
+        "SUBJECT_DELETED",
+        "SUBJECT_RETRIEVED",
+        "SUBJECT_UPDATED",
+        "TAGS_ADDED",
+        "TAGS_DELETED",
+        "TAGS_RETRIEVED",
+        "TAGS_UPDATED",
+        "TAG_ADDED",
+        "TAG_DELETED",
+        "TAG_RETRIEVED",
+        "TAG_UPDATED",
+        "TEACHERS_ADDED",
+        "TEACHERS_DELETED",
+        "TEACHERS_RETRIEVED",
+        "TEACHERS_UPDATED",
+        "TEACHER_ADDED",
+        "TEACHER_DELETED",
+        "TEACHER_RETRIEVED",
+        "TEACHER_UPDATED",
+        "UPDATE_ANSWERS_IN_DB",
+        "UPDATE_ANSWER_IN_DB",
+        "UPDATE_ASSOCIATIONS_IN_DB",
+        "UPDATE_ASSOCIATION_IN_DB",
+        "UPDATE_CUSTOMFIELDS_IN_DB",
+        "UPDATE_CUSTOMFIELD_IN_DB",
+        "UPDATE_DIFFICULTIES_IN_DB",
+        "UPDATE_DIFFICULTY_IN_DB",
+        "UPDATE_FLASHCARDS_IN_DB",
+        "UPDATE_FLASHCARD_IN_DB",
+        "UPDATE_IMAGES_IN_DB",
+        "UPDATE_IMAGE_IN_DB",
+        "UPDATE_NOTES_IN_DB",
+        "UPDATE_NOTE_IN_DB",
+        "UPDATE_OBSERVABLE_MODEL",
+        "UPDATE_OPTIONS_IN_DB",
+        "UPDATE_OPTION_IN_DB",
+        "UPDATE_PRIORITIES_IN_DB",
+        "UPDATE_PRIORITY_IN_DB",
+        "UPDATE_QUESTIONS_IN_DB",
+        "UPDATE_QUESTION_IN_DB",
+        "UPDATE_REHEARSAL_RUNS_IN_DB",
+        "UPDATE_REHEARSAL_RUN_IN_DB",
+        "UPDATE_REHEARSAL_RUN_ITEMS_IN_DB",
+        "UPDATE_REHEARSAL_RUN_ITEM_IN_DB",
+        "UPDATE_STACKS_IN_DB",
+        "UPDATE_STACK_IN_DB",
+        "UPDATE_SUBJECTS_IN_DB",
+        "UPDATE_SUBJECT_IN_DB",
+        "UPDATE_TAGS_IN_DB",
+        "UPDATE_TAG_IN_DB",
+        "UPDATE_TEACHERS_IN_DB",
+        "UPDATE_TEACHER_IN_DB",
+        "UPDATE_USERS_IN_DB",
+        "UPDATE_USER_IN_DB",
+        "USERS_ADDED",
+        "USERS_DELETED",
+        "USERS_RETRIEVED",
+        "USERS_UPDATED",
+        "USER_ADDED",
+        "USER_DELETED",
+        "USER_RETRIEVED",
+        "USER_UPDATED",
+        "get_all_events",
+        "get_answer_events",
+        "get_customfield_events",
+        "get_difficulty_events",
+        "get_event_by_name",
+        "get_events_by_names",
+        "get_events_by_prefix",
+        "get_events_by_prefixes",
+        "get_flashcard_events",
+        "get_image_events",
+        "get_note_events",
+        "get_option_events",
+        "get_priority_events",
+        "get_rehearsal_run_events",
+        "get_rehearsal_run_item_events",
+        "get_stack_events",
+        "get_subject_events",
+        "get_tag_events",
+        "get_teacher_events",
+        "get_user_events",
+        "get_utility_events",
+    ),
+    # File constants
+    "studyfrog.constants.files": (
+        "ANSWERS_DB_JSON",
+        "ASSOCIATIONS_DB_JSON",
+        "CONFIG_DB_JSON",
+        "CUSTOMFIELDS_DB_JSON",
+        "DIFFICULTIES_DB_JSON",
+        "DUE_INDEX_DB_JSON",
+        "FLASHCARDS_DB_JSON",
+        "IMAGES_DB_JSON",
+        "NOTES_DB_JSON",
+        "OPTIONS_DB_JSON",
+        "PRIORITIES_DB_JSON",
+        "QUESTIONS_DB_JSON",
+        "REHEARSAL_ACTION_DB_JSON",
+        "REHEARSAL_BUFFER_DB_JSON",
+        "REHEARSAL_RUN_DB_JSON",
+        "REHEARSAL_RUN_ITEM_DB_JSON",
+        "STACKS_DB_JSON",
+        "SUBJECTS_DB_JSON",
+        "TAGS_DB_JSON",
+        "TEACHERS_DB_JSON",
+        "USERS_DB_JSON",
+    ),
+    # GUI constants
+    "studyfrog.constants.gui": (
+        "READONLY",
+        "TOPLEVEL_GEOMETRY",
+        "WINDOW_GEOMETRY",
+        "WINDOW_TITLE",
+    ),
+    # Logging constants
+    "studyfrog.constants.logging": (
+        "CRITICAL_FG",
+        "DEBUG_FG",
+        "ERROR_FG",
+        "INFO_FG",
+        "RESET",
+        "SUCCESS_FG",
+        "TRACE_FG",
+        "WARNING_FG",
+    ),
+    # Namespace constants
+    "studyfrog.constants.namespaces": ("GLOBAL_NAMESPACE",),
+    # Storage constants
+    "studyfrog.constants.storage": (
+        "ANSWERS",
+        "ASSOCIATIONS",
+        "CUSTOMFIELDS",
+        "DIFFICULTIES",
+        "FLASHCARDS",
+        "IMAGES",
+        "NOTES",
+        "OPTIONS",
+        "PRIORITIES",
+        "QUESTIONS",
+        "REHEARSAL_ACTIONS",
+        "REHEARSAL_RUN_ITEMS",
+        "REHEARSAL_RUNS",
+        "STACKS",
+        "SUBJECTS",
+        "TABLE_INDEXES",
+        "TAGS",
+        "TEACHERS",
+        "USERS",
+    ),
+}
 
-# Storage constants
-from studyfrog.constants.storage import (
-    ANSWERS,
-    ASSOCIATIONS,
-    CUSTOMFIELDS,
-    DIFFICULTIES,
-    FLASHCARDS,
-    IMAGES,
-    NOTES,
-    OPTIONS,
-    PRIORITIES,
-    QUESTIONS,
-    REHEARSAL_RUN_ITEMS,
-    REHEARSAL_RUNS,
-    STACKS,
-    SUBJECTS,
-    TAGS,
-    TEACHERS,
-    USERS,
+register_lazy_imports(
+    imports=_LAZY_IMPORTS,
+    package=__name__,
 )
 
 # Export all constants
@@ -664,38 +718,57 @@ __all__: list[str] = [
     "ADD_USER_TO_DB",
     "ALL_ANSWERS_DELETED",
     "ALL_ANSWERS_RETRIEVED",
+    "ANSWERS_PAGE_RETRIEVED",
     "ALL_ASSOCIATIONS_DELETED",
     "ALL_ASSOCIATIONS_RETRIEVED",
     "ALL_CUSTOMFIELDS_DELETED",
     "ALL_CUSTOMFIELDS_RETRIEVED",
+    "CUSTOMFIELDS_PAGE_RETRIEVED",
     "ALL_DIFFICULTIES_DELETED",
     "ALL_DIFFICULTIES_RETRIEVED",
+    "DIFFICULTIES_PAGE_RETRIEVED",
     "ALL_FLASHCARDS_DELETED",
     "ALL_FLASHCARDS_RETRIEVED",
+    "FLASHCARDS_PAGE_RETRIEVED",
     "ALL_IMAGES_DELETED",
     "ALL_IMAGES_RETRIEVED",
+    "IMAGES_PAGE_RETRIEVED",
     "ALL_NOTES_DELETED",
     "ALL_NOTES_RETRIEVED",
+    "NOTES_PAGE_RETRIEVED",
     "ALL_OPTIONS_DELETED",
     "ALL_OPTIONS_RETRIEVED",
+    "OPTIONS_PAGE_RETRIEVED",
     "ALL_PRIORITIES_DELETED",
     "ALL_PRIORITIES_RETRIEVED",
+    "PRIORITIES_PAGE_RETRIEVED",
     "ALL_QUESTIONS_DELETED",
     "ALL_QUESTIONS_RETRIEVED",
+    "QUESTIONS_PAGE_RETRIEVED",
+    "ALL_REHEARSAL_ACTIONS_DELETED",
+    "ALL_REHEARSAL_ACTIONS_RETRIEVED",
+    "REHEARSAL_ACTIONS_PAGE_RETRIEVED",
     "ALL_REHEARSAL_RUNS_DELETED",
     "ALL_REHEARSAL_RUNS_RETRIEVED",
+    "REHEARSAL_RUNS_PAGE_RETRIEVED",
     "ALL_REHEARSAL_RUN_ITEMS_DELETED",
     "ALL_REHEARSAL_RUN_ITEMS_RETRIEVED",
+    "REHEARSAL_RUN_ITEMS_PAGE_RETRIEVED",
     "ALL_STACKS_DELETED",
     "ALL_STACKS_RETRIEVED",
+    "STACKS_PAGE_RETRIEVED",
     "ALL_SUBJECTS_DELETED",
     "ALL_SUBJECTS_RETRIEVED",
+    "SUBJECTS_PAGE_RETRIEVED",
     "ALL_TAGS_DELETED",
     "ALL_TAGS_RETRIEVED",
+    "TAGS_PAGE_RETRIEVED",
     "ALL_TEACHERS_DELETED",
     "ALL_TEACHERS_RETRIEVED",
+    "TEACHERS_PAGE_RETRIEVED",
     "ALL_USERS_DELETED",
     "ALL_USERS_RETRIEVED",
+    "USERS_PAGE_RETRIEVED",
     "ANSWERS_ADDED",
     "ANSWERS_DELETED",
     "ANSWERS_RETRIEVED",
@@ -825,6 +898,7 @@ __all__: list[str] = [
     "DIFFICULTY_DELETED",
     "DIFFICULTY_RETRIEVED",
     "DIFFICULTY_UPDATED",
+    "DUMP_DISPATCH_TRACE",
     "FILTER_ANSWERS_FROM_DB",
     "FILTER_ASSOCIATIONS_FROM_DB",
     "FILTER_CUSTOMFIELDS_FROM_DB",
@@ -851,22 +925,38 @@ __all__: list[str] = [
     "FLASHCARD_RETRIEVED",
     "FLASHCARD_UPDATED",
     "GET_ALL_ANSWERS_FROM_DB",
+    "GET_PAGE_OF_ANSWERS_FROM_DB",
     "GET_ALL_ASSOCIATIONS_FROM_DB",
     "GET_ALL_CUSTOMFIELDS_FROM_DB",
+    "GET_PAGE_OF_CUSTOMFIELDS_FROM_DB",
     "GET_ALL_DIFFICULTIES_FROM_DB",
+    "GET_PAGE_OF_DIFFICULTIES_FROM_DB",
     "GET_ALL_FLASHCARDS_FROM_DB",
+    "GET_PAGE_OF_FLASHCARDS_FROM_DB",
     "GET_ALL_IMAGES_FROM_DB",
+    "GET_PAGE_OF_IMAGES_FROM_DB",
     "GET_ALL_NOTES_FROM_DB",
+    "GET_PAGE_OF_NOTES_FROM_DB",
     "GET_ALL_OPTIONS_FROM_DB",
+    "GET_PAGE_OF_OPTIONS_FROM_DB",
     "GET_ALL_PRIORITIES_FROM_DB",
+    "GET_PAGE_OF_PRIORITIES_FROM_DB",
     "GET_ALL_QUESTIONS_FROM_DB",
+    "GET_PAGE_OF_QUESTIONS_FROM_DB",
     "GET_ALL_REHEARSAL_RUNS_FROM_DB",
+    "GET_PAGE_OF_REHEARSAL_RUNS_FROM_DB",
     "GET_ALL_REHEARSAL_RUN_ITEMS_FROM_DB",
+    "GET_PAGE_OF_REHEARSAL_RUN_ITEMS_FROM_DB",
     "GET_ALL_STACKS_FROM_DB",
+    "GET_PAGE_OF_STACKS_FROM_DB",
     "GET_ALL_SUBJECTS_FROM_DB",
+    "GET_PAGE_OF_SUBJECTS_FROM_DB",
     "GET_ALL_TAGS_FROM_DB",
+    "GET_PAGE_OF_TAGS_FROM_DB",
     "GET_ALL_TEACHERS_FROM_DB",
+    "GET_PAGE_OF_TEACHERS_FROM_DB",
     "GET_ALL_USERS_FROM_DB",
+    "GET_PAGE_OF_USERS_FROM_DB",
     "GET_ANSWER_CHOICE_CREATE_FORM",
     "GET_ANSWER_CREATE_FORM",
     "GET_ANSWERS_FROM_DB",
@@ -994,6 +1084,14 @@ __all__: list[str] = [
     "QUESTION_DELETED",
     "QUESTION_RETRIEVED",
     "QUESTION_UPDATED",
+    "REHEARSAL_ACTIONS_ADDED",
+    "REHEARSAL_ACTIONS_DELETED",
+    "REHEARSAL_ACTIONS_RETRIEVED",
+    "REHEARSAL_ACTIONS_UPDATED",
+    "REHEARSAL_ACTION_ADDED",
+    "REHEARSAL_ACTION_DELETED",
+    "REHEARSAL_ACTION_RETRIEVED",
+    "REHEARSAL_ACTION_UPDATED",
     "REHEARSAL_RUNS_ADDED",
     "REHEARSAL_RUNS_DELETED",
     "REHEARSAL_RUNS_RETRIEVED",
@@ -1122,12 +1220,15 @@ __all__: list[str] = [
     "CONFIG_DB_JSON",
     "CUSTOMFIELDS_DB_JSON",
     "DIFFICULTIES_DB_JSON",
+    "DUE_INDEX_DB_JSON",
     "FLASHCARDS_DB_JSON",
     "IMAGES_DB_JSON",
     "NOTES_DB_JSON",
     "OPTIONS_DB_JSON",
     "PRIORITIES_DB_JSON",
     "QUESTIONS_DB_JSON",
+    "REHEARSAL_ACTION_DB_JSON",
+    "REHEARSAL_BUFFER_DB_JSON",
     "REHEARSAL_RUN_DB_JSON",
     "REHEARSAL_RUN_ITEM_DB_JSON",
     "STACKS_DB_JSON",
@@ -1162,11 +1263,24 @@ __all__: list[str] = [
     "OPTIONS",
     "PRIORITIES",
     "QUESTIONS",
+    "REHEARSAL_ACTIONS",
     "REHEARSAL_RUN_ITEMS",
     "REHEARSAL_RUNS",
     "STACKS",
     "SUBJECTS",
+    "TABLE_INDEXES",
     "TAGS",
     "TEACHERS",
     "USERS",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return get_lazy_attribute(
+        name=name,
+        package=__name__,
+    )
+
+
+def __dir__() -> list[str]:
+    return get_lazy_attribute_names(package=__name__)
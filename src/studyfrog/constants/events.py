@@ -48,38 +48,57 @@ __all__: Final[list[str]] = [
     "ADD_USER_TO_DB",
     "ALL_ANSWERS_DELETED",
     "ALL_ANSWERS_RETRIEVED",
+    "ANSWERS_PAGE_RETRIEVED",
     "ALL_ASSOCIATIONS_DELETED",
     "ALL_ASSOCIATIONS_RETRIEVED",
     "ALL_CUSTOMFIELDS_DELETED",
     "ALL_CUSTOMFIELDS_RETRIEVED",
+    "CUSTOMFIELDS_PAGE_RETRIEVED",
     "ALL_DIFFICULTIES_DELETED",
     "ALL_DIFFICULTIES_RETRIEVED",
+    "DIFFICULTIES_PAGE_RETRIEVED",
     "ALL_FLASHCARDS_DELETED",
     "ALL_FLASHCARDS_RETRIEVED",
+    "FLASHCARDS_PAGE_RETRIEVED",
     "ALL_IMAGES_DELETED",
     "ALL_IMAGES_RETRIEVED",
+    "IMAGES_PAGE_RETRIEVED",
     "ALL_NOTES_DELETED",
     "ALL_NOTES_RETRIEVED",
+    "NOTES_PAGE_RETRIEVED",
     "ALL_OPTIONS_DELETED",
     "ALL_OPTIONS_RETRIEVED",
+    "OPTIONS_PAGE_RETRIEVED",
     "ALL_PRIORITIES_DELETED",
     "ALL_PRIORITIES_RETRIEVED",
+    "PRIORITIES_PAGE_RETRIEVED",
     "ALL_QUESTIONS_DELETED",
     "ALL_QUESTIONS_RETRIEVED",
+    "QUESTIONS_PAGE_RETRIEVED",
+    "ALL_REHEARSAL_ACTIONS_DELETED",
+    "ALL_REHEARSAL_ACTIONS_RETRIEVED",
+    "REHEARSAL_ACTIONS_PAGE_RETRIEVED",
     "ALL_REHEARSAL_RUNS_DELETED",
     "ALL_REHEARSAL_RUNS_RETRIEVED",
+    "REHEARSAL_RUNS_PAGE_RETRIEVED",
     "ALL_REHEARSAL_RUN_ITEMS_DELETED",
     "ALL_REHEARSAL_RUN_ITEMS_RETRIEVED",
+    "REHEARSAL_RUN_ITEMS_PAGE_RETRIEVED",
     "ALL_STACKS_DELETED",
     "ALL_STACKS_RETRIEVED",
+    "STACKS_PAGE_RETRIEVED",
     "ALL_SUBJECTS_DELETED",
     "ALL_SUBJECTS_RETRIEVED",
+    "SUBJECTS_PAGE_RETRIEVED",
     "ALL_TAGS_DELETED",
     "ALL_TAGS_RETRIEVED",
+    "TAGS_PAGE_RETRIEVED",
     "ALL_TEACHERS_DELETED",
     "ALL_TEACHERS_RETRIEVED",
+    "TEACHERS_PAGE_RETRIEVED",
     "ALL_USERS_DELETED",
     "ALL_USERS_RETRIEVED",
+    "USERS_PAGE_RETRIEVED",
     "ANSWERS_ADDED",
     "ANSWERS_DELETED",
     "ANSWERS_RETRIEVED",
@@ -209,6 +228,7 @@ __all__: Final[list[str]] = [
     "DIFFICULTY_DELETED",
     "DIFFICULTY_RETRIEVED",
     "DIFFICULTY_UPDATED",
+    "DUMP_DISPATCH_TRACE",
     "FILTER_ANSWERS_FROM_DB",
     "FILTER_ASSOCIATIONS_FROM_DB",
     "FILTER_CUSTOMFIELDS_FROM_DB",
@@ -235,22 +255,38 @@ __all__: Final[list[str]] = [
     "FLASHCARD_RETRIEVED",
     "FLASHCARD_UPDATED",
     "GET_ALL_ANSWERS_FROM_DB",
+    "GET_PAGE_OF_ANSWERS_FROM_DB",
     "GET_ALL_ASSOCIATIONS_FROM_DB",
     "GET_ALL_CUSTOMFIELDS_FROM_DB",
+    "GET_PAGE_OF_CUSTOMFIELDS_FROM_DB",
     "GET_ALL_DIFFICULTIES_FROM_DB",
+    "GET_PAGE_OF_DIFFICULTIES_FROM_DB",
     "GET_ALL_FLASHCARDS_FROM_DB",
+    "GET_PAGE_OF_FLASHCARDS_FROM_DB",
     "GET_ALL_IMAGES_FROM_DB",
+    "GET_PAGE_OF_IMAGES_FROM_DB",
     "GET_ALL_NOTES_FROM_DB",
+    "GET_PAGE_OF_NOTES_FROM_DB",
     "GET_ALL_OPTIONS_FROM_DB",
+    "GET_PAGE_OF_OPTIONS_FROM_DB",
     "GET_ALL_PRIORITIES_FROM_DB",
+    "GET_PAGE_OF_PRIORITIES_FROM_DB",
     "GET_ALL_QUESTIONS_FROM_DB",
+    "GET_PAGE_OF_QUESTIONS_FROM_DB",
     "GET_ALL_REHEARSAL_RUNS_FROM_DB",
+    "GET_PAGE_OF_REHEARSAL_RUNS_FROM_DB",
     "GET_ALL_REHEARSAL_RUN_ITEMS_FROM_DB",
+    "GET_PAGE_OF_REHEARSAL_RUN_ITEMS_FROM_DB",
     "GET_ALL_STACKS_FROM_DB",
+    "GET_PAGE_OF_STACKS_FROM_DB",
     "GET_ALL_SUBJECTS_FROM_DB",
+    "GET_PAGE_OF_SUBJECTS_FROM_DB",
     "GET_ALL_TAGS_FROM_DB",
+    "GET_PAGE_OF_TAGS_FROM_DB",
     "GET_ALL_TEACHERS_FROM_DB",
+    "GET_PAGE_OF_TEACHERS_FROM_DB",
     "GET_ALL_USERS_FROM_DB",
+    "GET_PAGE_OF_USERS_FROM_DB",
     "GET_ANSWER_CHOICE_CREATE_FORM",
     "GET_ANSWER_CREATE_FORM",
     "GET_ANSWERS_FROM_DB",
@@ -378,6 +414,14 @@ __all__: Final[list[str]] = [
     "QUESTION_DELETED",
     "QUESTION_RETRIEVED",
     "QUESTION_UPDATED",
+    "REHEARSAL_ACTIONS_ADDED",
+    "REHEARSAL_ACTIONS_DELETED",
+    "REHEARSAL_ACTIONS_RETRIEVED",
+    "REHEARSAL_ACTIONS_UPDATED",
+    "REHEARSAL_ACTION_ADDED",
+    "REHEARSAL_ACTION_DELETED",
+    "REHEARSAL_ACTION_RETRIEVED",
+    "REHEARSAL_ACTION_UPDATED",
     "REHEARSAL_RUNS_ADDED",
     "REHEARSAL_RUNS_DELETED",
     "REHEARSAL_RUNS_RETRIEVED",
@@ -512,6 +556,7 @@ GET_ANSWER_FROM_DB: Final[str] = "broadcast:request:get_answer_from_db"
 GET_ANSWER_MODEL: Final[str] = "broadcast:request:get_answer_model"
 GET_ANSWERS_FROM_DB: Final[str] = "broadcast:request:get_answers_from_db"
 GET_ALL_ANSWERS_FROM_DB: Final[str] = "broadcast:request:get_all_answers_from_db"
+GET_PAGE_OF_ANSWERS_FROM_DB: Final[str] = "broadcast:request:get_page_of_answers_from_db"
 DELETE_ANSWER_FROM_DB: Final[str] = "broadcast:request:delete_answer_from_db"
 DELETE_ANSWERS_FROM_DB: Final[str] = "broadcast:request:delete_answers_from_db"
 DELETE_ALL_ANSWERS_FROM_DB: Final[str] = "broadcast:request:delete_all_answers_from_db"
@@ -525,6 +570,7 @@ ALL_ANSWERS_DELETED: Final[str] = "broadcast:notification:all_answers_deleted"
 ANSWER_RETRIEVED: Final[str] = "broadcast:notification:answer_retrieved"
 ANSWERS_RETRIEVED: Final[str] = "broadcast:notification:answers_retrieved"
 ALL_ANSWERS_RETRIEVED: Final[str] = "broadcast:notification:all_answers_retrieved"
+ANSWERS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:answers_page_retrieved"
 ANSWER_UPDATED: Final[str] = "broadcast:notification:answer_updated"
 ANSWERS_UPDATED: Final[str] = "broadcast:notification:answers_updated"
 
@@ -557,6 +603,7 @@ FILTER_CUSTOMFIELDS_FROM_DB: Final[str] = "broadcast:request:filter_customfields
 GET_CUSTOMFIELD_FROM_DB: Final[str] = "broadcast:request:get_customfield_from_db"
 GET_CUSTOMFIELDS_FROM_DB: Final[str] = "broadcast:request:get_customfields_from_db"
 GET_ALL_CUSTOMFIELDS_FROM_DB: Final[str] = "broadcast:request:get_all_customfields_from_db"
+GET_PAGE_OF_CUSTOMFIELDS_FROM_DB: Final[str] = "broadcast:request:get_page_of_customfields_from_db"
 DELETE_CUSTOMFIELD_FROM_DB: Final[str] = "broadcast:request:delete_customfield_from_db"
 DELETE_CUSTOMFIELDS_FROM_DB: Final[str] = "broadcast:request:delete_customfields_from_db"
 DELETE_ALL_CUSTOMFIELDS_FROM_DB: Final[str] = "broadcast:request:delete_all_customfields_from_db"
@@ -570,6 +617,7 @@ ALL_CUSTOMFIELDS_DELETED: Final[str] = "broadcast:notification:all_customfields_
 CUSTOMFIELD_RETRIEVED: Final[str] = "broadcast:notification:customfield_retrieved"
 CUSTOMFIELDS_RETRIEVED: Final[str] = "broadcast:notification:customfields_retrieved"
 ALL_CUSTOMFIELDS_RETRIEVED: Final[str] = "broadcast:notification:all_customfields_retrieved"
+CUSTOMFIELDS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:customfields_page_retrieved"
 CUSTOMFIELD_UPDATED: Final[str] = "broadcast:notification:customfield_updated"
 CUSTOMFIELDS_UPDATED: Final[str] = "broadcast:notification:customfields_updated"
 
@@ -579,6 +627,7 @@ FILTER_DIFFICULTIES_FROM_DB: Final[str] = "broadcast:request:filter_difficulties
 GET_DIFFICULTY_FROM_DB: Final[str] = "broadcast:request:get_difficulty_from_db"
 GET_DIFFICULTIES_FROM_DB: Final[str] = "broadcast:request:get_difficulties_from_db"
 GET_ALL_DIFFICULTIES_FROM_DB: Final[str] = "broadcast:request:get_all_difficulties_from_db"
+GET_PAGE_OF_DIFFICULTIES_FROM_DB: Final[str] = "broadcast:request:get_page_of_difficulties_from_db"
 DELETE_DIFFICULTY_FROM_DB: Final[str] = "broadcast:request:delete_difficulty_from_db"
 DELETE_DIFFICULTIES_FROM_DB: Final[str] = "broadcast:request:delete_difficulties_from_db"
 DELETE_ALL_DIFFICULTIES_FROM_DB: Final[str] = "broadcast:request:delete_all_difficulties_from_db"
@@ -592,6 +641,7 @@ ALL_DIFFICULTIES_DELETED: Final[str] = "broadcast:notification:all_difficulties_
 DIFFICULTY_RETRIEVED: Final[str] = "broadcast:notification:difficulty_retrieved"
 DIFFICULTIES_RETRIEVED: Final[str] = "broadcast:notification:difficulties_retrieved"
 ALL_DIFFICULTIES_RETRIEVED: Final[str] = "broadcast:notification:all_difficulties_retrieved"
+DIFFICULTIES_PAGE_RETRIEVED: Final[str] = "broadcast:notification:difficulties_page_retrieved"
 DIFFICULTY_UPDATED: Final[str] = "broadcast:notification:difficulty_updated"
 DIFFICULTIES_UPDATED: Final[str] = "broadcast:notification:difficulties_updated"
 
@@ -602,6 +652,7 @@ GET_FLASHCARD_FROM_DB: Final[str] = "broadcast:request:get_flashcard_from_db"
 GET_FLASHCARD_MODEL: Final[str] = "broadcast:request:get_flashcard_model"
 GET_FLASHCARDS_FROM_DB: Final[str] = "broadcast:request:get_flashcards_from_db"
 GET_ALL_FLASHCARDS_FROM_DB: Final[str] = "broadcast:request:get_all_flashcards_from_db"
+GET_PAGE_OF_FLASHCARDS_FROM_DB: Final[str] = "broadcast:request:get_page_of_flashcards_from_db"
 DELETE_FLASHCARD_FROM_DB: Final[str] = "broadcast:request:delete_flashcard_from_db"
 DELETE_FLASHCARDS_FROM_DB: Final[str] = "broadcast:request:delete_flashcards_from_db"
 DELETE_ALL_FLASHCARDS_FROM_DB: Final[str] = "broadcast:request:delete_all_flashcards_from_db"
@@ -615,6 +666,7 @@ ALL_FLASHCARDS_DELETED: Final[str] = "broadcast:notification:all_flashcards_dele
 FLASHCARD_RETRIEVED: Final[str] = "broadcast:notification:flashcard_retrieved"
 FLASHCARDS_RETRIEVED: Final[str] = "broadcast:notification:flashcards_retrieved"
 ALL_FLASHCARDS_RETRIEVED: Final[str] = "broadcast:notification:all_flashcards_retrieved"
+FLASHCARDS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:flashcards_page_retrieved"
 FLASHCARD_UPDATED: Final[str] = "broadcast:notification:flashcard_updated"
 FLASHCARDS_UPDATED: Final[str] = "broadcast:notification:flashcards_updated"
 
@@ -624,6 +676,7 @@ FILTER_IMAGES_FROM_DB: Final[str] = "broadcast:request:filter_images_from_db"
 GET_IMAGE_FROM_DB: Final[str] = "broadcast:request:get_image_from_db"
 GET_IMAGES_FROM_DB: Final[str] = "broadcast:request:get_images_from_db"
 GET_ALL_IMAGES_FROM_DB: Final[str] = "broadcast:request:get_all_images_from_db"
+GET_PAGE_OF_IMAGES_FROM_DB: Final[str] = "broadcast:request:get_page_of_images_from_db"
 DELETE_IMAGE_FROM_DB: Final[str] = "broadcast:request:delete_image_from_db"
 DELETE_IMAGES_FROM_DB: Final[str] = "broadcast:request:delete_images_from_db"
 DELETE_ALL_IMAGES_FROM_DB: Final[str] = "broadcast:request:delete_all_images_from_db"
@@ -637,6 +690,7 @@ ALL_IMAGES_DELETED: Final[str] = "broadcast:notification:all_images_deleted"
 IMAGE_RETRIEVED: Final[str] = "broadcast:notification:image_retrieved"
 IMAGES_RETRIEVED: Final[str] = "broadcast:notification:images_retrieved"
 ALL_IMAGES_RETRIEVED: Final[str] = "broadcast:notification:all_images_retrieved"
+IMAGES_PAGE_RETRIEVED: Final[str] = "broadcast:notification:images_page_retrieved"
 IMAGE_UPDATED: Final[str] = "broadcast:notification:image_updated"
 IMAGES_UPDATED: Final[str] = "broadcast:notification:images_updated"
 
@@ -647,6 +701,7 @@ GET_NOTE_FROM_DB: Final[str] = "broadcast:request:get_note_from_db"
 GET_NOTE_MODEL: Final[str] = "broadcast:request:get_note_model"
 GET_NOTES_FROM_DB: Final[str] = "broadcast:request:get_notes_from_db"
 GET_ALL_NOTES_FROM_DB: Final[str] = "broadcast:request:get_all_notes_from_db"
+GET_PAGE_OF_NOTES_FROM_DB: Final[str] = "broadcast:request:get_page_of_notes_from_db"
 DELETE_NOTE_FROM_DB: Final[str] = "broadcast:request:delete_note_from_db"
 DELETE_NOTES_FROM_DB: Final[str] = "broadcast:request:delete_notes_from_db"
 DELETE_ALL_NOTES_FROM_DB: Final[str] = "broadcast:request:delete_all_notes_from_db"
@@ -660,6 +715,7 @@ ALL_NOTES_DELETED: Final[str] = "broadcast:notification:all_notes_deleted"
 NOTE_RETRIEVED: Final[str] = "broadcast:notification:note_retrieved"
 NOTES_RETRIEVED: Final[str] = "broadcast:notification:notes_retrieved"
 ALL_NOTES_RETRIEVED: Final[str] = "broadcast:notification:all_notes_retrieved"
+NOTES_PAGE_RETRIEVED: Final[str] = "broadcast:notification:notes_page_retrieved"
 NOTE_UPDATED: Final[str] = "broadcast:notification:note_updated"
 NOTES_UPDATED: Final[str] = "broadcast:notification:notes_updated"
 
@@ -669,6 +725,7 @@ FILTER_OPTIONS_FROM_DB: Final[str] = "broadcast:request:filter_options_from_db"
 GET_OPTION_FROM_DB: Final[str] = "broadcast:request:get_option_from_db"
 GET_OPTIONS_FROM_DB: Final[str] = "broadcast:request:get_options_from_db"
 GET_ALL_OPTIONS_FROM_DB: Final[str] = "broadcast:request:get_all_options_from_db"
+GET_PAGE_OF_OPTIONS_FROM_DB: Final[str] = "broadcast:request:get_page_of_options_from_db"
 DELETE_OPTION_FROM_DB: Final[str] = "broadcast:request:delete_option_from_db"
 DELETE_OPTIONS_FROM_DB: Final[str] = "broadcast:request:delete_options_from_db"
 DELETE_ALL_OPTIONS_FROM_DB: Final[str] = "broadcast:request:delete_all_options_from_db"
@@ -682,6 +739,7 @@ ALL_OPTIONS_DELETED: Final[str] = "broadcast:notification:all_options_deleted"
 OPTION_RETRIEVED: Final[str] = "broadcast:notification:option_retrieved"
 OPTIONS_RETRIEVED: Final[str] = "broadcast:notification:options_retrieved"
 ALL_OPTIONS_RETRIEVED: Final[str] = "broadcast:notification:all_options_retrieved"
+OPTIONS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:options_page_retrieved"
 OPTION_UPDATED: Final[str] = "broadcast:notification:option_updated"
 OPTIONS_UPDATED: Final[str] = "broadcast:notification:options_updated"
 
@@ -691,6 +749,7 @@ FILTER_PRIORITIES_FROM_DB: Final[str] = "broadcast:request:filter_priorities_fro
 GET_PRIORITY_FROM_DB: Final[str] = "broadcast:request:get_priority_from_db"
 GET_PRIORITIES_FROM_DB: Final[str] = "broadcast:request:get_priorities_from_db"
 GET_ALL_PRIORITIES_FROM_DB: Final[str] = "broadcast:request:get_all_priorities_from_db"
+GET_PAGE_OF_PRIORITIES_FROM_DB: Final[str] = "broadcast:request:get_page_of_priorities_from_db"
 DELETE_PRIORITY_FROM_DB: Final[str] = "broadcast:request:delete_priority_from_db"
 DELETE_PRIORITIES_FROM_DB: Final[str] = "broadcast:request:delete_priorities_from_db"
 DELETE_ALL_PRIORITIES_FROM_DB: Final[str] = "broadcast:request:delete_all_priorities_from_db"
@@ -704,6 +763,7 @@ ALL_PRIORITIES_DELETED: Final[str] = "broadcast:notification:all_priorities_dele
 PRIORITY_RETRIEVED: Final[str] = "broadcast:notification:priority_retrieved"
 PRIORITIES_RETRIEVED: Final[str] = "broadcast:notification:priorities_retrieved"
 ALL_PRIORITIES_RETRIEVED: Final[str] = "broadcast:notification:all_priorities_retrieved"
+PRIORITIES_PAGE_RETRIEVED: Final[str] = "broadcast:notification:priorities_page_retrieved"
 PRIORITY_UPDATED: Final[str] = "broadcast:notification:priority_updated"
 PRIORITIES_UPDATED: Final[str] = "broadcast:notification:priorities_updated"
 
@@ -714,6 +774,7 @@ GET_QUESTION_FROM_DB: Final[str] = "broadcast:request:get_question_from_db"
 GET_QUESTION_MODEL: Final[str] = "broadcast:request:get_question_model"
 GET_QUESTIONS_FROM_DB: Final[str] = "broadcast:request:get_questions_from_db"
 GET_ALL_QUESTIONS_FROM_DB: Final[str] = "broadcast:request:get_all_questions_from_db"
+GET_PAGE_OF_QUESTIONS_FROM_DB: Final[str] = "broadcast:request:get_page_of_questions_from_db"
 DELETE_QUESTION_FROM_DB: Final[str] = "broadcast:request:delete_question_from_db"
 DELETE_QUESTIONS_FROM_DB: Final[str] = "broadcast:request:delete_questions_from_db"
 DELETE_ALL_QUESTIONS_FROM_DB: Final[str] = "broadcast:request:delete_all_questions_from_db"
@@ -727,15 +788,35 @@ ALL_QUESTIONS_DELETED: Final[str] = "broadcast:notification:all_questions_delete
 QUESTION_RETRIEVED: Final[str] = "broadcast:notification:question_retrieved"
 QUESTIONS_RETRIEVED: Final[str] = "broadcast:notification:questions_retrieved"
 ALL_QUESTIONS_RETRIEVED: Final[str] = "broadcast:notification:all_questions_retrieved"
+QUESTIONS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:questions_page_retrieved"
 QUESTION_UPDATED: Final[str] = "broadcast:notification:question_updated"
 QUESTIONS_UPDATED: Final[str] = "broadcast:notification:questions_updated"
 
+REHEARSAL_ACTION_ADDED: Final[str] = "broadcast:notification:rehearsal_action_added"
+REHEARSAL_ACTIONS_ADDED: Final[str] = "broadcast:notification:rehearsal_actions_added"
+REHEARSAL_ACTION_DELETED: Final[str] = "broadcast:notification:rehearsal_action_deleted"
+REHEARSAL_ACTIONS_DELETED: Final[str] = "broadcast:notification:rehearsal_actions_deleted"
+ALL_REHEARSAL_ACTIONS_DELETED: Final[str] = "broadcast:notification:all_rehearsal_actions_deleted"
+REHEARSAL_ACTION_RETRIEVED: Final[str] = "broadcast:notification:rehearsal_action_retrieved"
+REHEARSAL_ACTIONS_RETRIEVED: Final[str] = "broadcast:notification:rehearsal_actions_retrieved"
+ALL_REHEARSAL_ACTIONS_RETRIEVED: Final[str] = (
+    "broadcast:notification:all_rehearsal_actions_retrieved"
+)
+REHEARSAL_ACTIONS_PAGE_RETRIEVED: Final[str] = (
+    "broadcast:notification:rehearsal_actions_page_retrieved"
+)
+REHEARSAL_ACTION_UPDATED: Final[str] = "broadcast:notification:rehearsal_action_updated"
+REHEARSAL_ACTIONS_UPDATED: Final[str] = "broadcast:notification:rehearsal_actions_updated"
+
 ADD_REHEARSAL_RUN_TO_DB: Final[str] = "broadcast:request:add_rehearsal_run_to_db"
 ADD_REHEARSAL_RUNS_TO_DB: Final[str] = "broadcast:request:add_rehearsal_runs_to_db"
 FILTER_REHEARSAL_RUNS_FROM_DB: Final[str] = "broadcast:request:filter_rehearsal_runs_from_db"
 GET_REHEARSAL_RUN_FROM_DB: Final[str] = "broadcast:request:get_rehearsal_run_from_db"
 GET_REHEARSAL_RUNS_FROM_DB: Final[str] = "broadcast:request:get_rehearsal_runs_from_db"
 GET_ALL_REHEARSAL_RUNS_FROM_DB: Final[str] = "broadcast:request:get_all_rehearsal_runs_from_db"
+GET_PAGE_OF_REHEARSAL_RUNS_FROM_DB: Final[str] = (
+    "broadcast:request:get_page_of_rehearsal_runs_from_db"
+)
 DELETE_REHEARSAL_RUN_FROM_DB: Final[str] = "broadcast:request:delete_rehearsal_run_from_db"
 DELETE_REHEARSAL_RUNS_FROM_DB: Final[str] = "broadcast:request:delete_rehearsal_runs_from_db"
 DELETE_ALL_REHEARSAL_RUNS_FROM_DB: Final[str] = (
@@ -751,6 +832,7 @@ ALL_REHEARSAL_RUNS_DELETED: Final[str] = "broadcast:notification:all_rehearsal_r
 REHEARSAL_RUN_RETRIEVED: Final[str] = "broadcast:notification:rehearsal_run_retrieved"
 REHEARSAL_RUNS_RETRIEVED: Final[str] = "broadcast:notification:rehearsal_runs_retrieved"
 ALL_REHEARSAL_RUNS_RETRIEVED: Final[str] = "broadcast:notification:all_rehearsal_runs_retrieved"
+REHEARSAL_RUNS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:rehearsal_runs_page_retrieved"
 REHEARSAL_RUN_UPDATED: Final[str] = "broadcast:notification:rehearsal_run_updated"
 REHEARSAL_RUNS_UPDATED: Final[str] = "broadcast:notification:rehearsal_runs_updated"
 
@@ -764,6 +846,9 @@ GET_REHEARSAL_RUN_ITEMS_FROM_DB: Final[str] = "broadcast:request:get_rehearsal_r
 GET_ALL_REHEARSAL_RUN_ITEMS_FROM_DB: Final[str] = (
     "broadcast:request:get_all_rehearsal_run_items_from_db"
 )
+GET_PAGE_OF_REHEARSAL_RUN_ITEMS_FROM_DB: Final[str] = (
+    "broadcast:request:get_page_of_rehearsal_run_items_from_db"
+)
 DELETE_REHEARSAL_RUN_ITEM_FROM_DB: Final[str] = (
     "broadcast:request:delete_rehearsal_run_item_from_db"
 )
@@ -789,6 +874,9 @@ REHEARSAL_RUN_ITEMS_RETRIEVED: Final[str] = "broadcast:notification:rehearsal_ru
 ALL_REHEARSAL_RUN_ITEMS_RETRIEVED: Final[str] = (
     "broadcast:notification:all_rehearsal_run_items_retrieved"
 )
+REHEARSAL_RUN_ITEMS_PAGE_RETRIEVED: Final[str] = (
+    "broadcast:notification:rehearsal_run_items_page_retrieved"
+)
 REHEARSAL_RUN_ITEM_UPDATED: Final[str] = "broadcast:notification:rehearsal_run_item_updated"
 REHEARSAL_RUN_ITEMS_UPDATED: Final[str] = "broadcast:notification:rehearsal_run_items_updated"
 
@@ -799,6 +887,7 @@ GET_STACK_FROM_DB: Final[str] = "broadcast:request:get_stack_from_db"
 GET_STACK_MODEL: Final[str] = "broadcast:request:get_stack_model"
 GET_STACKS_FROM_DB: Final[str] = "broadcast:request:get_stacks_from_db"
 GET_ALL_STACKS_FROM_DB: Final[str] = "broadcast:request:get_all_stacks_from_db"
+GET_PAGE_OF_STACKS_FROM_DB: Final[str] = "broadcast:request:get_page_of_stacks_from_db"
 DELETE_STACK_FROM_DB: Final[str] = "broadcast:request:delete_stack_from_db"
 DELETE_STACKS_FROM_DB: Final[str] = "broadcast:request:delete_stacks_from_db"
 DELETE_ALL_STACKS_FROM_DB: Final[str] = "broadcast:request:delete_all_stacks_from_db"
@@ -812,6 +901,7 @@ ALL_STACKS_DELETED: Final[str] = "broadcast:notification:all_stacks_deleted"
 STACK_RETRIEVED: Final[str] = "broadcast:notification:stack_retrieved"
 STACKS_RETRIEVED: Final[str] = "broadcast:notification:stacks_retrieved"
 ALL_STACKS_RETRIEVED: Final[str] = "broadcast:notification:all_stacks_retrieved"
+STACKS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:stacks_page_retrieved"
 STACK_UPDATED: Final[str] = "broadcast:notification:stack_updated"
 STACKS_UPDATED: Final[str] = "broadcast:notification:stacks_updated"
 
@@ -821,6 +911,7 @@ FILTER_SUBJECTS_FROM_DB: Final[str] = "broadcast:request:filter_subjects_from_db
 GET_SUBJECT_FROM_DB: Final[str] = "broadcast:request:get_subject_from_db"
 GET_SUBJECTS_FROM_DB: Final[str] = "broadcast:request:get_subjects_from_db"
 GET_ALL_SUBJECTS_FROM_DB: Final[str] = "broadcast:request:get_all_subjects_from_db"
+GET_PAGE_OF_SUBJECTS_FROM_DB: Final[str] = "broadcast:request:get_page_of_subjects_from_db"
 DELETE_SUBJECT_FROM_DB: Final[str] = "broadcast:request:delete_subject_from_db"
 DELETE_SUBJECTS_FROM_DB: Final[str] = "broadcast:request:delete_subjects_from_db"
 DELETE_ALL_SUBJECTS_FROM_DB: Final[str] = "broadcast:request:delete_all_subjects_from_db"
@@ -834,6 +925,7 @@ ALL_SUBJECTS_DELETED: Final[str] = "broadcast:notification:all_subjects_deleted"
 SUBJECT_RETRIEVED: Final[str] = "broadcast:notification:subject_retrieved"
 SUBJECTS_RETRIEVED: Final[str] = "broadcast:notification:subjects_retrieved"
 ALL_SUBJECTS_RETRIEVED: Final[str] = "broadcast:notification:all_subjects_retrieved"
+SUBJECTS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:subjects_page_retrieved"
 SUBJECT_UPDATED: Final[str] = "broadcast:notification:subject_updated"
 SUBJECTS_UPDATED: Final[str] = "broadcast:notification:subjects_updated"
 
@@ -843,6 +935,7 @@ FILTER_TAGS_FROM_DB: Final[str] = "broadcast:request:filter_tags_from_db"
 GET_TAG_FROM_DB: Final[str] = "broadcast:request:get_tag_from_db"
 GET_TAGS_FROM_DB: Final[str] = "broadcast:request:get_tags_from_db"
 GET_ALL_TAGS_FROM_DB: Final[str] = "broadcast:request:get_all_tags_from_db"
+GET_PAGE_OF_TAGS_FROM_DB: Final[str] = "broadcast:request:get_page_of_tags_from_db"
 DELETE_TAG_FROM_DB: Final[str] = "broadcast:request:delete_tag_from_db"
 DELETE_TAGS_FROM_DB: Final[str] = "broadcast:request:delete_tags_from_db"
 DELETE_ALL_TAGS_FROM_DB: Final[str] = "broadcast:request:delete_all_tags_from_db"
@@ -856,6 +949,7 @@ ALL_TAGS_DELETED: Final[str] = "broadcast:notification:all_tags_deleted"
 TAG_RETRIEVED: Final[str] = "broadcast:notification:tag_retrieved"
 TAGS_RETRIEVED: Final[str] = "broadcast:notification:tags_retrieved"
 ALL_TAGS_RETRIEVED: Final[str] = "broadcast:notification:all_tags_retrieved"
+TAGS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:tags_page_retrieved"
 TAG_UPDATED: Final[str] = "broadcast:notification:tag_updated"
 TAGS_UPDATED: Final[str] = "broadcast:notification:tags_updated"
 
@@ -865,6 +959,7 @@ FILTER_TEACHERS_FROM_DB: Final[str] = "broadcast:request:filter_teachers_from_db
 GET_TEACHER_FROM_DB: Final[str] = "broadcast:request:get_teacher_from_db"
 GET_TEACHERS_FROM_DB: Final[str] = "broadcast:request:get_teachers_from_db"
 GET_ALL_TEACHERS_FROM_DB: Final[str] = "broadcast:request:get_all_teachers_from_db"
+GET_PAGE_OF_TEACHERS_FROM_DB: Final[str] = "broadcast:request:get_page_of_teachers_from_db"
 DELETE_TEACHER_FROM_DB: Final[str] = "broadcast:request:delete_teacher_from_db"
 DELETE_TEACHERS_FROM_DB: Final[str] = "broadcast:request:delete_teachers_from_db"
 DELETE_ALL_TEACHERS_FROM_DB: Final[str] = "broadcast:request:delete_all_teachers_from_db"
@@ -878,6 +973,7 @@ ALL_TEACHERS_DELETED: Final[str] = "broadcast:notification:all_teachers_deleted"
 TEACHER_RETRIEVED: Final[str] = "broadcast:notification:teacher_retrieved"
 TEACHERS_RETRIEVED: Final[str] = "broadcast:notification:teachers_retrieved"
 ALL_TEACHERS_RETRIEVED: Final[str] = "broadcast:notification:all_teachers_retrieved"
+TEACHERS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:teachers_page_retrieved"
 TEACHER_UPDATED: Final[str] = "broadcast:notification:teacher_updated"
 TEACHERS_UPDATED: Final[str] = "broadcast:notification:teachers_updated"
 
@@ -887,6 +983,7 @@ FILTER_USERS_FROM_DB: Final[str] = "broadcast:request:filter_users_from_db"
 GET_USER_FROM_DB: Final[str] = "broadcast:request:get_user_from_db"
 GET_USERS_FROM_DB: Final[str] = "broadcast:request:get_users_from_db"
 GET_ALL_USERS_FROM_DB: Final[str] = "broadcast:request:get_all_users_from_db"
+GET_PAGE_OF_USERS_FROM_DB: Final[str] = "broadcast:request:get_page_of_users_from_db"
 DELETE_USER_FROM_DB: Final[str] = "broadcast:request:delete_user_from_db"
 DELETE_USERS_FROM_DB: Final[str] = "broadcast:request:delete_users_from_db"
 DELETE_ALL_USERS_FROM_DB: Final[str] = "broadcast:request:delete_all_users_from_db"
@@ -900,6 +997,7 @@ ALL_USERS_DELETED: Final[str] = "broadcast:notification:all_users_deleted"
 USER_RETRIEVED: Final[str] = "broadcast:notification:user_retrieved"
 USERS_RETRIEVED: Final[str] = "broadcast:notification:users_retrieved"
 ALL_USERS_RETRIEVED: Final[str] = "broadcast:notification:all_users_retrieved"
+USERS_PAGE_RETRIEVED: Final[str] = "broadcast:notification:users_page_retrieved"
 USER_UPDATED: Final[str] = "broadcast:notification:user_updated"
 USERS_UPDATED: Final[str] = "broadcast:notification:users_updated"
 
@@ -1058,6 +1156,7 @@ APPLICATION_STOPPED: Final[str] = "broadcast:notification:application_stopped"
 APPLICATION_STOPPING: Final[str] = "broadcast:notification:application_stopping"
 DB_OPERATION_FAILURE: Final[str] = "broadcast:notification:db_operation_failure"
 DB_OPERATION_SUCCESS: Final[str] = "broadcast:notification:db_operation_success"
+DUMP_DISPATCH_TRACE: Final[str] = "broadcast:request:dump_dispatch_trace"
 
 
 # ---------- Helper Functions ---------- #
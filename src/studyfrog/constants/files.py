@@ -19,12 +19,15 @@ __all__: Final[list[str]] = [
     "CONFIG_DB_JSON",
     "CUSTOMFIELDS_DB_JSON",
     "DIFFICULTIES_DB_JSON",
+    "DUE_INDEX_DB_JSON",
     "FLASHCARDS_DB_JSON",
     "IMAGES_DB_JSON",
     "NOTES_DB_JSON",
     "OPTIONS_DB_JSON",
     "PRIORITIES_DB_JSON",
     "QUESTIONS_DB_JSON",
+    "REHEARSAL_ACTION_DB_JSON",
+    "REHEARSAL_BUFFER_DB_JSON",
     "REHEARSAL_RUN_DB_JSON",
     "REHEARSAL_RUN_ITEM_DB_JSON",
     "STACKS_DB_JSON",
@@ -47,6 +50,8 @@ CUSTOMFIELDS_DB_JSON: Final[Path] = DATA_DIR / "customfields.json"
 
 DIFFICULTIES_DB_JSON: Final[Path] = DATA_DIR / "difficulties.json"
 
+DUE_INDEX_DB_JSON: Final[Path] = DATA_DIR / "due_index.json"
+
 FLASHCARDS_DB_JSON: Final[Path] = DATA_DIR / "flashcards.json"
 
 IMAGES_DB_JSON: Final[Path] = DATA_DIR / "images.json"
@@ -59,6 +64,11 @@ PRIORITIES_DB_JSON: Final[Path] = DATA_DIR / "priorities.json"
 
 QUESTIONS_DB_JSON: Final[Path] = DATA_DIR / "questions.json"
 
+REHEARSAL_ACTION_DB_JSON: Final[Path] = DATA_DIR / "rehearsal_actions.json"
+
+# Only the journal next to this file is written (see 'utils.rehearsal_buffer')
+REHEARSAL_BUFFER_DB_JSON: Final[Path] = DATA_DIR / "rehearsal_buffer.json"
+
 REHEARSAL_RUN_DB_JSON: Final[Path] = DATA_DIR / "rehearsal_runs.json"
 
 REHEARSAL_RUN_ITEM_DB_JSON: Final[Path] = DATA_DIR / "rehearsal_run_items.json"
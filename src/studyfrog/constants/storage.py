@@ -21,10 +21,12 @@ __all__: Final[list[str]] = [
     "OPTIONS",
     "PRIORITIES",
     "QUESTIONS",
+    "REHEARSAL_ACTIONS",
     "REHEARSAL_RUN_ITEMS",
     "REHEARSAL_RUNS",
     "STACKS",
     "SUBJECTS",
+    "TABLE_INDEXES",
     "TAGS",
     "TEACHERS",
     "USERS",
@@ -53,6 +55,8 @@ PRIORITIES: Final[Literal["priorities"]] = "priorities"
 
 QUESTIONS: Final[Literal["questions"]] = "questions"
 
+REHEARSAL_ACTIONS: Final[Literal["rehearsal_actions"]] = "rehearsal_actions"
+
 REHEARSAL_RUN_ITEMS: Final[Literal["rehearsal_run_items"]] = "rehearsal_run_items"
 
 REHEARSAL_RUNS: Final[Literal["rehearsal_runs"]] = "rehearsal_runs"
@@ -66,3 +70,30 @@ TAGS: Final[Literal["tags"]] = "tags"
 TEACHERS: Final[Literal["teachers"]] = "teachers"
 
 USERS: Final[Literal["users"]] = "users"
+
+
+# ---------- Indexes ---------- #
+
+TABLE_INDEXES: Final[dict[str, tuple[str, ...]]] = {
+    DIFFICULTIES: ("name",),
+    FLASHCARDS: (
+        "difficulty",
+        "priority",
+        "subject",
+        "tags",
+    ),
+    NOTES: (
+        "difficulty",
+        "priority",
+        "subject",
+        "tags",
+    ),
+    PRIORITIES: ("name",),
+    QUESTIONS: (
+        "difficulty",
+        "priority",
+        "subject",
+        "tags",
+    ),
+    STACKS: ("name",),
+}
@@ -1,33 +1,45 @@
 from __future__ import annotations
 
-# Import all exported variables and functions from individual modules
-
-# Application functions
-from studyfrog.core.application import (
-    run_post_start_tasks,
-    run_post_stop_tasks,
-    run_pre_start_tasks,
-    run_pre_stop_tasks,
-    start_application,
-    stop_application,
-)
+from typing import Any, Final
 
-# Bootstrap functions
-from studyfrog.core.bootstrap import (
-    initialize_gui,
-    subscribe_to_events,
-    unsubscribe_from_events,
+from studyfrog.utils.lazy import (
+    get_lazy_attribute,
+    get_lazy_attribute_names,
+    register_lazy_imports,
 )
 
-# Common functions
-from studyfrog.core.common import (
-    get_default_difficulties,
-    get_default_priorities,
-    get_default_user,
-)
 
-# Core module (empty, but included for completeness)
-from studyfrog.core.core import *
+# Import all exported variables and functions from individual modules (lazily, on first access)
+_LAZY_IMPORTS: Final[dict[str, tuple[str, ...]]] = {
+    # Application functions
+    "studyfrog.core.application": (
+        "run_post_start_tasks",
+        "run_post_stop_tasks",
+        "run_pre_start_tasks",
+        "run_pre_stop_tasks",
+        "start_application",
+        "stop_application",
+    ),
+    # Bootstrap functions
+    "studyfrog.core.bootstrap": (
+        "initialize_gui",
+        "subscribe_to_events",
+        "unsubscribe_from_events",
+    ),
+    # Common functions
+    "studyfrog.core.common": (
+        "get_default_difficulties",
+        "get_default_priorities",
+        "get_default_user",
+    ),
+    # Core module (empty, but included for completeness)
+    "studyfrog.core.core": (),
+}
+
+register_lazy_imports(
+    imports=_LAZY_IMPORTS,
+    package=__name__,
+)
 
 # Export all functions and variables
 __all__: list[str] = [
@@ -47,3 +59,14 @@ __all__: list[str] = [
     "get_default_priorities",
     "get_default_user",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return get_lazy_attribute(
+        name=name,
+        package=__name__,
+    )
+
+
+def __dir__() -> list[str]:
+    return get_lazy_attribute_names(package=__name__)
@@ -26,8 +26,25 @@ from studyfrog.core.bootstrap import (
 )
 from studyfrog.gui.gui import get_root
 from studyfrog.utils.common import exists, get_now
-from studyfrog.utils.dispatcher import dispatch
-from studyfrog.utils.logging import log_error, log_info, log_trace
+from studyfrog.utils.config import get_config_value
+from studyfrog.utils.dispatcher import (
+    dispatch,
+    schedule_dispatch_callbacks,
+    shutdown_dispatch_executor,
+)
+from studyfrog.utils.logging import (
+    log_error,
+    log_info,
+    log_trace,
+    start_log_writer,
+    stop_log_writer,
+)
+from studyfrog.utils.reference_cache import warm_reference_cache
+from studyfrog.utils.rehearsal_buffer import flush_rehearsal_buffer, recover_rehearsal_buffer
+from studyfrog.utils.sqlite import close_sqlite_connections
+from studyfrog.utils.startup import end_startup_phase, format_startup_report, start_startup_phase
+from studyfrog.utils.storage import compact_tables
+from studyfrog.utils.tracing import TRACE, dump_dispatch_trace, enable_dispatch_tracing
 
 
 # ---------- Exports ---------- #
@@ -115,6 +132,23 @@ def _get_stop() -> Optional[datetime]:
     return STOP
 
 
+def _on_first_dashboard_paint() -> None:
+    """
+    Ends the startup report once the dashboard was painted and logs the report.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    if end_startup_phase(phase="first_dashboard_paint") is None:
+        return
+
+    log_info(message=f"Startup timing: {format_startup_report()}")
+
+
 def _set_start(timestamp: datetime) -> None:
     """
     Sets the starting timestamp of the application.
@@ -171,15 +205,21 @@ def run_post_start_tasks() -> None:
     """
 
     try:
+        start_startup_phase(phase="initialize_gui")
         initialize_gui()
+        end_startup_phase(phase="initialize_gui")
+        schedule_dispatch_callbacks(widget=get_root())
         dispatch(
             event=APPLICATION_STARTED,
             namespace=GLOBAL_NAMESPACE,
         )
+        start_startup_phase(phase="first_dashboard_paint")
         dispatch(
             event=GET_DASHBOARD_VIEW,
             namespace=GLOBAL_NAMESPACE,
         )
+        # Idle callbacks run after Tk processed the pending redraws of the dashboard
+        get_root().after_idle(_on_first_dashboard_paint)
     except Exception as e:
         log_error(message=f"Caught an exception while running post start tasks: {e}")
         raise e
@@ -205,6 +245,8 @@ def run_post_stop_tasks() -> None:
             namespace=GLOBAL_NAMESPACE,
         )
         unsubscribe_from_events()
+        close_sqlite_connections()
+        stop_log_writer()
     except Exception as e:
         log_error(message=f"Caught an exception while running post stop tasks: {e}")
         raise e
@@ -225,14 +267,33 @@ def run_pre_start_tasks() -> None:
     """
 
     try:
+        start_startup_phase(phase="run_pre_start_tasks")
+        if get_config_value(key="logging.background"):
+            start_log_writer()
+
+        if get_config_value(key="dispatcher.tracing"):
+            enable_dispatch_tracing(
+                sample_rate=get_config_value(key="dispatcher.trace_sample_rate"),
+            )
+
         ensure_directories()
         ensure_files()
+        start_startup_phase(phase="ensure_defaults")
         ensure_defaults()
+        end_startup_phase(phase="ensure_defaults")
+        start_startup_phase(phase="warm_reference_cache")
+        warm_reference_cache()
+        end_startup_phase(phase="warm_reference_cache")
+        start_startup_phase(phase="subscribe_to_events")
         subscribe_to_events()
+        end_startup_phase(phase="subscribe_to_events")
+        # Writes the grades of a rehearsal run that was interrupted by a crash
+        recover_rehearsal_buffer()
         dispatch(
             event=APPLICATION_STARTING,
             namespace=GLOBAL_NAMESPACE,
         )
+        end_startup_phase(phase="run_pre_start_tasks")
     except Exception as e:
         log_error(message=f"Caught an exception while running pre start tasks: {e}")
         raise e
@@ -257,6 +318,12 @@ def run_pre_stop_tasks() -> None:
             event=APPLICATION_STOPPING,
             namespace=GLOBAL_NAMESPACE,
         )
+        shutdown_dispatch_executor()
+        flush_rehearsal_buffer(final=True)
+        compact_tables()
+
+        if TRACE["enabled"]:
+            dump_dispatch_trace()
     except Exception as e:
         log_error(message=f"Caught an exception while running pre stop tasks: {e}")
         raise e
@@ -277,6 +344,7 @@ def start_application() -> None:
     """
 
     try:
+        end_startup_phase(phase="import")
         _set_start(timestamp=get_now())
         log_trace(message=f"Starting the application at ({_get_start().isoformat()}).")
         log_info(message="Starting the application...")
@@ -43,6 +43,7 @@ from studyfrog.constants.files import (
     OPTIONS_DB_JSON,
     PRIORITIES_DB_JSON,
     QUESTIONS_DB_JSON,
+    REHEARSAL_ACTION_DB_JSON,
     REHEARSAL_RUN_DB_JSON,
     REHEARSAL_RUN_ITEM_DB_JSON,
     STACKS_DB_JSON,
@@ -93,6 +94,16 @@ from studyfrog.utils.directories import ensure_directory
 from studyfrog.utils.dispatcher import subscribe, unsubscribe
 from studyfrog.utils.files import ensure_file
 from studyfrog.utils.logging import log_error, log_info, log_warning
+from studyfrog.utils.reference_cache import (
+    clear_reference_cache,
+    remove_from_reference_cache,
+    update_reference_cache,
+)
+from studyfrog.utils.review_queue import (
+    rebuild_due_index,
+    remove_from_due_index,
+    update_due_index,
+)
 from studyfrog.utils.storage import (
     add_entries_if_not_exist,
     add_entry_if_not_exist,
@@ -102,10 +113,12 @@ from studyfrog.utils.storage import (
     filter_entries,
     get_all_entries,
     get_entries,
+    get_entries_page,
     get_entry,
     update_entry,
     update_entries,
 )
+from studyfrog.utils.tracing import dump_dispatch_trace
 
 
 # ---------- Exports ---------- #
@@ -165,6 +178,7 @@ STORAGE_FILES: Final[tuple[Path]] = (
     OPTIONS_DB_JSON,
     PRIORITIES_DB_JSON,
     QUESTIONS_DB_JSON,
+    REHEARSAL_ACTION_DB_JSON,
     REHEARSAL_RUN_DB_JSON,
     REHEARSAL_RUN_ITEM_DB_JSON,
     STACKS_DB_JSON,
@@ -424,6 +438,138 @@ def _get_model_event_subscriptions() -> list[dict[str, Any]]:
     return subscriptions
 
 
+def _get_reference_cache_event_subscriptions() -> list[dict[str, Any]]:
+    """
+    Generates a list of subscription dictionaries keeping the reference cache coherent.
+
+    Added and updated difficulties, priorities, subjects, tags and teachers are (re-)cached,
+    deleted ones removed, and deleting a whole table discards the cache.
+
+    Returns:
+        list[dict[str, Any]]: A list of subscription dictionaries for reference cache events.
+    """
+
+    events: dict[Callable[..., Any], list[str]] = {
+        clear_reference_cache: [
+            ALL_DIFFICULTIES_DELETED,
+            ALL_PRIORITIES_DELETED,
+            ALL_SUBJECTS_DELETED,
+            ALL_TAGS_DELETED,
+            ALL_TEACHERS_DELETED,
+        ],
+        remove_from_reference_cache: [
+            DIFFICULTY_DELETED,
+            DIFFICULTIES_DELETED,
+            PRIORITY_DELETED,
+            PRIORITIES_DELETED,
+            SUBJECT_DELETED,
+            SUBJECTS_DELETED,
+            TAG_DELETED,
+            TAGS_DELETED,
+            TEACHER_DELETED,
+            TEACHERS_DELETED,
+        ],
+        update_reference_cache: [
+            DIFFICULTY_ADDED,
+            DIFFICULTIES_ADDED,
+            DIFFICULTY_UPDATED,
+            DIFFICULTIES_UPDATED,
+            PRIORITY_ADDED,
+            PRIORITIES_ADDED,
+            PRIORITY_UPDATED,
+            PRIORITIES_UPDATED,
+            SUBJECT_ADDED,
+            SUBJECTS_ADDED,
+            SUBJECT_UPDATED,
+            SUBJECTS_UPDATED,
+            TAG_ADDED,
+            TAGS_ADDED,
+            TAG_UPDATED,
+            TAGS_UPDATED,
+            TEACHER_ADDED,
+            TEACHERS_ADDED,
+            TEACHER_UPDATED,
+            TEACHERS_UPDATED,
+        ],
+    }
+
+    subscriptions: list[dict[str, Any]] = [
+        {
+            "event": event,
+            "function": function,
+            "namespace": GLOBAL_NAMESPACE,
+            "persistent": True,
+            "priority": 100,
+        }
+        for (
+            function,
+            events_,
+        ) in events.items()
+        for event in events_
+    ]
+
+    return subscriptions
+
+
+def _get_review_queue_event_subscriptions() -> list[dict[str, Any]]:
+    """
+    Generates a list of subscription dictionaries keeping the due-date index of the review queue up to date.
+
+    Added and updated flashcards, notes and questions are (re-)indexed, deleted ones
+    removed, and deleting a whole table rebuilds the index.
+
+    Returns:
+        list[dict[str, Any]]: A list of subscription dictionaries for review queue events.
+    """
+
+    events: dict[Callable[..., Any], list[str]] = {
+        rebuild_due_index: [
+            ALL_FLASHCARDS_DELETED,
+            ALL_NOTES_DELETED,
+            ALL_QUESTIONS_DELETED,
+        ],
+        remove_from_due_index: [
+            FLASHCARD_DELETED,
+            FLASHCARDS_DELETED,
+            NOTE_DELETED,
+            NOTES_DELETED,
+            QUESTION_DELETED,
+            QUESTIONS_DELETED,
+        ],
+        update_due_index: [
+            FLASHCARD_ADDED,
+            FLASHCARDS_ADDED,
+            FLASHCARD_UPDATED,
+            FLASHCARDS_UPDATED,
+            NOTE_ADDED,
+            NOTES_ADDED,
+            NOTE_UPDATED,
+            NOTES_UPDATED,
+            QUESTION_ADDED,
+            QUESTIONS_ADDED,
+            QUESTION_UPDATED,
+            QUESTIONS_UPDATED,
+        ],
+    }
+
+    subscriptions: list[dict[str, Any]] = [
+        {
+            "event": event,
+            "function": function,
+            "namespace": GLOBAL_NAMESPACE,
+            "persistent": True,
+            "priority": 100,
+        }
+        for (
+            function,
+            events_,
+        ) in events.items()
+        for event in events_
+    ]
+
+    return subscriptions
+
+
 def _get_storage_event_subscriptions() -> list[dict[str, Any]]:
     """
     Dynamically generates a list of subscription dictionaries for all
@@ -434,7 +580,8 @@ def _get_storage_event_subscriptions() -> list[dict[str, Any]]:
     are called directly as handlers when the event is triggered.
 
     The function ensures that the 11 command event types (Add, Delete, Get, Filter, Update)
-    are correctly assigned to the 11 storage functions for each model type.
+    are correctly assigned to the 11 storage functions for each model type. The paginated
+    'GET_PAGE_OF_..._FROM_DB' event of each model type is assigned to 'get_entries_page'.
 
     Args:
         None
@@ -521,6 +668,21 @@ def _get_storage_event_subscriptions() -> list[dict[str, Any]]:
                 }
             )
 
+        page_event: Optional[str] = get_event_by_name(name=f"GET_PAGE_OF_{plural.upper()}_FROM_DB")
+
+        if not exists(value=page_event):
+            continue
+
+        subscriptions.append(
+            {
+                "event": page_event,
+                "function": get_entries_page,
+                "namespace": GLOBAL_NAMESPACE,
+                "persistent": True,
+                "priority": 100,
+            }
+        )
+
     return subscriptions
 
 
@@ -569,6 +731,27 @@ def _get_toast_event_subscriptions() -> list[dict[str, Any]]:
     return subscriptions
 
 
+def _get_tracing_event_subscriptions() -> list[dict[str, Any]]:
+    """
+    Generates a list of subscription dictionaries for dispatcher tracing events.
+
+    Returns:
+        list[dict[str, Any]]: A list of subscription dictionaries for tracing events.
+    """
+
+    subscriptions: list[dict[str, Any]] = [
+        {
+            "event": DUMP_DISPATCH_TRACE,
+            "function": dump_dispatch_trace,
+            "namespace": GLOBAL_NAMESPACE,
+            "persistent": True,
+            "priority": 100,
+        },
+    ]
+
+    return subscriptions
+
+
 # ---------- Functions ---------- #
 
 
@@ -702,8 +885,11 @@ def subscribe_to_events() -> None:
     subscriptions.extend(_get_get_create_form_subscriptions())
     subscriptions.extend(_get_get_view_form_subscriptions())
     subscriptions.extend(_get_model_event_subscriptions())
+    subscriptions.extend(_get_reference_cache_event_subscriptions())
+    subscriptions.extend(_get_review_queue_event_subscriptions())
     subscriptions.extend(_get_storage_event_subscriptions())
     subscriptions.extend(_get_toast_event_subscriptions())
+    subscriptions.extend(_get_tracing_event_subscriptions())
 
     for subscription in subscriptions:
         SUBSCRIPTION_IDS.append(
@@ -1,37 +1,37 @@
 from __future__ import annotations
 
-# Import all exported functions from individual form modules
+from typing import Any, Final
 
-# Answer create form functions
-from studyfrog.gui.forms.answer_create_form import (
-    get_answer_choice_create_form,
-    get_answer_open_ended_create_form,
-    get_answer_true_false_create_form,
+from studyfrog.utils.lazy import (
+    get_lazy_attribute,
+    get_lazy_attribute_names,
+    register_lazy_imports,
 )
 
-# Flashcard create form functions
-from studyfrog.gui.forms.flashcard_create_form import (
-    get_flashcard_create_form,
-)
-
-# Flashcard edit form functions
-from studyfrog.gui.forms.flashcard_edit_form import (
-    get_flashcard_edit_form,
-)
-
-# Note create form functions
-from studyfrog.gui.forms.note_create_form import (
-    get_note_create_form,
-)
 
-# Question create form functions
-from studyfrog.gui.forms.question_create_form import (
-    get_question_create_form,
-)
+# Import all exported functions from individual form modules (lazily, on first access)
+_LAZY_IMPORTS: Final[dict[str, tuple[str, ...]]] = {
+    # Answer create form functions
+    "studyfrog.gui.forms.answer_create_form": (
+        "get_answer_choice_create_form",
+        "get_answer_open_ended_create_form",
+        "get_answer_true_false_create_form",
+    ),
+    # Flashcard create form functions
+    "studyfrog.gui.forms.flashcard_create_form": ("get_flashcard_create_form",),
+    # Flashcard edit form functions
+    "studyfrog.gui.forms.flashcard_edit_form": ("get_flashcard_edit_form",),
+    # Note create form functions
+    "studyfrog.gui.forms.note_create_form": ("get_note_create_form",),
+    # Question create form functions
+    "studyfrog.gui.forms.question_create_form": ("get_question_create_form",),
+    # Stack create form functions
+    "studyfrog.gui.forms.stack_create_form": ("get_stack_create_form",),
+}
 
-# Stack create form functions
-from studyfrog.gui.forms.stack_create_form import (
-    get_stack_create_form,
+register_lazy_imports(
+    imports=_LAZY_IMPORTS,
+    package=__name__,
 )
 
 # Export all form functions
@@ -51,3 +51,14 @@ __all__: list[str] = [
     # Stack create form functions
     "get_stack_create_form",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return get_lazy_attribute(
+        name=name,
+        package=__name__,
+    )
+
+
+def __dir__() -> list[str]:
+    return get_lazy_attribute_names(package=__name__)
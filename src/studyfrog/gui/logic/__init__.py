@@ -1,61 +1,69 @@
 from __future__ import annotations
 
-# Import all exported functions from individual logic modules
+from typing import Any, Final
 
-# Create view logic functions
-from studyfrog.gui.logic.create_view_logic import (
-    on_cancel_button_click,
-    on_create_button_click,
-    on_stack_combobox_select,
-    on_type_combobox_select,
+from studyfrog.utils.lazy import (
+    get_lazy_attribute,
+    get_lazy_attribute_names,
+    register_lazy_imports,
 )
 
-# Dashboard view logic functions
-from studyfrog.gui.logic.dashboard_view_logic import (
-    on_create_button_click,
-    on_delete_button_click,
-    on_edit_button_click,
-)
-
-# Delete confirmation view logic functions
-from studyfrog.gui.logic.delete_confirmation_view_logic import (
-    on_cancel_button_click,
-    on_okay_button_click,
-)
-
-# Edit view logic functions
-from studyfrog.gui.logic.edit_view_logic import (
-    on_cancel_button_click,
-    on_delete_button_click,
-    on_save_button_click,
-)
 
-# Rehearsal run result view logic functions (empty file, included for completeness)
-from studyfrog.gui.logic.rehearsal_run_result_view_logic import *
-
-# Rehearsal run setup view logic functions
-from studyfrog.gui.logic.rehearsal_run_setup_view_logic import (
-    on_cancel_button_click,
-    on_start_button_click,
-)
+# Import all exported functions from individual logic modules (lazily, on first access)
+_LAZY_IMPORTS: Final[dict[str, tuple[str, ...]]] = {
+    # Create view logic functions
+    "studyfrog.gui.logic.create_view_logic": (
+        "on_cancel_button_click",
+        "on_create_button_click",
+        "on_stack_combobox_select",
+        "on_type_combobox_select",
+    ),
+    # Dashboard view logic functions
+    "studyfrog.gui.logic.dashboard_view_logic": (
+        "on_create_button_click",
+        "on_delete_button_click",
+        "on_edit_button_click",
+    ),
+    # Delete confirmation view logic functions
+    "studyfrog.gui.logic.delete_confirmation_view_logic": (
+        "on_cancel_button_click",
+        "on_okay_button_click",
+    ),
+    # Edit view logic functions
+    "studyfrog.gui.logic.edit_view_logic": (
+        "on_cancel_button_click",
+        "on_delete_button_click",
+        "on_save_button_click",
+    ),
+    # Rehearsal run result view logic functions (empty file, included for completeness)
+    "studyfrog.gui.logic.rehearsal_run_result_view_logic": (),
+    # Rehearsal run setup view logic functions
+    "studyfrog.gui.logic.rehearsal_run_setup_view_logic": (
+        "on_cancel_button_click",
+        "on_start_button_click",
+    ),
+    # Rehearsal run view logic functions
+    "studyfrog.gui.logic.rehearsal_run_view_logic": (
+        "end_rehearsal_run",
+        "on_cancel_button_click",
+        "on_easy_button_click",
+        "on_edit_button_click",
+        "on_end_button_click",
+        "on_hard_button_click",
+        "on_medium_button_click",
+        "on_next_button_click",
+        "on_previous_button_click",
+        "start_rehearsal_run",
+    ),
+    # Note rehearsal view logic functions (empty file, included for completeness)
+    "studyfrog.gui.logic.note_rehearsal_view": (),
+}
 
-# Rehearsal run view logic functions
-from studyfrog.gui.logic.rehearsal_run_view_logic import (
-    end_rehearsal_run,
-    on_cancel_button_click,
-    on_easy_button_click,
-    on_edit_button_click,
-    on_end_button_click,
-    on_hard_button_click,
-    on_medium_button_click,
-    on_next_button_click,
-    on_previous_button_click,
-    start_rehearsal_run,
+register_lazy_imports(
+    imports=_LAZY_IMPORTS,
+    package=__name__,
 )
 
-# Note rehearsal view logic functions (empty file, included for completeness)
-from studyfrog.gui.logic.note_rehearsal_view import *
-
 # Export all logic functions
 __all__: list[str] = [
     # Create view logic functions
@@ -89,3 +97,14 @@ __all__: list[str] = [
     "on_previous_button_click",
     "start_rehearsal_run",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return get_lazy_attribute(
+        name=name,
+        package=__name__,
+    )
+
+
+def __dir__() -> list[str]:
+    return get_lazy_attribute_names(package=__name__)
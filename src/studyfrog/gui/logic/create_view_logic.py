@@ -24,11 +24,7 @@ from studyfrog.constants.events import (
     DESTROY_NOTE_CREATE_FORM,
     DESTROY_QUESTION_CREATE_FORM,
     DESTROY_STACK_CREATE_FORM,
-    FILTER_DIFFICULTIES_FROM_DB,
-    FILTER_PRIORITIES_FROM_DB,
     FILTER_STACKS_FROM_DB,
-    FILTER_SUBJECTS_FROM_DB,
-    FILTER_TEACHERS_FROM_DB,
     GET_ANSWER_FROM_DB,
     GET_ANSWER_MODEL,
     GET_CREATE_FORM,
@@ -59,10 +55,8 @@ from studyfrog.constants.events import (
 from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
 from studyfrog.constants.storage import (
     ANSWERS,
-    DIFFICULTIES,
     FLASHCARDS,
     NOTES,
-    PRIORITIES,
     QUESTIONS,
     STACKS,
     SUBJECTS,
@@ -72,6 +66,7 @@ from studyfrog.models.models import Model
 from studyfrog.utils.common import exists, pluralize_word, search_string, generate_model_key
 from studyfrog.utils.dispatcher import bulk_dispatch, dispatch
 from studyfrog.utils.logging import log_debug, log_error, log_info, log_warning
+from studyfrog.utils.reference_cache import get_reference_key, get_reference_model
 
 
 # ---------- Exports ---------- #
@@ -173,74 +168,6 @@ def _add_to_database(model: Model) -> Optional[int]:
         return None
 
 
-def _filter_difficulty(**kwargs) -> Model:
-    """
-    Returns a difficulty matching the given criteria from the database.
-
-    Args:
-        **kwargs: The criteria to filter the difficulty by.
-
-    Returns:
-        Model: The difficulty matching the given criteria.
-    """
-
-    difficulties: Optional[list[Model]] = (
-        dispatch(
-            event=FILTER_DIFFICULTIES_FROM_DB,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=DIFFICULTIES,
-            **kwargs,
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )
-    )
-
-    if not difficulties:
-        return {}
-
-    return difficulties[0]
-
-
-def _filter_priority(**kwargs) -> Model:
-    """
-    Returns a priority matching the given criteria from the database.
-
-    Args:
-        **kwargs: The criteria to filter the priority by.
-
-    Returns:
-        Model: The priority matching the given criteria.
-    """
-
-    priorities: Optional[list[Model]] = (
-        dispatch(
-            event=FILTER_PRIORITIES_FROM_DB,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=PRIORITIES,
-            **kwargs,
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )
-    )
-
-    if not priorities:
-        return {}
-
-    return priorities[0]
-
-
 def _filter_stack(**kwargs) -> Model:
     """
     Returns a stack matching the given criteria from the database.
@@ -275,74 +202,6 @@ def _filter_stack(**kwargs) -> Model:
     return stacks[0]
 
 
-def _filter_subject(**kwargs) -> Model:
-    """
-    Returns a subject matching the given criteria from the database.
-
-    Args:
-        **kwargs: The criteria to filter the subject by.
-
-    Returns:
-        Model: The subject matching the given criteria.
-    """
-
-    subjects: Optional[list[Model]] = (
-        dispatch(
-            event=FILTER_SUBJECTS_FROM_DB,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=SUBJECTS,
-            **kwargs,
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )
-    )
-
-    if not subjects:
-        return {}
-
-    return subjects[0]
-
-
-def _filter_teacher(**kwargs) -> Model:
-    """
-    Returns a teacher matching the given criteria from the database.
-
-    Args:
-        **kwargs: The criteria to filter the teacher by.
-
-    Returns:
-        Model: The teacher matching the given criteria.
-    """
-
-    teachers: Optional[list[Model]] = (
-        dispatch(
-            event=FILTER_TEACHERS_FROM_DB,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=TEACHERS,
-            **kwargs,
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )
-    )
-
-    if not teachers:
-        return {}
-
-    return teachers[0]
-
-
 def _get_add_event(
     type_: Literal[
         "answer",
@@ -612,7 +471,10 @@ def _inherit_metadata_from_stack(dictionary: dict[str, Any]) -> None:
             stack_parent = _get_from_database(key=dictionary["stack"])
 
         if exists(value=dictionary["subject"]):
-            dictionary["subject"] = _filter_subject(name=dictionary["subject"])["metadata"]["key"]
+            dictionary["subject"] = get_reference_key(
+                name=dictionary["subject"],
+                table_name=SUBJECTS,
+            )
 
         elif not exists(value=dictionary["subject"]) and has_stack_parent:
             dictionary["subject"] = stack_parent.subject
@@ -620,7 +482,10 @@ def _inherit_metadata_from_stack(dictionary: dict[str, Any]) -> None:
             log_warning(message="Subject metadata could not be inherited. Parent stack not found.")
 
         if exists(value=dictionary["teacher"]):
-            dictionary["teacher"] = _filter_teacher(name=dictionary["teacher"])["metadata"]["key"]
+            dictionary["teacher"] = get_reference_key(
+                name=dictionary["teacher"],
+                table_name=TEACHERS,
+            )
 
         elif not exists(value=dictionary["teacher"]) and has_stack_parent:
             dictionary["teacher"] = stack_parent.teacher
@@ -680,7 +545,10 @@ def _resolve_metadata_keys(dictionary: dict[str, Any]) -> None:
                 None,
             )
         ):
-            response: Optional[Model] = _filter_subject(name=dictionary["subject"])
+            response: Optional[Model] = get_reference_model(
+                name=dictionary["subject"],
+                table_name=SUBJECTS,
+            )
 
             if not exists(value=response):
                 log_warning(
@@ -695,7 +563,10 @@ def _resolve_metadata_keys(dictionary: dict[str, Any]) -> None:
                 None,
             )
         ):
-            response: Optional[Model] = _filter_teacher(name=dictionary["teacher"])
+            response: Optional[Model] = get_reference_model(
+                name=dictionary["teacher"],
+                table_name=TEACHERS,
+            )
 
             if not exists(value=response):
                 log_warning(
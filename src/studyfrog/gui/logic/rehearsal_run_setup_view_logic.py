@@ -11,8 +11,6 @@ from typing import Any, Final, Optional
 from studyfrog.constants.events import (
     ADD_REHEARSAL_RUN_TO_DB,
     DESTROY_REHEARSAL_RUN_SETUP_VIEW,
-    FILTER_DIFFICULTIES_FROM_DB,
-    FILTER_PRIORITIES_FROM_DB,
     FILTER_STACKS_FROM_DB,
     GET_DASHBOARD_VIEW,
     GET_REHEARSAL_RUN_FROM_DB,
@@ -25,6 +23,7 @@ from studyfrog.models.models import Model
 from studyfrog.utils.common import exists
 from studyfrog.utils.dispatcher import dispatch
 from studyfrog.utils.logging import log_debug, log_error
+from studyfrog.utils.reference_cache import get_reference_key
 
 
 # ---------- Exports ---------- #
@@ -41,74 +40,6 @@ __all__: Final[list[str]] = [
 # ---------- Helper Functions ---------- #
 
 
-def _filter_difficulty(**kwargs) -> Model:
-    """
-    Returns a difficulty matching the given criteria from the database.
-
-    Args:
-        **kwargs: The criteria to filter the difficulty by.
-
-    Returns:
-        Model: The difficulty matching the given criteria.
-    """
-
-    difficulties: Optional[list[Model]] = (
-        dispatch(
-            event=FILTER_DIFFICULTIES_FROM_DB,
-            namespace=GLOBAL_NAMESPACE,
-            table_name="difficulties",
-            **kwargs,
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )
-    )
-
-    if not difficulties:
-        return {}
-
-    return difficulties[0]
-
-
-def _filter_priority(**kwargs) -> Model:
-    """
-    Returns a priority matching the given criteria from the database.
-
-    Args:
-        **kwargs: The criteria to filter the priority by.
-
-    Returns:
-        Model: The priority matching the given criteria.
-    """
-
-    priorities: Optional[list[Model]] = (
-        dispatch(
-            event=FILTER_PRIORITIES_FROM_DB,
-            namespace=GLOBAL_NAMESPACE,
-            table_name="priorities",
-            **kwargs,
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )
-    )
-
-    if not priorities:
-        return {}
-
-    return priorities[0]
-
-
 def _filter_stack(**kwargs) -> Model:
     """
     Returns a stack matching the given criteria from the database.
@@ -155,12 +86,13 @@ def _handle_difficulty_data(data: str) -> str:
     """
 
     try:
-        dificulty_data: list[Model] = _filter_difficulty(display_name=data)
-
-        if not dificulty_data:
-            return ""
-
-        return dificulty_data[0].key
+        return (
+            get_reference_key(
+                name=data,
+                table_name="difficulties",
+            )
+            or ""
+        )
     except Exception as e:
         log_error(message=f"Failed to handle difficulty data: {e}")
         raise e
@@ -178,12 +110,13 @@ def _handle_priority_data(data: str) -> str:
     """
 
     try:
-        priority_data: list[Model] = _filter_priority(display_name=data)
-
-        if not priority_data:
-            return ""
-
-        return priority_data[0].key
+        return (
+            get_reference_key(
+                name=data,
+                table_name="priorities",
+            )
+            or ""
+        )
     except Exception as e:
         log_error(message=f"Failed to handle priority data: {e}")
         raise e
@@ -321,6 +254,7 @@ def on_start_button_click() -> None:
 
     rehearsal_run_model: Model = (
         dispatch(
+            due_today_enabled=bool(response["due_today_enabled"]["value"]),
             event=GET_REHEARSAL_RUN_MODEL,
             filter_by_difficulty_enabled=bool(response["difficulty"]["value"]),
             filter_by_difficulty=response["difficulty"]["value"],
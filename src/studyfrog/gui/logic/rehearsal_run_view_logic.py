@@ -10,20 +10,20 @@ from typing import Final, Literal, Optional
 
 from studyfrog.constants.common import PATTERNS
 from studyfrog.constants.events import (
-    ADD_REHEARSAL_RUN_ITEM_TO_DB,
     CLICKED_EASY_BUTTON,
     CLICKED_EDIT_BUTTON,
     CLICKED_HARD_BUTTON,
     CLICKED_MEDIUM_BUTTON,
     CLICKED_NEXT_BUTTON,
     CLICKED_PREVIOUS_BUTTON,
-    FILTER_DIFFICULTIES_FROM_DB,
     GET_DASHBOARD_VIEW,
     GET_FLASHCARD_FROM_DB,
+    GET_FLASHCARDS_FROM_DB,
+    GET_INFO_TOAST,
     GET_NOTE_FROM_DB,
+    GET_NOTES_FROM_DB,
     GET_QUESTION_FROM_DB,
-    GET_REHEARSAL_RUN_ITEM_FROM_DB,
-    GET_REHEARSAL_RUN_ITEM_MODEL,
+    GET_QUESTIONS_FROM_DB,
     GET_REHEARSAL_RUN_RESULT_VIEW,
     GET_STACK_FROM_DB,
     LOAD_REHEARSAL_VIEW_FORM,
@@ -31,9 +31,6 @@ from studyfrog.constants.events import (
     REHEARSAL_RUN_INDEX_INCREMENTED,
     REHEARSAL_RUN_INDEX_MAX_REACHED,
     REHEARSAL_RUN_INDEX_MIN_REACHED,
-    UPDATE_FLASHCARD_IN_DB,
-    UPDATE_NOTE_IN_DB,
-    UPDATE_QUESTION_IN_DB,
     UPDATE_REHEARSAL_RUN_IN_DB,
 )
 from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
@@ -48,7 +45,17 @@ from studyfrog.utils.common import (
     shuffle_list,
 )
 from studyfrog.utils.dispatcher import dispatch
-from studyfrog.utils.logging import log_debug, log_error, log_info, log_warning
+from studyfrog.utils.logging import log_error, log_info, log_warning
+from studyfrog.utils.reference_cache import get_reference_key
+from studyfrog.utils.rehearsal_buffer import (
+    REHEARSAL_BUFFER_LOCK,
+    flush_rehearsal_buffer,
+    record_rehearsal_action,
+    record_rehearsal_grade,
+    record_rehearsal_item,
+    start_rehearsal_buffer,
+)
+from studyfrog.utils.review_queue import build_review_queue
 
 
 # ---------- Exports ---------- #
@@ -75,10 +82,10 @@ CURRENT_INDEX: int = 0
 
 REHEARSAL_RUN: Optional[Model] = None
 
-REHEARSAL_RUN_ITEM: Optional[Model] = None
-
 STACK_ITEM_KEYS: Final[list[str]] = []
 
+STACK_ITEMS: Final[dict[str, Model]] = {}
+
 
 # ---------- Helper Functions ---------- #
 
@@ -147,28 +154,6 @@ def _get_rehearsal_run() -> Model:
     return REHEARSAL_RUN
 
 
-def _get_rehearsal_run_item() -> Model:
-    """
-    Returns the rehearsal run item.
-
-    Args:
-        None
-
-    Returns:
-        Model: The rehearsal run item.
-
-    Raises:
-        ValueError: If the rehearsal run item is not set.
-    """
-
-    if not exists(value=REHEARSAL_RUN_ITEM):
-        raise ValueError(
-            "Rehearsal run item is not set. Call '_set_rehearsal_run_item' function first."
-        )
-
-    return REHEARSAL_RUN_ITEM
-
-
 def _get_stack_item_key_at_current_index() -> str:
     """
     Returns the stack item key at the current index.
@@ -245,22 +230,6 @@ def _set_rehearsal_run(model: Model) -> None:
     REHEARSAL_RUN = model
 
 
-def _set_rehearsal_run_item(model: Model) -> None:
-    """
-    Sets the rehearsal run item.
-
-    Args:
-        model (Model): The rehearsal run item to set.
-
-    Returns:
-        None
-    """
-
-    global REHEARSAL_RUN_ITEM
-
-    REHEARSAL_RUN_ITEM = model
-
-
 def _update_rehearsal_run() -> None:
     """
     Updates the rehearsal run.
@@ -326,6 +295,9 @@ def _filter_stack_items_by_difficulty(difficulty_key: str) -> None:
     """
     Filters the stack items keys list by the passed difficulty.
 
+    The stack items are filtered in memory, so they must have been loaded first
+    (see '_load_stack_items_from_db').
+
     Args:
         difficulty_key (str): The key of the difficulty to filter the items by.
 
@@ -333,53 +305,8 @@ def _filter_stack_items_by_difficulty(difficulty_key: str) -> None:
         None
     """
 
-    model_type_to_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": GET_FLASHCARD_FROM_DB,
-        "note": GET_NOTE_FROM_DB,
-        "question": GET_QUESTION_FROM_DB,
-    }
-
-    for item_key in STACK_ITEM_KEYS:
-        model_type: Literal[
-            "flashcard",
-            "note",
-            "question",
-        ] = model_key_to_model_type(model_key=item_key)
-
-        response: Optional[Model] = (
-            dispatch(
-                event=model_type_to_event[model_type],
-                id_=search_string(
-                    pattern=PATTERNS["MODEL_ID"],
-                    string=item_key,
-                ),
-                namespace=GLOBAL_NAMESPACE,
-                table_name=pluralize_word(word=model_type),
-            )
-            .get(
-                "get_entry",
-                [{}],
-            )[0]
-            .get(
-                "result",
-                {},
-            )
-        )
-
-        if not exists(value=response):
-            log_warning(
-                message=f"Failed to retrieve {model_type} with ID {search_string(pattern=PATTERNS['MODEL_ID'], string=item_key)}"
-            )
-            continue
-
-        if response.difficulty != difficulty_key:
+    for item_key in list(STACK_ITEM_KEYS):
+        if _get_stack_item(key=item_key).difficulty != difficulty_key:
             _remove_from_stack_item_keys(key=item_key)
 
 
@@ -387,6 +314,9 @@ def _filter_stack_items_by_priority(priority_key: str) -> None:
     """
     Filters the stack items keys list by the passed priority.
 
+    The stack items are filtered in memory, so they must have been loaded first
+    (see '_load_stack_items_from_db').
+
     Args:
         priority_key (str): The key of the priority to filter the items by.
 
@@ -394,54 +324,36 @@ def _filter_stack_items_by_priority(priority_key: str) -> None:
         None
     """
 
-    model_type_to_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": GET_FLASHCARD_FROM_DB,
-        "note": GET_NOTE_FROM_DB,
-        "question": GET_QUESTION_FROM_DB,
-    }
+    for item_key in list(STACK_ITEM_KEYS):
+        if _get_stack_item(key=item_key).priority != priority_key:
+            _remove_from_stack_item_keys(key=item_key)
 
-    for item_key in STACK_ITEM_KEYS:
-        model_type: Literal[
-            "flashcard",
-            "note",
-            "question",
-        ] = model_key_to_model_type(model_key=item_key)
 
-        response: Optional[Model] = (
-            dispatch(
-                event=model_type_to_event[model_type],
-                id_=search_string(
-                    pattern=PATTERNS["MODEL_ID"],
-                    string=item_key,
-                ),
-                namespace=GLOBAL_NAMESPACE,
-                table_name=pluralize_word(word=model_type),
-            )
-            .get(
-                "get_entry",
-                [{}],
-            )[0]
-            .get(
-                "result",
-                {},
-            )
-        )
+def _get_stack_item(key: str) -> Optional[Model]:
+    """
+    Returns the stack item corresponding to the passed stack item key.
 
-        if not exists(value=response):
-            log_warning(
-                message=f"Failed to retrieve {model_type} with ID {search_string(pattern=PATTERNS['MODEL_ID'], string=item_key)}"
-            )
-            continue
+    Stack items are served from the run-scoped cache filled when the run starts,
+    items missing from it are loaded from the database once and cached.
 
-        if response.priority != priority_key:
-            _remove_from_stack_item_keys(key=item_key)
+    Args:
+        key (str): The key of the stack item.
+
+    Returns:
+        Optional[Model]: The stack item, or None if it could not be loaded.
+    """
+
+    if key in STACK_ITEMS:
+        return STACK_ITEMS[key]
+
+    model: Optional[Model] = _load_stack_item_from_db(stack_item_key=key)
+
+    if not exists(value=model):
+        return None
+
+    STACK_ITEMS[key] = model
+
+    return model
 
 
 def _get_stack_items(key: str) -> list[str]:
@@ -548,6 +460,107 @@ def _load_stack_item_from_db(stack_item_key: str) -> Model:
     )
 
 
+def _load_stack_items_from_db(keys: list[str]) -> None:
+    """
+    Loads the stack items corresponding to the passed stack item keys into the run-scoped cache.
+
+    The keys are grouped by model type, so every table is read once, no matter how
+    many of its entries the run contains. Keys whose item cannot be loaded are
+    removed from the stack item keys list.
+
+    Args:
+        keys (list[str]): The keys of the stack items to load.
+
+    Returns:
+        None
+    """
+
+    model_type_to_get_event: dict[
+        Literal[
+            "flashcard",
+            "note",
+            "question",
+        ],
+        str,
+    ] = {
+        "flashcard": GET_FLASHCARDS_FROM_DB,
+        "note": GET_NOTES_FROM_DB,
+        "question": GET_QUESTIONS_FROM_DB,
+    }
+
+    keys_by_model_type: dict[str, dict[str, str]] = {}
+
+    for key in keys:
+        if key in STACK_ITEMS:
+            continue
+
+        model_type: Optional[str] = model_key_to_model_type(model_key=key)
+        model_id: Optional[str] = search_string(
+            pattern=PATTERNS["MODEL_ID"],
+            string=key,
+        )
+
+        if not exists(value=model_type) or not exists(value=model_id):
+            log_warning(
+                message=f"Failed to retrieve model type or ID from stack item key {key}",
+                name=f"{__NAME__}._load_stack_items_from_db",
+            )
+            continue
+
+        keys_by_model_type.setdefault(
+            model_type.lower(),
+            {},
+        )[model_id] = key
+
+    for (
+        model_type,
+        keys_by_id,
+    ) in keys_by_model_type.items():
+        if model_type not in model_type_to_get_event:
+            log_warning(
+                message=f"Unsupported stack item type '{model_type}'",
+                name=f"{__NAME__}._load_stack_items_from_db",
+            )
+            continue
+
+        models: Optional[list[Model]] = (
+            dispatch(
+                event=model_type_to_get_event[model_type],
+                ids=list(keys_by_id),
+                namespace=GLOBAL_NAMESPACE,
+                table_name=pluralize_word(word=model_type),
+            )
+            .get(
+                "get_entries",
+                [{}],
+            )[0]
+            .get(
+                "result",
+                [],
+            )
+        )
+
+        for model in models or []:
+            key: Optional[str] = keys_by_id.get(str(model.id))
+
+            if exists(value=key):
+                STACK_ITEMS[key] = model
+
+    for key in keys:
+        if key not in STACK_ITEMS:
+            log_warning(
+                message=f"Failed to load stack item {key} from database",
+                name=f"{__NAME__}._load_stack_items_from_db",
+            )
+
+            _remove_from_stack_item_keys(key=key)
+
+    log_info(
+        message=f"Loaded {len(STACK_ITEMS)} stack items with {len(keys_by_model_type)} table read(s)",
+        name=f"{__NAME__}._load_stack_items_from_db",
+    )
+
+
 def _remove_from_stack_item_keys(key: str) -> None:
     """
     Removes a passed key from the stack item keys list.
@@ -568,6 +581,54 @@ def _remove_from_stack_item_keys(key: str) -> None:
     log_info(message=f"Removed key {key} from stack item keys list.")
 
 
+def _set_stack_item_grade(
+    grade: str,
+    key: str,
+) -> None:
+    """
+    Records the grade of a stack item in the rehearsal buffer.
+
+    The difficulty of the stack item is set to the difficulty named like the grade.
+    A later grade of the same item replaces the earlier one; the graded items are
+    scheduled and saved when the rehearsal buffer is flushed.
+
+    Args:
+        grade (str): The grade, e.g. "easy", "medium" or "hard".
+        key (str): The key of the stack item.
+
+    Returns:
+        None
+    """
+
+    model: Optional[Model] = _get_stack_item(key=key)
+
+    if not exists(value=model):
+        log_warning(
+            message=f"Failed to load stack item for key {key}. Aborting...",
+            name=f"{__NAME__}._set_stack_item_grade",
+        )
+
+        return
+
+    record_rehearsal_grade(
+        difficulty=get_reference_key(
+            name=grade,
+            table_name="difficulties",
+        ),
+        grade=grade,
+        model=model,
+    )
+
+    record_rehearsal_action(
+        action_data={
+            "grade": grade,
+            "type": "grade",
+        },
+        item=key,
+        message=f"Graded {key} as '{grade}'",
+    )
+
+
 # ---------- Public Functions ---------- #
 
 
@@ -584,27 +645,30 @@ def end_rehearsal_run() -> None:
 
     log_info(message=f"Ending rehearsal run: {_get_rehearsal_run().key}")
 
-    _get_rehearsal_run().finished_at = get_now()
-    _get_rehearsal_run().finished_on = _get_rehearsal_run().finished_at.date()
-
-    _get_rehearsal_run().duration = {
-        "minutes": (
-            _get_rehearsal_run().finished_at - _get_rehearsal_run().started_at
-        ).total_seconds()
-        // 60,
-        "seconds": (
-            _get_rehearsal_run().finished_at - _get_rehearsal_run().started_at
-        ).total_seconds(),
-    }
+    # The buffered run is not changed while a periodic flush writes it
+    with REHEARSAL_BUFFER_LOCK:
+        _get_rehearsal_run().finished_at = get_now()
+        _get_rehearsal_run().finished_on = _get_rehearsal_run().finished_at.date()
 
-    _get_rehearsal_run().finished_at = _get_rehearsal_run().finished_at.isoformat()
-    _get_rehearsal_run().finished_on = _get_rehearsal_run().finished_on.isoformat()
-    _get_rehearsal_run().started_at = _get_rehearsal_run().started_at.isoformat()
-    _get_rehearsal_run().started_on = _get_rehearsal_run().started_on.isoformat()
+        _get_rehearsal_run().duration = {
+            "minutes": (
+                _get_rehearsal_run().finished_at - _get_rehearsal_run().started_at
+            ).total_seconds()
+            // 60,
+            "seconds": (
+                _get_rehearsal_run().finished_at - _get_rehearsal_run().started_at
+            ).total_seconds(),
+        }
 
-    log_info(message=f"Updating rehearsal run: {_get_rehearsal_run().key}")
+        _get_rehearsal_run().finished_at = _get_rehearsal_run().finished_at.isoformat()
+        _get_rehearsal_run().finished_on = _get_rehearsal_run().finished_on.isoformat()
+        _get_rehearsal_run().started_at = _get_rehearsal_run().started_at.isoformat()
+        _get_rehearsal_run().started_on = _get_rehearsal_run().started_on.isoformat()
 
-    _update_rehearsal_run()
+        log_info(message=f"Updating rehearsal run: {_get_rehearsal_run().key}")
+
+        # Writes the run together with its items, actions and graded stack items
+        flush_rehearsal_buffer(final=True)
 
     log_info(
         message=f"Loading rehearsal run result view for rehearsal run {_get_rehearsal_run().key}..."
@@ -616,11 +680,15 @@ def end_rehearsal_run() -> None:
         rehearsal_run=_get_rehearsal_run(),
     )
 
+    STACK_ITEMS.clear()
+
 
 def on_cancel_button_click() -> None:
     """
     Handles the 'cancel' button click.
 
+    The grades given so far are kept, i.e. the rehearsal buffer is flushed.
+
     Args:
         None
 
@@ -628,6 +696,8 @@ def on_cancel_button_click() -> None:
         None
     """
 
+    flush_rehearsal_buffer(final=True)
+
     dispatch(
         event=GET_DASHBOARD_VIEW,
         namespace=GLOBAL_NAMESPACE,
@@ -645,126 +715,37 @@ def on_easy_button_click() -> None:
         None
     """
 
-    difficulty: Model = (
-        dispatch(
-            event=FILTER_DIFFICULTIES_FROM_DB,
-            name="easy",
-            namespace=GLOBAL_NAMESPACE,
-            table_name="difficulties",
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )[0]
+    _set_stack_item_grade(
+        grade="easy",
+        key=_get_stack_item_key_at_current_index(),
     )
 
-    model_type_to_get_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": GET_FLASHCARD_FROM_DB,
-        "note": GET_NOTE_FROM_DB,
-        "question": GET_QUESTION_FROM_DB,
-    }
-
-    model_id: Optional[str] = search_string(
-        pattern=PATTERNS["MODEL_ID"],
-        string=STACK_ITEM_KEYS[CURRENT_INDEX],
+    dispatch(
+        event=CLICKED_EASY_BUTTON,
+        namespace=GLOBAL_NAMESPACE,
     )
 
-    if not exists(value=model_id):
-        log_warning(
-            message=f"Failed to retrieve model ID from stack item key {STACK_ITEM_KEYS[CURRENT_INDEX]}"
-        )
 
-        return
+def on_edit_button_click() -> None:
+    """
+    Handles the 'edit' button click.
 
-    model_id = model_id.lower()
+    Args:
+        None
 
-    model_type: Optional[str] = model_key_to_model_type(model_key=STACK_ITEM_KEYS[CURRENT_INDEX])
+    Returns:
+        None
+    """
 
-    if not exists(value=model_type):
-        log_warning(
-            message=f"Failed to retrieve model type from stack item key {STACK_ITEM_KEYS[CURRENT_INDEX]}"
-        )
+    dispatch(
+        event=CLICKED_EDIT_BUTTON,
+        namespace=GLOBAL_NAMESPACE,
+    )
 
-        return
 
-    model_type = model_type.lower()
-
-    model: Model = (
-        dispatch(
-            event=model_type_to_get_event[model_type],
-            id_=model_id,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=pluralize_word(word=model_type),
-        )
-        .get(
-            "get_entry",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            {},
-        )
-    )
-
-    model_type_to_update_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": UPDATE_FLASHCARD_IN_DB,
-        "note": UPDATE_NOTE_IN_DB,
-        "question": UPDATE_QUESTION_IN_DB,
-    }
-
-    model.difficulty = difficulty.key
-
-    dispatch(
-        model=model,
-        event=model_type_to_update_event[model_type],
-        namespace=GLOBAL_NAMESPACE,
-        table_name=pluralize_word(word=model_type),
-    )
-
-    dispatch(
-        event=CLICKED_EASY_BUTTON,
-        namespace=GLOBAL_NAMESPACE,
-    )
-
-
-def on_edit_button_click() -> None:
-    """
-    Handles the 'edit' button click.
-
-    Args:
-        None
-
-    Returns:
-        None
-    """
-
-    dispatch(
-        event=CLICKED_EDIT_BUTTON,
-        namespace=GLOBAL_NAMESPACE,
-    )
-
-
-def on_end_button_click() -> None:
-    """
-    Handles the 'end' button click.
+def on_end_button_click() -> None:
+    """
+    Handles the 'end' button click.
 
     This function dispatches the 'REHEARSAL_RUN_INDEX_MAX_REACHED' event,
     thus prompting the rehearsal run to end.
@@ -793,98 +774,9 @@ def on_hard_button_click() -> None:
         None
     """
 
-    difficulty: Model = (
-        dispatch(
-            event=FILTER_DIFFICULTIES_FROM_DB,
-            name="hard",
-            namespace=GLOBAL_NAMESPACE,
-            table_name="difficulties",
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )[0]
-    )
-
-    model_type_to_get_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": GET_FLASHCARD_FROM_DB,
-        "note": GET_NOTE_FROM_DB,
-        "question": GET_QUESTION_FROM_DB,
-    }
-
-    model_id: Optional[str] = search_string(
-        pattern=PATTERNS["MODEL_ID"],
-        string=STACK_ITEM_KEYS[CURRENT_INDEX],
-    )
-
-    if not exists(value=model_id):
-        log_warning(
-            message=f"Failed to retrieve model ID from stack item key {STACK_ITEM_KEYS[CURRENT_INDEX]}"
-        )
-
-        return
-
-    model_id = model_id.lower()
-
-    model_type: Optional[str] = model_key_to_model_type(model_key=STACK_ITEM_KEYS[CURRENT_INDEX])
-
-    if not exists(value=model_type):
-        log_warning(
-            message=f"Failed to retrieve model type from stack item key {STACK_ITEM_KEYS[CURRENT_INDEX]}"
-        )
-
-        return
-
-    model_type = model_type.lower()
-
-    model: Model = (
-        dispatch(
-            event=model_type_to_get_event[model_type],
-            id_=model_id,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=pluralize_word(word=model_type),
-        )
-        .get(
-            "get_entry",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            {},
-        )
-    )
-
-    model_type_to_update_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": UPDATE_FLASHCARD_IN_DB,
-        "note": UPDATE_NOTE_IN_DB,
-        "question": UPDATE_QUESTION_IN_DB,
-    }
-
-    model.difficulty = difficulty.key
-
-    dispatch(
-        model=model,
-        event=model_type_to_update_event[model_type],
-        namespace=GLOBAL_NAMESPACE,
-        table_name=pluralize_word(word=model_type),
+    _set_stack_item_grade(
+        grade="hard",
+        key=_get_stack_item_key_at_current_index(),
     )
 
     dispatch(
@@ -904,100 +796,9 @@ def on_medium_button_click() -> None:
         None
     """
 
-    difficulty: Model = (
-        dispatch(
-            event=FILTER_DIFFICULTIES_FROM_DB,
-            name="medium",
-            namespace=GLOBAL_NAMESPACE,
-            table_name="difficulties",
-        )
-        .get(
-            "filter_entries",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            [{}],
-        )[0]
-    )
-
-    model_type_to_get_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": GET_FLASHCARD_FROM_DB,
-        "note": GET_NOTE_FROM_DB,
-        "question": GET_QUESTION_FROM_DB,
-    }
-
-    model_id: Optional[str] = search_string(
-        pattern=PATTERNS["MODEL_ID"],
-        string=_get_stack_item_key_at_current_index(),
-    )
-
-    if not exists(value=model_id):
-        log_warning(
-            message=f"Failed to retrieve model ID from stack item key {_get_stack_item_key_at_current_index()}"
-        )
-
-        return
-
-    model_id = model_id.lower()
-
-    model_type: Optional[str] = model_key_to_model_type(
-        model_key=_get_stack_item_key_at_current_index()
-    )
-
-    if not exists(value=model_type):
-        log_warning(
-            message=f"Failed to retrieve model type from stack item key {_get_stack_item_key_at_current_index()}"
-        )
-
-        return
-
-    model_type = model_type.lower()
-
-    model: Model = (
-        dispatch(
-            event=model_type_to_get_event[model_type],
-            id_=model_id,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=pluralize_word(word=model_type),
-        )
-        .get(
-            "get_entry",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            {},
-        )
-    )
-
-    model_type_to_update_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": UPDATE_FLASHCARD_IN_DB,
-        "note": UPDATE_NOTE_IN_DB,
-        "question": UPDATE_QUESTION_IN_DB,
-    }
-
-    model.difficulty = difficulty.key
-
-    dispatch(
-        model=model,
-        event=model_type_to_update_event[model_type],
-        namespace=GLOBAL_NAMESPACE,
-        table_name=pluralize_word(word=model_type),
+    _set_stack_item_grade(
+        grade="medium",
+        key=_get_stack_item_key_at_current_index(),
     )
 
     dispatch(
@@ -1031,33 +832,6 @@ def on_next_button_click() -> None:
 
     _increment_current_index()
 
-    model_type_to_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": GET_FLASHCARD_FROM_DB,
-        "note": GET_NOTE_FROM_DB,
-        "question": GET_QUESTION_FROM_DB,
-    }
-
-    model_id: Optional[str] = search_string(
-        pattern=PATTERNS["MODEL_ID"],
-        string=_get_stack_item_key_at_current_index(),
-    )
-
-    if not exists(value=model_id):
-        log_warning(
-            message=f"Failed to retrieve model ID from stack item key {_get_stack_item_key_at_current_index()}"
-        )
-
-        return
-
-    model_id = model_id.lower()
-
     model_type: Optional[str] = model_key_to_model_type(
         model_key=_get_stack_item_key_at_current_index()
     )
@@ -1071,22 +845,7 @@ def on_next_button_click() -> None:
 
     model_type = model_type.lower()
 
-    model: Model = (
-        dispatch(
-            event=model_type_to_event[model_type],
-            id_=model_id,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=pluralize_word(word=model_type),
-        )
-        .get(
-            "get_entry",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            {},
-        )
-    )
+    model: Optional[Model] = _get_stack_item(key=_get_stack_item_key_at_current_index())
 
     if not exists(value=model):
         log_warning(
@@ -1100,86 +859,14 @@ def on_next_button_click() -> None:
 
         return
 
-    rehearsal_run_item: Optional[Model] = (
-        dispatch(
-            event=GET_REHEARSAL_RUN_ITEM_MODEL,
-            item=_get_stack_item_key_at_current_index(),
-            namespace=GLOBAL_NAMESPACE,
-        )
-        .get(
-            "get_rehearsal_run_item_model",
-            {},
-        )[0]
-        .get(
-            "result",
-            {},
-        )
-    )
+    record_rehearsal_item(item=_get_stack_item_key_at_current_index())
 
-    id_: Optional[int] = (
-        dispatch(
-            event=ADD_REHEARSAL_RUN_ITEM_TO_DB,
-            model=rehearsal_run_item,
-            namespace=GLOBAL_NAMESPACE,
-            table_name="rehearsal_run_items",
-        )
-        .get(
-            "add_entry_if_not_exists",
-            {},
-        )
-        .get(
-            "result",
-            None,
-        )
+    record_rehearsal_action(
+        action_data={"type": "next"},
+        item=_get_stack_item_key_at_current_index(),
+        message=f"Moved on to {_get_stack_item_key_at_current_index()}",
     )
 
-    if not exists(value=id_):
-        log_warning(
-            message="Failed to add rehearsal run item to database",
-            name=f"{__NAME__}.on_next_button_click",
-        )
-        return
-
-    rehearsal_run_item = (
-        dispatch(
-            event=GET_REHEARSAL_RUN_ITEM_FROM_DB,
-            id_=id_,
-            namespace=GLOBAL_NAMESPACE,
-            table_name="rehearsal_run_items",
-        )
-        .get(
-            "get_rehearsal_run_item_from_db",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            {},
-        )
-    )
-
-    if not exists(value=rehearsal_run_item):
-        log_warning(
-            message=f"Failed to get rehearsal run item with ID {id_} from database",
-            name=f"{__NAME__}.on_next_button_click",
-        )
-        return
-
-    _set_rehearsal_run_item(model=rehearsal_run_item)
-
-    _get_rehearsal_run().items["items"][_get_stack_item_key_at_current_index()].append(
-        rehearsal_run_item.id
-    )
-    _get_rehearsal_run().items["total"][_get_stack_item_key_at_current_index()] = len(
-        _get_rehearsal_run().items["items"]
-    )
-
-    log_debug(
-        message=f"Rehearsal run item {rehearsal_run_item.id} added to stack item {_get_stack_item_key_at_current_index()}",
-        name=f"{__NAME__}.on_next_button_click",
-    )
-
-    _update_rehearsal_run()
-
     dispatch(
         event=CLICKED_NEXT_BUTTON,
         namespace=GLOBAL_NAMESPACE,
@@ -1225,33 +912,6 @@ def on_previous_button_click() -> None:
 
     _decrement_current_index()
 
-    model_type_to_event: dict[
-        Literal[
-            "flashcard",
-            "note",
-            "question",
-        ],
-        str,
-    ] = {
-        "flashcard": GET_FLASHCARD_FROM_DB,
-        "note": GET_NOTE_FROM_DB,
-        "question": GET_QUESTION_FROM_DB,
-    }
-
-    model_id: Optional[str] = search_string(
-        pattern=PATTERNS["MODEL_ID"],
-        string=_get_stack_item_key_at_current_index(),
-    )
-
-    if not exists(value=model_id):
-        log_warning(
-            message=f"Failed to retrieve model ID from stack item key {_get_stack_item_key_at_current_index()}"
-        )
-
-        return
-
-    model_id = model_id.lower()
-
     model_type: Optional[str] = model_key_to_model_type(
         model_key=_get_stack_item_key_at_current_index()
     )
@@ -1265,21 +925,12 @@ def on_previous_button_click() -> None:
 
     model_type = model_type.lower()
 
-    model: Model = (
-        dispatch(
-            event=model_type_to_event[model_type],
-            id_=model_id,
-            namespace=GLOBAL_NAMESPACE,
-            table_name=pluralize_word(word=model_type),
-        )
-        .get(
-            "get_entry",
-            [{}],
-        )[0]
-        .get(
-            "result",
-            {},
-        )
+    model: Optional[Model] = _get_stack_item(key=_get_stack_item_key_at_current_index())
+
+    record_rehearsal_action(
+        action_data={"type": "previous"},
+        item=_get_stack_item_key_at_current_index(),
+        message=f"Moved back to {_get_stack_item_key_at_current_index()}",
     )
 
     dispatch(
@@ -1296,7 +947,7 @@ def on_previous_button_click() -> None:
     )
 
     dispatch(
-        _load_stack_item_from_db(stack_item_key=_get_stack_item_key_at_current_index()),
+        model,
         event=LOAD_REHEARSAL_VIEW_FORM,
         namespace=GLOBAL_NAMESPACE,
     )
@@ -1316,14 +967,30 @@ def start_rehearsal_run(model: Model) -> None:
     model.started_at = get_now()
     model.started_on = get_today()
 
-    for stack in model.stacks:
-        stack_items: list[str] = _get_stack_items(key=stack)
-
-        if not stack_items:
-            continue
+    STACK_ITEM_KEYS.clear()
+    STACK_ITEMS.clear()
 
-        for key in stack_items:
+    if model.configuration.get(
+        "due_today_enabled",
+        False,
+    ):
+        # The review queue is already ordered by priority and difficulty
+        for key in build_review_queue(
+            date=get_today(),
+            stacks=model.stacks,
+        ):
             _add_to_stack_items(key=key)
+    else:
+        for stack in model.stacks:
+            stack_items: list[str] = _get_stack_items(key=stack)
+
+            if not stack_items:
+                continue
+
+            for key in stack_items:
+                _add_to_stack_items(key=key)
+
+    _load_stack_items_from_db(keys=list(STACK_ITEM_KEYS))
 
     if model.configuration.get(
         "filter_by_difficulty_enabled",
@@ -1345,19 +1012,38 @@ def start_rehearsal_run(model: Model) -> None:
     ):
         shuffle_list(list_=STACK_ITEM_KEYS)
 
+    if not STACK_ITEM_KEYS:
+        log_warning(
+            message="Found no stack items to rehearse. Returning to the dashboard.",
+            name=f"{__NAME__}.start_rehearsal_run",
+        )
+
+        dispatch(
+            event=GET_INFO_TOAST,
+            message="There are no items to rehearse in the selected stacks.",
+            namespace=GLOBAL_NAMESPACE,
+            title="Nothing to rehearse",
+        )
+
+        dispatch(
+            event=GET_DASHBOARD_VIEW,
+            namespace=GLOBAL_NAMESPACE,
+        )
+
+        return
+
     _set_current_index(integer=0)
 
     _set_rehearsal_run(model=model)
 
-    _get_rehearsal_run().items = {
-        "items": {},
-        "total": 0,
-    }
-
     _update_rehearsal_run()
 
+    start_rehearsal_buffer(run=_get_rehearsal_run())
+
+    record_rehearsal_item(item=_get_stack_item_key_at_current_index())
+
     dispatch(
-        _load_stack_item_from_db(stack_item_key=_get_stack_item_key_at_current_index()),
+        _get_stack_item(key=_get_stack_item_key_at_current_index()),
         event=LOAD_REHEARSAL_VIEW_FORM,
         namespace=GLOBAL_NAMESPACE,
     )
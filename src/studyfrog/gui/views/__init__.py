@@ -1,59 +1,46 @@
 from __future__ import annotations
 
-# Import all exported functions from individual view modules
+from typing import Any, Final
 
-# Answer rehearsal view functions
-from studyfrog.gui.views.answer_rehearsal_view import (
-    get_answer_rehearsal_view,
+from studyfrog.utils.lazy import (
+    get_lazy_attribute,
+    get_lazy_attribute_names,
+    register_lazy_imports,
 )
 
-# Create view functions
-from studyfrog.gui.views.create_view import (
-    get_create_view,
-)
-
-# Dashboard view functions
-from studyfrog.gui.views.dashboard_view import (
-    get_dashboard_view,
-)
-
-# Delete confirmation view functions
-from studyfrog.gui.views.delete_confirmation_view import (
-    get_delete_confirmation_view,
-)
-
-# Edit view functions
-from studyfrog.gui.views.edit_view import (
-    get_edit_view,
-)
 
-# Flashcard rehearsal view functions
-from studyfrog.gui.views.flashcard_rehearsal_view import (
-    get_flashcard_rehearsal_view,
-    set_flip_side,
-)
-
-# Note rehearsal view functions
-from studyfrog.gui.views.note_rehearsal_view import (
-    get_note_rehearsal_view,
-)
-
-# Question rehearsal view functions
-from studyfrog.gui.views.question_rehearsal_view import (
-    get_question_rehearsal_view,
-)
-
-# Rehearsal run result view functions (empty, included for completeness)
-from studyfrog.gui.views.rehearsal_run_result_view import *
-
-# Rehearsal run setup view functions
-from studyfrog.gui.views.rehearsal_run_setup_view import (
-    get_rehearsal_run_setup_view,
-)
+# Import all exported functions from individual view modules (lazily, on first access)
+_LAZY_IMPORTS: Final[dict[str, tuple[str, ...]]] = {
+    # Answer rehearsal view functions
+    "studyfrog.gui.views.answer_rehearsal_view": ("get_answer_rehearsal_view",),
+    # Create view functions
+    "studyfrog.gui.views.create_view": ("get_create_view",),
+    # Dashboard view functions
+    "studyfrog.gui.views.dashboard_view": ("get_dashboard_view",),
+    # Delete confirmation view functions
+    "studyfrog.gui.views.delete_confirmation_view": ("get_delete_confirmation_view",),
+    # Edit view functions
+    "studyfrog.gui.views.edit_view": ("get_edit_view",),
+    # Flashcard rehearsal view functions
+    "studyfrog.gui.views.flashcard_rehearsal_view": (
+        "get_flashcard_rehearsal_view",
+        "set_flip_side",
+    ),
+    # Note rehearsal view functions
+    "studyfrog.gui.views.note_rehearsal_view": ("get_note_rehearsal_view",),
+    # Question rehearsal view functions
+    "studyfrog.gui.views.question_rehearsal_view": ("get_question_rehearsal_view",),
+    # Rehearsal run result view functions (empty, included for completeness)
+    "studyfrog.gui.views.rehearsal_run_result_view": (),
+    # Rehearsal run setup view functions
+    "studyfrog.gui.views.rehearsal_run_setup_view": ("get_rehearsal_run_setup_view",),
+    # Rehearsal run view functions
+    "studyfrog.gui.views.rehearsal_run_view": ("get_rehearsal_run_view",),
+}
 
-# Rehearsal run view functions
-from studyfrog.gui.views.rehearsal_run_view import (
-    get_rehearsal_run_view,
+register_lazy_imports(
+    imports=_LAZY_IMPORTS,
+    package=__name__,
 )
 
 # Export all view functions
@@ -80,3 +67,14 @@ __all__: list[str] = [
     # Rehearsal run view functions
     "get_rehearsal_run_view",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return get_lazy_attribute(
+        name=name,
+        package=__name__,
+    )
+
+
+def __dir__() -> list[str]:
+    return get_lazy_attribute_names(package=__name__)
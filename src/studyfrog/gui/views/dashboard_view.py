@@ -9,11 +9,11 @@ from __future__ import annotations
 import customtkinter as ctk
 
 from tkinter.constants import NSEW, TOP, VERTICAL, W, X, YES
-from typing import Any, Final, Optional
+from typing import Any, Final, Optional, Union
 
 from studyfrog.constants.events import (
     DESTROY_DASHBOARD_VIEW,
-    GET_ALL_STACKS_FROM_DB,
+    GET_PAGE_OF_STACKS_FROM_DB,
     STACK_ADDED,
     STACK_DELETED,
     STACKS_ADDED,
@@ -32,8 +32,9 @@ from studyfrog.gui.logic.dashboard_view_logic import (
     on_view_button_click,
 )
 from studyfrog.models.models import Model
+from studyfrog.models.proxies import ModelProxy, is_model_proxy
 from studyfrog.utils.common import exists
-from studyfrog.utils.dispatcher import dispatch, subscribe, unsubscribe
+from studyfrog.utils.dispatcher import dispatch, subscribe, unsubscribe_owner
 from studyfrog.utils.gui import (
     clear_bottom_frame,
     clear_center_frame,
@@ -55,7 +56,15 @@ _DASHBOARD_ITEM_CONTAINER: Optional[ctk.CTkScrollableFrame] = None
 
 _DASHBOARD_ITEMS: dict[str, ctk.CTkFrame] = {}
 
-_SUBSCRIPTION_IDS: Final[list[str]] = []
+# 'last_id' is the ID of the last stack loaded by paging, stacks up to it shift the offset when deleted
+_STACKS_PAGE: Final[dict[str, Any]] = {
+    "has_more": False,
+    "last_id": -1,
+    "loading": False,
+    "next_offset": 0,
+}
+
+_STACKS_PAGE_SIZE: Final[int] = 25
 
 
 # ---------- Helper Functions ---------- #
@@ -135,6 +144,29 @@ def _unregister_dashboard_item(key: str) -> None:
 # ---------- Private Functions ---------- #
 
 
+def _add_dashboard_items(stacks: list[Union[Model, ModelProxy]]) -> None:
+    """
+    Creates and registers the dashboard item widgets for the passed stacks.
+
+    Stacks that already have a dashboard item are skipped.
+
+    Args:
+        stacks (list[Union[Model, ModelProxy]]): The stacks to create dashboard items for.
+
+    Returns:
+        None
+    """
+
+    for stack in stacks:
+        if stack.key in _DASHBOARD_ITEMS:
+            continue
+
+        _register_dashboard_item(
+            frame=_create_dashboard_item_widgets(stack=stack),
+            key=stack.key,
+        )
+
+
 def _configure_widget_grids() -> None:
     """
     Configures the grid of the widgets of the dashboard view.
@@ -289,13 +321,19 @@ def _create_center_frame_widgets() -> None:
 
     _set_dashboard_item_container(scrollable_frame=scrollable_frame)
 
+    # Hook into the canvas' scroll updates to load further stacks when nearing the end.
+    scrollable_frame._parent_canvas.configure(yscrollcommand=_on_dashboard_item_container_scroll)
 
-def _create_dashboard_item_widgets(stack: Model) -> ctk.CTkFrame:
+
+def _create_dashboard_item_widgets(stack: Union[Model, ModelProxy]) -> ctk.CTkFrame:
     """
     Creates the dashboard item widgets.
 
+    Stacks loaded for the dashboard are lazy proxies, which are only upgraded to
+    the full model once one of the item's buttons is clicked.
+
     Args:
-        stack (Model): The stack to create the dashboard item widgets for.
+        stack (Union[Model, ModelProxy]): The stack to create the dashboard item widgets for.
 
     Returns:
         ctk.CTkFrame: The created dashboard item frame.
@@ -345,7 +383,7 @@ def _create_dashboard_item_widgets(stack: Model) -> ctk.CTkFrame:
     )
 
     ctk.CTkButton(
-        command=lambda: on_delete_button_click(stack=stack),
+        command=lambda: on_delete_button_click(stack=_hydrate_stack(stack=stack)),
         master=frame,
         text="Delete",
         width=75,
@@ -357,7 +395,7 @@ def _create_dashboard_item_widgets(stack: Model) -> ctk.CTkFrame:
     )
 
     ctk.CTkButton(
-        command=lambda: on_edit_button_click(stack=stack),
+        command=lambda: on_edit_button_click(stack=_hydrate_stack(stack=stack)),
         master=frame,
         text="Edit",
         width=75,
@@ -369,7 +407,7 @@ def _create_dashboard_item_widgets(stack: Model) -> ctk.CTkFrame:
     )
 
     ctk.CTkButton(
-        command=lambda: on_rehearse_button_click(stack=stack),
+        command=lambda: on_rehearse_button_click(stack=_hydrate_stack(stack=stack)),
         master=frame,
         text="Rehearse",
         width=75,
@@ -381,7 +419,7 @@ def _create_dashboard_item_widgets(stack: Model) -> ctk.CTkFrame:
     )
 
     ctk.CTkButton(
-        command=lambda: on_view_button_click(stack=stack),
+        command=lambda: on_view_button_click(stack=_hydrate_stack(stack=stack)),
         master=frame,
         text="View",
         width=75,
@@ -418,9 +456,29 @@ def _create_top_frame_widgets() -> None:
     )
 
 
-def _load_stacks() -> None:
+def _hydrate_stack(stack: Union[Model, ModelProxy]) -> Model:
+    """
+    Returns the full model of a stack shown on the dashboard.
+
+    Args:
+        stack (Union[Model, ModelProxy]): The stack or its lazy proxy.
+
+    Returns:
+        Model: The stack model.
     """
-    Retrieves the stacks from the database and creates the dashboard item widgets for each stack.
+
+    if is_model_proxy(value=stack):
+        return stack.to_model()
+
+    return stack
+
+
+def _load_next_stacks_page() -> None:
+    """
+    Retrieves the next page of stacks from the database and creates the dashboard item widgets for each stack.
+
+    Stacks that already have a dashboard item (e.g. because they were added while
+    the dashboard was shown) are skipped.
 
     Args:
         None
@@ -429,27 +487,105 @@ def _load_stacks() -> None:
         None
     """
 
-    stacks: Optional[list[Model]] = (
-        dispatch(
-            event=GET_ALL_STACKS_FROM_DB,
-            namespace=GLOBAL_NAMESPACE,
-            table_name="stacks",
+    if not _STACKS_PAGE["has_more"] or _STACKS_PAGE["loading"]:
+        return
+
+    _STACKS_PAGE["loading"] = True
+
+    try:
+        page: dict[str, Any] = (
+            dispatch(
+                event=GET_PAGE_OF_STACKS_FROM_DB,
+                lazy=True,
+                limit=_STACKS_PAGE_SIZE,
+                namespace=GLOBAL_NAMESPACE,
+                offset=_STACKS_PAGE["next_offset"],
+                table_name="stacks",
+            )
+            .get(
+                "get_entries_page",
+                [{}],
+            )[0]
+            .get(
+                "result",
+                {},
+            )
+        ) or {}
+
+        _STACKS_PAGE["has_more"] = page.get(
+            "has_more",
+            False,
         )
-        .get(
-            "get_all_entries",
-            {},
-        )[0]
-        .get(
-            "result",
-            [{}],
+        _STACKS_PAGE["next_offset"] = page.get(
+            "next_offset",
+            _STACKS_PAGE["next_offset"],
         )
+
+        stacks: list[Model] = page.get(
+            "entries",
+            [],
+        )
+
+        if exists(value=stacks):
+            _STACKS_PAGE["last_id"] = max(
+                _STACKS_PAGE["last_id"],
+                *(int(stack.id) for stack in stacks),
+            )
+
+        _add_dashboard_items(stacks=stacks)
+    finally:
+        _STACKS_PAGE["loading"] = False
+
+
+def _load_stacks() -> None:
+    """
+    Retrieves the first page of stacks from the database and creates the dashboard item widgets for each stack.
+
+    Further pages are loaded as the dashboard item container is scrolled towards its end.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    _STACKS_PAGE["has_more"] = True
+    _STACKS_PAGE["last_id"] = -1
+    _STACKS_PAGE["next_offset"] = 0
+
+    _load_next_stacks_page()
+
+
+def _on_dashboard_item_container_scroll(
+    first: str,
+    last: str,
+) -> None:
+    """
+    Handles scroll updates of the dashboard item container.
+
+    Updates the scrollbar and schedules loading the next page of stacks once the
+    visible area reaches the last 10% of the loaded stacks (or they do not fill it).
+
+    Args:
+        first (str): The top of the visible area, as a fraction of the scrollable height.
+        last (str): The bottom of the visible area, as a fraction of the scrollable height.
+
+    Returns:
+        None
+    """
+
+    container: ctk.CTkScrollableFrame = _get_dashboard_item_container()
+
+    container._scrollbar.set(
+        first,
+        last,
     )
 
-    if not exists(value=stacks):
+    if float(last) < 0.9 or not _STACKS_PAGE["has_more"]:
         return
 
-    for stack in stacks:
-        _create_dashboard_item_widgets(stack=stack)
+    container.after_idle(_load_next_stacks_page)
 
 
 def _on_destroy() -> None:
@@ -471,43 +607,58 @@ def _on_destroy() -> None:
 
     _DASHBOARD_ITEM_CONTAINER = None
 
+    _STACKS_PAGE["has_more"] = False
+
 
-def _on_stack_added(stack: Model) -> None:
+def _on_stack_added(stack: list[Model]) -> None:
     """
     Handler for the 'STACK_ADDED' event.
 
+    The handler coalesces, so stacks added one by one within a batch (or the
+    coalescing window) are added to the dashboard in a single call.
+
     Args:
-        stack (Model): The stack that was added.
+        stack (list[Model]): The stacks that were added.
 
     Returns:
         None
     """
 
-    frame: ctk.CTkFrame = _create_dashboard_item_widgets(stack=stack)
-
-    _register_dashboard_item(
-        frame=frame,
-        key=stack.key,
-    )
+    _add_dashboard_items(stacks=stack)
 
 
-def _on_stack_deleted(stack: dict[str, Any]) -> None:
+def _on_stack_deleted(stack: list[dict[str, Any]]) -> None:
     """
     Handler for the 'STACK_DELETED' event.
 
-    This method is called when a stack is deleted from the database.
-    It removes the stack from the dashboard view and unregisters it.
+    This method is called when stacks are deleted from the database (coalesced).
+    It removes the stacks from the dashboard view and unregisters them. Deleting a stack
+    that was loaded by paging moves the following stacks one position up, so the offset
+    of the next page is moved back accordingly.
 
     Args:
-        stack (dict[str, Any]): A dictionary representing the stack that was deleted.
+        stack (list[dict[str, Any]]): Dictionaries representing the stacks that were deleted.
 
     Returns:
         None
     """
 
-    _DASHBOARD_ITEMS[stack["identifiable"]["key"]].destroy()
+    for entry in stack:
+        id_: Optional[int] = entry["identifiable"]["id"]
+        key: str = entry["identifiable"]["key"]
+
+        if exists(value=id_) and int(id_) <= _STACKS_PAGE["last_id"]:
+            _STACKS_PAGE["next_offset"] = max(
+                0,
+                _STACKS_PAGE["next_offset"] - 1,
+            )
 
-    _unregister_dashboard_item(key=stack["identifiable"]["key"])
+        if key not in _DASHBOARD_ITEMS:
+            continue
+
+        _DASHBOARD_ITEMS[key].destroy()
+
+        _unregister_dashboard_item(key=key)
 
 
 def _on_stacks_added(stacks: list[Model]) -> None:
@@ -515,25 +666,22 @@ def _on_stacks_added(stacks: list[Model]) -> None:
     Handler for the 'STACKS_ADDED' event.
 
     Args:
-        stacks (list[Model]): The stacks that were added.
+        stacks (list[Model]): The stacks that were added, merged across coalesced dispatches.
 
     Returns:
         None
     """
 
-    for stack in stacks:
-        frame: ctk.CTkFrame = _create_dashboard_item_widgets(stack=stack)
-
-        _register_dashboard_item(
-            frame=frame,
-            key=stack.key,
-        )
+    _add_dashboard_items(stacks=stacks)
 
 
 def _subscribe_to_events() -> None:
     """
     Subscribes to events for the dashboard view.
 
+    The subscriptions are owned by the dashboard item container, so they are
+    unsubscribed once it is destroyed, even if 'DESTROY_DASHBOARD_VIEW' is never dispatched.
+
     Args:
         None
 
@@ -543,6 +691,7 @@ def _subscribe_to_events() -> None:
 
     subscriptions: list[dict[str, Any]] = [
         {
+            "coalesce": False,
             "event": DESTROY_DASHBOARD_VIEW,
             "function": _on_destroy,
             "namespace": GLOBAL,
@@ -550,6 +699,7 @@ def _subscribe_to_events() -> None:
             "priority": 100,
         },
         {
+            "coalesce": True,
             "event": STACK_ADDED,
             "function": _on_stack_added,
             "namespace": GLOBAL,
@@ -557,6 +707,7 @@ def _subscribe_to_events() -> None:
             "priority": 100,
         },
         {
+            "coalesce": True,
             "event": STACKS_ADDED,
             "function": _on_stacks_added,
             "namespace": GLOBAL,
@@ -564,6 +715,7 @@ def _subscribe_to_events() -> None:
             "priority": 100,
         },
         {
+            "coalesce": True,
             "event": STACK_DELETED,
             "function": _on_stack_deleted,
             "namespace": GLOBAL,
@@ -573,14 +725,14 @@ def _subscribe_to_events() -> None:
     ]
 
     for subscription in subscriptions:
-        _SUBSCRIPTION_IDS.append(
-            subscribe(
-                event=subscription["event"],
-                function=subscription["function"],
-                namespace=subscription["namespace"],
-                persistent=subscription["persistent"],
-                priority=subscription["priority"],
-            )
+        subscribe(
+            coalesce=subscription["coalesce"],
+            event=subscription["event"],
+            function=subscription["function"],
+            namespace=subscription["namespace"],
+            owner=_get_dashboard_item_container(),
+            persistent=subscription["persistent"],
+            priority=subscription["priority"],
         )
 
     log_info(message="Subscribed to all events for the dashboard view.")
@@ -597,13 +749,10 @@ def _unsubscribe_from_events() -> None:
         None
     """
 
-    for uuid in _SUBSCRIPTION_IDS:
-        unsubscribe(uuid=uuid)
+    unsubscribe_owner(owner=_get_dashboard_item_container())
 
     log_info(message="Unsubscribed from all events for the dashboard view.")
 
-    _SUBSCRIPTION_IDS.clear()
-
 
 # ---------- Public Functions ---------- #
 
@@ -20,7 +20,7 @@ from studyfrog.gui.logic.delete_confirmation_view_logic import (
 )
 from studyfrog.models.models import Model
 from studyfrog.utils.common import exists
-from studyfrog.utils.dispatcher import subscribe, unsubscribe
+from studyfrog.utils.dispatcher import subscribe, unsubscribe_owner
 from studyfrog.utils.logging import log_error, log_info
 
 
@@ -35,7 +35,6 @@ _BOTTOM_FRAME: Optional[ctk.CTkFrame] = None
 _CENTER_FRAME: Optional[ctk.CTkFrame] = None
 _MASTER: Optional[ctk.CTkToplevel] = None
 _MODEL: Optional[Model] = None
-_SUBSCRIPTION_IDS: Final[list[str]] = []
 _TOP_FRAME: Optional[ctk.CTkFrame] = None
 
 
@@ -126,20 +125,6 @@ def _get_model() -> Optional[Model]:
     return _MODEL
 
 
-def _get_subscription_ids() -> list[str]:
-    """
-    Returns the subscription IDs for subscriptions in the delete confirmation view.
-
-    Args:
-        None
-
-    Returns:
-        list[str]: The subscription IDs for subscriptions in the delete confirmation view.
-    """
-
-    return list(_SUBSCRIPTION_IDS)
-
-
 def _get_top_frame() -> ctk.CTkFrame:
     """
     Returns the delete confirmation view's 'top frame' ctk.Frame widget.
@@ -539,6 +524,8 @@ def _subscribe_to_events() -> None:
     """
     Subscribes to events in the delete confirmation view.
 
+    The subscriptions are owned by the toplevel, so closing the window unsubscribes them.
+
     Args:
         None
 
@@ -557,14 +544,13 @@ def _subscribe_to_events() -> None:
     ]
 
     for subscription in subscriptions:
-        _get_subscription_ids().append(
-            subscribe(
-                event=subscription["event"],
-                function=subscription["function"],
-                namespace=subscription["namespace"],
-                persistent=subscription["persistent"],
-                priority=subscription["priority"],
-            )
+        subscribe(
+            event=subscription["event"],
+            function=subscription["function"],
+            namespace=subscription["namespace"],
+            owner=_get_master(),
+            persistent=subscription["persistent"],
+            priority=subscription["priority"],
         )
 
     log_info(message="Subscribed all events for the delete confirmation view.")
@@ -581,13 +567,10 @@ def _unsubscribe_from_events() -> None:
         None
     """
 
-    for uuid in _get_subscription_ids():
-        unsubscribe(uuid=uuid)
+    unsubscribe_owner(owner=_get_master())
 
     log_info(message="Unsubscribed from all events for the delete confirmation view.")
 
-    _get_subscription_ids().clear()
-
 
 # ---------- Public Functions ---------- #
 
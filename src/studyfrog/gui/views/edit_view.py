@@ -21,7 +21,7 @@ from studyfrog.gui.logic.edit_view_logic import (
 )
 from studyfrog.models.models import Model
 from studyfrog.utils.common import exists
-from studyfrog.utils.dispatcher import subscribe, unsubscribe
+from studyfrog.utils.dispatcher import subscribe, unsubscribe_owner
 from studyfrog.utils.logging import log_error
 
 
@@ -36,7 +36,6 @@ _BOTTOM_FRAME: Optional[ctk.CTkFrame] = None
 _CENTER_FRAME: Optional[ctk.CTkFrame] = None
 _MASTER: Optional[ctk.CTkScrollableFrame] = None
 _MODEL: Optional[dict[str, Any]] = None
-_SUBSCRIPTION_IDS: Final[list[str]] = []
 _TABVIEW: Optional[ctk.CTkTabview] = None
 _TOP_FRAME: Optional[ctk.CTkFrame] = None
 
@@ -44,34 +43,6 @@ _TOP_FRAME: Optional[ctk.CTkFrame] = None
 # ---------- Helper Functions ---------- #
 
 
-def _append_subscription(uuid: str) -> None:
-    """
-    Appends a passed subscription UUID to the list of subscription IDs.
-
-    Args:
-        uuid (str): The subscription UUID to append.
-
-    Returns:
-        None
-    """
-
-    _get_subscription_ids().append(uuid)
-
-
-def _clear_subscription_ids() -> None:
-    """
-    Clears the list of subscription IDs for the edit view.
-
-    Args:
-        None
-
-    Returns:
-        None
-    """
-
-    _SUBSCRIPTION_IDS.clear()
-
-
 def _get_bottom_frame() -> ctk.CTkFrame:
     """
     Returns the 'bottom' frame widget for the edit view.
@@ -157,20 +128,6 @@ def _get_model() -> Model:
     return _MODEL
 
 
-def _get_subscription_ids() -> list[str]:
-    """
-    Returns the subscription IDs for the edit view.
-
-    Args:
-        None
-
-    Returns:
-        list[str]: The subscription IDs for the edit view.
-    """
-
-    return _SUBSCRIPTION_IDS
-
-
 def _get_tabview() -> ctk.CTkTabview:
     """
     Returns the tabview widget of the edit view.
@@ -635,7 +592,8 @@ def _subscribe_to_events() -> None:
     """
     Subscribes to events for the edit view.
 
-    The edit view currently only subscribes to the 'DESTROY_EDIT_VIEW' event.
+    The edit view currently only subscribes to the 'DESTROY_EDIT_VIEW' event. The
+    subscriptions are owned by the toplevel, so closing the window unsubscribes them.
 
     Args:
         None
@@ -655,14 +613,13 @@ def _subscribe_to_events() -> None:
     ]
 
     for subscription in subscriptions:
-        _append_subscription(
-            uuid=subscribe(
-                event=subscription["event"],
-                function=subscription["function"],
-                namespace=subscription["namespace"],
-                persistent=subscription["persistent"],
-                priority=subscription["priority"],
-            )
+        subscribe(
+            event=subscription["event"],
+            function=subscription["function"],
+            namespace=subscription["namespace"],
+            owner=_get_master(),
+            persistent=subscription["persistent"],
+            priority=subscription["priority"],
         )
 
 
@@ -670,8 +627,7 @@ def _unsubscribe_from_events() -> None:
     """
     Unsubscribes from all currently active event subscriptions.
 
-    Iterates through the subscription IDs returned by `_get_subscription_ids()`
-    and calls `unsubscribe(uuid=uuid)` for each ID.
+    Unsubscribes every subscription owned by the toplevel of the edit view.
 
     Args:
         None
@@ -680,10 +636,7 @@ def _unsubscribe_from_events() -> None:
         None
     """
 
-    for uuid in _get_subscription_ids():
-        unsubscribe(uuid=uuid)
-
-    _clear_subscription_ids()
+    unsubscribe_owner(owner=_get_master())
 
 
 # ---------- Public Functions ---------- #
@@ -15,7 +15,7 @@ from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
 from studyfrog.gui.gui import get_bottom_frame, get_center_frame, get_top_frame
 from studyfrog.models.models import Model
 from studyfrog.utils.common import exists
-from studyfrog.utils.dispatcher import subscribe, unsubscribe
+from studyfrog.utils.dispatcher import subscribe, unsubscribe_owner
 from studyfrog.utils.gui import clear_frames, reset_frame_grids
 from studyfrog.utils.logging import log_debug, log_error, log_info, log_warning
 
@@ -28,7 +28,7 @@ __all__: Final[list[str]] = []
 # ---------- Constants ---------- #
 
 _REHEARSAL_RUN: Optional[Model] = None
-_SUBSCRIPTION_IDS: Final[list[str]] = []
+_SUBSCRIPTION_OWNER: Final[str] = "gui.views.rehearsal_run_result_view"
 
 # ---------- Helper Functions ---------- #
 
@@ -201,8 +201,6 @@ def _on_destroy() -> None:
 
     _unsubscribe_from_events()
 
-    _SUBSCRIPTION_IDS.clear()
-
 
 def _subscribe_to_events() -> None:
     """
@@ -226,14 +224,13 @@ def _subscribe_to_events() -> None:
     ]
 
     for subscription in subscriptions:
-        _SUBSCRIPTION_IDS.append(
-            subscribe(
-                event=subscription["event"],
-                function=subscription["function"],
-                namespace=subscription["namespace"],
-                persistent=subscription["persistent"],
-                priority=subscription["priority"],
-            )
+        subscribe(
+            event=subscription["event"],
+            function=subscription["function"],
+            namespace=subscription["namespace"],
+            owner=_SUBSCRIPTION_OWNER,
+            persistent=subscription["persistent"],
+            priority=subscription["priority"],
         )
 
     log_info(message="Subscribed to events in the rehearsal run result view.")
@@ -250,8 +247,7 @@ def _unsubscribe_from_events() -> None:
         None
     """
 
-    for uuid in _SUBSCRIPTION_IDS:
-        unsubscribe(uuid=uuid)
+    unsubscribe_owner(owner=_SUBSCRIPTION_OWNER)
 
     log_info(message="Unsubscribed from all events in the rehearsal run result view.")
 
@@ -258,6 +258,7 @@ def _create_center_frame_widgets() -> None:
     )
 
     _create_difficulty_form_widgets(master=scrollable_frame)
+    _create_due_today_form_widgets(master=scrollable_frame)
     _create_priority_form_widgets(master=scrollable_frame)
     _create_randomization_form_widgets(master=scrollable_frame)
     _create_stack_selection_form_widgets(master=scrollable_frame)
@@ -363,6 +364,73 @@ def _create_difficulty_form_widgets(master: ctk.CTkScrollableFrame) -> None:
     )
 
 
+def _create_due_today_form_widgets(master: ctk.CTkScrollableFrame) -> None:
+    """
+    Creates the 'due today' form widgets.
+
+    Args:
+        master (ctk.CTkScrollableFrame): The master widget.
+
+    Returns:
+        None
+    """
+
+    _FORM["due_today_enabled"] = {
+        "is_required": False,
+        "variable": ctk.BooleanVar(),
+    }
+
+    frame: ctk.CTkFrame = ctk.CTkFrame(master=master)
+
+    frame.pack(
+        expand=YES,
+        fill=X,
+        padx=5,
+        pady=5,
+        side=TOP,
+    )
+
+    frame.grid_columnconfigure(
+        index=0,
+        weight=0,
+    )
+    frame.grid_columnconfigure(
+        index=1,
+        weight=1,
+    )
+    frame.grid_rowconfigure(
+        index=0,
+        weight=0,
+    )
+    frame.grid_rowconfigure(
+        index=1,
+        weight=0,
+    )
+
+    ctk.CTkLabel(
+        master=frame,
+        text="Only rehearse items due today? ",
+    ).grid(
+        column=0,
+        padx=5,
+        pady=5,
+        row=0,
+        sticky=NSEW,
+    )
+
+    ctk.CTkCheckBox(
+        master=frame,
+        text="",
+        variable=_FORM["due_today_enabled"]["variable"],
+    ).grid(
+        column=1,
+        padx=5,
+        pady=5,
+        row=0,
+        sticky=W,
+    )
+
+
 def _create_priority_form_widgets(master: ctk.CTkScrollableFrame) -> None:
     """
     Creates the 'priority' form widgets.
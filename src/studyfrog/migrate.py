@@ -0,0 +1,56 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from studyfrog.core.bootstrap import ensure_directories
+from studyfrog.utils.logging import log_error, log_exception, log_info
+from studyfrog.utils.sqlite import close_sqlite_connections
+from studyfrog.utils.storage import migrate_tables_to_sqlite
+
+
+__NAME__: Final[str] = "src.migrate.migrate"
+
+
+def migrate() -> int:
+    """
+    Entry point for migrating the JSON tables in the data directory to SQLite.
+
+    Once migrated, the SQLite backend is used by setting "storage.backend" to
+    "sqlite" in the config JSON file.
+
+    Args:
+        None
+
+    Returns:
+        int: The exit code of the migration. (0 for success, 1 for failure)
+    """
+
+    try:
+        ensure_directories()
+
+        migrated: list[str] = migrate_tables_to_sqlite()
+
+        log_info(
+            message=f"Migrated {len(migrated)} tables. Set 'storage.backend' to 'sqlite' in the config to use them.",
+            name=f"{__NAME__}.migrate",
+        )
+
+        return 0
+    except Exception as e:
+        log_error(
+            message=f"Caught an exception while migrating the tables to SQLite: {e}",
+            name=f"{__NAME__}.migrate",
+        )
+        log_exception(message="", name=f"{__NAME__}.migrate")
+        return 1
+    finally:
+        close_sqlite_connections()
+
+
+if __name__ == "__main__":
+    raise SystemExit(migrate())
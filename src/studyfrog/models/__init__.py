@@ -1,65 +1,84 @@
 from __future__ import annotations
 
-# Import all exported variables and functions from individual modules
+from typing import Any, Final
 
-# Model classes
-from studyfrog.models.models import (
-    AnswerModel,
-    AssociationModel,
-    CustomfieldModel,
-    DifficultyModel,
-    FlashcardModel,
-    ImageModel,
-    Model,
-    NoteModel,
-    OptionModel,
-    PriorityModel,
-    QuestionModel,
-    RehearsalRunItemModel,
-    RehearsalRunModel,
-    StackModel,
-    SubjectModel,
-    TagModel,
-    TeacherModel,
-    UserModel,
+from studyfrog.utils.lazy import (
+    get_lazy_attribute,
+    get_lazy_attribute_names,
+    register_lazy_imports,
 )
 
-# Factory functions
-from studyfrog.models.factory import (
-    get_answer_model,
-    get_association_model,
-    get_customfield_model,
-    get_difficulty_model,
-    get_flashcard_model,
-    get_image_model,
-    get_model,
-    get_note_model,
-    get_option_model,
-    get_priority_model,
-    get_question_model,
-    get_rehearsal_action_model,
-    get_rehearsal_run_model,
-    get_rehearsal_run_item_model,
-    get_stack_model,
-    get_subject_model,
-    get_tag_model,
-    get_teacher_model,
-    get_user_model,
-)
 
-# Observable model classes
-from studyfrog.models.observables import (
-    AnswerObservableModel,
-    DifficultyObservableModel,
-    FlashcardObservableModel,
-    NoteObservableModel,
-    PriorityObservableModel,
-    QuestionObservableModel,
-    StackObservableModel,
-    SubjectObservableModel,
-    TagObservableModel,
-    TeacherObservableModel,
-    ObservableModel,  # TypeAlias
+# Import all exported variables and functions from individual modules (lazily, on first access)
+_LAZY_IMPORTS: Final[dict[str, tuple[str, ...]]] = {
+    # Model classes
+    "studyfrog.models.models": (
+        "AnswerModel",
+        "AssociationModel",
+        "CustomfieldModel",
+        "DifficultyModel",
+        "FlashcardModel",
+        "ImageModel",
+        "Model",
+        "NoteModel",
+        "OptionModel",
+        "PriorityModel",
+        "QuestionModel",
+        "RehearsalRunItemModel",
+        "RehearsalRunModel",
+        "StackModel",
+        "SubjectModel",
+        "TagModel",
+        "TeacherModel",
+        "UserModel",
+    ),
+    # Factory functions
+    "studyfrog.models.factory": (
+        "get_answer_model",
+        "get_association_model",
+        "get_customfield_model",
+        "get_difficulty_model",
+        "get_flashcard_model",
+        "get_image_model",
+        "get_model",
+        "get_note_model",
+        "get_option_model",
+        "get_priority_model",
+        "get_question_model",
+        "get_rehearsal_action_model",
+        "get_rehearsal_run_model",
+        "get_rehearsal_run_item_model",
+        "get_stack_model",
+        "get_subject_model",
+        "get_tag_model",
+        "get_teacher_model",
+        "get_user_model",
+    ),
+    # Lazy model proxies
+    "studyfrog.models.proxies": (
+        "ModelProxy",
+        "get_model_proxy",
+        "is_model_proxy",
+    ),
+    # Observable model classes
+    "studyfrog.models.observables": (
+        "AnswerObservableModel",
+        "DifficultyObservableModel",
+        "FlashcardObservableModel",
+        "NoteObservableModel",
+        "PriorityObservableModel",
+        "QuestionObservableModel",
+        "StackObservableModel",
+        "SubjectObservableModel",
+        "TagObservableModel",
+        "TeacherObservableModel",
+        "ObservableModel",  # TypeAlias
+    ),
+}
+
+register_lazy_imports(
+    imports=_LAZY_IMPORTS,
+    package=__name__,
 )
 
 # Export all models, functions, and type aliases
@@ -103,6 +122,10 @@ __all__: list[str] = [
     "get_tag_model",
     "get_teacher_model",
     "get_user_model",
+    # Lazy model proxies
+    "ModelProxy",
+    "get_model_proxy",
+    "is_model_proxy",
     # Observable model classes
     "AnswerObservableModel",
     "DifficultyObservableModel",
@@ -116,3 +139,14 @@ __all__: list[str] = [
     "TeacherObservableModel",
     "ObservableModel",  # TypeAlias
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return get_lazy_attribute(
+        name=name,
+        package=__name__,
+    )
+
+
+def __dir__() -> list[str]:
+    return get_lazy_attribute_names(package=__name__)
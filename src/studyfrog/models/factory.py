@@ -6,6 +6,7 @@ Description: This module contains the factory methods for creating model instanc
 
 from __future__ import annotations
 
+import inspect
 import uuid
 
 from datetime import date, datetime
@@ -37,7 +38,6 @@ from studyfrog.utils.common import (
     date_from_string,
     datetime_from_string,
     exists,
-    filter_and_call,
     uuid_from_string,
 )
 from studyfrog.utils.logging import log_error, log_warning
@@ -70,6 +70,43 @@ __all__: Final[list[str]] = [
 
 __NAME__: Final[str] = "src.models.factory"
 
+ARGUMENT_ALIASES: Final[dict[str, str]] = {
+    "id": "id_",
+    "uuid": "uuid_",
+}
+
+MODEL_CLASSES: Final[dict[str, Optional[Type]]] = {
+    "answer": AnswerModel,
+    "association": AssociationModel,
+    "customfield": CustomfieldModel,
+    "difficulty": DifficultyModel,
+    "flashcard": FlashcardModel,
+    "image": ImageModel,
+    "note": NoteModel,
+    "option": OptionModel,
+    "priority": PriorityModel,
+    "question": QuestionModel,
+    "rehearsal_action": RehearsalActionModel,
+    # The rehearsal run factory regroups its filter parameters into a 'configuration'.
+    "rehearsal_run": None,
+    "rehearsal_run_item": RehearsalRunItemModel,
+    "stack": StackModel,
+    "subject": SubjectModel,
+    "tag": TagModel,
+    "teacher": TeacherModel,
+    "user": UserModel,
+}
+
+MODEL_PLANS: Final[dict[str, dict[str, Any]]] = {}
+
+PARAMETER_CONVERTERS: Final[dict[str, tuple[Type, Callable]]] = {
+    "created_at": (datetime, datetime_from_string),
+    "created_on": (date, date_from_string),
+    "updated_at": (datetime, datetime_from_string),
+    "updated_on": (date, date_from_string),
+    "uuid_": (uuid.UUID, uuid_from_string),
+}
+
 # ---------- Helper Functions ---------- #
 
 
@@ -90,13 +127,7 @@ def _convert_parameters(**kwargs) -> dict[str, Any]:
         dict[str, Any]: The updated dictionary with converted values.
     """
 
-    checks_for_type: dict[str, list[Type, Callable]] = {
-        "created_at": [datetime, datetime_from_string],
-        "created_on": [date, date_from_string],
-        "updated_at": [datetime, datetime_from_string],
-        "updated_on": [date, date_from_string],
-        "uuid_": [uuid.UUID, uuid_from_string],
-    }
+    checks_for_type: dict[str, tuple[Type, Callable]] = PARAMETER_CONVERTERS
 
     for (
         key,
@@ -133,6 +164,144 @@ def _convert_parameters(**kwargs) -> dict[str, Any]:
     return kwargs
 
 
+def _get_model_arguments(
+    kwargs: dict[str, Any],
+    parameters: frozenset[str],
+) -> dict[str, Any]:
+    """
+    Collects the arguments of a model factory from a (stored) model dictionary.
+
+    The 'identifiable' and 'metadata' parts are flattened into the top level (taking
+    precedence over top-level keys of the same name), 'id' and 'uuid' are renamed to
+    'id_' and 'uuid_', and everything the factory does not accept is dropped.
+
+    Args:
+        kwargs (dict[str, Any]): The model dictionary.
+        parameters (frozenset[str]): The names of the parameters accepted by the factory.
+
+    Returns:
+        dict[str, Any]: The arguments to pass to the factory.
+    """
+
+    arguments: dict[str, Any] = {}
+
+    for source in (
+        kwargs,
+        kwargs.get("identifiable"),
+        kwargs.get("metadata"),
+    ):
+        if not isinstance(
+            source,
+            dict,
+        ):
+            continue
+
+        for (
+            key,
+            value,
+        ) in source.items():
+            name: str = ARGUMENT_ALIASES.get(
+                key,
+                key,
+            )
+
+            if name not in parameters:
+                continue
+
+            arguments[name] = value
+
+    return arguments
+
+
+def _get_model_factories() -> dict[str, Callable[..., Model]]:
+    """
+    Returns the factory function of every model type.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Callable[..., Model]]: The factory functions, keyed by lowercase model type.
+    """
+
+    return {
+        "answer": get_answer_model,
+        "association": get_association_model,
+        "customfield": get_customfield_model,
+        "difficulty": get_difficulty_model,
+        "flashcard": get_flashcard_model,
+        "image": get_image_model,
+        "note": get_note_model,
+        "option": get_option_model,
+        "priority": get_priority_model,
+        "question": get_question_model,
+        "rehearsal_action": get_rehearsal_action_model,
+        "rehearsal_run": get_rehearsal_run_model,
+        "rehearsal_run_item": get_rehearsal_run_item_model,
+        "stack": get_stack_model,
+        "subject": get_subject_model,
+        "tag": get_tag_model,
+        "teacher": get_teacher_model,
+        "user": get_user_model,
+    }
+
+
+def _get_model_plan(type_: str) -> Optional[dict[str, Any]]:
+    """
+    Returns the construction plan of a model type, computing it on first use.
+
+    The plan holds everything 'get_model' needs to know about the type's factory:
+    the parameters it accepts, their defaults and the converters that apply to them.
+    For factories that do nothing but convert their parameters, it also holds the
+    model class, so that 'get_model' can construct the model directly.
+
+    Args:
+        type_ (str): The model type (case-insensitive).
+
+    Returns:
+        Optional[dict[str, Any]]: The plan with the 'converters', 'defaults', 'factory',
+                                  'model' and 'parameters' keys, or None if the type is unknown.
+    """
+
+    plan: Optional[dict[str, Any]] = MODEL_PLANS.get(type_.lower())
+
+    if exists(value=plan):
+        return plan
+
+    factory: Optional[Callable[..., Model]] = _get_model_factories().get(type_.lower())
+
+    if not exists(value=factory):
+        return None
+
+    signature: inspect.Signature = inspect.signature(factory)
+
+    plan = {
+        "converters": {
+            name: converter
+            for (
+                name,
+                converter,
+            ) in PARAMETER_CONVERTERS.items()
+            if name in signature.parameters
+        },
+        "defaults": {
+            name: parameter.default
+            for (
+                name,
+                parameter,
+            ) in signature.parameters.items()
+            if parameter.default is not inspect.Parameter.empty
+        },
+        "factory": factory,
+        "model": MODEL_CLASSES.get(type_.lower()),
+        "parameters": frozenset(signature.parameters.keys()),
+    }
+
+    MODEL_PLANS[type_.lower()] = plan
+
+    return plan
+
+
 # ---------- Public Functions ---------- #
 
 
@@ -339,6 +508,7 @@ def get_flashcard_model(
     last_viewed_on: Optional[str] = None,
     next_view_on: Optional[str] = None,
     priority: Optional[str] = None,
+    schedule: Optional[dict[str, Any]] = None,
     subject: Optional[str] = None,
     tags: Optional[list[str]] = None,
     teacher: Optional[str] = None,
@@ -370,6 +540,7 @@ def get_flashcard_model(
         last_viewed_on (Optional[str]): ISO-formatted date of the last review.
         next_view_on (Optional[str]): ISO-formatted date for the next scheduled review.
         priority (Optional[str]): Reference key for the associated Priority level.
+        schedule (Optional[dict[str, Any]]): The spaced-repetition state computed by the scheduler.
         subject (Optional[str]): Reference key for the associated Subject.
         tags (Optional[list[str]]): A list of tag keys associated with this card.
         teacher (Optional[str]): Reference key for the associated Teacher.
@@ -454,6 +625,11 @@ def get_model(
     """
     Creates and returns an instance of a model based on the specified type.
 
+    The passed keyword arguments may be a stored model dictionary, including its
+    'identifiable' and 'metadata' parts. The type's construction plan (see
+    '_get_model_plan') is computed on first use, after which building a model is a
+    single pass over the arguments followed by the constructor call.
+
     Args:
         type_ (Literal): The type of model to create.
         **kwargs: Additional keyword arguments to pass to the model constructor.
@@ -463,72 +639,54 @@ def get_model(
     """
 
     try:
-        dictionary: dict[str, Callable] = {
-            "answer": get_answer_model,
-            "association": get_association_model,
-            "customfield": get_customfield_model,
-            "difficulty": get_difficulty_model,
-            "flashcard": get_flashcard_model,
-            "image": get_image_model,
-            "note": get_note_model,
-            "option": get_option_model,
-            "priority": get_priority_model,
-            "question": get_question_model,
-            "rehearsal_action": get_rehearsal_action_model,
-            "rehearsal_run": get_rehearsal_run_model,
-            "rehearsal_run_item": get_rehearsal_run_item_model,
-            "stack": get_stack_model,
-            "subject": get_subject_model,
-            "tag": get_tag_model,
-            "teacher": get_teacher_model,
-            "user": get_user_model,
-        }
-
-        if exists(
-            value=kwargs.get(
-                "identifiable",
-                None,
-            )
-        ):
-            kwargs.update(**kwargs.pop("identifiable"))
-
-        if exists(
-            value=kwargs.get(
-                "metadata",
-                None,
-            )
-        ):
-            kwargs.update(**kwargs.pop("metadata"))
-
-        if exists(
-            value=kwargs.get(
-                "id",
-                None,
-            )
-        ):
-            kwargs["id_"] = kwargs.pop("id")
-
-        if exists(
-            value=kwargs.get(
-                "uuid",
-                None,
-            )
-        ):
-            kwargs["uuid_"] = kwargs.pop("uuid")
-
-        handler: Optional[Callable[[...], Any]] = dictionary.get(type_.lower())
+        plan: Optional[dict[str, Any]] = MODEL_PLANS.get(type_.lower()) or _get_model_plan(
+            type_=type_
+        )
 
-        if not exists(value=handler):
+        if not exists(value=plan):
             log_error(
                 message=f"Found no handler function for model type '{type_}'",
                 name="models.factory.get_model",
             )
             return None
 
-        return filter_and_call(
-            function=handler,
-            **kwargs,
+        arguments: dict[str, Any] = _get_model_arguments(
+            kwargs=kwargs,
+            parameters=plan["parameters"],
         )
+
+        if not exists(value=plan["model"]):
+            return plan["factory"](**arguments)
+
+        arguments = {
+            **plan["defaults"],
+            **arguments,
+        }
+
+        for (
+            key,
+            (
+                expected_type,
+                converter,
+            ),
+        ) in plan["converters"].items():
+            value: Any = arguments.get(key)
+
+            if value is None or isinstance(
+                value,
+                expected_type,
+            ):
+                continue
+
+            try:
+                arguments[key] = converter(string=value)
+            except Exception as e:
+                log_error(
+                    message=f"Failed to convert '{key}' from string '{value}': {e}",
+                    name="models.factory.get_model",
+                )
+
+        return plan["model"](**arguments)
     except KeyError as ke:
         log_error(
             message=f"Invalid model type: {type_}: {ke}",
@@ -561,6 +719,7 @@ def get_note_model(
     last_viewed_on: Optional[str] = None,
     next_view_on: Optional[str] = None,
     priority: Optional[str] = None,
+    schedule: Optional[dict[str, Any]] = None,
     subject: Optional[str] = None,
     tags: Optional[list[str]] = None,
     teacher: Optional[str] = None,
@@ -592,6 +751,7 @@ def get_note_model(
         last_viewed_on (Optional[str]): ISO-formatted last review date.
         next_view_on (Optional[str]): ISO-formatted next scheduled review date.
         priority (Optional[str]): Reference key for the priority level.
+        schedule (Optional[dict[str, Any]]): The spaced-repetition state computed by the scheduler.
         subject (Optional[str]): Reference key for the associated subject.
         tags (Optional[list[str]]): List of tag keys associated with the note.
         teacher (Optional[str]): Reference key for the associated teacher.
@@ -702,6 +862,7 @@ def get_question_model(
     last_viewed_on: Optional[str] = None,
     next_view_on: Optional[str] = None,
     priority: Optional[str] = None,
+    schedule: Optional[dict[str, Any]] = None,
     subject: Optional[str] = None,
     tags: Optional[list[str]] = None,
     teacher: Optional[str] = None,
@@ -734,6 +895,7 @@ def get_question_model(
         last_viewed_on (Optional[str]): ISO-formatted date of the last time this question was seen.
         next_view_on (Optional[str]): ISO-formatted date for the next scheduled review.
         priority (Optional[str]): Reference key for the associated Priority level.
+        schedule (Optional[dict[str, Any]]): The spaced-repetition state computed by the scheduler.
         subject (Optional[str]): Reference key for the associated Subject.
         tags (Optional[list[str]]): A list of tag keys associated with this question.
         teacher (Optional[str]): Reference key for the associated Teacher.
@@ -844,9 +1006,11 @@ def get_rehearsal_run_model(
     author: Optional[str] = None,
     completed_at: Optional[Union[datetime, str]] = None,
     completed_on: Optional[Union[date, str]] = None,
+    configuration: Optional[dict[str, Any]] = None,
     created_at: Optional[Union[datetime, str]] = None,
     created_on: Optional[Union[date, str]] = None,
     customfields: Optional[list[dict[str, Any]]] = None,
+    due_today_enabled: bool = False,
     duration: Optional[dict[str, float]] = None,
     filter_by_difficulty: Optional[str] = None,
     filter_by_difficulty_enabled: bool = False,
@@ -879,9 +1043,12 @@ def get_rehearsal_run_model(
         author (Optional[str]): Identifier of the user who initiated the run.
         completed_at (Optional[str]): ISO-formatted timestamp of session completion.
         completed_on (Optional[str]): ISO-formatted date of session completion.
+        configuration (Optional[dict[str, Any]]): The stored session configuration. Takes precedence
+                                                  over the individual configuration parameters.
         created_at (Optional[str]): ISO-formatted creation timestamp.
         created_on (Optional[str]): ISO-formatted creation date.
         customfields (Optional[list[dict[str, Any]]]): List of custom metadata dictionaries.
+        due_today_enabled (bool): Whether only the items of the stacks due today are rehearsed.
         duration (Optional[dict[str, float]]): Dictionary tracking time spent in the session.
         filter_by_difficulty (Optional[str]): Difficulty to filter by in the session.
         filter_by_difficulty_enabled (bool): Whether difficulty filtering is enabled.
@@ -907,11 +1074,13 @@ def get_rehearsal_run_model(
     parameters: dict[str, Any] = _convert_parameters(**locals().copy())
 
     parameters["configuration"] = {
+        "due_today_enabled": parameters.pop("due_today_enabled"),
         "filter_by_difficulty": parameters.pop("filter_by_difficulty"),
         "filter_by_difficulty_enabled": parameters.pop("filter_by_difficulty_enabled"),
         "filter_by_priority": parameters.pop("filter_by_priority"),
         "filter_by_priority_enabled": parameters.pop("filter_by_priority_enabled"),
         "item_order_randomization_enabled": parameters.pop("item_order_randomization_enabled"),
+        **(parameters.pop("configuration") or {}),
     }
 
     return RehearsalRunModel(**parameters)
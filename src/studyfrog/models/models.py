@@ -12,7 +12,8 @@ import uuid
 from pathlib import Path
 from datetime import date, datetime
 
-from typing import Any, Final, Optional, TypeAlias, Union
+from types import CodeType
+from typing import Any, Callable, Final, Optional, TypeAlias, Union
 
 from studyfrog.utils.common import (
     exists,
@@ -68,6 +69,18 @@ Model: TypeAlias = Union[
     "UserModel",
 ]
 
+MODEL_ATTRIBUTES: Final[dict[type, tuple[tuple[str, str], ...]]] = {}
+
+MODEL_FIELDS: Final[dict[tuple[type, str], dict[str, Any]]] = {}
+
+JSON_CONVERTERS: Final[dict[type, Callable[[Any], Any]]] = {
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    uuid.UUID: str,
+}
+
+UNSET: Final[object] = object()
+
 
 # ---------- Helper Functions ---------- #
 
@@ -86,23 +99,27 @@ def _convert_to_dict(model: Model) -> dict[str, Any]:
     result: dict[str, Any] = {}
 
     for (
+        attribute,
         key,
-        value,
-    ) in model.__dict__.items():
+    ) in _get_model_attributes(model_class=model.__class__):
+        value: Any = getattr(
+            model,
+            attribute,
+            UNSET,
+        )
+
+        if value is UNSET:
+            continue
+
         if isinstance(
             value,
-            (
-                ModelIdentifiable,
-                ModelMetadata,
-            ),
+            BaseModel,
         ):
-            result[key.strip("_")] = value.to_dict()
-
-            continue
+            value = value.to_dict()
 
-        result[key.strip("_")] = value
+        result[key] = value
 
-    return dict(sorted(result.items()))
+    return result
 
 
 def _convert_to_json(model: Model) -> dict[str, Any]:
@@ -119,54 +136,145 @@ def _convert_to_json(model: Model) -> dict[str, Any]:
     result: dict[str, Any] = {}
 
     for (
+        attribute,
         key,
-        value,
-    ) in model.__dict__.items():
-        if not isinstance(
-            value,
-            (
-                datetime,
-                date,
-                ModelIdentifiable,
-                ModelMetadata,
-                Path,
-                uuid.UUID,
-            ),
-        ):
-            result[key.strip("_")] = value
+    ) in _get_model_attributes(model_class=model.__class__):
+        value: Any = getattr(
+            model,
+            attribute,
+            UNSET,
+        )
 
+        if value is UNSET:
             continue
 
-        if isinstance(
-            value,
-            datetime,
-        ):
-            result[key.strip("_")] = value.isoformat()
-        elif isinstance(
-            value,
-            date,
-        ):
-            result[key.strip("_")] = value.isoformat()
+        converter: Optional[Callable[[Any], Any]] = JSON_CONVERTERS.get(value.__class__)
+
+        if converter is not None:
+            value = converter(value)
         elif isinstance(
             value,
-            (
-                ModelIdentifiable,
-                ModelMetadata,
-            ),
+            BaseModel,
         ):
-            result[key.strip("_")] = value.to_json_dict()
+            value = value.to_json_dict()
         elif isinstance(
             value,
             Path,
         ):
-            result[key.strip("_")] = str(value)
-        elif isinstance(
+            value = str(value)
+
+        result[key] = value
+
+    return result
+
+
+def _copy_model_fields(fields: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns a copy of the field metadata of a model that shares no lists with the original.
+
+    Args:
+        fields (dict[str, Any]): The field metadata to copy.
+
+    Returns:
+        dict[str, Any]: The copied field metadata.
+    """
+
+    return {
+        key: (
+            list(value)
+            if isinstance(
+                value,
+                list,
+            )
+            else value
+        )
+        for (
+            key,
             value,
-            uuid.UUID,
-        ):
-            result[key.strip("_")] = str(value)
+        ) in fields.items()
+    }
+
+
+def _get_model_attributes(model_class: type) -> tuple[tuple[str, str], ...]:
+    """
+    Returns the slotted attributes of a model class paired with their dictionary keys.
+
+    The pairs are collected once per class from the '__slots__' along its MRO and are
+    sorted by key, so the converters build their dictionaries already in order.
+
+    Args:
+        model_class (type): The model class.
+
+    Returns:
+        tuple[tuple[str, str], ...]: The (attribute, key) pairs sorted by key.
+    """
+
+    attributes: Optional[tuple[tuple[str, str], ...]] = MODEL_ATTRIBUTES.get(model_class)
+
+    if attributes is None:
+        attributes = tuple(
+            sorted(
+                (
+                    (
+                        attribute,
+                        attribute.strip("_"),
+                    )
+                    for class_ in model_class.__mro__
+                    for attribute in class_.__dict__.get(
+                        "__slots__",
+                        (),
+                    )
+                ),
+                key=lambda pair: pair[1],
+            )
+        )
+
+        MODEL_ATTRIBUTES[model_class] = attributes
+
+    return attributes
+
+
+def _get_model_fields(
+    model_class: type,
+    key: str = "values",
+) -> dict[str, Any]:
+    """
+    Returns the field metadata shared by all instances of a model class.
+
+    The metadata lists the names the initializer of the class is called with
+    ('self', its parameters and 'class'), as stored along with every model. It is
+    computed once per class and must not be modified; ModelMetadata only hands out
+    copies of it.
+
+    Args:
+        model_class (type): The model class.
+        key (str): The key the names are listed under. Defaults to 'values'.
+
+    Returns:
+        dict[str, Any]: The field metadata with the names and their 'total'.
+    """
+
+    fields: Optional[dict[str, Any]] = MODEL_FIELDS.get((model_class, key))
+
+    if fields is None:
+        code: CodeType = model_class.__init__.__code__
+
+        values: list[str] = [
+            name.strip("_")
+            for name in (
+                *code.co_varnames[: code.co_argcount + code.co_kwonlyargcount],
+                *code.co_freevars,
+            )
+        ]
+
+        fields = {
+            "total": len(values),
+            key: values,
+        }
 
-    return dict(sorted(result.items()))
+        MODEL_FIELDS[(model_class, key)] = fields
+
+    return fields
 
 
 # ---------- Classes ---------- #
@@ -174,6 +282,8 @@ def _convert_to_json(model: Model) -> dict[str, Any]:
 
 class BaseModel:
 
+    __slots__: Final[tuple[str, ...]] = ()
+
     def __eq__(
         self,
         other: BaseModel,
@@ -242,6 +352,14 @@ class AnswerModel(BaseModel):
     for tracking lifecycle details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_customfields",
+        "_identifiable",
+        "_is_correct",
+        "_metadata",
+        "_text",
+    )
+
     def __init__(
         self,
         is_correct: bool,
@@ -291,10 +409,7 @@ class AnswerModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="ANSWER",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -461,6 +576,27 @@ class AssociationModel(BaseModel):
     for tracking lifecycle details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_answer",
+        "_customfield",
+        "_difficulty",
+        "_flashcard",
+        "_identifiable",
+        "_image",
+        "_metadata",
+        "_note",
+        "_option",
+        "_priority",
+        "_question",
+        "_rehearsal_run",
+        "_rehearsal_run_item",
+        "_stack",
+        "_subject",
+        "_tag",
+        "_teacher",
+        "_user",
+    )
+
     def __init__(
         self,
         answer: Optional[Union[int, str]] = None,
@@ -523,10 +659,7 @@ class AssociationModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="ASSOCIATION",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -921,6 +1054,13 @@ class CustomfieldModel(BaseModel):
     ModelMetadata for tracking lifecycle details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_identifiable",
+        "_metadata",
+        "_name",
+        "_options",
+    )
+
     def __init__(
         self,
         name: str,
@@ -963,10 +1103,7 @@ class CustomfieldModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="CUSTOMFIELD",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -1128,6 +1265,14 @@ class DifficultyModel(BaseModel):
     identification and metadata management.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_display_name",
+        "_identifiable",
+        "_metadata",
+        "_name",
+        "_value",
+    )
+
     def __init__(
         self,
         display_name: str,
@@ -1174,10 +1319,7 @@ class DifficultyModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="DIFFICULTY",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -1326,6 +1468,24 @@ class FlashcardModel(BaseModel):
     such as tags, subjects, and teachers.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_back",
+        "_customfields",
+        "_difficulty",
+        "_front",
+        "_identifiable",
+        "_is_assigned_to_stack",
+        "_last_viewed_at",
+        "_last_viewed_on",
+        "_metadata",
+        "_next_view_on",
+        "_priority",
+        "_schedule",
+        "_subject",
+        "_tags",
+        "_teacher",
+    )
+
     def __init__(
         self,
         back: str,
@@ -1342,6 +1502,7 @@ class FlashcardModel(BaseModel):
         last_viewed_on: Optional[datetime] = None,
         next_view_on: Optional[date] = None,
         priority: Optional[str] = None,
+        schedule: Optional[dict[str, Any]] = None,
         subject: Optional[str] = None,
         tags: Optional[list[str]] = None,
         teacher: Optional[str] = None,
@@ -1367,6 +1528,7 @@ class FlashcardModel(BaseModel):
             last_viewed_on (Optional[datetime]): Last date the card was seen.
             next_view_on (Optional[date]): Scheduled date for next review.
             priority (Optional[str]): Priority level key.
+            schedule (Optional[dict[str, Any]]): The spaced-repetition state (see 'utils.scheduler').
             subject (Optional[str]): Associated subject key.
             tags (Optional[list[str]]): List of associated tags.
             teacher (Optional[str]): Associated teacher key.
@@ -1396,16 +1558,14 @@ class FlashcardModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="FLASHCARD",
             updated_at=updated_at,
             updated_on=updated_on,
         )
         self._next_view_on: Optional[date] = next_view_on
         self._priority: Optional[str] = priority
+        self._schedule: dict[str, Any] = schedule or {}
         self._subject: Optional[str] = subject
         self._tags: list[str] = tags or []
         self._teacher: Optional[str] = teacher
@@ -1583,6 +1743,24 @@ class FlashcardModel(BaseModel):
 
         self._last_viewed_at = value
 
+    @property
+    def last_viewed_on(self) -> Optional[date]:
+        """
+        Returns the date when the flashcard was last viewed.
+
+        Returns:
+            Optional[date]: The last viewing date if available.
+        """
+
+        return self._last_viewed_on
+
+    @last_viewed_on.setter
+    def last_viewed_on(
+        self,
+        value: date,
+    ) -> None:
+        self._last_viewed_on = value
+
     @property
     def next_view_on(self) -> Optional[date]:
         """
@@ -1623,6 +1801,25 @@ class FlashcardModel(BaseModel):
     ) -> None:
         self._priority = value
 
+    @property
+    def schedule(self) -> dict[str, Any]:
+        """
+        Returns the spaced-repetition state of the flashcard.
+
+        Returns:
+            dict[str, Any]: The 'ease', 'interval', 'lapses', 'repetitions' and 'stability'
+                            computed by the scheduler, or an empty dictionary if it was never reviewed.
+        """
+
+        return self._schedule
+
+    @schedule.setter
+    def schedule(
+        self,
+        value: dict[str, Any],
+    ) -> None:
+        self._schedule = value
+
     @property
     def subject(self) -> Optional[str]:
         """
@@ -1732,6 +1929,13 @@ class ImageModel(BaseModel):
     update information.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_identifiable",
+        "_metadata",
+        "_name",
+        "_path",
+    )
+
     def __init__(
         self,
         name: str,
@@ -1777,10 +1981,7 @@ class ImageModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="IMAGE",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -1918,6 +2119,12 @@ class ModelIdentifiable(BaseModel):
     universally unique identifier (UUID).
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_id",
+        "_key",
+        "_uuid",
+    )
+
     def __init__(
         self,
         id_: Optional[Union[int, str]] = None,
@@ -1989,6 +2196,16 @@ class ModelMetadata(BaseModel):
     or using system defaults.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_author",
+        "_created_at",
+        "_created_on",
+        "_fields",
+        "_type",
+        "_updated_at",
+        "_updated_on",
+    )
+
     def __init__(
         self,
         type_: str,
@@ -2077,7 +2294,7 @@ class ModelMetadata(BaseModel):
             dict[str, Any]: A dictionary containing dynamic metadata fields.
         """
 
-        return dict(self._fields)
+        return _copy_model_fields(fields=self._fields)
 
     @property
     def type_(self) -> str:
@@ -2113,6 +2330,38 @@ class ModelMetadata(BaseModel):
         return self._updated_on
 
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the dictionary representation of the metadata.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, Any]: The dictionary representation of the metadata.
+        """
+
+        return {
+            **_convert_to_dict(self),
+            "fields": _copy_model_fields(fields=self._fields),
+        }
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """
+        Returns a JSON representation of the metadata as a dictionary.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, Any]: The JSON dictionary representation of the metadata.
+        """
+
+        return {
+            **_convert_to_json(self),
+            "fields": _copy_model_fields(fields=self._fields),
+        }
+
 class NoteModel(BaseModel):
     """
     Represents a note entity within the application.
@@ -2123,6 +2372,24 @@ class NoteModel(BaseModel):
     for tracking lifecycle details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_customfields",
+        "_difficulty",
+        "_identifiable",
+        "_is_assigned_to_stack",
+        "_last_viewed_at",
+        "_last_viewed_on",
+        "_metadata",
+        "_next_view_on",
+        "_priority",
+        "_schedule",
+        "_subject",
+        "_tags",
+        "_teacher",
+        "_text",
+        "_title",
+    )
+
     def __init__(
         self,
         text: str,
@@ -2139,6 +2406,7 @@ class NoteModel(BaseModel):
         last_viewed_on: Optional[datetime] = None,
         next_view_on: Optional[date] = None,
         priority: Optional[str] = None,
+        schedule: Optional[dict[str, Any]] = None,
         subject: Optional[str] = None,
         tags: Optional[list[str]] = None,
         teacher: Optional[str] = None,
@@ -2179,16 +2447,14 @@ class NoteModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="NOTE",
             updated_at=updated_at,
             updated_on=updated_on,
         )
         self._next_view_on: Optional[date] = next_view_on
         self._priority: Optional[str] = priority
+        self._schedule: dict[str, Any] = schedule or {}
         self._subject: Optional[str] = subject
         self._tags: list[str] = tags or []
         self._teacher: Optional[str] = teacher
@@ -2332,6 +2598,24 @@ class NoteModel(BaseModel):
 
         self._last_viewed_at = value
 
+    @property
+    def last_viewed_on(self) -> Optional[date]:
+        """
+        Returns the date when the note was last viewed.
+
+        Returns:
+            Optional[date]: The last viewing date if available.
+        """
+
+        return self._last_viewed_on
+
+    @last_viewed_on.setter
+    def last_viewed_on(
+        self,
+        value: date,
+    ) -> None:
+        self._last_viewed_on = value
+
     @property
     def next_view_on(self) -> Optional[date]:
         """
@@ -2372,6 +2656,25 @@ class NoteModel(BaseModel):
     ) -> None:
         self._priority = value
 
+    @property
+    def schedule(self) -> dict[str, Any]:
+        """
+        Returns the spaced-repetition state of the note.
+
+        Returns:
+            dict[str, Any]: The 'ease', 'interval', 'lapses', 'repetitions' and 'stability'
+                            computed by the scheduler, or an empty dictionary if it was never reviewed.
+        """
+
+        return self._schedule
+
+    @schedule.setter
+    def schedule(
+        self,
+        value: dict[str, Any],
+    ) -> None:
+        self._schedule = value
+
     @property
     def subject(self) -> Optional[str]:
         """
@@ -2516,6 +2819,12 @@ class OptionModel(BaseModel):
     identity through ModelIdentifiable and lifecycle data via ModelMetadata.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_identifiable",
+        "_metadata",
+        "_value",
+    )
+
     def __init__(
         self,
         value: Any,
@@ -2557,10 +2866,7 @@ class OptionModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="OPTION",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -2693,6 +2999,14 @@ class PriorityModel(BaseModel):
     identification and metadata management.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_display_name",
+        "_identifiable",
+        "_metadata",
+        "_name",
+        "_value",
+    )
+
     def __init__(
         self,
         display_name: str,
@@ -2739,10 +3053,7 @@ class PriorityModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="PRIORITY",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -2893,6 +3204,24 @@ class QuestionModel(BaseModel):
     for tracking lifecycle details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_answers",
+        "_customfields",
+        "_difficulty",
+        "_identifiable",
+        "_is_assigned_to_stack",
+        "_last_viewed_at",
+        "_last_viewed_on",
+        "_metadata",
+        "_next_view_on",
+        "_priority",
+        "_schedule",
+        "_subject",
+        "_tags",
+        "_teacher",
+        "_text",
+    )
+
     def __init__(
         self,
         text: str,
@@ -2909,6 +3238,7 @@ class QuestionModel(BaseModel):
         last_viewed_on: Optional[datetime] = None,
         next_view_on: Optional[date] = None,
         priority: Optional[str] = None,
+        schedule: Optional[dict[str, Any]] = None,
         subject: Optional[str] = None,
         tags: Optional[list[str]] = None,
         teacher: Optional[str] = None,
@@ -2932,6 +3262,7 @@ class QuestionModel(BaseModel):
             last_viewed_on (Optional[datetime]): Last date the question was seen.
             next_view_on (Optional[date]): Scheduled date for next review.
             priority (Optional[str]): Priority level key.
+            schedule (Optional[dict[str, Any]]): The spaced-repetition state (see 'utils.scheduler').
             subject (Optional[str]): Associated subject key.
             tags (Optional[list[str]]): List of associated tags.
             teacher (Optional[str]): Associated teacher key.
@@ -2954,19 +3285,21 @@ class QuestionModel(BaseModel):
             key=key,
             uuid_=uuid_,
         )
+        self._is_assigned_to_stack: bool = is_assigned_to_stack
+        self._last_viewed_at: Optional[datetime] = last_viewed_at
+        self._last_viewed_on: Optional[datetime] = last_viewed_on
         self._metadata: Final[ModelMetadata] = ModelMetadata(
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="QUESTION",
             updated_at=updated_at,
             updated_on=updated_on,
         )
+        self._next_view_on: Optional[date] = next_view_on
         self._priority: Optional[str] = priority
+        self._schedule: dict[str, Any] = schedule or {}
         self._subject: Optional[str] = subject
         self._tags: Optional[list[str]] = tags
         self._teacher: Optional[str] = teacher
@@ -3100,6 +3433,23 @@ class QuestionModel(BaseModel):
     ) -> None:
         self._last_viewed_at = value
 
+    @property
+    def last_viewed_on(self) -> Optional[date]:
+        """
+        Returns the date when the question was last viewed.
+
+        Returns:
+            Optional[date]: The last viewing date if available.
+        """
+        return self._last_viewed_on
+
+    @last_viewed_on.setter
+    def last_viewed_on(
+        self,
+        value: date,
+    ) -> None:
+        self._last_viewed_on = value
+
     @property
     def next_view_on(self) -> Optional[date]:
         """
@@ -3134,6 +3484,25 @@ class QuestionModel(BaseModel):
     ) -> None:
         self._priority = value
 
+    @property
+    def schedule(self) -> dict[str, Any]:
+        """
+        Returns the spaced-repetition state of the question.
+
+        Returns:
+            dict[str, Any]: The 'ease', 'interval', 'lapses', 'repetitions' and 'stability'
+                            computed by the scheduler, or an empty dictionary if it was never reviewed.
+        """
+
+        return self._schedule
+
+    @schedule.setter
+    def schedule(
+        self,
+        value: dict[str, Any],
+    ) -> None:
+        self._schedule = value
+
     @property
     def subject(self) -> Optional[str]:
         """
@@ -3253,6 +3622,14 @@ class RehearsalActionModel(BaseModel):
     provides the necessary metadata to track the study progress.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_action_data",
+        "_identifiable",
+        "_message",
+        "_metadata",
+        "_timestamp",
+    )
+
     def __init__(
         self,
         action_data: dict[str, Any],
@@ -3302,10 +3679,7 @@ class RehearsalActionModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="REHEARSAL_ACTION",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -3433,6 +3807,16 @@ class RehearsalRunItemModel(BaseModel):
     maintains its own identity and metadata for audit trails.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_actions",
+        "_completed_at",
+        "_identifiable",
+        "_item",
+        "_metadata",
+        "_result",
+        "_started_at",
+    )
+
     def __init__(
         self,
         item: str,
@@ -3485,10 +3869,7 @@ class RehearsalRunItemModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="REHEARSAL_RUN_ITEM",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -3670,6 +4051,25 @@ class RehearsalRunModel(BaseModel):
     and ModelMetadata for lifecycle tracking.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_completed_at",
+        "_completed_on",
+        "_configuration",
+        "_customfields",
+        "_duration",
+        "_finished_at",
+        "_finished_on",
+        "_identifiable",
+        "_is_finished",
+        "_items",
+        "_metadata",
+        "_scheduled_at",
+        "_scheduled_on",
+        "_stacks",
+        "_started_at",
+        "_started_on",
+    )
+
     def __init__(
         self,
         stacks: list[str],
@@ -3751,10 +4151,7 @@ class RehearsalRunModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="REHEARSAL_RUN",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -4065,6 +4462,24 @@ class StackModel(BaseModel):
     through ModelMetadata.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_children",
+        "_customfields",
+        "_description",
+        "_difficulty",
+        "_identifiable",
+        "_items",
+        "_last_viewed_at",
+        "_metadata",
+        "_name",
+        "_next_view_on",
+        "_parent",
+        "_priority",
+        "_subject",
+        "_tags",
+        "_teacher",
+    )
+
     def __init__(
         self,
         name: str,
@@ -4144,10 +4559,10 @@ class StackModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "fields": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(
+                key="fields",
+                model_class=self.__class__,
+            ),
             type_="STACK",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -4518,6 +4933,15 @@ class SubjectModel(BaseModel):
     and ModelMetadata for tracking creation and update details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_customfields",
+        "_difficulty",
+        "_identifiable",
+        "_metadata",
+        "_name",
+        "_priority",
+    )
+
     def __init__(
         self,
         name: str,
@@ -4567,10 +4991,7 @@ class SubjectModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="SUBJECT",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -4762,6 +5183,12 @@ class TagModel(BaseModel):
     management and ModelMetadata for tracking creation and update details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_identifiable",
+        "_metadata",
+        "_value",
+    )
+
     def __init__(
         self,
         value: str,
@@ -4803,10 +5230,7 @@ class TagModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="TAG",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -4932,6 +5356,16 @@ class TeacherModel(BaseModel):
     identity management and ModelMetadata for tracking lifecycle information.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_customfields",
+        "_difficulty",
+        "_identifiable",
+        "_metadata",
+        "_name",
+        "_priority",
+        "_subjects",
+    )
+
     def __init__(
         self,
         name: str,
@@ -4983,10 +5417,7 @@ class TeacherModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="TEACHER",
             updated_at=updated_at,
             updated_on=updated_on,
@@ -5209,6 +5640,12 @@ class UserModel(BaseModel):
     update details.
     """
 
+    __slots__: Final[tuple[str, ...]] = (
+        "_identifiable",
+        "_metadata",
+        "_name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -5250,10 +5687,7 @@ class UserModel(BaseModel):
             author=author,
             created_at=created_at,
             created_on=created_on,
-            fields={
-                "total": len(locals().keys()),
-                "values": [key.strip("_") for key in locals().keys()],
-            },
+            fields=_get_model_fields(model_class=self.__class__),
             type_="USER",
             updated_at=updated_at,
             updated_on=updated_on,
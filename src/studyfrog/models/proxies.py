@@ -0,0 +1,306 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: This module contains the lazy, read-only model proxies returned by the lazy read mode of the storage
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Final, Optional
+
+from studyfrog.models.factory import get_model
+from studyfrog.models.models import BaseModel, Model
+from studyfrog.utils.common import (
+    date_from_string,
+    datetime_from_string,
+    exists,
+    uuid_from_string,
+)
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "ModelProxy",
+    "get_model_proxy",
+    "is_model_proxy",
+]
+
+
+# ---------- Constants ---------- #
+
+IDENTIFIABLE_FIELDS: Final[tuple[str, ...]] = (
+    "id",
+    "key",
+    "uuid",
+)
+
+METADATA_FIELDS: Final[tuple[str, ...]] = (
+    "author",
+    "created_at",
+    "created_on",
+    "fields",
+    "type",
+    "updated_at",
+    "updated_on",
+)
+
+DECODERS: Final[dict[str, Callable[..., Any]]] = {
+    "created_at": datetime_from_string,
+    "created_on": date_from_string,
+    "updated_at": datetime_from_string,
+    "updated_on": date_from_string,
+    "uuid": uuid_from_string,
+}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _clone_value(value: Any) -> Any:
+    """
+    Returns a copy of a JSON value that shares no mutable containers with the original.
+
+    Args:
+        value (Any): The JSON value to copy.
+
+    Returns:
+        Any: The copied JSON value.
+    """
+
+    if isinstance(
+        value,
+        dict,
+    ):
+        return {key: _clone_value(value=item) for (key, item) in value.items()}
+
+    if isinstance(
+        value,
+        list,
+    ):
+        return [_clone_value(value=item) for item in value]
+
+    return value
+
+
+# ---------- Classes ---------- #
+
+
+class ModelProxy:
+    """
+    Represents a stored model without constructing it.
+
+    The proxy wraps the raw JSON entry of a model as stored in a table. Fields are
+    read from the entry when they are accessed, and dates, timestamps and UUIDs are
+    only decoded then. Anything the entry does not hold (e.g. derived properties)
+    upgrades the proxy to the full model, which is created once and kept.
+
+    The wrapped entry is never modified and never handed out: containers (lists and
+    dictionaries) are copied on access, just like the models built by the storage.
+    """
+
+    __slots__: Final[tuple[str, ...]] = (
+        "_decoded",
+        "_entry",
+        "_model",
+    )
+
+    def __init__(
+        self,
+        entry: dict[str, Any],
+    ) -> None:
+        """
+        Initializes the ModelProxy instance.
+
+        Args:
+            entry (dict[str, Any]): The raw JSON entry of the model, with its
+                                    'identifiable' and 'metadata' parts.
+
+        Returns:
+            None
+        """
+
+        self._decoded: dict[str, Any] = {}
+        self._entry: Final[dict[str, Any]] = entry
+        self._model: Optional[Model] = None
+
+    def __eq__(
+        self,
+        other: Any,
+    ) -> bool:
+        if isinstance(
+            other,
+            ModelProxy,
+        ):
+            return self._entry == other._entry
+
+        if isinstance(
+            other,
+            BaseModel,
+        ):
+            return self.to_model() == other
+
+        return False
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if name in self._decoded:
+            return self._decoded[name]
+
+        field: str = "type" if name == "type_" else name
+
+        if field in IDENTIFIABLE_FIELDS:
+            value: Any = (self._entry.get("identifiable") or {}).get(field)
+        elif field in METADATA_FIELDS:
+            value = (self._entry.get("metadata") or {}).get(field)
+        elif field in self._entry and field not in (
+            "identifiable",
+            "metadata",
+        ):
+            value = self._entry[field]
+        else:
+            return getattr(
+                self.to_model(),
+                name,
+            )
+
+        if field in DECODERS and isinstance(
+            value,
+            str,
+        ):
+            value = DECODERS[field](string=value)
+
+        if isinstance(
+            value,
+            (
+                dict,
+                list,
+            ),
+        ):
+            return _clone_value(value=value)
+
+        self._decoded[name] = value
+
+        return value
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                self.type_,
+                self.key,
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({self.type_}, {self.key})>"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @property
+    def is_hydrated(self) -> bool:
+        """
+        Returns whether the full model has been created.
+
+        Returns:
+            bool: True if the proxy was upgraded to the full model, False otherwise.
+        """
+
+        return exists(value=self._model)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the dictionary representation of the full model.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, Any]: The dictionary representation of the model.
+        """
+
+        return self.to_model().to_dict()
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """
+        Returns the JSON representation of the model as a dictionary, without creating the model.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, Any]: A copy of the wrapped JSON entry.
+        """
+
+        return _clone_value(value=self._entry)
+
+    def to_json_str(self) -> str:
+        """
+        Returns the JSON representation of the full model as string.
+
+        Args:
+            None
+
+        Returns:
+            str: The JSON string representation of the model.
+        """
+
+        return self.to_model().to_json_str()
+
+    def to_model(self) -> Model:
+        """
+        Upgrades the proxy to the full model, creating it on first use.
+
+        Args:
+            None
+
+        Returns:
+            Model: The model built from the wrapped entry.
+        """
+
+        if not exists(value=self._model):
+            self._model = get_model(
+                type_=self.type_,
+                **_clone_value(value=self._entry),
+            )
+
+        return self._model
+
+
+# ---------- Functions ---------- #
+
+
+def get_model_proxy(entry: dict[str, Any]) -> ModelProxy:
+    """
+    Creates and returns a lazy proxy over the raw JSON entry of a model.
+
+    Args:
+        entry (dict[str, Any]): The raw JSON entry of the model.
+
+    Returns:
+        ModelProxy: The proxy wrapping the entry.
+    """
+
+    return ModelProxy(entry=entry)
+
+
+def is_model_proxy(value: Any) -> bool:
+    """
+    Returns whether the passed value is a lazy model proxy.
+
+    Args:
+        value (Any): The value to check.
+
+    Returns:
+        bool: True if the value is a ModelProxy, False otherwise.
+    """
+
+    return isinstance(
+        value,
+        ModelProxy,
+    )
@@ -1,140 +1,281 @@
 from __future__ import annotations
 
-# Import all exported variables and functions from individual modules
+from typing import Any, Final
 
-# Common utility functions
-from studyfrog.utils.common import (
-    create_rgb_bg_color,
-    create_rgb_fg_color,
-    date_from_string,
-    datetime_from_string,
-    exists,
-    filter_and_call,
-    find_string,
-    flatten_dictionary,
-    generate_model_key,
-    generate_uuid4,
-    generate_uuid4_str,
-    get_date_from_string,
-    get_datetime_from_string,
-    get_time_from_string,
-    get_now,
-    get_now_iso_str,
-    get_today,
-    get_today_iso_str,
-    is_empty,
-    is_none,
-    is_none_or_empty,
-    is_not_none,
-    is_not_none_or_empty,
-    match_string,
-    model_key_to_model_type,
-    path_from_string,
-    pluralize_word,
-    search_string,
-    shuffle_list,
-    simple_dict_to_string,
-    simple_string_to_dict,
-    singularize_word,
-    string_to_snake_case,
-    uuid_from_string,
+from studyfrog.utils.lazy import (
+    get_lazy_attribute,
+    get_lazy_attribute_names,
+    register_lazy_imports,
 )
 
-# Directory utilities
-from studyfrog.utils.directories import (
-    create_directory,
-    does_directory_exist,
-    ensure_directory,
-    is_directory_empty,
-    remove_directory,
-)
-
-# Dispatcher utilities
-from studyfrog.utils.dispatcher import (
-    bulk_dispatch,
-    bulk_subscribe,
-    bulk_unsubscribe,
-    dispatch,
-    subscribe,
-    unsubscribe,
-)
 
-# File utilities
-from studyfrog.utils.files import (
-    create_file,
-    does_file_exist,
-    does_file_have_content,
-    ensure_file,
-    read_file_json,
-    read_file_text,
-    remove_file,
-    write_file_json,
-    write_file_text,
-)
-
-# GUI utilities
-from studyfrog.utils.gui import (
-    clear_center_frame,
-    clear_bottom_frame,
-    clear_frames,
-    clear_top_frame,
-    count_widget_children,
-    destroy_widget_children,
-    get_widget_children,
-    reset_bottom_frame_grid,
-    reset_center_frame_grid,
-    reset_frame_grids,
-    reset_top_frame_grid,
-    reset_widget_grid,
-)
-
-# Logging utilities
-from studyfrog.utils.logging import (
-    log,
-    log_critical,
-    log_debug,
-    log_error,
-    log_info,
-    log_success,
-    log_trace,
-    log_warning,
-    LogLevel,  # TypeAlias
-)
-
-# Model utilities
-from studyfrog.utils.models import (
-    count_models,
-    create_model,
-    create_models,
-    delete_model,
-    delete_models,
-    filter_models,
-    read_all_models,
-    read_model,
-    read_model_by_key,
-    read_models,
-    read_models_by_keys,
-    update_model,
-    update_models,
-)
+# Import all exported variables and functions from individual modules (lazily, on first access)
+_LAZY_IMPORTS: Final[dict[str, tuple[str, ...]]] = {
+    # Common utility functions
+    "studyfrog.utils.common": (
+        "create_rgb_bg_color",
+        "create_rgb_fg_color",
+        "date_from_string",
+        "datetime_from_string",
+        "exists",
+        "filter_and_call",
+        "find_string",
+        "flatten_dictionary",
+        "generate_model_key",
+        "generate_uuid4",
+        "generate_uuid4_str",
+        "get_date_from_string",
+        "get_datetime_from_string",
+        "get_time_from_string",
+        "get_now",
+        "get_now_iso_str",
+        "get_today",
+        "get_today_iso_str",
+        "is_empty",
+        "is_none",
+        "is_none_or_empty",
+        "is_not_none",
+        "is_not_none_or_empty",
+        "match_string",
+        "model_key_to_model_type",
+        "path_from_string",
+        "pluralize_word",
+        "search_string",
+        "shuffle_list",
+        "simple_dict_to_string",
+        "simple_string_to_dict",
+        "singularize_word",
+        "string_to_snake_case",
+        "uuid_from_string",
+    ),
+    # Config utilities
+    "studyfrog.utils.config": (
+        "get_config_value",
+        "reload_config",
+        "set_config_value",
+    ),
+    # Directory utilities
+    "studyfrog.utils.directories": (
+        "create_directory",
+        "does_directory_exist",
+        "ensure_directory",
+        "is_directory_empty",
+        "remove_directory",
+    ),
+    # Dispatcher utilities
+    "studyfrog.utils.dispatcher": (
+        "batch",
+        "bulk_dispatch",
+        "bulk_subscribe",
+        "bulk_unsubscribe",
+        "call_on_main_thread",
+        "dispatch",
+        "dispatch_async",
+        "dispatch_lean",
+        "flush_coalesced_events",
+        "get_subscription_leak_report",
+        "has_subscribers",
+        "process_dispatch_callbacks",
+        "prune_subscriptions",
+        "schedule_dispatch_callbacks",
+        "shutdown_dispatch_executor",
+        "subscribe",
+        "unsubscribe",
+        "unsubscribe_owner",
+    ),
+    # File utilities
+    "studyfrog.utils.files": (
+        "backup_file",
+        "create_file",
+        "does_file_exist",
+        "does_file_have_content",
+        "ensure_file",
+        "get_backup_file",
+        "read_file_json",
+        "read_file_text",
+        "remove_file",
+        "write_file_json",
+        "write_file_text",
+    ),
+    # GUI utilities
+    "studyfrog.utils.gui": (
+        "clear_center_frame",
+        "clear_bottom_frame",
+        "clear_frames",
+        "clear_top_frame",
+        "count_widget_children",
+        "destroy_widget_children",
+        "get_widget_children",
+        "reset_bottom_frame_grid",
+        "reset_center_frame_grid",
+        "reset_frame_grids",
+        "reset_top_frame_grid",
+        "reset_widget_grid",
+    ),
+    # Journal utilities
+    "studyfrog.utils.journal": (
+        "append_journal_records",
+        "compact_journal",
+        "get_journal_file",
+        "get_journal_record_count",
+        "get_table_header",
+        "load_journaled_table",
+        "read_journal_records",
+        "replay_journal_records",
+        "save_journaled_table",
+        "write_journal_records",
+    ),
+    # JSON Lines utilities
+    "studyfrog.utils.jsonl": (
+        "convert_json_tables_to_jsonl",
+        "convert_json_to_jsonl",
+        "convert_jsonl_tables_to_json",
+        "convert_jsonl_to_json",
+        "does_jsonl_table_exist",
+        "get_jsonl_entries",
+        "get_jsonl_file",
+        "get_jsonl_table_signature",
+        "iter_jsonl_entries",
+        "load_jsonl_table",
+        "save_jsonl_table",
+    ),
+    # Logging utilities
+    "studyfrog.utils.logging": (
+        "configure_logging",
+        "flush_logs",
+        "is_log_level_enabled",
+        "log",
+        "log_critical",
+        "log_debug",
+        "log_error",
+        "log_info",
+        "log_success",
+        "log_trace",
+        "log_warning",
+        "set_log_level",
+        "set_module_log_level",
+        "start_log_writer",
+        "stop_log_writer",
+        "LogLevel",  # TypeAlias
+    ),
+    # Model utilities
+    "studyfrog.utils.models": (
+        "count_models",
+        "create_model",
+        "create_models",
+        "delete_model",
+        "delete_models",
+        "filter_models",
+        "read_all_models",
+        "read_model",
+        "read_model_by_key",
+        "read_models",
+        "read_models_by_keys",
+        "update_model",
+        "update_models",
+    ),
+    # Reference cache utilities
+    "studyfrog.utils.reference_cache": (
+        "clear_reference_cache",
+        "get_reference_key",
+        "get_reference_model",
+        "get_reference_models",
+        "remove_from_reference_cache",
+        "update_reference_cache",
+        "warm_reference_cache",
+    ),
+    # Rehearsal buffer utilities
+    "studyfrog.utils.rehearsal_buffer": (
+        "clear_rehearsal_buffer",
+        "flush_rehearsal_buffer",
+        "record_rehearsal_action",
+        "record_rehearsal_grade",
+        "record_rehearsal_item",
+        "recover_rehearsal_buffer",
+        "start_rehearsal_buffer",
+    ),
+    # Review queue utilities
+    "studyfrog.utils.review_queue": (
+        "build_review_queue",
+        "clear_due_index",
+        "count_due_items",
+        "rebuild_due_index",
+        "remove_from_due_index",
+        "update_due_index",
+    ),
+    # Scheduler utilities
+    "studyfrog.utils.scheduler": (
+        "get_next_schedule",
+        "get_review_interval",
+        "get_scheduler_parameters",
+        "reschedule_all_entries",
+        "reschedule_entries",
+        "schedule_reviews",
+    ),
+    # SQLite utilities
+    "studyfrog.utils.sqlite": (
+        "close_sqlite_connections",
+        "does_sqlite_table_exist",
+        "filter_sqlite_entries",
+        "get_sqlite_connection",
+        "get_sqlite_entries",
+        "get_sqlite_table_signature",
+        "iter_sqlite_entries",
+        "load_sqlite_table",
+        "migrate_json_tables_to_sqlite",
+        "save_sqlite_table",
+    ),
+    # Startup utilities
+    "studyfrog.utils.startup": (
+        "end_startup_phase",
+        "format_startup_report",
+        "get_startup_report",
+        "reset_startup_report",
+        "start_startup_phase",
+    ),
+    # Storage utilities
+    "studyfrog.utils.storage": (
+        "add_entry",
+        "add_entry_if_not_exist",
+        "add_entries",
+        "add_entries_if_not_exist",
+        "clear_table_cache",
+        "compact_table",
+        "compact_tables",
+        "convert_tables_to_json",
+        "convert_tables_to_jsonl",
+        "count_entries",
+        "declare_table_index",
+        "delete_entry",
+        "delete_entries",
+        "filter_entries",
+        "get_all_entries",
+        "get_entries",
+        "get_entries_by_keys",
+        "get_entries_page",
+        "get_entry",
+        "get_entry_by_key",
+        "get_storage_backend",
+        "get_table_cache_statistics",
+        "iter_entries",
+        "migrate_tables_to_sqlite",
+        "register_storage_backend",
+        "update_entry",
+        "update_entries",
+    ),
+    # Tracing utilities
+    "studyfrog.utils.tracing": (
+        "disable_dispatch_tracing",
+        "dump_dispatch_trace",
+        "enable_dispatch_tracing",
+        "get_dispatch_trace",
+        "reset_dispatch_trace",
+    ),
+}
 
-# Storage utilities
-from studyfrog.utils.storage import (
-    add_entry,
-    add_entry_if_not_exist,
-    add_entries,
-    add_entries_if_not_exist,
-    count_entries,
-    delete_entry,
-    delete_entries,
-    filter_entries,
-    get_all_entries,
-    get_entries,
-    get_entries_by_keys,
-    get_entry,
-    get_entry_by_key,
-    update_entry,
-    update_entries,
+register_lazy_imports(
+    imports=_LAZY_IMPORTS,
+    package=__name__,
 )
 
 # Export all utilities
@@ -174,6 +315,10 @@ __all__: list[str] = [
     "singularize_word",
     "string_to_snake_case",
     "uuid_from_string",
+    # Config utilities
+    "get_config_value",
+    "reload_config",
+    "set_config_value",
     # Directory utilities
     "create_directory",
     "does_directory_exist",
@@ -181,17 +326,31 @@ __all__: list[str] = [
     "is_directory_empty",
     "remove_directory",
     # Dispatcher utilities
+    "batch",
     "bulk_dispatch",
     "bulk_subscribe",
     "bulk_unsubscribe",
+    "call_on_main_thread",
     "dispatch",
+    "dispatch_async",
+    "dispatch_lean",
+    "flush_coalesced_events",
+    "get_subscription_leak_report",
+    "has_subscribers",
+    "process_dispatch_callbacks",
+    "prune_subscriptions",
+    "schedule_dispatch_callbacks",
+    "shutdown_dispatch_executor",
     "subscribe",
     "unsubscribe",
+    "unsubscribe_owner",
     # File utilities
+    "backup_file",
     "create_file",
     "does_file_exist",
     "does_file_have_content",
     "ensure_file",
+    "get_backup_file",
     "read_file_json",
     "read_file_text",
     "remove_file",
@@ -210,7 +369,33 @@ __all__: list[str] = [
     "reset_frame_grids",
     "reset_top_frame_grid",
     "reset_widget_grid",
+    # Journal utilities
+    "append_journal_records",
+    "compact_journal",
+    "get_journal_file",
+    "get_journal_record_count",
+    "get_table_header",
+    "load_journaled_table",
+    "read_journal_records",
+    "replay_journal_records",
+    "save_journaled_table",
+    "write_journal_records",
+    # JSON Lines utilities
+    "convert_json_tables_to_jsonl",
+    "convert_json_to_jsonl",
+    "convert_jsonl_tables_to_json",
+    "convert_jsonl_to_json",
+    "does_jsonl_table_exist",
+    "get_jsonl_entries",
+    "get_jsonl_file",
+    "get_jsonl_table_signature",
+    "iter_jsonl_entries",
+    "load_jsonl_table",
+    "save_jsonl_table",
     # Logging utilities
+    "configure_logging",
+    "flush_logs",
+    "is_log_level_enabled",
     "log",
     "log_critical",
     "log_debug",
@@ -219,6 +404,10 @@ __all__: list[str] = [
     "log_success",
     "log_trace",
     "log_warning",
+    "set_log_level",
+    "set_module_log_level",
+    "start_log_writer",
+    "stop_log_writer",
     "LogLevel",  # TypeAlias
     # Model utilities
     "count_models",
@@ -234,20 +423,96 @@ __all__: list[str] = [
     "read_models_by_keys",
     "update_model",
     "update_models",
+    # Reference cache utilities
+    "clear_reference_cache",
+    "get_reference_key",
+    "get_reference_model",
+    "get_reference_models",
+    "remove_from_reference_cache",
+    "update_reference_cache",
+    "warm_reference_cache",
+    # Rehearsal buffer utilities
+    "clear_rehearsal_buffer",
+    "flush_rehearsal_buffer",
+    "record_rehearsal_action",
+    "record_rehearsal_grade",
+    "record_rehearsal_item",
+    "recover_rehearsal_buffer",
+    "start_rehearsal_buffer",
+    # Review queue utilities
+    "build_review_queue",
+    "clear_due_index",
+    "count_due_items",
+    "rebuild_due_index",
+    "remove_from_due_index",
+    "update_due_index",
+    # Scheduler utilities
+    "get_next_schedule",
+    "get_review_interval",
+    "get_scheduler_parameters",
+    "reschedule_all_entries",
+    "reschedule_entries",
+    "schedule_reviews",
+    # SQLite utilities
+    "close_sqlite_connections",
+    "does_sqlite_table_exist",
+    "filter_sqlite_entries",
+    "get_sqlite_connection",
+    "get_sqlite_entries",
+    "get_sqlite_table_signature",
+    "iter_sqlite_entries",
+    "load_sqlite_table",
+    "migrate_json_tables_to_sqlite",
+    "save_sqlite_table",
+    # Startup utilities
+    "end_startup_phase",
+    "format_startup_report",
+    "get_startup_report",
+    "reset_startup_report",
+    "start_startup_phase",
     # Storage utilities
     "add_entry",
     "add_entry_if_not_exist",
     "add_entries",
     "add_entries_if_not_exist",
+    "clear_table_cache",
+    "compact_table",
+    "compact_tables",
+    "convert_tables_to_json",
+    "convert_tables_to_jsonl",
     "count_entries",
+    "declare_table_index",
     "delete_entry",
     "delete_entries",
     "filter_entries",
     "get_all_entries",
     "get_entries",
     "get_entries_by_keys",
+    "get_entries_page",
     "get_entry",
     "get_entry_by_key",
+    "get_storage_backend",
+    "get_table_cache_statistics",
+    "iter_entries",
+    "migrate_tables_to_sqlite",
+    "register_storage_backend",
     "update_entry",
     "update_entries",
+    # Tracing utilities
+    "disable_dispatch_tracing",
+    "dump_dispatch_trace",
+    "enable_dispatch_tracing",
+    "get_dispatch_trace",
+    "reset_dispatch_trace",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return get_lazy_attribute(
+        name=name,
+        package=__name__,
+    )
+
+
+def __dir__() -> list[str]:
+    return get_lazy_attribute_names(package=__name__)
@@ -56,6 +56,35 @@ __all__: Final[list[str]] = [
 ]
 
 
+# ---------- Constants ---------- #
+
+FUNCTION_PARAMETERS: Final[dict[Callable, frozenset[str]]] = {}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _get_function_parameters(function: Callable) -> frozenset[str]:
+    """
+    Returns the names of the parameters of a function, inspecting its signature only once.
+
+    Args:
+        function (Callable): The function to get the parameter names of.
+
+    Returns:
+        frozenset[str]: The names of the function's parameters.
+    """
+
+    parameters: Optional[frozenset[str]] = FUNCTION_PARAMETERS.get(function)
+
+    if parameters is None:
+        parameters = frozenset(inspect.signature(function).parameters.keys())
+
+        FUNCTION_PARAMETERS[function] = parameters
+
+    return parameters
+
+
 # ---------- Functions ---------- #
 
 
@@ -168,6 +197,7 @@ def filter_and_call(
     Calls the given function with filtered arguments and keyword arguments.
 
     Filters the arguments and keyword arguments based on the parameters of the given function.
+    The parameters of each function are only inspected on its first call.
 
     Args:
         function (Callable): The function to call.
@@ -180,20 +210,16 @@ def filter_and_call(
         Exception: If any errors occur.
     """
 
-    filtered_kwargs: dict[str, Any] = {}
-
-    parameters: list[str] = list(inspect.signature(function).parameters.keys())
+    parameters: frozenset[str] = _get_function_parameters(function=function)
 
-    filtered_kwargs.update(
-        {
-            key: value
-            for (
-                key,
-                value,
-            ) in kwargs.items()
-            if key in parameters
-        }
-    )
+    filtered_kwargs: dict[str, Any] = {
+        key: value
+        for (
+            key,
+            value,
+        ) in kwargs.items()
+        if key in parameters
+    }
 
     try:
         return function(**filtered_kwargs)
@@ -0,0 +1,236 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Read access to the application configuration stored in the config JSON file.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Final, Optional
+
+from studyfrog.constants.files import CONFIG_DB_JSON
+from studyfrog.utils.files import read_file_json
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "get_config_value",
+    "reload_config",
+    "set_config_value",
+]
+
+
+# ---------- Constants ---------- #
+
+CONFIG: Final[dict[str, Any]] = {}
+
+CONFIG_LOADED: bool = False
+
+DEFAULT_CONFIG: Final[dict[str, Any]] = {
+    "dispatcher": {
+        "coalesce_window": 0,
+        "trace_sample_rate": 1.0,
+        "tracing": False,
+        "workers": 4,
+    },
+    "logging": {
+        "background": True,
+        "batch_size": 256,
+        "file": False,
+        "file_backups": 3,
+        "file_max_bytes": 1_048_576,
+        "json": False,
+        "level": "TRACE",
+        "levels": {},
+    },
+    "rehearsal": {
+        "flush_interval": 60,
+    },
+    "scheduler": {
+        "desired_retention": 0.9,
+        "easy_bonus": 1.3,
+        "first_stability": 1.0,
+        "initial_ease": 2.5,
+        "lapse_factor": 0.2,
+        "maximum_interval": 36500,
+        "minimum_ease": 1.3,
+        "passing_quality": 3,
+        "qualities": {
+            "easy": 5,
+            "hard": 2,
+            "medium": 4,
+        },
+        "second_stability": 6.0,
+    },
+    "storage": {
+        "atomic_writes": True,
+        "backend": "json",
+        "backups": True,
+        "journal_compaction_threshold": 1000,
+    },
+}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _ensure_config_loaded() -> None:
+    """
+    Loads the config JSON file into the in-process config the first time it is needed.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    if CONFIG_LOADED:
+        return
+
+    reload_config()
+
+
+def _get_nested_value(
+    data: dict[str, Any],
+    key: str,
+) -> tuple[bool, Any]:
+    """
+    Resolves a dotted key (e.g. "storage.backend") within a nested dictionary.
+
+    Args:
+        data (dict[str, Any]): The dictionary to resolve the key in.
+        key (str): The dotted key to resolve.
+
+    Returns:
+        tuple[bool, Any]: Whether the key was found and the value it resolved to.
+    """
+
+    value: Any = data
+
+    for part in key.split("."):
+        if not isinstance(
+            value,
+            dict,
+        ) or part not in value:
+            return (
+                False,
+                None,
+            )
+
+        value = value[part]
+
+    return (
+        True,
+        value,
+    )
+
+
+# ---------- Functions ---------- #
+
+
+def get_config_value(
+    key: str,
+    default: Optional[Any] = None,
+) -> Any:
+    """
+    Returns the configured value for a dotted key.
+
+    Values from the config JSON file take precedence over the built-in defaults.
+
+    Args:
+        key (str): The dotted key of the value (e.g. "storage.backend").
+        default (Optional[Any]): The value to return if the key is neither configured
+                                 nor part of the built-in defaults. Defaults to None.
+
+    Returns:
+        Any: The configured value, the built-in default or the passed default.
+    """
+
+    _ensure_config_loaded()
+
+    for data in (
+        CONFIG,
+        DEFAULT_CONFIG,
+    ):
+        (
+            found,
+            value,
+        ) = _get_nested_value(
+            data=data,
+            key=key,
+        )
+
+        if found:
+            return value
+
+    return default
+
+
+def reload_config() -> None:
+    """
+    Re-reads the config JSON file, discarding all in-process overrides.
+
+    An empty or missing config file results in the built-in defaults being used.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    global CONFIG_LOADED
+
+    CONFIG.clear()
+
+    CONFIG_LOADED = True
+
+    try:
+        data: Optional[dict[str, Any]] = read_file_json(file=CONFIG_DB_JSON)
+    except ValueError:
+        data = None
+
+    if not isinstance(
+        data,
+        dict,
+    ):
+        return
+
+    CONFIG.update(data)
+
+
+def set_config_value(
+    key: str,
+    value: Any,
+) -> None:
+    """
+    Overrides the value of a dotted key for the running process.
+
+    The override is not written back to the config JSON file.
+
+    Args:
+        key (str): The dotted key of the value (e.g. "storage.backend").
+        value (Any): The value to set.
+
+    Returns:
+        None
+    """
+
+    _ensure_config_loaded()
+
+    parts: list[str] = key.split(".")
+
+    data: dict[str, Any] = CONFIG
+
+    for part in parts[:-1]:
+        if not isinstance(
+            data.get(part),
+            dict,
+        ):
+            data[part] = {}
+
+        data = data[part]
+
+    data[parts[-1]] = value
@@ -5,37 +5,730 @@ Date: 2025-12-10
 
 from __future__ import annotations
 
-from typing import Any, Callable, Final, Optional
+import contextlib
+import queue
+import threading
+import weakref
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Final, Iterator, Optional
 
 from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
 from studyfrog.utils.common import get_now, generate_uuid4_str
+from studyfrog.utils.config import get_config_value
 from studyfrog.utils.logging import log_error, log_exception, log_info, log_warning
+from studyfrog.utils.tracing import (
+    TRACE,
+    begin_dispatch_span,
+    begin_subscriber_span,
+    end_dispatch_span,
+    end_subscriber_span,
+)
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "batch",
+    "bulk_dispatch",
+    "bulk_subscribe",
+    "bulk_unsubscribe",
+    "call_on_main_thread",
+    "dispatch",
+    "dispatch_async",
+    "dispatch_lean",
+    "flush_coalesced_events",
+    "get_subscription_leak_report",
+    "has_subscribers",
+    "process_dispatch_callbacks",
+    "prune_subscriptions",
+    "schedule_dispatch_callbacks",
+    "shutdown_dispatch_executor",
+    "subscribe",
+    "unsubscribe",
+    "unsubscribe_owner",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "utils.dispatcher"
+
+BATCHES: int = 0
+
+CALLBACKS: Final[queue.SimpleQueue] = queue.SimpleQueue()
+
+CALLBACKS_INTERVAL: Final[int] = 25
+
+CALLBACKS_SCHEDULED: bool = False
+
+COALESCED: Final[dict[str, dict[str, Any]]] = {}
+
+COALESCE_TIMER: Optional[threading.Timer] = None
+
+EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+LOCK: Final[threading.RLock] = threading.RLock()
+
+OWNERS: Final[dict[Any, dict[str, Any]]] = {}
+
+SUBSCRIBERS: Final[dict[str, dict[str, dict[str, Any]]]] = {}
+
+SUBSCRIPTIONS: Final[dict[str, dict[str, tuple[dict[str, Any], ...]]]] = {}
+
+NAMES: Final[dict[str, str]] = {}
+
+UUIDS: Final[dict[str, dict[str, str]]] = {}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _aggregate_arguments(
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    aggregated: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """
+    Merges the arguments of a dispatch into the aggregated arguments of a coalesced call.
+
+    Every argument is aggregated into a list: list values are concatenated, any other
+    value is appended. Positional arguments are aggregated per position.
+
+    Args:
+        args (tuple[Any, ...]): The positional arguments of the dispatch.
+        kwargs (dict[str, Any]): The keyword arguments of the dispatch.
+        aggregated (Optional[dict[str, Any]]): The arguments aggregated so far. Defaults to None.
+
+    Returns:
+        dict[str, Any]: The aggregated arguments, with their 'args' and 'kwargs'.
+    """
+
+    if aggregated is None:
+        aggregated = {
+            "args": [],
+            "kwargs": {},
+        }
+
+    values: list[tuple[list[Any], Any]] = []
+
+    for (
+        index,
+        value,
+    ) in enumerate(args):
+        if index == len(aggregated["args"]):
+            aggregated["args"].append([])
+
+        values.append(
+            (
+                aggregated["args"][index],
+                value,
+            )
+        )
+
+    for (
+        key,
+        value,
+    ) in kwargs.items():
+        values.append(
+            (
+                aggregated["kwargs"].setdefault(
+                    key,
+                    [],
+                ),
+                value,
+            )
+        )
+
+    for (
+        collected,
+        value,
+    ) in values:
+        if isinstance(
+            value,
+            list,
+        ):
+            collected.extend(value)
+        else:
+            collected.append(value)
+
+    return aggregated
+
+
+def _call_coalesced_subscription(
+    aggregated: dict[str, Any],
+    subscription: dict[str, Any],
+) -> None:
+    """
+    Calls the function of a coalescing subscription once with the aggregated arguments.
+
+    Non-persistent subscriptions are unsubscribed afterwards.
+
+    Args:
+        aggregated (dict[str, Any]): The aggregated arguments, with their 'args' and 'kwargs'.
+        subscription (dict[str, Any]): The coalescing subscription.
+
+    Returns:
+        None
+    """
+
+    if subscription["uuid"] not in UUIDS:
+        return
+
+    function: Optional[Callable[..., Any]] = _get_function(subscription=subscription)
+
+    if function is None:
+        unsubscribe(uuid=subscription["uuid"])
+
+        return
+
+    try:
+        function(
+            *aggregated["args"],
+            **aggregated["kwargs"],
+        )
+    except Exception as e:
+        log_error(
+            message={
+                "exception": e,
+                "message": f"Function '{subscription["function"]["name"]}' failed. Aborting...",
+                "status": "ERROR",
+            },
+            name=f"{__NAME__}.dispatch",
+        )
+
+        log_exception(
+            message="",
+            name=f"{__NAME__}.dispatch",
+        )
+
+    if not subscription["persistent"]:
+        unsubscribe(uuid=subscription["uuid"])
+
+
+def _call_subscriptions(
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    subscriptions: tuple[dict[str, Any], ...],
+    result: Optional[dict[str, Any]] = None,
+    span: Optional[dict[str, Any]] = None,
+) -> list[str]:
+    """
+    Calls the functions of the passed subscriptions in order.
+
+    Args:
+        args (tuple[Any, ...]): The positional arguments to pass to the functions.
+        kwargs (dict[str, Any]): The keyword arguments to pass to the functions.
+        subscriptions (tuple[dict[str, Any], ...]): The subscriptions, sorted by priority.
+        result (Optional[dict[str, Any]]): The dispatch result to record the return values in.
+                                           Defaults to None, in which case they are discarded.
+        span (Optional[dict[str, Any]]): The tracing span of the dispatch to time the calls in.
+                                         Defaults to None, in which case they are not timed.
+
+    Returns:
+        list[str]: The IDs (UUIDs) of the non-persistent subscriptions that were called and of the
+                   weak subscriptions whose function was garbage-collected. Coalescing subscriptions
+                   are handled (and unsubscribed) separately.
+    """
+
+    non_persistents: list[str] = []
+
+    traced: bool = span is not None and span["sampled"]
+
+    for subscription in subscriptions:
+        if subscription["coalesce"]:
+            _coalesce_subscription_call(
+                args=args,
+                kwargs=kwargs,
+                subscription=subscription,
+            )
+
+            continue
+
+        function: dict[str, Any] = subscription["function"]
+
+        callable_: Optional[Callable[..., Any]] = function["function"]
+
+        if callable_ is None:
+            callable_ = function["reference"]()
+
+            if callable_ is None:
+                non_persistents.append(subscription["uuid"])
+
+                continue
+
+        if traced:
+            start: float = begin_subscriber_span(
+                name=function["name"],
+                span=span,
+            )
+
+        try:
+            value: Any = callable_(
+                *args,
+                **kwargs,
+            )
+
+            if result is not None:
+                result.setdefault(
+                    function["name"],
+                    [],
+                ).append(
+                    {
+                        "result": value,
+                        "uuid": subscription["uuid"],
+                    }
+                )
+        except Exception as e:
+            if result is not None:
+                result.setdefault(
+                    function["name"],
+                    [],
+                )
+
+            log_error(
+                message={
+                    "exception": e,
+                    "message": f"Function '{function['name']}' failed. Aborting...",
+                    "status": "ERROR",
+                },
+                name=f"{__NAME__}.dispatch",
+            )
+
+            log_exception(
+                message="",
+                name=f"{__NAME__}.dispatch",
+            )
+
+        if traced:
+            end_subscriber_span(
+                name=function["name"],
+                span=span,
+                start=start,
+            )
+
+        if not subscription["persistent"]:
+            non_persistents.append(subscription["uuid"])
+
+    return non_persistents
+
+
+def _coalesce_subscription_call(
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    subscription: dict[str, Any],
+) -> None:
+    """
+    Holds back the call of a coalescing subscription, or calls it right away.
+
+    The call is held while a 'batch' is open, or for the coalescing window of the
+    subscription (in milliseconds, read on subscribe) after the first held call. Held calls of the same
+    subscription are merged and made once by 'flush_coalesced_events'. Otherwise the
+    function is called right away, still with aggregated arguments.
+
+    Args:
+        args (tuple[Any, ...]): The positional arguments of the dispatch.
+        kwargs (dict[str, Any]): The keyword arguments of the dispatch.
+        subscription (dict[str, Any]): The coalescing subscription.
+
+    Returns:
+        None
+    """
+
+    global COALESCE_TIMER
+
+    window: int = subscription["coalesce_window"]
+
+    with LOCK:
+        if BATCHES > 0 or window > 0:
+            pending: Optional[dict[str, Any]] = COALESCED.get(subscription["uuid"])
+
+            COALESCED[subscription["uuid"]] = {
+                **_aggregate_arguments(
+                    aggregated=pending,
+                    args=args,
+                    kwargs=kwargs,
+                ),
+                "subscription": subscription,
+            }
+
+            if BATCHES == 0 and COALESCE_TIMER is None:
+                COALESCE_TIMER = threading.Timer(
+                    function=_flush_coalesce_window,
+                    interval=window / 1000,
+                )
+                COALESCE_TIMER.daemon = True
+                COALESCE_TIMER.start()
+
+            return
+
+    _call_coalesced_subscription(
+        aggregated=_aggregate_arguments(
+            args=args,
+            kwargs=kwargs,
+        ),
+        subscription=subscription,
+    )
+
+
+def _flush_coalesce_window() -> None:
+    """
+    Flushes the held calls of coalescing subscriptions once the coalescing window has elapsed.
+
+    Calls held by an open 'batch' are left to be flushed when the batch closes.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    global COALESCE_TIMER
+
+    with LOCK:
+        COALESCE_TIMER = None
+
+        if BATCHES > 0:
+            return
+
+    flush_coalesced_events()
+
+
+def _get_captured_widgets(function: Callable[..., Any]) -> list[Any]:
+    """
+    Returns the widgets a function holds on to: its bound instance and the values of its closure.
+
+    Anything with a 'winfo_exists' method is considered a widget.
+
+    Args:
+        function (Callable[..., Any]): The function.
+
+    Returns:
+        list[Any]: The widgets captured by the function.
+    """
+
+    values: list[Any] = [getattr(function, "__self__", None)]
+
+    for cell in getattr(function, "__closure__", None) or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError:
+            continue
+
+    return [value for value in values if hasattr(value, "winfo_exists")]
+
+
+def _get_dispatch_result(future: Future) -> dict[str, Any]:
+    """
+    Returns the result of an asynchronous dispatch, or an error report if the dispatch itself failed.
+
+    Args:
+        future (Future): The completed future of the dispatch.
+
+    Returns:
+        dict[str, Any]: The result of the dispatch or the error report.
+    """
+
+    exception: Optional[BaseException] = future.exception()
+
+    if exception is None:
+        return future.result()
+
+    report: dict[str, Any] = {
+        "exception": exception,
+        "message": f"Asynchronous dispatch failed: {exception}",
+        "status": "ERROR",
+    }
+
+    log_error(
+        message=report,
+        name=f"{__NAME__}.dispatch_async",
+    )
+
+    return report
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool running asynchronous dispatches, creating it on first use.
+
+    The number of workers is read from the 'dispatcher.workers' config value.
+
+    Args:
+        None
+
+    Returns:
+        ThreadPoolExecutor: The thread pool.
+    """
+
+    global EXECUTOR
+
+    with LOCK:
+        if EXECUTOR is None:
+            EXECUTOR = ThreadPoolExecutor(
+                max_workers=get_config_value(key="dispatcher.workers"),
+                thread_name_prefix="studyfrog-dispatch",
+            )
+
+        return EXECUTOR
+
+
+def _get_function(subscription: dict[str, Any]) -> Optional[Callable[..., Any]]:
+    """
+    Returns the function of a subscription, resolving the weak reference of weak subscriptions.
+
+    Args:
+        subscription (dict[str, Any]): The subscription.
+
+    Returns:
+        Optional[Callable[..., Any]]: The function, or None if it was garbage-collected.
+    """
+
+    function: Optional[Callable[..., Any]] = subscription["function"]["function"]
+
+    if function is None:
+        function = subscription["function"]["reference"]()
+
+    return function
+
+
+def _get_name(name: str) -> str:
+    """
+    Returns the normalized (uppercase) form of an event or namespace name.
+
+    The normalized names are cached, as the same few names are dispatched over and over.
+
+    Args:
+        name (str): The event or namespace name.
+
+    Returns:
+        str: The uppercase name.
+    """
+
+    normalized: Optional[str] = NAMES.get(name)
+
+    if normalized is None:
+        normalized = name.upper()
+
+        NAMES[name] = normalized
+
+    return normalized
+
+
+def _get_owner_key(owner: Any) -> Any:
+    """
+    Returns the key under which the subscriptions of an owner are grouped.
+
+    Named groups (strings) are keyed by their name, any other owner (e.g. a widget) by its identity.
+
+    Args:
+        owner (Any): The owner of the subscriptions.
+
+    Returns:
+        Any: The key of the owner's group.
+    """
+
+    if isinstance(
+        owner,
+        str,
+    ):
+        return owner
+
+    return id(owner)
+
+
+def _get_reference(function: Callable[..., Any]) -> weakref.ref:
+    """
+    Returns a weak reference to a function.
+
+    Bound methods are referenced through 'weakref.WeakMethod', as a plain weak reference
+    to a bound method dies right away.
+
+    Args:
+        function (Callable[..., Any]): The function.
+
+    Returns:
+        weakref.ref: The weak reference to the function.
+    """
+
+    if hasattr(function, "__self__") and hasattr(function, "__func__"):
+        return weakref.WeakMethod(function)
+
+    return weakref.ref(function)
+
+
+def _is_widget_destroyed(widget: Any) -> bool:
+    """
+    Returns whether a widget was destroyed.
+
+    Args:
+        widget (Any): The widget.
+
+    Returns:
+        bool: True if the widget (or its Tk interpreter) no longer exists, False otherwise.
+    """
+
+    try:
+        return not widget.winfo_exists()
+    except Exception:
+        return True
+
+
+def _release_owner(key: Any) -> int:
+    """
+    Unsubscribes the remaining subscriptions of an owner's group and forgets the group.
+
+    Args:
+        key (Any): The key of the owner's group (see '_get_owner_key').
+
+    Returns:
+        int: The number of subscriptions unsubscribed.
+    """
+
+    with LOCK:
+        group: Optional[dict[str, Any]] = OWNERS.pop(
+            key,
+            None,
+        )
+
+    if group is None:
+        return 0
+
+    uuids: list[str] = list(group["uuids"])
+
+    for uuid in uuids:
+        unsubscribe(uuid=uuid)
+
+    return len(uuids)
+
+
+def _sort_subscriptions(
+    event: str,
+    namespace: str,
+) -> None:
+    """
+    Rebuilds the priority-sorted subscriptions of an event in a namespace.
+
+    Called whenever a subscription is added or removed, so that dispatching never sorts.
+    Subscriptions of equal priority keep the order they were subscribed in.
+
+    Args:
+        event (str): The (uppercase) event.
+        namespace (str): The (uppercase) namespace.
+
+    Returns:
+        None
+    """
+
+    subscribers: Optional[dict[str, Any]] = SUBSCRIBERS.get(event, {}).get(namespace)
+
+    if not subscribers:
+        SUBSCRIPTIONS.get(event, {}).pop(
+            namespace,
+            None,
+        )
+
+        if event in SUBSCRIPTIONS and not SUBSCRIPTIONS[event]:
+            del SUBSCRIPTIONS[event]
+
+        return
+
+    SUBSCRIPTIONS.setdefault(
+        event,
+        {},
+    )[namespace] = tuple(
+        sorted(
+            subscribers.values(),
+            key=lambda subscription: subscription["priority"],
+            reverse=True,
+        )
+    )
+
+
+def _track_owner(
+    owner: Any,
+    uuid: str,
+) -> Any:
+    """
+    Adds a subscription to the group of its owner.
 
+    The first time a widget owns a subscription, its group is bound to the widget's
+    lifetime: once the widget is destroyed, the group is unsubscribed.
 
-# ---------- Exports ---------- #
+    Args:
+        owner (Any): The owner of the subscription, a widget or the name of a group.
+        uuid (str): The ID (UUID) of the subscription.
 
-__all__: Final[list[str]] = [
-    "bulk_dispatch",
-    "bulk_subscribe",
-    "bulk_unsubscribe",
-    "dispatch",
-    "subscribe",
-    "unsubscribe",
-]
+    Returns:
+        Any: The key of the owner's group.
+    """
 
+    key: Any = _get_owner_key(owner=owner)
 
-# ---------- Constants ---------- #
+    with LOCK:
+        group: Optional[dict[str, Any]] = OWNERS.get(key)
 
-__NAME__: Final[str] = "utils.dispatcher"
+        if group is None:
+            group = OWNERS[key] = {
+                "name": owner if isinstance(owner, str) else str(owner),
+                "reference": None if isinstance(owner, str) else weakref.ref(owner),
+                "uuids": set(),
+            }
 
-SUBSCRIBERS: Final[dict[str, dict[str, dict[str, Any]]]] = {}
+            created: bool = True
+        else:
+            created = False
 
-UUIDS: Final[dict[str, dict[str, str]]] = {}
+        group["uuids"].add(uuid)
+
+    if created and hasattr(owner, "bind"):
+        owner.bind(
+            "<Destroy>",
+            lambda event: _is_widget_destroyed(widget=owner) and _release_owner(key=key),
+            "+",
+        )
+
+    return key
 
 
 # ---------- Functions ---------- #
 
 
+@contextlib.contextmanager
+def batch() -> Iterator[None]:
+    """
+    Coalesces notifications within a 'with' block.
+
+    While the block runs, the calls of coalescing subscriptions (see 'subscribe') are
+    held and merged; they are made once, with the aggregated arguments, when the
+    outermost block exits. Other subscriptions are called as usual.
+
+    Args:
+        None
+
+    Yields:
+        None
+    """
+
+    global BATCHES
+
+    with LOCK:
+        BATCHES += 1
+
+    try:
+        yield
+    finally:
+        with LOCK:
+            BATCHES -= 1
+
+            is_outermost: bool = BATCHES == 0
+
+        if is_outermost:
+            flush_coalesced_events()
+
+
 def bulk_dispatch(
     *args: tuple[Any],
     events: list[str],
@@ -149,6 +842,44 @@ def bulk_unsubscribe(uuids: list[str]) -> bool:
     return all(result)
 
 
+def call_on_main_thread(
+    function: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Calls a function on the main (Tk) thread.
+
+    While the Tk loop processes dispatch callbacks (see 'schedule_dispatch_callbacks'),
+    the call is queued for the loop, also when called on the main thread itself.
+    Otherwise the function is called right away.
+
+    Args:
+        function (Callable[..., Any]): The function to call.
+        *args (Any): The positional arguments to pass to the function.
+        **kwargs (Any): The keyword arguments to pass to the function.
+
+    Returns:
+        None
+    """
+
+    if CALLBACKS_SCHEDULED:
+        CALLBACKS.put(
+            (
+                function,
+                args,
+                kwargs,
+            )
+        )
+
+        return
+
+    function(
+        *args,
+        **kwargs,
+    )
+
+
 def dispatch(
     *args: tuple[Any],
     event: str,
@@ -158,7 +889,8 @@ def dispatch(
     """
     Dispatches an event in the given namespace. (Defaults to 'namespace:GLOBAL')
 
-    Additional parameters such as args and kwargs are optional.
+    Additional parameters such as args and kwargs are optional. Dispatching an event
+    nobody subscribed to is cheap: a warning report is returned, but nothing is logged.
 
     Args:
         event (str): The event to dispatch.
@@ -173,98 +905,442 @@ def dispatch(
         ValueError: If any error occurs during the dispatch.
     """
 
-    event = event.upper()
-    namespace = namespace.upper()
+    event = _get_name(name=event)
+    namespace = _get_name(name=namespace)
 
-    result: dict[str, Any] = {}
-
-    report: Optional[dict[str, Any]] = None
-
-    if event not in SUBSCRIBERS:
-        report = {
+    if event not in SUBSCRIPTIONS:
+        return {
             "message": f"Event '{event}' not found. Aborting...",
             "status": "WARNING",
         }
 
-        log_warning(
-            message=report,
-            name=f"{__NAME__}.dispatch",
-        )
-
-        return report
+    subscriptions: Optional[tuple[dict[str, Any], ...]] = SUBSCRIPTIONS[event].get(namespace)
 
-    if namespace not in SUBSCRIBERS[event]:
-        report = {
+    if subscriptions is None:
+        return {
             "message": f"Namespace '{namespace}' not found. Aborting...",
             "status": "WARNING",
         }
 
-        log_warning(
-            message=report,
-            name=f"{__NAME__}.dispatch",
+    span: Optional[dict[str, Any]] = begin_dispatch_span(event=event) if TRACE["enabled"] else None
+
+    start: datetime = get_now()
+
+    result: dict[str, Any] = {
+        "args": args,
+        "kwargs": kwargs,
+        "event": event,
+        "namespace": namespace,
+    }
+
+    try:
+        non_persistents: list[str] = _call_subscriptions(
+            args=args,
+            kwargs=kwargs,
+            result=result,
+            span=span,
+            subscriptions=subscriptions,
         )
+    finally:
+        if span is not None:
+            end_dispatch_span(span=span)
 
-        return report
+    end: datetime = get_now()
 
-    result["args"] = args
-    result["kwargs"] = kwargs
-    result["event"] = event
-    result["namespace"] = namespace
-    result["start"] = get_now()
+    result["start"] = start.isoformat()
+    result["end"] = end.isoformat()
+    result["duration"] = (end - start).total_seconds()
 
-    subscriptions: list[dict[str, Any]] = list(
-        sorted(
-            list(SUBSCRIBERS[event][namespace].values()),
-            key=lambda x: x["priority"],
+    if non_persistents:
+        bulk_unsubscribe(uuids=non_persistents)
+
+    return result
+
+
+def dispatch_async(
+    *args: tuple[Any],
+    event: str,
+    callback: Optional[Callable[[dict[str, Any]], Any]] = None,
+    namespace: str = GLOBAL_NAMESPACE,
+    **kwargs: dict[str, Any],
+) -> Future:
+    """
+    Dispatches an event in the given namespace on a worker thread. (Defaults to 'namespace:GLOBAL')
+
+    The subscribed functions run on the dispatcher's thread pool, so slow work such as
+    storage writes does not block the Tk loop. Storage serializes the work per table,
+    so asynchronous writes to the same table never interleave.
+
+    Args:
+        event (str): The event to dispatch.
+        callback (Optional[Callable[[dict[str, Any]], Any]]): The function to pass the result of the
+                                                              dispatch to once done. It is called on the
+                                                              main (Tk) thread. Defaults to None.
+        namespace (str): The namespace in which to dispatch the event. Defaults to GLOBAL_NAMESPACE.
+        *args: tuple[Any]: Additional positional arguments to pass along with the event.
+        **kwargs: dict[str, Any]: Additional keyword arguments to pass along with the event.
+
+    Returns:
+        Future: The future of the dispatch, resolving to its result.
+    """
+
+    future: Future = _get_executor().submit(
+        dispatch,
+        *args,
+        event=event,
+        namespace=namespace,
+        **kwargs,
+    )
+
+    if callback is not None:
+        future.add_done_callback(
+            lambda done: call_on_main_thread(
+                callback,
+                _get_dispatch_result(future=done),
+            )
+        )
+
+    return future
+
+
+def dispatch_lean(
+    *args: tuple[Any],
+    event: str,
+    namespace: str = GLOBAL_NAMESPACE,
+    **kwargs: dict[str, Any],
+) -> None:
+    """
+    Dispatches an event in the given namespace without reporting back. (Defaults to 'namespace:GLOBAL')
+
+    Behaves like 'dispatch', but neither records the return values of the subscribed
+    functions nor times the dispatch. Meant for notifications whose callers discard
+    the result. Events without subscribers are silently ignored.
+
+    Dispatched on a worker thread (e.g. by storage within 'dispatch_async'), the
+    notification is handed to the main (Tk) thread, as its subscribers may update widgets.
+
+    Args:
+        event (str): The event to dispatch.
+        namespace (str): The namespace in which to dispatch the event. Defaults to GLOBAL_NAMESPACE.
+        *args: tuple[Any]: Additional positional arguments to pass along with the event.
+        **kwargs: dict[str, Any]: Additional keyword arguments to pass along with the event.
+
+    Returns:
+        None
+    """
+
+    if CALLBACKS_SCHEDULED and threading.current_thread() is not threading.main_thread():
+        call_on_main_thread(
+            dispatch_lean,
+            *args,
+            event=event,
+            namespace=namespace,
+            **kwargs,
+        )
+
+        return
+
+    event = _get_name(name=event)
+
+    subscriptions: Optional[tuple[dict[str, Any], ...]] = SUBSCRIPTIONS.get(
+        event,
+        {},
+    ).get(_get_name(name=namespace))
+
+    if subscriptions is None:
+        return
+
+    span: Optional[dict[str, Any]] = begin_dispatch_span(event=event) if TRACE["enabled"] else None
+
+    try:
+        non_persistents: list[str] = _call_subscriptions(
+            args=args,
+            kwargs=kwargs,
+            span=span,
+            subscriptions=subscriptions,
+        )
+    finally:
+        if span is not None:
+            end_dispatch_span(span=span)
+
+    if non_persistents:
+        bulk_unsubscribe(uuids=non_persistents)
+
+
+def flush_coalesced_events() -> int:
+    """
+    Makes the held calls of coalescing subscriptions, each once with its aggregated arguments.
+
+    The calls are made in order of subscription priority. Called on a worker thread,
+    they are handed to the main (Tk) thread (see 'schedule_dispatch_callbacks').
+
+    Args:
+        None
+
+    Returns:
+        int: The number of calls made.
+    """
+
+    global COALESCE_TIMER
+
+    with LOCK:
+        pendings: list[dict[str, Any]] = sorted(
+            COALESCED.values(),
+            key=lambda pending: pending["subscription"]["priority"],
             reverse=True,
         )
-    )
 
-    non_persistents: list[str] = []
+        COALESCED.clear()
+
+        if COALESCE_TIMER is not None:
+            COALESCE_TIMER.cancel()
+
+            COALESCE_TIMER = None
+
+    is_main_thread: bool = threading.current_thread() is threading.main_thread()
+
+    for pending in pendings:
+        subscription: dict[str, Any] = pending.pop("subscription")
+
+        if is_main_thread:
+            _call_coalesced_subscription(
+                aggregated=pending,
+                subscription=subscription,
+            )
+
+            continue
+
+        call_on_main_thread(
+            _call_coalesced_subscription,
+            aggregated=pending,
+            subscription=subscription,
+        )
+
+    return len(pendings)
+
+
+def get_subscription_leak_report() -> list[dict[str, Any]]:
+    """
+    Returns the stale subscriptions that are still registered.
+
+    A subscription is stale if it is weak and its function was garbage-collected, if
+    its owner was destroyed, or if its function holds on to a widget that was destroyed
+    (e.g. a handler of a toplevel that was closed without unsubscribing).
+
+    Args:
+        None
+
+    Returns:
+        list[dict[str, Any]]: The stale subscriptions, with their 'event', 'name', 'namespace',
+                              'reason' and 'uuid'.
+    """
+
+    with LOCK:
+        subscriptions: list[dict[str, Any]] = [
+            subscription
+            for namespaces in SUBSCRIBERS.values()
+            for subscribers in namespaces.values()
+            for subscription in subscribers.values()
+        ]
+        owners: dict[Any, dict[str, Any]] = dict(OWNERS)
+
+    report: list[dict[str, Any]] = []
 
     for subscription in subscriptions:
-        if subscription["function"]["name"] not in result:
-            result[subscription["function"]["name"]] = []
+        function: Optional[Callable[..., Any]] = _get_function(subscription=subscription)
+        group: Optional[dict[str, Any]] = owners.get(subscription["owner"])
+
+        if function is None:
+            reason: Optional[str] = "function garbage-collected"
+        elif (
+            group is not None
+            and group["reference"] is not None
+            and (
+                group["reference"]() is None
+                or _is_widget_destroyed(widget=group["reference"]())
+            )
+        ):
+            reason = f"owner '{group['name']}' destroyed"
+        elif any(
+            _is_widget_destroyed(widget=widget)
+            for widget in _get_captured_widgets(function=function)
+        ):
+            reason = "captured widget destroyed"
+        else:
+            reason = None
+
+        if reason is None:
+            continue
+
+        report.append(
+            {
+                "event": subscription["event"],
+                "name": subscription["function"]["name"],
+                "namespace": subscription["namespace"],
+                "reason": reason,
+                "uuid": subscription["uuid"],
+            }
+        )
+
+    if report:
+        log_warning(
+            message=f"Found {len(report)} stale subscription(s).",
+            name=f"{__NAME__}.get_subscription_leak_report",
+        )
+
+    return report
+
+
+def has_subscribers(
+    event: str,
+    namespace: str = GLOBAL_NAMESPACE,
+) -> bool:
+    """
+    Returns whether any function is subscribed to an event in the given namespace.
+
+    Meant for callers that would otherwise build an expensive payload for an event
+    nobody listens to.
+
+    Args:
+        event (str): The event.
+        namespace (str): The namespace of the event. Defaults to GLOBAL_NAMESPACE.
+
+    Returns:
+        bool: True if the event has subscribers in the namespace, False otherwise.
+    """
+
+    return _get_name(name=namespace) in SUBSCRIPTIONS.get(
+        _get_name(name=event),
+        {},
+    )
+
+
+def process_dispatch_callbacks() -> int:
+    """
+    Calls the callbacks that worker threads have queued for the main (Tk) thread.
+
+    Args:
+        None
 
+    Returns:
+        int: The number of callbacks called.
+    """
+
+    count: int = 0
+
+    while True:
         try:
-            result[subscription["function"]["name"]].append(
-                {
-                    "result": subscription["function"]["function"](
-                        *args,
-                        **kwargs,
-                    ),
-                    "uuid": subscription["uuid"],
-                }
+            (
+                function,
+                args,
+                kwargs,
+            ) = CALLBACKS.get_nowait()
+        except queue.Empty:
+            return count
+
+        count += 1
+
+        try:
+            function(
+                *args,
+                **kwargs,
             )
         except Exception as e:
-            report = {
-                "exception": e,
-                "message": f"Function '{subscription["function"]["name"]}' failed. Aborting...",
-                "status": "ERROR",
-            }
-
             log_error(
-                message=report,
-                name=f"{__NAME__}.dispatch",
+                message=f"Caught an exception while calling dispatch callback '{getattr(function, '__name__', function)}': {e}",
+                name=f"{__NAME__}.process_dispatch_callbacks",
             )
 
             log_exception(
                 message="",
-                name=f"{__NAME__}.dispatch",
+                name=f"{__NAME__}.process_dispatch_callbacks",
             )
 
-        if not subscription["persistent"]:
-            non_persistents.append(subscription["uuid"])
 
-    result["end"] = get_now()
-    result["duration"] = (result["end"] - result["start"]).total_seconds()
+def prune_subscriptions() -> int:
+    """
+    Unsubscribes all stale subscriptions (see 'get_subscription_leak_report').
+
+    Args:
+        None
 
-    result["start"] = result["start"].isoformat()
-    result["end"] = result["end"].isoformat()
+    Returns:
+        int: The number of subscriptions unsubscribed.
+    """
 
-    bulk_unsubscribe(uuids=non_persistents)
+    report: list[dict[str, Any]] = get_subscription_leak_report()
 
-    return result
+    for entry in report:
+        unsubscribe(uuid=entry["uuid"])
+
+    return len(report)
+
+
+def schedule_dispatch_callbacks(
+    widget: Any,
+    interval: int = CALLBACKS_INTERVAL,
+) -> None:
+    """
+    Makes the Tk loop of the passed widget process dispatch callbacks every 'interval' milliseconds.
+
+    From then on, callbacks of 'dispatch_async' and notifications dispatched on worker
+    threads are queued for, and called on, the main (Tk) thread.
+
+    Args:
+        widget (Any): The widget whose 'after' method schedules the processing (e.g. the root window).
+        interval (int): The interval in milliseconds. Defaults to CALLBACKS_INTERVAL.
+
+    Returns:
+        None
+    """
+
+    global CALLBACKS_SCHEDULED
+
+    def process() -> None:
+        if not CALLBACKS_SCHEDULED:
+            return
+
+        process_dispatch_callbacks()
+
+        widget.after(
+            interval,
+            process,
+        )
+
+    CALLBACKS_SCHEDULED = True
+
+    process()
+
+
+def shutdown_dispatch_executor(wait: bool = True) -> None:
+    """
+    Shuts down the thread pool of 'dispatch_async' and stops queueing callbacks for the Tk loop.
+
+    Pending dispatches are completed first, unless 'wait' is False. Callbacks still
+    queued are called right away.
+
+    Args:
+        wait (bool): Whether to wait for pending dispatches to complete. Defaults to True.
+
+    Returns:
+        None
+    """
+
+    global CALLBACKS_SCHEDULED, EXECUTOR
+
+    with LOCK:
+        executor: Optional[ThreadPoolExecutor] = EXECUTOR
+
+        EXECUTOR = None
+
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+    flush_coalesced_events()
+
+    CALLBACKS_SCHEDULED = False
+
+    process_dispatch_callbacks()
 
 
 def subscribe(
@@ -273,6 +1349,9 @@ def subscribe(
     namespace: str = GLOBAL_NAMESPACE,
     persistent: bool = False,
     priority: int = 0,
+    coalesce: bool = False,
+    owner: Optional[Any] = None,
+    weak: bool = False,
 ) -> str:
     """
     Subscribes a function to an event based on a namespace. (Defaults to the 'namespace:GLOBAL' namespace)
@@ -285,38 +1364,67 @@ def subscribe(
         namespace (str, optional): The namespace to subscribe to. Defaults to GLOBAL_NAMESPACE.
         persistent (bool, optional): Whether the subscription should persist. Defaults to False.
         priority (int, optional): The priority of the subscription. Defaults to 0.
+        coalesce (bool, optional): Whether to coalesce the calls of the function. If True, the function
+                                   receives every argument aggregated into a list, merged across all
+                                   dispatches within a 'batch' or the coalescing window (the
+                                   'dispatcher.coalesce_window' config value at the time of
+                                   subscribing). Defaults to False.
+        owner (Optional[Any], optional): The owner of the subscription: a widget, whose destruction
+                                         unsubscribes it, or the name of a group to unsubscribe together
+                                         (see 'unsubscribe_owner'). Defaults to None.
+        weak (bool, optional): Whether to only hold a weak reference to the function. The subscription
+                               is pruned once the function is garbage-collected. Defaults to False.
 
     Returns:
         str: The ID (UUID) of the subscription.
     """
 
-    event = event.upper()
-    namespace = namespace.upper()
-
-    if event not in SUBSCRIBERS:
-        SUBSCRIBERS[event] = {}
-
-    if namespace not in SUBSCRIBERS[event]:
-        SUBSCRIBERS[event][namespace] = {}
+    event = _get_name(name=event)
+    namespace = _get_name(name=namespace)
 
     subscription: dict[str, Any] = {
+        "coalesce": coalesce,
+        # Read once here rather than on every dispatch
+        "coalesce_window": (
+            get_config_value(key="dispatcher.coalesce_window") if coalesce else 0
+        ),
         "event": event,
         "namespace": namespace,
         "function": {
-            "function": function,
+            "function": None if weak else function,
             "name": function.__name__,
+            "reference": _get_reference(function=function) if weak else None,
         },
+        "owner": None,
         "persistent": persistent,
         "priority": priority,
         "uuid": generate_uuid4_str(),
     }
 
-    SUBSCRIBERS[event][namespace][subscription["uuid"]] = subscription
+    if owner is not None:
+        subscription["owner"] = _track_owner(
+            owner=owner,
+            uuid=subscription["uuid"],
+        )
 
-    UUIDS[subscription["uuid"]] = {
-        "event": event,
-        "namespace": namespace,
-    }
+    with LOCK:
+        SUBSCRIBERS.setdefault(
+            event,
+            {},
+        ).setdefault(
+            namespace,
+            {},
+        )[subscription["uuid"]] = subscription
+
+        _sort_subscriptions(
+            event=event,
+            namespace=namespace,
+        )
+
+        UUIDS[subscription["uuid"]] = {
+            "event": event,
+            "namespace": namespace,
+        }
 
     log_info(
         message=f"Subscribed to event '{event}' in namespace '{namespace}' with UUID '{subscription['uuid']}'.",
@@ -337,25 +1445,37 @@ def unsubscribe(uuid: str) -> bool:
         bool: Whether the subscription was successfully unsubscribed.
     """
 
-    if uuid not in UUIDS:
-        log_warning(
-            message=f"UUID '{uuid}' not found. Aborting...",
-            name=f"{__NAME__}.unsubscribe",
+    with LOCK:
+        location: Optional[dict[str, str]] = UUIDS.pop(
+            uuid,
+            None,
         )
-        return False
 
-    event: str = UUIDS[uuid]["event"]
-    namespace: str = UUIDS[uuid]["namespace"]
+        if location is None:
+            log_warning(
+                message=f"UUID '{uuid}' not found. Aborting...",
+                name=f"{__NAME__}.unsubscribe",
+            )
+            return False
+
+        event: str = location["event"]
+        namespace: str = location["namespace"]
+
+        subscription: dict[str, Any] = SUBSCRIBERS[event][namespace].pop(uuid)
 
-    SUBSCRIBERS[event][namespace].pop(uuid)
+        if subscription["owner"] in OWNERS:
+            OWNERS[subscription["owner"]]["uuids"].discard(uuid)
 
-    del UUIDS[uuid]
+        if not SUBSCRIBERS[event][namespace]:
+            del SUBSCRIBERS[event][namespace]
 
-    if not SUBSCRIBERS[event][namespace]:
-        del SUBSCRIBERS[event][namespace]
+        if not SUBSCRIBERS[event]:
+            del SUBSCRIBERS[event]
 
-    if not SUBSCRIBERS[event]:
-        del SUBSCRIBERS[event]
+        _sort_subscriptions(
+            event=event,
+            namespace=namespace,
+        )
 
     log_info(
         message=f"Unsubscribed from event '{event}' in namespace '{namespace}' with UUID '{uuid}'.",
@@ -363,3 +1483,17 @@ def unsubscribe(uuid: str) -> bool:
     )
 
     return True
+
+
+def unsubscribe_owner(owner: Any) -> int:
+    """
+    Unsubscribes all subscriptions of an owner (see 'subscribe').
+
+    Args:
+        owner (Any): The owner of the subscriptions, a widget or the name of a group.
+
+    Returns:
+        int: The number of subscriptions unsubscribed.
+    """
+
+    return _release_owner(key=_get_owner_key(owner=owner))
@@ -6,6 +6,10 @@ Date: 2025-12-10
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import stat
+import tempfile
 
 from pathlib import Path
 from typing import Any, Final, Optional
@@ -16,10 +20,12 @@ from studyfrog.utils.directories import create_directory
 # ---------- Exports ---------- #
 
 __all__: Final[list[str]] = [
+    "backup_file",
     "create_file",
     "does_file_exist",
     "does_file_have_content",
     "ensure_file",
+    "get_backup_file",
     "read_file_json",
     "read_file_text",
     "remove_file",
@@ -28,9 +34,147 @@ __all__: Final[list[str]] = [
 ]
 
 
+# ---------- Helper Functions ---------- #
+
+
+def _fsync_directory(directory: Path) -> None:
+    """
+    Flushes the directory entry changes (e.g. a rename) of a directory to disk.
+
+    This is a no-op on platforms that do not support opening directories (e.g. Windows).
+
+    Args:
+        directory (Path): The directory to flush.
+
+    Returns:
+        None
+    """
+
+    try:
+        descriptor: int = os.open(
+            directory,
+            os.O_RDONLY,
+        )
+    except OSError:
+        return
+
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def _write_file_text_atomic(
+    data: str,
+    file: Path,
+    encoding: str = "utf-8",
+) -> None:
+    """
+    Writes text content to a given file atomically.
+
+    The content is written to a temporary file in the same directory, flushed to disk
+    and then renamed over the target file. Readers (and a crash at any point) therefore
+    only ever see either the complete previous or the complete new content.
+
+    Args:
+        data (str): The data to write.
+        file (Path): The file to write to.
+        encoding (str, optional): The encoding of the file. Defaults to "utf-8".
+
+    Returns:
+        None
+    """
+
+    create_directory(directory=file.parent)
+
+    (
+        descriptor,
+        temp_name,
+    ) = tempfile.mkstemp(
+        dir=file.parent,
+        prefix=f".{file.name}.",
+        suffix=".tmp",
+    )
+
+    try:
+        with os.fdopen(
+            descriptor,
+            encoding=encoding,
+            mode="w",
+        ) as handle:
+            handle.write(data)
+            handle.flush()
+
+            os.fsync(handle.fileno())
+
+        # The temporary file is created with mode 0600, the replaced file keeps its mode
+        if file.exists():
+            os.chmod(
+                temp_name,
+                stat.S_IMODE(os.stat(file).st_mode),
+            )
+
+        os.replace(
+            temp_name,
+            file,
+        )
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+    _fsync_directory(directory=file.parent)
+
+
 # ---------- Functions ---------- #
 
 
+def backup_file(
+    file: Path,
+    link: bool = False,
+) -> bool:
+    """
+    Replaces the backup of a file with the file's current content.
+
+    Args:
+        file (Path): The file to back up.
+        link (bool, optional): Whether to create the backup as a hard link, which costs the
+                               same regardless of the file size. Only safe if the file is
+                               replaced rather than modified afterwards (i.e. by an atomic
+                               write). Falls back to copying if hard links are not
+                               supported. Defaults to False.
+
+    Returns:
+        bool: True if a backup was created, False if the file does not exist.
+    """
+
+    if not does_file_exist(file=file):
+        return False
+
+    backup: Path = get_backup_file(file=file)
+
+    backup.unlink(missing_ok=True)
+
+    if link:
+        try:
+            os.link(
+                file,
+                backup,
+            )
+
+            return True
+        except OSError:
+            pass
+
+    shutil.copy2(
+        file,
+        backup,
+    )
+
+    return True
+
+
 def create_file(file: Path) -> bool:
     """
     Creates a file if it does not exist.
@@ -100,6 +244,20 @@ def ensure_file(file: Path) -> bool:
     return create_file(file=file) or does_file_exist(file=file)
 
 
+def get_backup_file(file: Path) -> Path:
+    """
+    Returns the path of the backup of a file.
+
+    Args:
+        file (Path): The file (e.g. ".../flashcards.json").
+
+    Returns:
+        Path: The backup file (e.g. ".../flashcards.json.bak").
+    """
+
+    return file.with_name(f"{file.name}.bak")
+
+
 def read_file_json(
     file: Path,
     encoding: str = "utf-8",
@@ -170,6 +328,8 @@ def write_file_json(
     data: dict[str, Any],
     file: Path,
     encoding: str = "utf-8",
+    atomic: bool = False,
+    backup: bool = False,
 ) -> bool:
     """
     Writes JSON content to a given file.
@@ -178,29 +338,34 @@ def write_file_json(
         data (dict[str, Any]): The data to write.
         encoding (str, optional): The encoding of the file. Defaults to "utf-8".
         file (Path): The file to write to.
+        atomic (bool, optional): Whether to write through a temporary file that is
+                                 flushed to disk and renamed over the file. Defaults to False.
+        backup (bool, optional): Whether to keep the previous content of the file as its
+                                 backup (see 'get_backup_file'). Defaults to False.
 
     Returns:
         bool: True if the file was written, False otherwise.
     """
 
-    ensure_file(file=file)
-
-    file.write_text(
+    return write_file_text(
+        atomic=atomic,
+        backup=backup,
         data=json.dumps(
             data,
             indent=4,
             sort_keys=True,
         ),
         encoding=encoding,
+        file=file,
     )
 
-    return True
-
 
 def write_file_text(
     data: str,
     file: Path,
     encoding: str = "utf-8",
+    atomic: bool = False,
+    backup: bool = False,
 ) -> bool:
     """
     Writes text content to a given file.
@@ -209,11 +374,30 @@ def write_file_text(
         data (str): The data to write.
         encoding (str, optional): The encoding of the file. Defaults to "utf-8".
         file (Path): The file to write to.
+        atomic (bool, optional): Whether to write through a temporary file that is
+                                 flushed to disk and renamed over the file. Defaults to False.
+        backup (bool, optional): Whether to keep the previous content of the file as its
+                                 backup (see 'get_backup_file'). Defaults to False.
 
     Returns:
         bool: True if the file was written, False otherwise.
     """
 
+    if backup and does_file_have_content(file=file):
+        backup_file(
+            file=file,
+            link=atomic,
+        )
+
+    if atomic:
+        _write_file_text_atomic(
+            data=data,
+            encoding=encoding,
+            file=file,
+        )
+
+        return True
+
     ensure_file(file=file)
 
     file.write_text(
@@ -0,0 +1,433 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Append-only journal files recording per-entry table changes next to the JSON table snapshots.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+from pathlib import Path
+from typing import Any, Final, Optional
+
+from studyfrog.utils.common import exists
+from studyfrog.utils.config import get_config_value
+from studyfrog.utils.files import (
+    does_file_exist,
+    ensure_file,
+    read_file_json,
+    remove_file,
+    write_file_json,
+    write_file_text,
+)
+from studyfrog.utils.logging import log_error, log_warning
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "JOURNAL_OPERATIONS",
+    "append_journal_records",
+    "compact_journal",
+    "get_journal_file",
+    "get_journal_record_count",
+    "get_table_header",
+    "load_journaled_table",
+    "read_journal_records",
+    "replay_journal_records",
+    "save_journaled_table",
+    "write_journal_records",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "src.utils.journal"
+
+JOURNAL_OPERATIONS: Final[tuple[str, ...]] = (
+    "delete",
+    "header",
+    "insert",
+    "update",
+)
+
+JOURNAL_RECORD_COUNTS: Final[dict[str, int]] = {}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _encode_journal_records(records: list[dict[str, Any]]) -> str:
+    """
+    Encodes journal records as compact JSON lines.
+
+    Args:
+        records (list[dict[str, Any]]): The records to encode. Each record must have
+                                        an 'op' key that is one of JOURNAL_OPERATIONS.
+
+    Returns:
+        str: The records, one JSON line each.
+
+    Raises:
+        ValueError: If a record has an unknown operation.
+    """
+
+    for record in records:
+        if record.get("op") in JOURNAL_OPERATIONS:
+            continue
+
+        raise ValueError(f"Unknown journal operation '{record.get('op')}'")
+
+    return "".join(
+        json.dumps(
+            record,
+            separators=(
+                ",",
+                ":",
+            ),
+        )
+        + "\n"
+        for record in records
+    )
+
+
+# ---------- Functions ---------- #
+
+
+def append_journal_records(
+    file: Path,
+    records: list[dict[str, Any]],
+) -> int:
+    """
+    Appends records to the journal of a table file and flushes them to disk.
+
+    Every record is written as a single compact JSON line. A crash while writing
+    can therefore only ever truncate the last line, which is skipped on replay.
+
+    Args:
+        file (Path): The table file (not the journal file) the records belong to.
+        records (list[dict[str, Any]]): The records to append. Each record must have
+                                        an 'op' key that is one of JOURNAL_OPERATIONS.
+
+    Returns:
+        int: The number of records in the journal after appending.
+
+    Raises:
+        ValueError: If a record has an unknown operation.
+    """
+
+    data: str = _encode_journal_records(records=records)
+
+    journal_file: Path = get_journal_file(file=file)
+
+    ensure_file(file=journal_file)
+
+    with journal_file.open(
+        encoding="utf-8",
+        mode="a",
+    ) as handle:
+        handle.write(data)
+        handle.flush()
+
+        os.fsync(handle.fileno())
+
+    JOURNAL_RECORD_COUNTS[str(file)] = get_journal_record_count(file=file) + len(records)
+
+    return JOURNAL_RECORD_COUNTS[str(file)]
+
+
+def compact_journal(
+    file: Path,
+    table_data: dict[str, Any],
+) -> None:
+    """
+    Writes the passed table state as a JSON snapshot and removes the table's journal.
+
+    The snapshot is written atomically and the previous snapshot kept as a backup,
+    unless disabled via the "storage.atomic_writes" and "storage.backups" config values.
+
+    The snapshot is written before the journal is removed. Should the process die in
+    between, the journal is replayed over the new snapshot on the next load, which is
+    harmless since all journal operations are idempotent.
+
+    Args:
+        file (Path): The table file to write the snapshot to.
+        table_data (dict[str, Any]): The complete table data dictionary.
+
+    Returns:
+        None
+    """
+
+    write_file_json(
+        atomic=get_config_value(
+            default=True,
+            key="storage.atomic_writes",
+        ),
+        backup=get_config_value(
+            default=True,
+            key="storage.backups",
+        ),
+        data=table_data,
+        file=file,
+    )
+
+    journal_file: Path = get_journal_file(file=file)
+
+    if does_file_exist(file=journal_file):
+        remove_file(file=journal_file)
+
+    JOURNAL_RECORD_COUNTS[str(file)] = 0
+
+
+def get_journal_file(file: Path) -> Path:
+    """
+    Returns the journal file belonging to a table file.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+
+    Returns:
+        Path: The journal file (e.g. ".../flashcards.journal").
+    """
+
+    return file.with_suffix(".journal")
+
+
+def get_journal_record_count(file: Path) -> int:
+    """
+    Returns the number of records in the journal of a table file.
+
+    The count is tracked in memory once the journal has been read or written by this
+    process and is only determined from the file itself the first time.
+
+    Args:
+        file (Path): The table file (not the journal file).
+
+    Returns:
+        int: The number of records in the journal.
+    """
+
+    if str(file) not in JOURNAL_RECORD_COUNTS:
+        JOURNAL_RECORD_COUNTS[str(file)] = len(read_journal_records(file=file))
+
+    return JOURNAL_RECORD_COUNTS[str(file)]
+
+
+def get_table_header(table_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the parts of a table that are not entries (metadata, counters and timestamps).
+
+    The header is journaled after every batch of changes, so that replaying the
+    journal restores the table counters ('next_id', 'available_ids', 'total', ...)
+    without them having to be re-derived from the entries.
+
+    Args:
+        table_data (dict[str, Any]): The table data dictionary.
+
+    Returns:
+        dict[str, Any]: The header of the table.
+    """
+
+    return {
+        "table": {key: value for (key, value) in table_data.items() if key != "entries"},
+        "total": table_data["entries"]["total"],
+    }
+
+
+def load_journaled_table(file: Path) -> Optional[dict[str, Any]]:
+    """
+    Loads a table by reading its JSON snapshot and replaying its journal on top of it.
+
+    Args:
+        file (Path): The table file.
+
+    Returns:
+        Optional[dict[str, Any]]: The table data dictionary, or None if the snapshot has no content.
+    """
+
+    table_data: Optional[dict[str, Any]] = read_file_json(file=file)
+
+    if not exists(value=table_data):
+        return table_data
+
+    records: list[dict[str, Any]] = read_journal_records(file=file)
+
+    JOURNAL_RECORD_COUNTS[str(file)] = len(records)
+
+    return replay_journal_records(
+        records=records,
+        table_data=table_data,
+    )
+
+
+def read_journal_records(file: Path) -> list[dict[str, Any]]:
+    """
+    Reads all intact records from the journal of a table file.
+
+    Reading stops at the first line that cannot be decoded. For the last line this is
+    the expected result of a crash during an append, for any other line it indicates
+    corruption, in which case the records after it are not trusted either.
+
+    Args:
+        file (Path): The table file (not the journal file).
+
+    Returns:
+        list[dict[str, Any]]: The records in the order they were appended.
+    """
+
+    journal_file: Path = get_journal_file(file=file)
+
+    if not does_file_exist(file=journal_file):
+        return []
+
+    lines: list[str] = journal_file.read_text(encoding="utf-8").splitlines()
+
+    records: list[dict[str, Any]] = []
+
+    for (
+        index,
+        line,
+    ) in enumerate(lines):
+        if not line.strip():
+            continue
+
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            if index == len(lines) - 1:
+                log_warning(
+                    message=f"Skipping truncated last record of journal '{journal_file}': {e}",
+                    name=f"{__NAME__}.read_journal_records",
+                )
+            else:
+                log_error(
+                    message=f"Stopped reading corrupt journal '{journal_file}' at line {index + 1}: {e}",
+                    name=f"{__NAME__}.read_journal_records",
+                )
+
+            break
+
+    return records
+
+
+def replay_journal_records(
+    records: list[dict[str, Any]],
+    table_data: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Applies journal records to a table data dictionary in place.
+
+    Args:
+        records (list[dict[str, Any]]): The records to apply, in the order they were appended.
+        table_data (dict[str, Any]): The table data dictionary to apply the records to.
+
+    Returns:
+        dict[str, Any]: The passed table data dictionary.
+    """
+
+    entries: dict[str, Any] = table_data["entries"]["entries"]
+
+    for record in records:
+        operation: Optional[str] = record.get("op")
+
+        if operation in (
+            "insert",
+            "update",
+        ):
+            entries[str(record["id"])] = record["entry"]
+        elif operation == "delete":
+            entries.pop(
+                str(record["id"]),
+                None,
+            )
+        elif operation == "header":
+            table_data.update(record["table"])
+            table_data["entries"]["total"] = record["total"]
+
+    return table_data
+
+
+def save_journaled_table(
+    changes: Optional[list[dict[str, Any]]],
+    file: Path,
+    table_data: dict[str, Any],
+    compaction_threshold: int,
+) -> None:
+    """
+    Persists changes to a table by appending them to the table's journal.
+
+    The journal is compacted into the JSON snapshot once it holds at least
+    'compaction_threshold' records, or right away if no changes are passed
+    (i.e. the caller replaced the table as a whole).
+
+    Args:
+        changes (Optional[list[dict[str, Any]]]): The per-entry change records to append.
+        file (Path): The table file.
+        table_data (dict[str, Any]): The complete table data dictionary after the changes.
+        compaction_threshold (int): The record count at which the journal is compacted.
+
+    Returns:
+        None
+    """
+
+    if changes is None or not does_file_exist(file=file):
+        compact_journal(
+            file=file,
+            table_data=table_data,
+        )
+
+        return
+
+    count: int = append_journal_records(
+        file=file,
+        records=[
+            *changes,
+            {
+                "op": "header",
+                **get_table_header(table_data=table_data),
+            },
+        ],
+    )
+
+    if count < compaction_threshold:
+        return
+
+    compact_journal(
+        file=file,
+        table_data=table_data,
+    )
+
+
+def write_journal_records(
+    file: Path,
+    records: list[dict[str, Any]],
+) -> int:
+    """
+    Replaces the journal of a table file by the passed records.
+
+    The journal is written to a temporary file and renamed over the previous one, so
+    a crash leaves either the complete previous or the complete new journal behind.
+
+    Args:
+        file (Path): The table file (not the journal file) the records belong to.
+        records (list[dict[str, Any]]): The records to write. Each record must have
+                                        an 'op' key that is one of JOURNAL_OPERATIONS.
+
+    Returns:
+        int: The number of records in the journal.
+
+    Raises:
+        ValueError: If a record has an unknown operation.
+    """
+
+    write_file_text(
+        atomic=True,
+        data=_encode_journal_records(records=records),
+        file=get_journal_file(file=file),
+    )
+
+    JOURNAL_RECORD_COUNTS[str(file)] = len(records)
+
+    return JOURNAL_RECORD_COUNTS[str(file)]
@@ -0,0 +1,687 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: JSON Lines table format with a byte offset index, allowing single entries to be read without decoding the whole table.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+
+from pathlib import Path
+from typing import Any, Final, Iterator, Optional
+
+from studyfrog.constants.directories import DATA_DIR
+from studyfrog.utils.common import exists
+from studyfrog.utils.config import get_config_value
+from studyfrog.utils.files import (
+    does_file_exist,
+    does_file_have_content,
+    read_file_json,
+    write_file_json,
+    write_file_text,
+)
+from studyfrog.utils.journal import (
+    get_table_header,
+    load_journaled_table,
+    replay_journal_records,
+)
+from studyfrog.utils.logging import log_info
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "convert_json_tables_to_jsonl",
+    "convert_json_to_jsonl",
+    "convert_jsonl_tables_to_json",
+    "convert_jsonl_to_json",
+    "does_jsonl_table_exist",
+    "get_jsonl_entries",
+    "get_jsonl_file",
+    "get_jsonl_table_signature",
+    "iter_jsonl_entries",
+    "load_jsonl_table",
+    "save_jsonl_table",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "src.utils.jsonl"
+
+JSONL_INDEXES: Final[dict[str, dict[str, Any]]] = {}
+
+RECORD_PREFIX_PATTERN: Final[re.Pattern[bytes]] = re.compile(rb'^\{"id":"([^"]*)","op":"(\w+)"')
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _encode_record(record: dict[str, Any]) -> bytes:
+    """
+    Encodes a record as a single JSON line starting with its 'id' and 'op' keys.
+
+    The fixed key order allows the offset index to be rebuilt by only looking at the
+    beginning of every line, without decoding the entries themselves.
+
+    Args:
+        record (dict[str, Any]): The record ('op', 'id' and 'entry', or a header record).
+
+    Returns:
+        bytes: The encoded line, including the trailing newline.
+    """
+
+    return (
+        json.dumps(
+            {
+                "id": str(record.get("id", "")),
+                "op": record["op"],
+                **{key: value for (key, value) in record.items() if key not in ("id", "op")},
+            },
+            separators=(
+                ",",
+                ":",
+            ),
+        )
+        + "\n"
+    ).encode("utf-8")
+
+
+def _get_index_file(file: Path) -> Path:
+    """
+    Returns the file the offset index of a JSON Lines table is persisted in.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+
+    Returns:
+        Path: The index file (e.g. ".../flashcards.jsonl.idx").
+    """
+
+    return file.with_suffix(".jsonl.idx")
+
+
+def _get_jsonl_index(file: Path) -> dict[str, Any]:
+    """
+    Returns the offset index of a JSON Lines table, bringing it up to date with the file first.
+
+    The index maps every live entry ID to the offset and length of its latest record.
+    It is kept in memory and persisted next to the table on compaction. Records appended
+    after the index was persisted (or last updated in memory) are indexed by scanning
+    only the new part of the file. A file that was replaced (e.g. compacted by another
+    process) is indexed from scratch.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+
+    Returns:
+        dict[str, Any]: The index with 'entries' (ID -> [offset, length]), 'header'
+                        ([offset, length] of the latest header record), 'dead'
+                        (number of superseded records), 'inode' (of the indexed file)
+                        and 'size' (indexed bytes).
+    """
+
+    jsonl_file: Path = get_jsonl_file(file=file)
+
+    (
+        inode,
+        size,
+    ) = (
+        (
+            jsonl_file.stat().st_ino,
+            jsonl_file.stat().st_size,
+        )
+        if does_file_exist(file=jsonl_file)
+        else (
+            0,
+            0,
+        )
+    )
+
+    index: Optional[dict[str, Any]] = JSONL_INDEXES.get(str(jsonl_file))
+
+    if not exists(value=index):
+        try:
+            index = read_file_json(file=_get_index_file(file=file))
+        except ValueError:
+            index = None
+
+    if not exists(value=index) or index["inode"] != inode or index["size"] > size:
+        index = {
+            "dead": 0,
+            "entries": {},
+            "header": None,
+            "inode": inode,
+            "size": 0,
+        }
+
+    if index["size"] < size:
+        with jsonl_file.open(mode="rb") as handle:
+            handle.seek(index["size"])
+
+            offset: int = index["size"]
+
+            for line in handle:
+                _index_record(
+                    index=index,
+                    line=line,
+                    offset=offset,
+                )
+
+                offset += len(line)
+
+        index["size"] = offset
+
+    JSONL_INDEXES[str(jsonl_file)] = index
+
+    return index
+
+
+def _index_record(
+    index: dict[str, Any],
+    line: bytes,
+    offset: int,
+) -> None:
+    """
+    Adds a single record line to an offset index.
+
+    Lines that do not start with a record prefix (e.g. a line truncated by a crash) are skipped.
+
+    Args:
+        index (dict[str, Any]): The offset index to update.
+        line (bytes): The record line, including the trailing newline.
+        offset (int): The offset of the line in the file.
+
+    Returns:
+        None
+    """
+
+    match: Optional[re.Match[bytes]] = RECORD_PREFIX_PATTERN.match(line)
+
+    if not exists(value=match) or not line.endswith(b"\n"):
+        return
+
+    id_: str = match.group(1).decode("utf-8")
+    operation: str = match.group(2).decode("utf-8")
+
+    if operation == "header":
+        if exists(value=index["header"]):
+            index["dead"] += 1
+
+        index["header"] = [
+            offset,
+            len(line),
+        ]
+
+        return
+
+    if id_ in index["entries"]:
+        index["dead"] += 1
+
+    if operation == "delete":
+        index["entries"].pop(id_, None)
+        index["dead"] += 1
+
+        return
+
+    index["entries"][id_] = [
+        offset,
+        len(line),
+    ]
+
+
+def _read_record(
+    handle: Any,
+    position: list[int],
+) -> dict[str, Any]:
+    """
+    Reads and decodes a single record at a known position.
+
+    Args:
+        handle (Any): The JSON Lines file opened in binary mode.
+        position (list[int]): The offset and length of the record.
+
+    Returns:
+        dict[str, Any]: The decoded record.
+    """
+
+    handle.seek(position[0])
+
+    return json.loads(handle.read(position[1]))
+
+
+def _write_compacted(
+    file: Path,
+    table_data: dict[str, Any],
+) -> None:
+    """
+    Rewrites a JSON Lines table with a single header record and one record per live entry, in ID order.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+        table_data (dict[str, Any]): The complete table data dictionary.
+
+    Returns:
+        None
+    """
+
+    jsonl_file: Path = get_jsonl_file(file=file)
+
+    lines: list[bytes] = [
+        _encode_record(
+            record={
+                "id": "",
+                "op": "header",
+                **get_table_header(table_data=table_data),
+            }
+        )
+    ]
+
+    index: dict[str, Any] = {
+        "dead": 0,
+        "entries": {},
+        "header": [
+            0,
+            len(lines[0]),
+        ],
+        "inode": 0,
+        "size": 0,
+    }
+
+    offset: int = len(lines[0])
+
+    for (
+        id_,
+        entry,
+    ) in sorted(
+        table_data["entries"]["entries"].items(),
+        key=lambda item: int(item[0]),
+    ):
+        line: bytes = _encode_record(
+            record={
+                "entry": entry,
+                "id": id_,
+                "op": "insert",
+            }
+        )
+
+        index["entries"][str(id_)] = [
+            offset,
+            len(line),
+        ]
+
+        lines.append(line)
+
+        offset += len(line)
+
+    write_file_text(
+        atomic=get_config_value(
+            default=True,
+            key="storage.atomic_writes",
+        ),
+        data=b"".join(lines).decode("utf-8"),
+        file=jsonl_file,
+    )
+
+    index["inode"] = jsonl_file.stat().st_ino
+    index["size"] = offset
+
+    JSONL_INDEXES[str(jsonl_file)] = index
+
+    write_file_json(
+        atomic=True,
+        data=index,
+        file=_get_index_file(file=file),
+    )
+
+
+# ---------- Functions ---------- #
+
+
+def convert_json_tables_to_jsonl(data_dir: Path = DATA_DIR) -> list[str]:
+    """
+    Converts all JSON tables (including pending journal records) of a data directory to JSON Lines.
+
+    Args:
+        data_dir (Path): The data directory containing the JSON tables. Defaults to DATA_DIR.
+
+    Returns:
+        list[str]: The names of the converted tables.
+    """
+
+    return [
+        file.stem for file in sorted(data_dir.glob("*.json")) if convert_json_to_jsonl(file=file)
+    ]
+
+
+def convert_json_to_jsonl(file: Path) -> bool:
+    """
+    Converts a JSON table (including pending journal records) to a JSON Lines table.
+
+    The JSON table is left untouched.
+
+    Args:
+        file (Path): The JSON table file (e.g. ".../flashcards.json").
+
+    Returns:
+        bool: True if the table was converted, False if it has no content.
+    """
+
+    table_data: Optional[dict[str, Any]] = load_journaled_table(file=file)
+
+    if not exists(value=table_data):
+        return False
+
+    _write_compacted(
+        file=file,
+        table_data=table_data,
+    )
+
+    log_info(
+        message=f"Successfully converted '{file.stem}' table to JSON Lines",
+        name=f"{__NAME__}.convert_json_to_jsonl",
+    )
+
+    return True
+
+
+def convert_jsonl_tables_to_json(data_dir: Path = DATA_DIR) -> list[str]:
+    """
+    Converts all JSON Lines tables of a data directory to JSON tables.
+
+    Args:
+        data_dir (Path): The data directory containing the JSON Lines tables. Defaults to DATA_DIR.
+
+    Returns:
+        list[str]: The names of the converted tables.
+    """
+
+    return [
+        file.stem
+        for file in sorted(data_dir.glob("*.jsonl"))
+        if convert_jsonl_to_json(file=file.with_suffix(".json"))
+    ]
+
+
+def convert_jsonl_to_json(file: Path) -> bool:
+    """
+    Converts a JSON Lines table to a JSON table in the '{"entries": {"entries": {...}}}' layout.
+
+    The JSON Lines table is left untouched, an existing JSON table is replaced.
+
+    Args:
+        file (Path): The JSON table file to write (e.g. ".../flashcards.json").
+
+    Returns:
+        bool: True if the table was converted, False if it has no content.
+    """
+
+    table_data: Optional[dict[str, Any]] = load_jsonl_table(file=file)
+
+    if not exists(value=table_data):
+        return False
+
+    write_file_json(
+        atomic=True,
+        data=table_data,
+        file=file,
+    )
+
+    log_info(
+        message=f"Successfully converted '{file.stem}' table to JSON",
+        name=f"{__NAME__}.convert_jsonl_to_json",
+    )
+
+    return True
+
+
+def does_jsonl_table_exist(file: Path) -> bool:
+    """
+    Returns True if the JSON Lines table of a table file exists and has content.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+
+    Returns:
+        bool: True if the table exists, False otherwise.
+    """
+
+    return does_file_have_content(file=get_jsonl_file(file=file))
+
+
+def get_jsonl_entries(
+    file: Path,
+    ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    """
+    Reads and decodes only the requested entries of a JSON Lines table.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+        ids (list[str]): The IDs of the entries to read.
+
+    Returns:
+        dict[str, dict[str, Any]]: The found entries, keyed by ID, in the requested order.
+    """
+
+    if not does_jsonl_table_exist(file=file):
+        return {}
+
+    index: dict[str, Any] = _get_jsonl_index(file=file)
+
+    entries: dict[str, dict[str, Any]] = {}
+
+    with get_jsonl_file(file=file).open(mode="rb") as handle:
+        for id_ in ids:
+            position: Optional[list[int]] = index["entries"].get(str(id_))
+
+            if not exists(value=position):
+                continue
+
+            entries[str(id_)] = _read_record(
+                handle=handle,
+                position=position,
+            )["entry"]
+
+    return entries
+
+
+def get_jsonl_file(file: Path) -> Path:
+    """
+    Returns the JSON Lines file belonging to a table file.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+
+    Returns:
+        Path: The JSON Lines file (e.g. ".../flashcards.jsonl").
+    """
+
+    return file.with_suffix(".jsonl")
+
+
+def get_jsonl_table_signature(file: Path) -> Optional[tuple[int, int]]:
+    """
+    Returns the signature of a JSON Lines table used to validate cached table data.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+
+    Returns:
+        Optional[tuple[int, int]]: The modification time (in nanoseconds) and size of
+                                   the JSON Lines file, or None if it does not exist.
+    """
+
+    try:
+        stat = get_jsonl_file(file=file).stat()
+    except FileNotFoundError:
+        return None
+
+    return (
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+def iter_jsonl_entries(
+    file: Path,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Streams the live entries of a JSON Lines table in ID order.
+
+    The entries are read at their offsets in the index, as an updated entry is appended
+    to the end of the file. Only the latest record of every entry within the window is
+    decoded, superseded, deleted and skipped records are not read at all.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+        limit (Optional[int]): The maximum number of entries to yield. Defaults to None (all).
+        offset (int): The number of entries to skip. Defaults to 0.
+
+    Yields:
+        tuple[str, dict[str, Any]]: The ID and the entry.
+    """
+
+    if not does_jsonl_table_exist(file=file):
+        return
+
+    positions: list[tuple[str, list[int]]] = sorted(
+        _get_jsonl_index(file=file)["entries"].items(),
+        key=lambda item: int(item[0]),
+    )
+
+    with get_jsonl_file(file=file).open(mode="rb") as handle:
+        for (
+            id_,
+            position,
+        ) in itertools.islice(
+            positions,
+            offset,
+            offset + limit if limit is not None else None,
+        ):
+            yield (
+                id_,
+                _read_record(
+                    handle=handle,
+                    position=position,
+                )["entry"],
+            )
+
+
+def load_jsonl_table(file: Path) -> Optional[dict[str, Any]]:
+    """
+    Loads a JSON Lines table into the table data dictionary format of the JSON tables.
+
+    Args:
+        file (Path): The table file (e.g. ".../flashcards.json").
+
+    Returns:
+        Optional[dict[str, Any]]: The table data dictionary, or None if the table does not exist.
+    """
+
+    if not does_jsonl_table_exist(file=file):
+        return None
+
+    index: dict[str, Any] = _get_jsonl_index(file=file)
+
+    if not exists(value=index["header"]):
+        return None
+
+    with get_jsonl_file(file=file).open(mode="rb") as handle:
+        header: dict[str, Any] = _read_record(
+            handle=handle,
+            position=index["header"],
+        )
+
+    table_data: dict[str, Any] = replay_journal_records(
+        records=[header],
+        table_data={
+            "entries": {
+                "entries": {},
+                "total": 0,
+            },
+        },
+    )
+
+    table_data["entries"]["entries"] = dict(iter_jsonl_entries(file=file))
+
+    return table_data
+
+
+def save_jsonl_table(
+    changes: Optional[list[dict[str, Any]]],
+    file: Path,
+    table_data: dict[str, Any],
+) -> None:
+    """
+    Persists changes to a JSON Lines table by appending one record per change.
+
+    The table is rewritten without superseded records once these outnumber both the live
+    entries and the "storage.journal_compaction_threshold" config value, or right away
+    if no changes are passed.
+
+    Args:
+        changes (Optional[list[dict[str, Any]]]): The per-entry change records to append.
+        file (Path): The table file (e.g. ".../flashcards.json").
+        table_data (dict[str, Any]): The complete table data dictionary after the changes.
+
+    Returns:
+        None
+    """
+
+    if changes is None or not does_jsonl_table_exist(file=file):
+        _write_compacted(
+            file=file,
+            table_data=table_data,
+        )
+
+        return
+
+    index: dict[str, Any] = _get_jsonl_index(file=file)
+
+    lines: list[bytes] = [
+        _encode_record(record=record)
+        for record in [
+            *changes,
+            {
+                "id": "",
+                "op": "header",
+                **get_table_header(table_data=table_data),
+            },
+        ]
+    ]
+
+    with get_jsonl_file(file=file).open(mode="ab") as handle:
+        handle.write(b"".join(lines))
+
+    offset: int = index["size"]
+
+    for line in lines:
+        _index_record(
+            index=index,
+            line=line,
+            offset=offset,
+        )
+
+        offset += len(line)
+
+    index["size"] = offset
+
+    if index["dead"] <= max(
+        len(index["entries"]),
+        get_config_value(
+            default=1000,
+            key="storage.journal_compaction_threshold",
+        ),
+    ):
+        return
+
+    _write_compacted(
+        file=file,
+        table_data=table_data,
+    )
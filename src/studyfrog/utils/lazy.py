@@ -0,0 +1,117 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Lazy re-exports for packages: attributes are imported from their module on first access (PEP 562).
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+from typing import Any, Final, Optional
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "get_lazy_attribute",
+    "get_lazy_attribute_names",
+    "register_lazy_imports",
+]
+
+
+# ---------- Constants ---------- #
+
+LAZY_IMPORTS: Final[dict[str, dict[str, str]]] = {}
+
+
+# ---------- Functions ---------- #
+
+
+def get_lazy_attribute(
+    name: str,
+    package: str,
+) -> Any:
+    """
+    Imports and returns a lazily re-exported attribute of a package.
+
+    Meant to be called from the module '__getattr__' of the package. The attribute is
+    stored on the package, so later accesses no longer reach '__getattr__'. Names that
+    are not re-exported resolve to the submodule of that name, if any.
+
+    Args:
+        name (str): The name of the attribute.
+        package (str): The name of the package (its '__name__').
+
+    Returns:
+        Any: The attribute.
+
+    Raises:
+        AttributeError: If the package neither re-exports the attribute nor has a submodule of that name.
+    """
+
+    module: Any = sys.modules[package]
+
+    source: Optional[str] = LAZY_IMPORTS.get(package, {}).get(name)
+
+    if source is None:
+        try:
+            return importlib.import_module(f"{package}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{package}.{name}":
+                raise e
+
+            raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+
+    value: Any = getattr(
+        importlib.import_module(source),
+        name,
+    )
+
+    setattr(
+        module,
+        name,
+        value,
+    )
+
+    return value
+
+
+def get_lazy_attribute_names(package: str) -> list[str]:
+    """
+    Returns the names of the loaded and lazily re-exported attributes of a package.
+
+    Meant to be called from the module '__dir__' of the package.
+
+    Args:
+        package (str): The name of the package (its '__name__').
+
+    Returns:
+        list[str]: The sorted attribute names.
+    """
+
+    return sorted(
+        {
+            *vars(sys.modules[package]),
+            *LAZY_IMPORTS.get(package, {}),
+        }
+    )
+
+
+def register_lazy_imports(
+    imports: dict[str, tuple[str, ...]],
+    package: str,
+) -> None:
+    """
+    Registers the attributes a package re-exports lazily.
+
+    Args:
+        imports (dict[str, tuple[str, ...]]): The names of the re-exported attributes per source module.
+        package (str): The name of the package (its '__name__').
+
+    Returns:
+        None
+    """
+
+    LAZY_IMPORTS[package] = {name: module for (module, names) in imports.items() for name in names}
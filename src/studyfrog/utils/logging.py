@@ -6,12 +6,19 @@ Description: This module holds the logg functions for the application.
 
 from __future__ import annotations
 
+import atexit
+import json
+import queue
 import sys
+import threading
 import traceback
 
-from typing import Any, Final, Literal, Optional, TypeAlias
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Final, Literal, Optional, TextIO, TypeAlias
 
 from studyfrog.constants.common import APP_NAME
+from studyfrog.constants.directories import LOGS_DIR
 from studyfrog.constants.logging import (
     CRITICAL_FG,
     DEBUG_FG,
@@ -22,12 +29,16 @@ from studyfrog.constants.logging import (
     TRACE_FG,
     WARNING_FG,
 )
-from studyfrog.utils.common import get_now_iso_str
+from studyfrog.utils.config import get_config_value
+from studyfrog.utils.directories import ensure_directory
 
 
 # ---------- Exports ---------- #
 
 __all__: Final[list[str]] = [
+    "configure_logging",
+    "flush_logs",
+    "is_log_level_enabled",
     "log",
     "log_critical",
     "log_debug",
@@ -36,6 +47,10 @@ __all__: Final[list[str]] = [
     "log_success",
     "log_trace",
     "log_warning",
+    "set_log_level",
+    "set_module_log_level",
+    "start_log_writer",
+    "stop_log_writer",
 ]
 
 
@@ -51,9 +66,576 @@ LogLevel: TypeAlias = Literal[
     "WARNING",
 ]
 
+
+# ---------- Constants ---------- #
+
+LEVELS: Final[dict[str, int]] = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+LEVEL_COLORS: Final[dict[str, str]] = {
+    "CRITICAL": CRITICAL_FG,
+    "DEBUG": DEBUG_FG,
+    "ERROR": ERROR_FG,
+    "INFO": INFO_FG,
+    "SUCCESS": SUCCESS_FG,
+    "TRACE": TRACE_FG,
+    "WARNING": WARNING_FG,
+}
+
+JSON_LOG_FILE: Final[Path] = LOGS_DIR / "studyfrog.jsonl"
+
+LOG_FILE: Final[Path] = LOGS_DIR / "studyfrog.log"
+
+LOG_QUEUE: Final[queue.SimpleQueue] = queue.SimpleQueue()
+
+LOG_WRITER: Optional[threading.Thread] = None
+
+MODULE_LEVELS: Final[dict[str, int]] = {}
+
+NAME_LEVELS: Final[dict[str, int]] = {}
+
+NAME_PREFIXES: Final[tuple[str, ...]] = (
+    "src.",
+    "studyfrog.",
+)
+
+SETTINGS: Final[dict[str, Any]] = {
+    "backups": 3,
+    "batch_size": 256,
+    "configured": False,
+    "level": 0,
+    "max_bytes": 1_048_576,
+    "minimum": 0,
+}
+
+SINKS: Final[dict[str, dict[str, Any]]] = {
+    "json": {
+        "file": None,
+        "handle": None,
+    },
+    "text": {
+        "file": None,
+        "handle": None,
+    },
+}
+
+STDERR_LEVELS: Final[frozenset[str]] = frozenset(
+    (
+        "CRITICAL",
+        "ERROR",
+        "WARNING",
+    )
+)
+
+WRITE_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _close_log_file(sink: str = "text") -> None:
+    """
+    Closes a log file sink, if open.
+
+    Args:
+        sink (str): The sink: "text" or "json". Defaults to "text".
+
+    Returns:
+        None
+    """
+
+    handle: Optional[TextIO] = SINKS[sink]["handle"]
+
+    SINKS[sink]["file"] = None
+    SINKS[sink]["handle"] = None
+
+    if handle is not None:
+        handle.close()
+
+
+def _configure_log_file(
+    enabled: bool,
+    file: Path,
+    sink: str,
+) -> None:
+    """
+    Opens or closes a log file sink.
+
+    Args:
+        enabled (bool): Whether the sink should be open.
+        file (Path): The log file of the sink.
+        sink (str): The sink: "text" or "json".
+
+    Returns:
+        None
+    """
+
+    if not enabled:
+        _close_log_file(sink=sink)
+    elif SINKS[sink]["file"] != file:
+        _open_log_file(
+            file=file,
+            sink=sink,
+        )
+
+
+def _format_json_record(record: tuple[Any, ...]) -> str:
+    """
+    Formats a log record as a JSON line.
+
+    Args:
+        record (tuple[Any, ...]): The record: its level, timestamp, message, name, args, kwargs and module.
+
+    Returns:
+        str: The JSON object, with its trailing newline.
+    """
+
+    (
+        level,
+        timestamp,
+        message,
+        name,
+        args,
+        kwargs,
+        module,
+    ) = record
+
+    data: dict[str, Any] = {
+        "kwargs": kwargs,
+        "level": level,
+        "message": message,
+        "module": name or module or APP_NAME,
+        "timestamp": timestamp.isoformat(),
+    }
+
+    if args:
+        data["args"] = args
+
+    try:
+        return f"{json.dumps(data, default=str)}\n"
+    except (
+        TypeError,
+        ValueError,
+    ):
+        data["message"] = str(message)
+
+        return f"{json.dumps(data, default=str, skipkeys=True)}\n"
+
+
+def _format_record(
+    record: tuple[Any, ...],
+    colored: bool = True,
+) -> str:
+    """
+    Formats a log record as a line.
+
+    Args:
+        record (tuple[Any, ...]): The record: its level, timestamp, message, name, args, kwargs and module.
+        colored (bool): Whether to wrap the line in the ANSI color of its level. Defaults to True.
+
+    Returns:
+        str: The formatted line, with its trailing newline.
+    """
+
+    (
+        level,
+        timestamp,
+        message,
+        name,
+        args,
+        kwargs,
+        _,
+    ) = record
+
+    line: str = (
+        f"{timestamp.isoformat()} - [{level}]{f' - [{name.upper()}] ' if name else f' - [{APP_NAME}] '}- {str(message)}{'' if not args else ' ' + ' '.join([str(arg) for arg in args])}{'' if not kwargs else ' ' + ' '.join([f'{k}={v}' for k, v in kwargs.items()])};"
+    )
+
+    if not colored:
+        return f"{line}\n"
+
+    return f"{LEVEL_COLORS.get(level, RESET)}{line}{RESET}\n"
+
+
+def _get_caller_name() -> str:
+    """
+    Returns the name of the module that called into the logging module.
+
+    The module's '__NAME__' is used if it defines one, its '__name__' otherwise.
+
+    Args:
+        None
+
+    Returns:
+        str: The name of the calling module.
+    """
+
+    frame: Any = sys._getframe(1)
+
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+
+    if frame is None:
+        return APP_NAME
+
+    return frame.f_globals.get("__NAME__") or frame.f_globals.get("__name__", APP_NAME)
+
+
+def _get_level(name: str) -> int:
+    """
+    Returns the minimum level (as number) of messages logged under a name.
+
+    The most specific module level configured for the name applies, e.g. 'utils.storage'
+    applies to 'src.utils.storage._save_table_data'. Without one, the global level applies.
+    Resolved levels are cached per name.
+
+    Args:
+        name (str): The name (module or function) logged under.
+
+    Returns:
+        int: The minimum level.
+    """
+
+    level: Optional[int] = NAME_LEVELS.get(name)
+
+    if level is not None:
+        return level
+
+    normalized: str = _normalize_name(name=name)
+
+    level = SETTINGS["level"]
+    matched: int = -1
+
+    for (
+        module,
+        value,
+    ) in MODULE_LEVELS.items():
+        if len(module) > matched and (
+            normalized == module or normalized.startswith(f"{module}.")
+        ):
+            level = value
+            matched = len(module)
+
+    NAME_LEVELS[name] = level
+
+    return level
+
+
+def _normalize_name(name: str) -> str:
+    """
+    Returns the normalized (lowercase, without 'src.' or 'studyfrog.' prefix) form of a module name.
+
+    Args:
+        name (str): The module name.
+
+    Returns:
+        str: The normalized module name.
+    """
+
+    name = name.lower()
+
+    for prefix in NAME_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix) :]
+
+    return name
+
+
+def _open_log_file(
+    file: Path,
+    sink: str = "text",
+) -> None:
+    """
+    Opens (appends to) a log file sink.
+
+    Args:
+        file (Path): The log file.
+        sink (str): The sink: "text" or "json". Defaults to "text".
+
+    Returns:
+        None
+    """
+
+    _close_log_file(sink=sink)
+
+    ensure_directory(directory=file.parent)
+
+    SINKS[sink]["file"] = file
+    SINKS[sink]["handle"] = file.open(
+        encoding="utf-8",
+        mode="a",
+    )
+
+
+def _rotate_log_file(sink: str = "text") -> None:
+    """
+    Rotates a log file sink: 'studyfrog.log' becomes 'studyfrog.log.1' and so on.
+
+    The oldest backup beyond the configured number of backups is discarded.
+
+    Args:
+        sink (str): The sink: "text" or "json". Defaults to "text".
+
+    Returns:
+        None
+    """
+
+    file: Path = SINKS[sink]["file"]
+
+    SINKS[sink]["handle"].close()
+
+    for index in range(
+        SETTINGS["backups"],
+        0,
+        -1,
+    ):
+        source: Path = file if index == 1 else file.with_name(f"{file.name}.{index - 1}")
+
+        if source.exists():
+            source.replace(file.with_name(f"{file.name}.{index}"))
+
+    if SETTINGS["backups"] <= 0:
+        file.unlink(missing_ok=True)
+
+    SINKS[sink]["handle"] = file.open(
+        encoding="utf-8",
+        mode="a",
+    )
+
+
+def _run_log_writer() -> None:
+    """
+    Writes queued log records in batches until stopped.
+
+    Runs on the background writer thread (see 'start_log_writer'). A 'None' record
+    stops the writer; a 'threading.Event' record is set once everything queued
+    before it was written (see 'flush_logs').
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    while True:
+        items: list[Any] = [LOG_QUEUE.get()]
+
+        while len(items) < SETTINGS["batch_size"]:
+            try:
+                items.append(LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        _write_records(
+            records=[
+                item
+                for item in items
+                if isinstance(
+                    item,
+                    tuple,
+                )
+            ]
+        )
+
+        for item in items:
+            if isinstance(
+                item,
+                threading.Event,
+            ):
+                item.set()
+
+        if None in items:
+            return
+
+
+def _update_minimum_level() -> None:
+    """
+    Recomputes the lowest level any message is logged at and drops the cached levels per name.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    NAME_LEVELS.clear()
+
+    SETTINGS["minimum"] = min(
+        [
+            SETTINGS["level"],
+            *MODULE_LEVELS.values(),
+        ]
+    )
+
+
+def _write_records(records: list[tuple[Any, ...]]) -> None:
+    """
+    Writes log records to the console and the open log file sinks.
+
+    Warnings and errors go to stderr, everything else to stdout. Each stream and
+    file is written to once per batch.
+
+    Args:
+        records (list[tuple[Any, ...]]): The log records.
+
+    Returns:
+        None
+    """
+
+    if not records:
+        return
+
+    stderr: list[str] = []
+    stdout: list[str] = []
+
+    for record in records:
+        (stderr if record[0] in STDERR_LEVELS else stdout).append(_format_record(record=record))
+
+    with WRITE_LOCK:
+        if stdout:
+            sys.stdout.write("".join(stdout))
+
+        if stderr:
+            sys.stderr.write("".join(stderr))
+
+        for (
+            sink,
+            formatter,
+        ) in (
+            (
+                "json",
+                _format_json_record,
+            ),
+            (
+                "text",
+                lambda record: _format_record(
+                    colored=False,
+                    record=record,
+                ),
+            ),
+        ):
+            handle: Optional[TextIO] = SINKS[sink]["handle"]
+
+            if handle is None:
+                continue
+
+            handle.write("".join(formatter(record) for record in records))
+            handle.flush()
+
+            if handle.tell() >= SETTINGS["max_bytes"]:
+                _rotate_log_file(sink=sink)
+
+
 # ---------- Functions ---------- #
 
 
+def configure_logging() -> None:
+    """
+    Applies the 'logging' config values: the minimum levels, the writer batch size and the file sinks.
+
+    Called on the first log call, so configuring explicitly is only needed after the
+    config changed. 'logging.levels' maps module names to their own minimum level,
+    e.g. {"utils.storage": "WARNING", "utils.dispatcher": "ERROR"}.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    SETTINGS["backups"] = get_config_value(key="logging.file_backups")
+    SETTINGS["batch_size"] = get_config_value(key="logging.batch_size")
+    SETTINGS["max_bytes"] = get_config_value(key="logging.file_max_bytes")
+
+    MODULE_LEVELS.clear()
+
+    for (
+        module,
+        level,
+    ) in (get_config_value(key="logging.levels") or {}).items():
+        MODULE_LEVELS[_normalize_name(name=module)] = LEVELS.get(
+            str(level).upper(),
+            0,
+        )
+
+    set_log_level(level=get_config_value(key="logging.level"))
+
+    with WRITE_LOCK:
+        _configure_log_file(
+            enabled=bool(get_config_value(key="logging.json")),
+            file=JSON_LOG_FILE,
+            sink="json",
+        )
+        _configure_log_file(
+            enabled=bool(get_config_value(key="logging.file")),
+            file=LOG_FILE,
+            sink="text",
+        )
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """
+    Waits until the background writer wrote every record logged so far.
+
+    Args:
+        timeout (float): The number of seconds to wait at most. Defaults to 5.0.
+
+    Returns:
+        bool: True if everything was written, False if the wait timed out.
+    """
+
+    if LOG_WRITER is None:
+        return True
+
+    flushed: threading.Event = threading.Event()
+
+    LOG_QUEUE.put(flushed)
+
+    return flushed.wait(timeout=timeout)
+
+
+def is_log_level_enabled(
+    level: LogLevel,
+    name: Optional[str] = None,
+) -> bool:
+    """
+    Returns whether messages of a level are logged.
+
+    Meant for callers that would otherwise build an expensive message that is discarded.
+
+    Args:
+        level (LogLevel): The level.
+        name (Optional[str]): The name the message would be logged under. Defaults to None,
+                              in which case the calling module's name is used.
+
+    Returns:
+        bool: True if messages of the level pass the applicable minimum level, False otherwise.
+    """
+
+    if not SETTINGS["configured"]:
+        configure_logging()
+
+    value: int = LEVELS.get(level.upper(), 0)
+
+    if value < SETTINGS["minimum"]:
+        return False
+
+    if not MODULE_LEVELS:
+        return value >= SETTINGS["level"]
+
+    return value >= _get_level(name=name or _get_caller_name())
+
+
 def log(
     *args,
     message: Any,
@@ -64,6 +646,11 @@ def log(
     """
     Prints a log message to the console.
 
+    Messages below the applicable minimum level ('logging.level', or the module's
+    level from 'logging.levels') are discarded before anything is formatted. While the
+    background writer runs (see 'start_log_writer'), the message is only queued;
+    formatting and writing happen on the writer thread.
+
     Args:
         *args: Additional positional arguments to include in the log message.
         level (LogLevel, optional): The level of the log. Defaults to "TRACE".
@@ -75,33 +662,41 @@ def log(
         None
     """
 
+    if not SETTINGS["configured"]:
+        configure_logging()
+
     if not level.isupper():
         level = level.upper()
 
-    level_to_color: dict[LogLevel, str] = {
-        "CRITICAL": CRITICAL_FG,
-        "DEBUG": DEBUG_FG,
-        "ERROR": ERROR_FG,
-        "INFO": INFO_FG,
-        "SUCCESS": SUCCESS_FG,
-        "TRACE": TRACE_FG,
-        "WARNING": WARNING_FG,
-    }
+    value: int = LEVELS.get(level, 0)
+
+    if value < SETTINGS["minimum"]:
+        return
 
-    log_string: str = (
-        f"{level_to_color.get(level, RESET)}{get_now_iso_str()} - [{level}]{f' - [{name.upper()}] ' if name else f' - [{APP_NAME}] '}- {str(message)}{'' if not args else ' ' + ' '.join([str(arg) for arg in args])}{'' if not kwargs else ' ' + ' '.join([f'{k}={v}' for k, v in kwargs.items()])};{RESET}\n"
+    module: Optional[str] = name
+
+    if module is None and (MODULE_LEVELS or SINKS["json"]["handle"] is not None):
+        module = _get_caller_name()
+
+    if value < (_get_level(name=module) if MODULE_LEVELS else SETTINGS["level"]):
+        return
+
+    record: tuple[Any, ...] = (
+        level,
+        datetime.now(),
+        message,
+        name,
+        args,
+        kwargs,
+        module,
     )
 
-    if level not in [
-        "CRITICAL",
-        "ERROR",
-        "WARNING",
-    ]:
-        sys.stdout.write(log_string)
+    if LOG_WRITER is not None:
+        LOG_QUEUE.put(record)
 
         return
 
-    sys.stderr.write(log_string)
+    _write_records(records=[record])
 
 
 def log_critical(
@@ -325,3 +920,113 @@ def log_warning(
         *args,
         **kwargs,
     )
+
+
+def set_log_level(level: LogLevel) -> None:
+    """
+    Sets the global minimum level of the messages to log.
+
+    Args:
+        level (LogLevel): The minimum level.
+
+    Returns:
+        None
+    """
+
+    SETTINGS["level"] = LEVELS.get(
+        str(level).upper(),
+        0,
+    )
+    SETTINGS["configured"] = True
+
+    _update_minimum_level()
+
+
+def set_module_log_level(
+    module: str,
+    level: Optional[LogLevel],
+) -> None:
+    """
+    Sets the minimum level of the messages logged by a module (and its functions).
+
+    Args:
+        module (str): The module name, e.g. 'utils.storage'.
+        level (Optional[LogLevel]): The minimum level, or None to fall back to the global level.
+
+    Returns:
+        None
+    """
+
+    if not SETTINGS["configured"]:
+        configure_logging()
+
+    module = _normalize_name(name=module)
+
+    if level is None:
+        MODULE_LEVELS.pop(
+            module,
+            None,
+        )
+    else:
+        MODULE_LEVELS[module] = LEVELS.get(
+            str(level).upper(),
+            0,
+        )
+
+    _update_minimum_level()
+
+
+def start_log_writer() -> None:
+    """
+    Starts the background writer thread, so logging only queues its messages.
+
+    The writer is stopped (and the queue written out) when the interpreter exits,
+    unless 'stop_log_writer' is called first.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    global LOG_WRITER
+
+    if LOG_WRITER is not None:
+        return
+
+    LOG_WRITER = threading.Thread(
+        daemon=True,
+        name="studyfrog-log-writer",
+        target=_run_log_writer,
+    )
+    LOG_WRITER.start()
+
+    atexit.register(stop_log_writer)
+
+
+def stop_log_writer(timeout: float = 5.0) -> None:
+    """
+    Stops the background writer thread after it wrote every queued message.
+
+    Args:
+        timeout (float): The number of seconds to wait for the writer at most. Defaults to 5.0.
+
+    Returns:
+        None
+    """
+
+    global LOG_WRITER
+
+    writer: Optional[threading.Thread] = LOG_WRITER
+
+    if writer is None:
+        return
+
+    LOG_WRITER = None
+
+    LOG_QUEUE.put(None)
+
+    writer.join(timeout=timeout)
+
+    atexit.unregister(stop_log_writer)
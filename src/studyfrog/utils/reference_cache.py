@@ -0,0 +1,416 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: In-memory cache of the small reference tables (difficulties, priorities, subjects, tags and teachers).
+
+Every table is cached as a map from key to model and a map from name to key, so looking
+up e.g. the "easy" difficulty is a dictionary hit instead of a table scan. The cache is
+warmed at startup (see 'warm_reference_cache'), loads a table on first use otherwise and
+is kept coherent by the storage notifications (see 'update_reference_cache' and
+'remove_from_reference_cache').
+"""
+
+from __future__ import annotations
+
+import threading
+
+from typing import Any, Final, Optional
+
+from studyfrog.constants.storage import DIFFICULTIES, PRIORITIES, SUBJECTS, TAGS, TEACHERS
+from studyfrog.models.models import Model
+from studyfrog.utils.common import exists, model_key_to_model_type, pluralize_word
+from studyfrog.utils.logging import log_info
+from studyfrog.utils.storage import get_all_entries
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "clear_reference_cache",
+    "get_reference_key",
+    "get_reference_model",
+    "get_reference_models",
+    "remove_from_reference_cache",
+    "update_reference_cache",
+    "warm_reference_cache",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "utils.reference_cache"
+
+REFERENCE_CACHE: Final[dict[str, dict[str, Any]]] = {}
+
+REFERENCE_CACHE_LOCK: Final[threading.RLock] = threading.RLock()
+
+# The fields a model of each table can be looked up by, in order of precedence
+REFERENCE_NAME_FIELDS: Final[dict[str, tuple[str, ...]]] = {
+    DIFFICULTIES: (
+        "name",
+        "display_name",
+    ),
+    PRIORITIES: (
+        "name",
+        "display_name",
+    ),
+    SUBJECTS: ("name",),
+    TAGS: ("value",),
+    TEACHERS: ("name",),
+}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _ensure_reference_table(table_name: str) -> dict[str, Any]:
+    """
+    Returns the cache of a reference table, loading the table on first use.
+
+    Args:
+        table_name (str): The name of the table, e.g. "difficulties".
+
+    Returns:
+        dict[str, Any]: The cache of the table, with the 'keys' (name to key) and 'models' (key to model) maps.
+
+    Raises:
+        KeyError: If the table is no reference table.
+    """
+
+    if table_name not in REFERENCE_NAME_FIELDS:
+        raise KeyError(f"'{table_name}' is no reference table.")
+
+    if table_name in REFERENCE_CACHE:
+        return REFERENCE_CACHE[table_name]
+
+    REFERENCE_CACHE[table_name] = {
+        "keys": {},
+        "models": {},
+    }
+
+    for model in get_all_entries(table_name=table_name) or []:
+        _insert_reference_model(
+            model=model,
+            table_name=table_name,
+        )
+
+    return REFERENCE_CACHE[table_name]
+
+
+def _get_item_key(item: Any) -> Optional[str]:
+    """
+    Returns the key of a notified model or raw entry.
+
+    Args:
+        item (Any): The model or raw entry.
+
+    Returns:
+        Optional[str]: The key, or None if it has none.
+    """
+
+    if isinstance(
+        item,
+        dict,
+    ):
+        return (item.get("identifiable") or {}).get("key")
+
+    return getattr(
+        item,
+        "key",
+        None,
+    )
+
+
+def _get_notified_items(kwargs: dict[str, Any]) -> list[Any]:
+    """
+    Returns the items of a storage notification.
+
+    Args:
+        kwargs (dict[str, Any]): The keyword arguments of the notification, e.g.
+                                 {"difficulty": Model} or {"difficulties": [Model, ...]}.
+
+    Returns:
+        list[Any]: The notified models or raw entries.
+    """
+
+    items: list[Any] = []
+
+    for value in kwargs.values():
+        if isinstance(
+            value,
+            (list, tuple),
+        ):
+            items.extend(value)
+        elif exists(value=value):
+            items.append(value)
+
+    return items
+
+
+def _get_table_name(key: Optional[str]) -> Optional[str]:
+    """
+    Returns the name of the cached reference table a key belongs to.
+
+    Args:
+        key (Optional[str]): The key, e.g. "DIFFICULTY_0".
+
+    Returns:
+        Optional[str]: The table name, or None if the key belongs to no cached reference table.
+    """
+
+    if not exists(value=key):
+        return None
+
+    model_type: Optional[str] = model_key_to_model_type(model_key=key)
+
+    if not exists(value=model_type):
+        return None
+
+    table_name: str = pluralize_word(word=model_type.lower())
+
+    if table_name not in REFERENCE_CACHE:
+        return None
+
+    return table_name
+
+
+def _insert_reference_model(
+    model: Model,
+    table_name: str,
+) -> None:
+    """
+    Inserts a model into the cache of its table, replacing an earlier version of it.
+
+    Args:
+        model (Model): The model.
+        table_name (str): The name of the table.
+
+    Returns:
+        None
+    """
+
+    _remove_reference_model(
+        key=model.key,
+        table_name=table_name,
+    )
+
+    cache: dict[str, Any] = REFERENCE_CACHE[table_name]
+
+    cache["models"][model.key] = model
+
+    for field in REFERENCE_NAME_FIELDS[table_name]:
+        name: Any = getattr(
+            model,
+            field,
+            None,
+        )
+
+        if exists(value=name):
+            cache["keys"].setdefault(
+                name,
+                model.key,
+            )
+
+
+def _remove_reference_model(
+    key: str,
+    table_name: str,
+) -> None:
+    """
+    Removes a model and its names from the cache of its table.
+
+    Args:
+        key (str): The key of the model.
+        table_name (str): The name of the table.
+
+    Returns:
+        None
+    """
+
+    cache: dict[str, Any] = REFERENCE_CACHE[table_name]
+
+    if cache["models"].pop(key, None) is None:
+        return
+
+    for name in [name for (name, key_) in cache["keys"].items() if key_ == key]:
+        cache["keys"].pop(name)
+
+
+# ---------- Functions ---------- #
+
+
+def clear_reference_cache(table_name: Optional[str] = None) -> None:
+    """
+    Discards the cache of a reference table, or of all of them. They are reloaded on next use.
+
+    Args:
+        table_name (Optional[str]): The name of the table. Defaults to None (all tables).
+
+    Returns:
+        None
+    """
+
+    with REFERENCE_CACHE_LOCK:
+        if exists(value=table_name):
+            REFERENCE_CACHE.pop(table_name, None)
+            return
+
+        REFERENCE_CACHE.clear()
+
+
+def get_reference_key(
+    name: str,
+    table_name: str,
+) -> Optional[str]:
+    """
+    Returns the key of a reference model by its name.
+
+    Difficulties and priorities are found by their name or display name, subjects and
+    teachers by their name and tags by their value.
+
+    Args:
+        name (str): The name, e.g. "easy".
+        table_name (str): The name of the table, e.g. "difficulties".
+
+    Returns:
+        Optional[str]: The key, or None if no model has the name.
+
+    Raises:
+        KeyError: If the table is no reference table.
+    """
+
+    with REFERENCE_CACHE_LOCK:
+        return _ensure_reference_table(table_name=table_name)["keys"].get(name)
+
+
+def get_reference_model(
+    table_name: str,
+    key: Optional[str] = None,
+    name: Optional[str] = None,
+) -> Optional[Model]:
+    """
+    Returns a reference model by its key or name.
+
+    Args:
+        table_name (str): The name of the table, e.g. "difficulties".
+        key (Optional[str]): The key of the model. Defaults to None.
+        name (Optional[str]): The name of the model (see 'get_reference_key'). Defaults to None.
+
+    Returns:
+        Optional[Model]: The model, or None if it is not found.
+
+    Raises:
+        KeyError: If the table is no reference table.
+    """
+
+    with REFERENCE_CACHE_LOCK:
+        cache: dict[str, Any] = _ensure_reference_table(table_name=table_name)
+
+        if not exists(value=key) and exists(value=name):
+            key = cache["keys"].get(name)
+
+        return cache["models"].get(key)
+
+
+def get_reference_models(table_name: str) -> list[Model]:
+    """
+    Returns all models of a reference table.
+
+    Args:
+        table_name (str): The name of the table, e.g. "difficulties".
+
+    Returns:
+        list[Model]: The models. The list is a copy, the models are shared.
+
+    Raises:
+        KeyError: If the table is no reference table.
+    """
+
+    with REFERENCE_CACHE_LOCK:
+        return list(_ensure_reference_table(table_name=table_name)["models"].values())
+
+
+def remove_from_reference_cache(**kwargs) -> None:
+    """
+    Removes deleted models from the cache.
+
+    Meant to be subscribed to the *_DELETED storage notifications of the reference
+    tables, whose keyword arguments hold the deleted entries.
+
+    Args:
+        **kwargs: The deleted models or raw entries, single or as a list.
+
+    Returns:
+        None
+    """
+
+    with REFERENCE_CACHE_LOCK:
+        for item in _get_notified_items(kwargs=kwargs):
+            key: Optional[str] = _get_item_key(item=item)
+            table_name: Optional[str] = _get_table_name(key=key)
+
+            if not exists(value=table_name):
+                continue
+
+            _remove_reference_model(
+                key=key,
+                table_name=table_name,
+            )
+
+
+def update_reference_cache(**kwargs) -> None:
+    """
+    Inserts added or updated models into the cache.
+
+    Meant to be subscribed to the *_ADDED and *_UPDATED storage notifications of the
+    reference tables, whose keyword arguments hold the models. Tables that are not
+    loaded yet are left alone, they are read in full on first use.
+
+    Args:
+        **kwargs: The added or updated models, single or as a list.
+
+    Returns:
+        None
+    """
+
+    with REFERENCE_CACHE_LOCK:
+        for item in _get_notified_items(kwargs=kwargs):
+            table_name: Optional[str] = _get_table_name(key=_get_item_key(item=item))
+
+            if not exists(value=table_name) or isinstance(
+                item,
+                dict,
+            ):
+                continue
+
+            _insert_reference_model(
+                model=item,
+                table_name=table_name,
+            )
+
+
+def warm_reference_cache() -> int:
+    """
+    Loads every reference table into the cache, replacing what was cached before.
+
+    Args:
+        None
+
+    Returns:
+        int: The number of cached models.
+    """
+
+    with REFERENCE_CACHE_LOCK:
+        REFERENCE_CACHE.clear()
+
+        count: int = sum(
+            len(_ensure_reference_table(table_name=table_name)["models"])
+            for table_name in REFERENCE_NAME_FIELDS
+        )
+
+    log_info(
+        message=f"Cached {count} models of {len(REFERENCE_NAME_FIELDS)} reference tables.",
+        name=f"{__NAME__}.warm_reference_cache",
+    )
+
+    return count
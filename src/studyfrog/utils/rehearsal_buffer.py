@@ -0,0 +1,905 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Run-scoped write-behind buffer for the grades, item results and actions of a rehearsal run.
+
+While a rehearsal run is in progress, grading an item, visiting an item or performing an
+action only changes the buffer in memory and appends a line to a small sidecar journal
+(see 'REHEARSAL_BUFFER_DB_JSON'). The buffer is written to the tables when the run ends
+and, if configured, periodically in between ('rehearsal.flush_interval'), with at most
+one write per table: the actions, the run items, the run and the graded items.
+The periodic flush runs on the main (Tk) thread, which grades the items, and every
+change to the buffered run and models is made while holding 'REHEARSAL_BUFFER_LOCK'.
+
+If the application stops before the run ended, the journal is replayed on the next
+start and the buffered changes are written (see 'recover_rehearsal_buffer'). The outcome
+of every table write (added actions, IDs of added run items) is journaled right after
+the write, so that recovery does not add the same rows again.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from pathlib import Path
+from typing import Any, Final, Optional
+
+from studyfrog.constants.common import PATTERNS
+from studyfrog.constants.files import REHEARSAL_BUFFER_DB_JSON
+from studyfrog.constants.storage import REHEARSAL_ACTIONS, REHEARSAL_RUN_ITEMS, REHEARSAL_RUNS
+from studyfrog.models.factory import (
+    get_rehearsal_action_model,
+    get_rehearsal_run_item_model,
+)
+from studyfrog.models.models import Model
+from studyfrog.utils.common import (
+    exists,
+    generate_model_key,
+    get_now,
+    model_key_to_model_type,
+    pluralize_word,
+    search_string,
+)
+from studyfrog.utils.config import get_config_value
+from studyfrog.utils.dispatcher import call_on_main_thread
+from studyfrog.utils.files import does_file_exist, remove_file
+from studyfrog.utils.journal import (
+    append_journal_records,
+    get_journal_file,
+    read_journal_records,
+    replay_journal_records,
+    write_journal_records,
+)
+from studyfrog.utils.logging import log_error, log_info, log_warning
+from studyfrog.utils.scheduler import schedule_reviews
+from studyfrog.utils.storage import add_entries, get_entries, get_entry, update_entries
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "clear_rehearsal_buffer",
+    "flush_rehearsal_buffer",
+    "record_rehearsal_action",
+    "record_rehearsal_grade",
+    "record_rehearsal_item",
+    "recover_rehearsal_buffer",
+    "start_rehearsal_buffer",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "utils.rehearsal_buffer"
+
+# The fields of a graded item that are restored before its grade is (re)applied
+GRADE_BASELINE_FIELDS: Final[tuple[str, ...]] = (
+    "difficulty",
+    "last_viewed_at",
+    "last_viewed_on",
+    "next_view_on",
+    "schedule",
+)
+
+REHEARSAL_BUFFER: Final[dict[str, Any]] = {
+    "dirty": set(),
+    "entries": {},
+    "models": {},
+    "next_action": 0,
+    "run": None,
+    "timer": None,
+}
+
+REHEARSAL_BUFFER_LOCK: Final[threading.RLock] = threading.RLock()
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _cancel_flush_timer() -> None:
+    """
+    Cancels the pending periodic flush, if any.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    timer: Optional[threading.Timer] = REHEARSAL_BUFFER["timer"]
+
+    REHEARSAL_BUFFER["timer"] = None
+
+    if exists(value=timer):
+        timer.cancel()
+
+
+def _flush_on_main_thread() -> None:
+    """
+    Flushes the buffer when the periodic flush is due, on the main (Tk) thread.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    try:
+        flush_rehearsal_buffer()
+    except Exception as e:
+        log_error(
+            message=f"Caught an exception while flushing the rehearsal buffer: {e}",
+            name=f"{__NAME__}._flush_on_main_thread",
+        )
+
+
+def _get_buffer_file() -> Path:
+    """
+    Returns the file the buffer journal belongs to.
+
+    Args:
+        None
+
+    Returns:
+        Path: The buffer file. Only its journal is written.
+    """
+
+    return REHEARSAL_BUFFER_DB_JSON
+
+
+def _get_item_table_name(key: str) -> Optional[str]:
+    """
+    Returns the table name of a flashcard, note or question key.
+
+    Args:
+        key (str): The key of the item, e.g. "FLASHCARD_0".
+
+    Returns:
+        Optional[str]: The table name, e.g. "flashcards", or None if the key has no model type.
+    """
+
+    model_type: Optional[str] = model_key_to_model_type(model_key=key)
+
+    if not exists(value=model_type):
+        return None
+
+    return pluralize_word(word=model_type.lower())
+
+
+def _journal_entries(ids: list[str]) -> None:
+    """
+    Appends the current state of buffer entries to the journal and marks them dirty.
+
+    Args:
+        ids (list[str]): The IDs of the entries, e.g. "grade:FLASHCARD_0".
+
+    Returns:
+        None
+    """
+
+    append_journal_records(
+        file=_get_buffer_file(),
+        records=[
+            {
+                "entry": REHEARSAL_BUFFER["entries"][id_],
+                "id": id_,
+                "op": "update",
+            }
+            for id_ in ids
+        ],
+    )
+
+    REHEARSAL_BUFFER["dirty"].update(ids)
+
+    _schedule_flush()
+
+
+def _journal_written_entries(
+    deleted: list[str],
+    updated: list[str],
+) -> None:
+    """
+    Appends the outcome of a table write to the journal.
+
+    Args:
+        deleted (list[str]): The IDs of the entries that were written and left the buffer.
+        updated (list[str]): The IDs of the entries that were changed by the write, e.g.
+                             run items that got the ID of their added row.
+
+    Returns:
+        None
+    """
+
+    append_journal_records(
+        file=_get_buffer_file(),
+        records=[
+            *(
+                {
+                    "id": id_,
+                    "op": "delete",
+                }
+                for id_ in deleted
+            ),
+            *(
+                {
+                    "entry": REHEARSAL_BUFFER["entries"][id_],
+                    "id": id_,
+                    "op": "update",
+                }
+                for id_ in updated
+            ),
+        ],
+    )
+
+
+def _on_flush_timer() -> None:
+    """
+    Hands the periodic flush to the main (Tk) thread when it is due.
+
+    The flush changes the graded models and the run, which the Tk thread reads and
+    changes while grading, so it does not run on the timer thread.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        REHEARSAL_BUFFER["timer"] = None
+
+    call_on_main_thread(_flush_on_main_thread)
+
+
+def _reset_rehearsal_buffer() -> None:
+    """
+    Resets the buffer state in memory.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    _cancel_flush_timer()
+
+    REHEARSAL_BUFFER["dirty"].clear()
+    REHEARSAL_BUFFER["entries"].clear()
+    REHEARSAL_BUFFER["models"].clear()
+    REHEARSAL_BUFFER["next_action"] = 0
+    REHEARSAL_BUFFER["run"] = None
+
+
+def _rewrite_journal() -> None:
+    """
+    Replaces the journal by the entries that are still buffered after a flush.
+
+    The journal is replaced atomically, so a crash leaves either journal behind.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    write_journal_records(
+        file=_get_buffer_file(),
+        records=[
+            {
+                "entry": entry,
+                "id": id_,
+                "op": "update",
+            }
+            for (
+                id_,
+                entry,
+            ) in REHEARSAL_BUFFER["entries"].items()
+        ],
+    )
+
+
+def _schedule_flush() -> None:
+    """
+    Schedules the periodic flush, unless one is pending or it is disabled.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    if exists(value=REHEARSAL_BUFFER["timer"]):
+        return
+
+    interval: float = get_config_value(
+        default=0,
+        key="rehearsal.flush_interval",
+    )
+
+    if not interval or interval <= 0:
+        return
+
+    timer: threading.Timer = threading.Timer(
+        function=_on_flush_timer,
+        interval=interval,
+    )
+    timer.daemon = True
+    timer.start()
+
+    REHEARSAL_BUFFER["timer"] = timer
+
+
+def _write_graded_items(ids: list[str]) -> int:
+    """
+    Schedules the next review of the graded items and writes them, one update per table.
+
+    The fields changed by a grade are restored to their state before the run first, so
+    writing the same grade again (e.g. after a periodic flush) schedules the item once.
+
+    Args:
+        ids (list[str]): The IDs of the dirty grade entries.
+
+    Returns:
+        int: The number of table writes.
+    """
+
+    graded_by_table: dict[str, dict[str, list]] = {}
+
+    for id_ in ids:
+        entry: dict[str, Any] = REHEARSAL_BUFFER["entries"][id_]
+        model: Optional[Model] = REHEARSAL_BUFFER["models"].get(entry["item"])
+
+        if not exists(value=model):
+            log_warning(
+                message=f"Failed to find graded item {entry['item']}",
+                name=f"{__NAME__}._write_graded_items",
+            )
+            continue
+
+        for (
+            field,
+            value,
+        ) in entry["baseline"].items():
+            setattr(
+                model,
+                field,
+                value,
+            )
+
+        if exists(value=entry["difficulty"]):
+            model.difficulty = entry["difficulty"]
+
+        graded: dict[str, list] = graded_by_table.setdefault(
+            entry["table_name"],
+            {
+                "grades": [],
+                "models": [],
+            },
+        )
+        graded["grades"].append(entry["grade"])
+        graded["models"].append(model)
+
+    for (
+        table_name,
+        graded,
+    ) in graded_by_table.items():
+        schedule_reviews(
+            grades=graded["grades"],
+            models=graded["models"],
+            reviewed_at=get_now(),
+        )
+
+        update_entries(
+            models=graded["models"],
+            table_name=table_name,
+        )
+
+    return len(graded_by_table)
+
+
+def _write_rehearsal_actions(ids: list[str]) -> int:
+    """
+    Adds the buffered actions and links them to their run items.
+
+    Args:
+        ids (list[str]): The IDs of the dirty action entries.
+
+    Returns:
+        int: The number of table writes.
+    """
+
+    if not exists(value=ids):
+        return 0
+
+    # The entries are only dropped once the actions are added
+    entries: list[dict[str, Any]] = [REHEARSAL_BUFFER["entries"][id_] for id_ in ids]
+
+    added_ids: list[int] = (
+        add_entries(
+            models=[
+                get_rehearsal_action_model(
+                    action_data=entry["action_data"],
+                    message=entry["message"],
+                    timestamp=entry["timestamp"],
+                )
+                for entry in entries
+            ],
+            table_name=REHEARSAL_ACTIONS,
+        )
+        or []
+    )
+
+    linked: list[str] = []
+
+    for (
+        entry,
+        added_id,
+    ) in zip(
+        entries,
+        added_ids,
+    ):
+        item_id: str = f"item:{entry['item']}"
+
+        if item_id not in REHEARSAL_BUFFER["entries"]:
+            continue
+
+        REHEARSAL_BUFFER["entries"][item_id]["actions"].append(
+            generate_model_key(
+                id_=added_id,
+                name="REHEARSAL_ACTION",
+            )
+        )
+        REHEARSAL_BUFFER["dirty"].add(item_id)
+
+        linked.append(item_id)
+
+    for id_ in ids:
+        REHEARSAL_BUFFER["entries"].pop(id_)
+
+    REHEARSAL_BUFFER["dirty"].difference_update(ids)
+
+    _journal_written_entries(
+        deleted=ids,
+        updated=sorted(set(linked)),
+    )
+
+    return 1
+
+
+def _write_rehearsal_run(final: bool) -> int:
+    """
+    Links the run items to the run and writes the run.
+
+    Args:
+        final (bool): Whether the run ended, in which case the run is always written.
+
+    Returns:
+        int: The number of table writes.
+    """
+
+    run: Model = REHEARSAL_BUFFER["run"]
+
+    # The keys of the run items, in the order the items were first shown
+    keys: list[str] = [
+        entry["key"]
+        for (
+            id_,
+            entry,
+        ) in REHEARSAL_BUFFER["entries"].items()
+        if id_.startswith("item:") and exists(value=entry["key"])
+    ]
+
+    if not final and run.items["items"] == keys:
+        return 0
+
+    # The 'items' setter appends, so the list is replaced through the getter
+    run.items["items"] = keys
+    run.items["total"] = len(keys)
+
+    update_entries(
+        models=[run],
+        table_name=REHEARSAL_RUNS,
+    )
+
+    return 1
+
+
+def _write_rehearsal_run_items(ids: list[str]) -> int:
+    """
+    Adds the new run items and updates the changed ones.
+
+    Args:
+        ids (list[str]): The IDs of the dirty run item entries.
+
+    Returns:
+        int: The number of table writes.
+    """
+
+    entries: list[dict[str, Any]] = [REHEARSAL_BUFFER["entries"][id_] for id_ in ids]
+
+    new_ids: list[str] = [id_ for id_ in ids if REHEARSAL_BUFFER["entries"][id_]["id_"] is None]
+
+    new_entries: list[dict[str, Any]] = [REHEARSAL_BUFFER["entries"][id_] for id_ in new_ids]
+
+    models: list[Model] = [
+        get_rehearsal_run_item_model(**entry) for entry in entries if entry["id_"] is not None
+    ]
+
+    writes: int = 0
+
+    if exists(value=new_entries):
+        for (
+            entry,
+            added_id,
+        ) in zip(
+            new_entries,
+            add_entries(
+                models=[get_rehearsal_run_item_model(**entry) for entry in new_entries],
+                table_name=REHEARSAL_RUN_ITEMS,
+            )
+            or [],
+        ):
+            entry["id_"] = added_id
+            entry["key"] = generate_model_key(
+                id_=added_id,
+                name="REHEARSAL_RUN_ITEM",
+            )
+
+        # Recovery updates the added run items instead of adding them again
+        _journal_written_entries(
+            deleted=[],
+            updated=new_ids,
+        )
+
+        writes += 1
+
+    if exists(value=models):
+        update_entries(
+            models=models,
+            table_name=REHEARSAL_RUN_ITEMS,
+        )
+
+        writes += 1
+
+    return writes
+
+
+# ---------- Functions ---------- #
+
+
+def clear_rehearsal_buffer() -> None:
+    """
+    Discards the buffer and its journal without writing anything.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        _reset_rehearsal_buffer()
+
+        remove_file(file=get_journal_file(file=_get_buffer_file()))
+
+
+def flush_rehearsal_buffer(final: bool = False) -> bool:
+    """
+    Writes the buffered changes, with at most one write per table.
+
+    The actions are added first, so that their keys can be linked to the run items,
+    which are added or updated before the run and finally the graded items are written.
+
+    Args:
+        final (bool): Whether the run ended. A final flush writes the run in any case,
+                      removes the journal and empties the buffer. Defaults to False.
+
+    Returns:
+        bool: True if a run was buffered, False otherwise.
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        if final:
+            _cancel_flush_timer()
+
+        if not exists(value=REHEARSAL_BUFFER["run"]):
+            return False
+
+        dirty: list[str] = sorted(REHEARSAL_BUFFER["dirty"])
+
+        writes: int = _write_rehearsal_actions(ids=[id_ for id_ in dirty if id_.startswith("action:")])
+
+        # Linking the actions marks their run items dirty
+        dirty = sorted(REHEARSAL_BUFFER["dirty"])
+
+        writes += _write_rehearsal_run_items(ids=[id_ for id_ in dirty if id_.startswith("item:")])
+        writes += _write_rehearsal_run(final=final)
+        writes += _write_graded_items(ids=[id_ for id_ in dirty if id_.startswith("grade:")])
+
+        REHEARSAL_BUFFER["dirty"].clear()
+
+        log_info(
+            message=f"Flushed the rehearsal buffer of run {REHEARSAL_BUFFER['run'].key} with {writes} table write(s)",
+            name=f"{__NAME__}.flush_rehearsal_buffer",
+        )
+
+        if final:
+            clear_rehearsal_buffer()
+        else:
+            _rewrite_journal()
+
+        return True
+
+
+def record_rehearsal_action(
+    item: str,
+    message: str,
+    action_data: Optional[dict[str, Any]] = None,
+) -> None:
+    """
+    Records an action performed on an item of the buffered run.
+
+    Args:
+        item (str): The key of the item, e.g. "FLASHCARD_0".
+        message (str): The description of the action.
+        action_data (Optional[dict[str, Any]]): Additional data of the action. Defaults to None.
+
+    Returns:
+        None
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        if not exists(value=REHEARSAL_BUFFER["run"]):
+            log_warning(
+                message=f"No rehearsal run is buffered. Dropping action on {item}.",
+                name=f"{__NAME__}.record_rehearsal_action",
+            )
+            return
+
+        id_: str = f"action:{REHEARSAL_BUFFER['next_action']}"
+
+        REHEARSAL_BUFFER["next_action"] += 1
+        REHEARSAL_BUFFER["entries"][id_] = {
+            "action_data": action_data or {},
+            "item": item,
+            "message": message,
+            "timestamp": get_now().isoformat(),
+        }
+
+        _journal_entries(ids=[id_])
+
+
+def record_rehearsal_grade(
+    grade: str,
+    model: Model,
+    difficulty: Optional[str] = None,
+) -> None:
+    """
+    Records the grade of an item of the buffered run.
+
+    A later grade of the same item replaces the earlier one. The difficulty of the
+    model is set right away, its next review is scheduled when the buffer is flushed.
+
+    Args:
+        grade (str): The grade, e.g. "easy", "medium" or "hard".
+        model (Model): The graded flashcard, note or question.
+        difficulty (Optional[str]): The key of the difficulty to assign. Defaults to None.
+
+    Returns:
+        None
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        if not exists(value=REHEARSAL_BUFFER["run"]):
+            log_warning(
+                message=f"No rehearsal run is buffered. Dropping grade of {model.key}.",
+                name=f"{__NAME__}.record_rehearsal_grade",
+            )
+            return
+
+        id_: str = f"grade:{model.key}"
+
+        previous: Optional[dict[str, Any]] = REHEARSAL_BUFFER["entries"].get(id_)
+
+        REHEARSAL_BUFFER["entries"][id_] = {
+            "baseline": (
+                previous["baseline"]
+                if exists(value=previous)
+                else {field: getattr(model, field) for field in GRADE_BASELINE_FIELDS}
+            ),
+            "difficulty": difficulty,
+            "grade": grade,
+            "item": model.key,
+            "table_name": _get_item_table_name(key=model.key),
+        }
+        REHEARSAL_BUFFER["models"][model.key] = model
+
+        if exists(value=difficulty):
+            model.difficulty = difficulty
+
+        ids: list[str] = [id_]
+
+        item: Optional[dict[str, Any]] = REHEARSAL_BUFFER["entries"].get(f"item:{model.key}")
+
+        if exists(value=item):
+            item["completed_at"] = get_now().isoformat()
+            item["result"] = grade
+
+            ids.append(f"item:{model.key}")
+
+        _journal_entries(ids=ids)
+
+
+def record_rehearsal_item(item: str) -> None:
+    """
+    Records that an item of the buffered run is shown.
+
+    The first visit creates the run item of the item, later visits reuse it.
+
+    Args:
+        item (str): The key of the item, e.g. "FLASHCARD_0".
+
+    Returns:
+        None
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        if not exists(value=REHEARSAL_BUFFER["run"]):
+            log_warning(
+                message=f"No rehearsal run is buffered. Dropping visit of {item}.",
+                name=f"{__NAME__}.record_rehearsal_item",
+            )
+            return
+
+        id_: str = f"item:{item}"
+
+        if id_ in REHEARSAL_BUFFER["entries"]:
+            return
+
+        REHEARSAL_BUFFER["entries"][id_] = {
+            "actions": [],
+            "completed_at": None,
+            "created_at": get_now().isoformat(),
+            "id_": None,
+            "item": item,
+            "key": None,
+            "result": None,
+            "started_at": get_now().isoformat(),
+        }
+
+        _journal_entries(ids=[id_])
+
+
+def recover_rehearsal_buffer() -> bool:
+    """
+    Writes the changes buffered by a run that did not end, e.g. because the application crashed.
+
+    The journal is replayed, the run and the graded items are read (one read per table)
+    and the buffer is flushed as if the run had been cancelled.
+
+    Args:
+        None
+
+    Returns:
+        bool: True if a run was recovered, False otherwise.
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        if not does_file_exist(file=get_journal_file(file=_get_buffer_file())):
+            return False
+
+        entries: dict[str, Any] = replay_journal_records(
+            records=read_journal_records(file=_get_buffer_file()),
+            table_data={
+                "entries": {
+                    "entries": {},
+                    "total": 0,
+                }
+            },
+        )["entries"]["entries"]
+
+        run: Optional[Model] = (
+            get_entry(
+                id_=entries["run"]["id"],
+                table_name=REHEARSAL_RUNS,
+            )
+            if "run" in entries
+            else None
+        )
+
+        if not exists(value=run):
+            log_warning(
+                message="Discarding a rehearsal buffer journal without a stored run.",
+                name=f"{__NAME__}.recover_rehearsal_buffer",
+            )
+
+            clear_rehearsal_buffer()
+
+            return False
+
+        _reset_rehearsal_buffer()
+
+        REHEARSAL_BUFFER["entries"].update(entries)
+        REHEARSAL_BUFFER["run"] = run
+
+        keys_by_table: dict[str, dict[str, str]] = {}
+
+        for entry in entries.values():
+            if "grade" not in entry or not exists(value=entry["table_name"]):
+                continue
+
+            keys_by_table.setdefault(
+                entry["table_name"],
+                {},
+            )[
+                search_string(
+                    pattern=PATTERNS["MODEL_ID"],
+                    string=entry["item"],
+                )
+            ] = entry["item"]
+
+        for (
+            table_name,
+            keys_by_id,
+        ) in keys_by_table.items():
+            for model in (
+                get_entries(
+                    ids=list(keys_by_id),
+                    table_name=table_name,
+                )
+                or []
+            ):
+                REHEARSAL_BUFFER["models"][keys_by_id[str(model.id)]] = model
+
+        REHEARSAL_BUFFER["dirty"].update(id_ for id_ in entries if id_ != "run")
+
+        log_info(
+            message=f"Recovering the rehearsal buffer of run {run.key} with {len(entries)} entries",
+            name=f"{__NAME__}.recover_rehearsal_buffer",
+        )
+
+        return flush_rehearsal_buffer(final=True)
+
+
+def start_rehearsal_buffer(run: Model) -> None:
+    """
+    Starts buffering the changes of a stored rehearsal run.
+
+    A run that is still buffered is flushed first.
+
+    Args:
+        run (Model): The rehearsal run. It must have been added to the database.
+
+    Returns:
+        None
+    """
+
+    with REHEARSAL_BUFFER_LOCK:
+        if exists(value=REHEARSAL_BUFFER["run"]):
+            flush_rehearsal_buffer(final=True)
+
+        clear_rehearsal_buffer()
+
+        REHEARSAL_BUFFER["run"] = run
+        REHEARSAL_BUFFER["entries"]["run"] = {
+            "id": run.id,
+            "key": run.key,
+        }
+
+        append_journal_records(
+            file=_get_buffer_file(),
+            records=[
+                {
+                    "entry": REHEARSAL_BUFFER["entries"]["run"],
+                    "id": "run",
+                    "op": "update",
+                }
+            ],
+        )
@@ -0,0 +1,710 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Persistent due-date index over flashcards, notes and questions, and the daily review queue built on it.
+
+The index maps every item key to the date the item is due ('next_view_on', or the
+creation date for items that were never reviewed) and to its priority and difficulty.
+In memory, the items are grouped by priority and difficulty, each group sorted by due
+date, so the queue of a day is read off the front of the groups without touching the
+item tables. The index is kept up to date by the storage notifications (see
+'update_due_index' and 'remove_from_due_index') and persisted as a journaled table,
+which is rebuilt from the item tables if it is missing or outdated.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Final, Optional
+
+from studyfrog.constants.common import PATTERNS
+from studyfrog.constants.files import DUE_INDEX_DB_JSON
+from studyfrog.constants.storage import FLASHCARDS, NOTES, QUESTIONS
+from studyfrog.utils.common import exists, get_now, get_today, search_string
+from studyfrog.utils.config import get_config_value
+from studyfrog.utils.journal import load_journaled_table, save_journaled_table
+from studyfrog.utils.logging import log_info
+from studyfrog.utils.reference_cache import get_reference_models
+from studyfrog.utils.storage import get_entries, iter_entries
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "build_review_queue",
+    "clear_due_index",
+    "count_due_items",
+    "rebuild_due_index",
+    "remove_from_due_index",
+    "update_due_index",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "utils.review_queue"
+
+DUE_INDEX: Final[dict[str, Any]] = {
+    "entries": {},
+    "groups": {},
+    "loaded": False,
+}
+
+DUE_INDEX_LOCK: Final[threading.RLock] = threading.RLock()
+
+# Bumped whenever the layout of the index entries changes, which forces a rebuild
+DUE_INDEX_VERSION: Final[int] = 1
+
+ITEM_TABLE_NAMES: Final[tuple[str, ...]] = (
+    FLASHCARDS,
+    NOTES,
+    QUESTIONS,
+)
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _ensure_due_index() -> None:
+    """
+    Loads the due-date index on first use, rebuilding it if it is missing or outdated.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    if DUE_INDEX["loaded"]:
+        return
+
+    table_data: Optional[dict[str, Any]] = load_journaled_table(file=_get_due_index_file())
+
+    if (
+        not exists(value=table_data)
+        or table_data.get("metadata", {}).get("version") != DUE_INDEX_VERSION
+    ):
+        rebuild_due_index()
+
+        return
+
+    _set_due_index_entries(entries=table_data["entries"]["entries"])
+
+
+def _get_due_date(item: Any) -> str:
+    """
+    Returns the date an item is due for review as an ISO date string.
+
+    Args:
+        item (Any): The model, model proxy or raw entry of the item.
+
+    Returns:
+        str: The 'next_view_on' date, or the creation date if the item was never scheduled.
+             An empty string (due at any date) if the item has neither.
+    """
+
+    value: Any = _get_item_value(
+        field="next_view_on",
+        item=item,
+    ) or _get_item_value(
+        field="created_on",
+        item=item,
+    )
+
+    if isinstance(
+        value,
+        date,
+    ):
+        return value.isoformat()
+
+    return str(value or "")[:10]
+
+
+def _get_due_index_entry(item: Any) -> dict[str, Any]:
+    """
+    Returns the due-date index entry of an item.
+
+    Args:
+        item (Any): The model, model proxy or raw entry of the item.
+
+    Returns:
+        dict[str, Any]: The 'difficulty', 'due' and 'priority' of the item.
+    """
+
+    return {
+        "difficulty": _get_item_value(
+            field="difficulty",
+            item=item,
+        ),
+        "due": _get_due_date(item=item),
+        "priority": _get_item_value(
+            field="priority",
+            item=item,
+        ),
+    }
+
+
+def _get_due_index_file() -> Path:
+    """
+    Returns the file the due-date index is persisted to.
+
+    Args:
+        None
+
+    Returns:
+        Path: The index file.
+    """
+
+    return DUE_INDEX_DB_JSON
+
+
+def _get_group_order(groups: list[tuple[Any, Any]]) -> list[tuple[Any, Any]]:
+    """
+    Returns the (priority, difficulty) groups of the index in review order.
+
+    Groups of a higher priority come first and, within a priority, groups of a higher
+    difficulty. Priorities and difficulties without a known value come last.
+
+    Args:
+        groups (list[tuple[Any, Any]]): The (priority key, difficulty key) groups.
+
+    Returns:
+        list[tuple[Any, Any]]: The groups in review order.
+    """
+
+    difficulties: dict[str, float] = _get_reference_values(table_name="difficulties")
+    priorities: dict[str, float] = _get_reference_values(table_name="priorities")
+
+    return sorted(
+        groups,
+        key=lambda group: (
+            group[0] not in priorities,
+            -priorities.get(group[0], 0.0),
+            group[1] not in difficulties,
+            -difficulties.get(group[1], 0.0),
+            str(group),
+        ),
+    )
+
+
+def _get_item_key(item: Any) -> Optional[str]:
+    """
+    Returns the key of an item.
+
+    Args:
+        item (Any): The model, model proxy or raw entry of the item.
+
+    Returns:
+        Optional[str]: The key of the item, or None if it has none yet.
+    """
+
+    if isinstance(
+        item,
+        dict,
+    ):
+        return (item.get("identifiable") or {}).get("key")
+
+    return getattr(
+        item,
+        "key",
+        None,
+    )
+
+
+def _get_item_value(
+    field: str,
+    item: Any,
+) -> Any:
+    """
+    Returns a field of an item.
+
+    Args:
+        field (str): The name of the field.
+        item (Any): The model, model proxy or raw entry of the item.
+
+    Returns:
+        Any: The value of the field, or None if the item has no such field.
+    """
+
+    if not isinstance(
+        item,
+        dict,
+    ):
+        return getattr(
+            item,
+            field,
+            None,
+        )
+
+    if field in item:
+        return item[field]
+
+    return (item.get("metadata") or {}).get(field)
+
+
+def _get_notified_items(kwargs: dict[str, Any]) -> list[Any]:
+    """
+    Returns the items of a storage notification.
+
+    Args:
+        kwargs (dict[str, Any]): The keyword arguments of the notification, e.g.
+                                 {"flashcard": Model} or {"flashcards": [Model, ...]}.
+
+    Returns:
+        list[Any]: The notified models, model proxies or raw entries.
+    """
+
+    items: list[Any] = []
+
+    for value in kwargs.values():
+        if isinstance(
+            value,
+            (list, tuple),
+        ):
+            items.extend(value)
+        elif exists(value=value):
+            items.append(value)
+
+    return items
+
+
+def _get_reference_values(table_name: str) -> dict[str, float]:
+    """
+    Returns the values of the difficulties or priorities by their key.
+
+    Args:
+        table_name (str): The name of the table, i.e. "difficulties" or "priorities".
+
+    Returns:
+        dict[str, float]: The value of every model of the table by its key.
+    """
+
+    return {
+        model.key: model.value
+        for model in get_reference_models(table_name=table_name)
+        if exists(value=model.value)
+    }
+
+
+def _get_stack_item_keys(stacks: list[str]) -> set[str]:
+    """
+    Returns the keys of the items of the passed stacks.
+
+    Args:
+        stacks (list[str]): The keys of the stacks.
+
+    Returns:
+        set[str]: The keys of the items of the stacks.
+    """
+
+    return {
+        key
+        for stack in get_entries(
+            ids=[
+                search_string(
+                    pattern=PATTERNS["MODEL_ID"],
+                    string=stack,
+                )
+                for stack in stacks
+            ],
+            table_name="stacks",
+        )
+        or []
+        for key in (stack.items or {}).get("items", [])
+    }
+
+
+def _insert_due_index_entry(
+    entry: dict[str, Any],
+    key: str,
+) -> None:
+    """
+    Inserts an entry into the in-memory due-date index, replacing a previous entry of the key.
+
+    Args:
+        entry (dict[str, Any]): The index entry.
+        key (str): The key of the item.
+
+    Returns:
+        None
+    """
+
+    _remove_due_index_entry(key=key)
+
+    DUE_INDEX["entries"][key] = entry
+
+    bisect.insort(
+        DUE_INDEX["groups"].setdefault(
+            (
+                entry["priority"],
+                entry["difficulty"],
+            ),
+            [],
+        ),
+        (
+            entry["due"],
+            key,
+        ),
+    )
+
+
+def _remove_due_index_entry(key: str) -> bool:
+    """
+    Removes the entry of an item from the in-memory due-date index.
+
+    Args:
+        key (str): The key of the item.
+
+    Returns:
+        bool: True if the index held an entry of the key, False otherwise.
+    """
+
+    entry: Optional[dict[str, Any]] = DUE_INDEX["entries"].pop(
+        key,
+        None,
+    )
+
+    if not exists(value=entry):
+        return False
+
+    group_key: tuple[Any, Any] = (
+        entry["priority"],
+        entry["difficulty"],
+    )
+    group: list[tuple[str, str]] = DUE_INDEX["groups"][group_key]
+
+    del group[
+        bisect.bisect_left(
+            group,
+            (
+                entry["due"],
+                key,
+            ),
+        )
+    ]
+
+    if not group:
+        del DUE_INDEX["groups"][group_key]
+
+    return True
+
+
+def _save_due_index(changes: Optional[list[dict[str, Any]]] = None) -> None:
+    """
+    Persists changes to the due-date index.
+
+    Args:
+        changes (Optional[list[dict[str, Any]]]): The per-entry change records. Defaults to
+                                                  None (the index is written as a whole).
+
+    Returns:
+        None
+    """
+
+    save_journaled_table(
+        changes=changes,
+        compaction_threshold=get_config_value(key="storage.journal_compaction_threshold"),
+        file=_get_due_index_file(),
+        table_data={
+            "entries": {
+                "entries": DUE_INDEX["entries"],
+                "total": len(DUE_INDEX["entries"]),
+            },
+            "metadata": {
+                "updated_at": get_now().isoformat(),
+                "version": DUE_INDEX_VERSION,
+            },
+        },
+    )
+
+
+def _set_due_index_entries(entries: dict[str, dict[str, Any]]) -> None:
+    """
+    Replaces the in-memory due-date index.
+
+    Args:
+        entries (dict[str, dict[str, Any]]): The index entries by item key.
+
+    Returns:
+        None
+    """
+
+    groups: dict[tuple[Any, Any], list[tuple[str, str]]] = {}
+
+    for (
+        key,
+        entry,
+    ) in entries.items():
+        groups.setdefault(
+            (
+                entry["priority"],
+                entry["difficulty"],
+            ),
+            [],
+        ).append(
+            (
+                entry["due"],
+                key,
+            )
+        )
+
+    for group in groups.values():
+        group.sort()
+
+    DUE_INDEX["entries"] = entries
+    DUE_INDEX["groups"] = groups
+    DUE_INDEX["loaded"] = True
+
+
+# ---------- Functions ---------- #
+
+
+def build_review_queue(
+    date: Optional[date] = None,
+    limit: Optional[int] = None,
+    stacks: Optional[list[str]] = None,
+) -> list[str]:
+    """
+    Returns the keys of the items due for review at a date.
+
+    Items of a higher priority come first, then items of a higher difficulty, then the
+    most overdue items. Without stacks, only the due front of every (priority, difficulty)
+    group of the index is read, so the cost grows with the number of returned items
+    rather than the size of the collection. With stacks, only the items of the stacks
+    are looked up.
+
+    Args:
+        date (Optional[date]): The date of the review. Defaults to None (today).
+        limit (Optional[int]): The maximum number of keys to return. Defaults to None (all due items).
+        stacks (Optional[list[str]]): The keys of the stacks to restrict the queue to.
+                                      Defaults to None (all items).
+
+    Returns:
+        list[str]: The keys of the due items in review order.
+    """
+
+    # Every item due at the date sorts before the first (due, key) pair of the next day
+    end: tuple[str] = (((date or get_today()) + timedelta(days=1)).isoformat(),)
+
+    with DUE_INDEX_LOCK:
+        _ensure_due_index()
+
+        if exists(value=stacks):
+            groups: dict[tuple[Any, Any], list[tuple[str, str]]] = {}
+
+            for key in sorted(_get_stack_item_keys(stacks=stacks)):
+                entry: Optional[dict[str, Any]] = DUE_INDEX["entries"].get(key)
+
+                if not exists(value=entry) or (entry["due"],) >= end:
+                    continue
+
+                groups.setdefault(
+                    (
+                        entry["priority"],
+                        entry["difficulty"],
+                    ),
+                    [],
+                ).append(
+                    (
+                        entry["due"],
+                        key,
+                    )
+                )
+
+            for group in groups.values():
+                group.sort()
+        else:
+            groups = DUE_INDEX["groups"]
+
+        keys: list[str] = []
+
+        for group_key in _get_group_order(groups=list(groups)):
+            group: list[tuple[str, str]] = groups[group_key]
+
+            keys.extend(
+                key
+                for (
+                    _,
+                    key,
+                ) in group[
+                    : bisect.bisect_left(
+                        group,
+                        end,
+                    )
+                ]
+            )
+
+            if exists(value=limit) and len(keys) >= limit:
+                return keys[:limit]
+
+        return keys
+
+
+def clear_due_index() -> None:
+    """
+    Discards the in-memory due-date index, so it is loaded again on next use.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    with DUE_INDEX_LOCK:
+        DUE_INDEX["entries"] = {}
+        DUE_INDEX["groups"] = {}
+        DUE_INDEX["loaded"] = False
+
+
+def count_due_items(date: Optional[date] = None) -> int:
+    """
+    Returns the number of items due for review at a date.
+
+    Args:
+        date (Optional[date]): The date of the review. Defaults to None (today).
+
+    Returns:
+        int: The number of due items.
+    """
+
+    end: tuple[str] = (((date or get_today()) + timedelta(days=1)).isoformat(),)
+
+    with DUE_INDEX_LOCK:
+        _ensure_due_index()
+
+        return sum(
+            bisect.bisect_left(
+                group,
+                end,
+            )
+            for group in DUE_INDEX["groups"].values()
+        )
+
+
+def rebuild_due_index() -> int:
+    """
+    Rebuilds the due-date index from the flashcard, note and question tables.
+
+    Args:
+        None
+
+    Returns:
+        int: The number of indexed items.
+    """
+
+    entries: dict[str, dict[str, Any]] = {}
+
+    with DUE_INDEX_LOCK:
+        for table_name in ITEM_TABLE_NAMES:
+            for batch in iter_entries(
+                batch_size=1000,
+                lazy=True,
+                table_name=table_name,
+            ):
+                for item in batch:
+                    key: Optional[str] = _get_item_key(item=item)
+
+                    if not exists(value=key):
+                        continue
+
+                    entries[key] = _get_due_index_entry(item=item)
+
+        _set_due_index_entries(entries=entries)
+        _save_due_index()
+
+    log_info(
+        message=f"Rebuilt the due-date index of {len(entries)} items.",
+        name=f"{__NAME__}.rebuild_due_index",
+    )
+
+    return len(entries)
+
+
+def remove_from_due_index(**kwargs) -> None:
+    """
+    Removes deleted items from the due-date index.
+
+    Meant to be subscribed to the *_DELETED storage notifications of flashcards, notes
+    and questions, whose keyword arguments hold the deleted entries.
+
+    Args:
+        **kwargs: The deleted models or raw entries, single or as a list.
+
+    Returns:
+        None
+    """
+
+    with DUE_INDEX_LOCK:
+        _ensure_due_index()
+
+        changes: list[dict[str, Any]] = []
+
+        for item in _get_notified_items(kwargs=kwargs):
+            key: Optional[str] = _get_item_key(item=item)
+
+            if not exists(value=key) or not _remove_due_index_entry(key=key):
+                continue
+
+            changes.append(
+                {
+                    "id": key,
+                    "op": "delete",
+                }
+            )
+
+        if exists(value=changes):
+            _save_due_index(changes=changes)
+
+
+def update_due_index(**kwargs) -> None:
+    """
+    Adds added or updated items to the due-date index.
+
+    Meant to be subscribed to the *_ADDED and *_UPDATED storage notifications of
+    flashcards, notes and questions, whose keyword arguments hold the models.
+    Items whose due date, priority and difficulty did not change are not written.
+
+    Args:
+        **kwargs: The added or updated models, single or as a list.
+
+    Returns:
+        None
+    """
+
+    with DUE_INDEX_LOCK:
+        _ensure_due_index()
+
+        changes: list[dict[str, Any]] = []
+
+        for item in _get_notified_items(kwargs=kwargs):
+            key: Optional[str] = _get_item_key(item=item)
+
+            if not exists(value=key):
+                continue
+
+            entry: dict[str, Any] = _get_due_index_entry(item=item)
+
+            if DUE_INDEX["entries"].get(key) == entry:
+                continue
+
+            changes.append(
+                {
+                    "entry": entry,
+                    "id": key,
+                    "op": "update" if key in DUE_INDEX["entries"] else "insert",
+                }
+            )
+
+            _insert_due_index_entry(
+                entry=entry,
+                key=key,
+            )
+
+        if exists(value=changes):
+            _save_due_index(changes=changes)
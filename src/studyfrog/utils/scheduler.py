@@ -0,0 +1,432 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Spaced-repetition scheduler computing the next review of flashcards, notes and questions.
+
+The scheduler follows SM-2 for the ease and the number of repetitions and FSRS for the
+stability: the number of days after which an item is still recalled with a probability
+of 90%. The interval until the next review is derived from the stability and the desired
+retention, so changing the parameters only requires recomputing the intervals from the
+stored stabilities (see 'reschedule_entries'), not replaying every review.
+
+The state is stored in the 'schedule' field of the items, next to 'last_viewed_at',
+'last_viewed_on' and 'next_view_on'. Grades are the names of the default difficulties
+("easy", "medium" and "hard").
+"""
+
+from __future__ import annotations
+
+import math
+
+from datetime import date, datetime
+from typing import Any, Final, Optional
+
+from studyfrog.constants.storage import FLASHCARDS, NOTES, QUESTIONS
+from studyfrog.models.models import Model
+from studyfrog.utils.common import exists, get_now
+from studyfrog.utils.config import DEFAULT_CONFIG, get_config_value
+from studyfrog.utils.logging import log_info
+from studyfrog.utils.storage import get_all_entries, update_entries
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "get_next_schedule",
+    "get_review_interval",
+    "get_scheduler_parameters",
+    "reschedule_all_entries",
+    "reschedule_entries",
+    "schedule_reviews",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "utils.scheduler"
+
+ITEM_TABLE_NAMES: Final[tuple[str, ...]] = (
+    FLASHCARDS,
+    NOTES,
+    QUESTIONS,
+)
+
+# The retention the stability is defined at (FSRS)
+STABILITY_RETENTION: Final[float] = 0.9
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _get_interval_factor(parameters: dict[str, Any]) -> float:
+    """
+    Returns the factor converting a stability into an interval at the desired retention.
+
+    Args:
+        parameters (dict[str, Any]): The scheduler parameters.
+
+    Returns:
+        float: The factor. (1.0 at a desired retention of 90%)
+
+    Raises:
+        ValueError: If the desired retention is not between 0 and 1 (exclusive).
+    """
+
+    retention: float = parameters["desired_retention"]
+
+    if not 0 < retention < 1:
+        raise ValueError(f"The desired retention must be between 0 and 1, got {retention}.")
+
+    return math.log(retention) / math.log(STABILITY_RETENTION)
+
+
+def _get_intervals(
+    parameters: dict[str, Any],
+    stabilities: list[float],
+) -> list[int]:
+    """
+    Returns the intervals (in days) of a column of stabilities.
+
+    Args:
+        parameters (dict[str, Any]): The scheduler parameters.
+        stabilities (list[float]): The stabilities.
+
+    Returns:
+        list[int]: The intervals, between 1 day and the maximum interval.
+    """
+
+    factor: float = _get_interval_factor(parameters=parameters)
+    maximum: int = parameters["maximum_interval"]
+
+    return [max(1, min(maximum, round(stability * factor))) for stability in stabilities]
+
+
+def _get_iso_dates(
+    days: list[int],
+    ordinals: list[int],
+) -> list[str]:
+    """
+    Returns the ISO dates that lie a column of days after a column of dates.
+
+    Most items of a collection share few distinct dates, so every distinct date is only formatted once.
+
+    Args:
+        days (list[int]): The number of days to add to each date.
+        ordinals (list[int]): The proleptic Gregorian ordinals of the dates (see 'date.toordinal').
+
+    Returns:
+        list[str]: The ISO dates.
+    """
+
+    targets: list[int] = [ordinal + day for (ordinal, day) in zip(ordinals, days, strict=True)]
+
+    formatted: dict[int, str] = {
+        target: date.fromordinal(target).isoformat() for target in set(targets)
+    }
+
+    return [formatted[target] for target in targets]
+
+
+def _get_ordinal(value: Any) -> Optional[int]:
+    """
+    Returns the ordinal of a date, datetime or ISO date(time) string.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Optional[int]: The proleptic Gregorian ordinal, or None if the value is no date.
+    """
+
+    if isinstance(
+        value,
+        date,
+    ):
+        return value.toordinal()
+
+    if not isinstance(
+        value,
+        str,
+    ):
+        return None
+
+    if len(value) < 10:
+        return None
+
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+# ---------- Functions ---------- #
+
+
+def get_next_schedule(
+    grade: str,
+    schedule: Optional[dict[str, Any]] = None,
+    parameters: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """
+    Returns the schedule of an item after it was reviewed with a grade.
+
+    The ease is updated as in SM-2. A passing grade grows the stability to the first and
+    second stability and from then on by the ease (and the easy bonus for the best grade);
+    a failing grade counts as a lapse, restarts the repetitions and shrinks the stability.
+
+    Args:
+        grade (str): The grade, e.g. "easy", "medium" or "hard".
+        schedule (Optional[dict[str, Any]]): The schedule before the review. Defaults to None (never reviewed).
+        parameters (Optional[dict[str, Any]]): The scheduler parameters. Defaults to None (the configured ones).
+
+    Returns:
+        dict[str, Any]: The 'ease', 'interval', 'lapses', 'repetitions' and 'stability' after the review.
+
+    Raises:
+        ValueError: If the grade has no configured quality.
+    """
+
+    parameters = parameters or get_scheduler_parameters()
+    schedule = schedule or {}
+
+    if grade not in parameters["qualities"]:
+        raise ValueError(f"The grade '{grade}' has no configured quality.")
+
+    quality: int = parameters["qualities"][grade]
+
+    ease: float = max(
+        parameters["minimum_ease"],
+        schedule.get("ease", parameters["initial_ease"])
+        + 0.1
+        - (5 - quality) * (0.08 + (5 - quality) * 0.02),
+    )
+    lapses: int = schedule.get("lapses", 0)
+    repetitions: int = schedule.get("repetitions", 0)
+    stability: float = schedule.get("stability", 0.0)
+
+    if quality < parameters["passing_quality"]:
+        lapses += 1
+        repetitions = 0
+        stability = max(1.0, stability * parameters["lapse_factor"])
+    else:
+        repetitions += 1
+
+        if repetitions == 1:
+            stability = parameters["first_stability"]
+        elif repetitions == 2:
+            stability = parameters["second_stability"]
+        else:
+            stability *= ease
+
+        if quality >= 5:
+            stability *= parameters["easy_bonus"]
+
+    return {
+        "ease": round(ease, 4),
+        "interval": _get_intervals(
+            parameters=parameters,
+            stabilities=[stability],
+        )[0],
+        "lapses": lapses,
+        "repetitions": repetitions,
+        "stability": round(stability, 4),
+    }
+
+
+def get_review_interval(
+    stability: float,
+    parameters: Optional[dict[str, Any]] = None,
+) -> int:
+    """
+    Returns the number of days until the next review of an item of a given stability.
+
+    Args:
+        stability (float): The stability of the item.
+        parameters (Optional[dict[str, Any]]): The scheduler parameters. Defaults to None (the configured ones).
+
+    Returns:
+        int: The interval, between 1 day and the maximum interval.
+    """
+
+    return _get_intervals(
+        parameters=parameters or get_scheduler_parameters(),
+        stabilities=[stability],
+    )[0]
+
+
+def get_scheduler_parameters() -> dict[str, Any]:
+    """
+    Returns the configured scheduler parameters ('scheduler' section of the config).
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Any]: The parameters, falling back to the defaults for every missing one.
+    """
+
+    return {key: get_config_value(key=f"scheduler.{key}") for key in DEFAULT_CONFIG["scheduler"]}
+
+
+def reschedule_all_entries(parameters: Optional[dict[str, Any]] = None) -> int:
+    """
+    Recomputes the next review of every reviewed flashcard, note and question.
+
+    Args:
+        parameters (Optional[dict[str, Any]]): The scheduler parameters. Defaults to None (the configured ones).
+
+    Returns:
+        int: The number of rescheduled items.
+    """
+
+    parameters = parameters or get_scheduler_parameters()
+
+    return sum(
+        reschedule_entries(
+            parameters=parameters,
+            table_name=table_name,
+        )
+        for table_name in ITEM_TABLE_NAMES
+    )
+
+
+def reschedule_entries(
+    table_name: str,
+    parameters: Optional[dict[str, Any]] = None,
+) -> int:
+    """
+    Recomputes the next review of every reviewed item of a table, e.g. after a parameter change.
+
+    The intervals are recomputed from the stored stabilities column by column and the
+    changed items are written back with a single 'update_entries' call. Items that were
+    never reviewed are left unscheduled.
+
+    Args:
+        table_name (str): The name of the table, e.g. "flashcards".
+        parameters (Optional[dict[str, Any]]): The scheduler parameters. Defaults to None (the configured ones).
+
+    Returns:
+        int: The number of rescheduled items.
+    """
+
+    parameters = parameters or get_scheduler_parameters()
+
+    models: list[Model] = []
+    ordinals: list[int] = []
+
+    for model in get_all_entries(table_name=table_name) or []:
+        ordinal: Optional[int] = _get_ordinal(value=model.last_viewed_on)
+
+        if ordinal is None or "stability" not in model.schedule:
+            continue
+
+        models.append(model)
+        ordinals.append(ordinal)
+
+    intervals: list[int] = _get_intervals(
+        parameters=parameters,
+        stabilities=[model.schedule["stability"] for model in models],
+    )
+
+    next_view_dates: list[str] = _get_iso_dates(
+        days=intervals,
+        ordinals=ordinals,
+    )
+
+    changed: list[Model] = []
+
+    for (
+        model,
+        interval,
+        next_view_on,
+    ) in zip(
+        models,
+        intervals,
+        next_view_dates,
+        strict=True,
+    ):
+        if model.next_view_on == next_view_on and model.schedule.get("interval") == interval:
+            continue
+
+        model.next_view_on = next_view_on
+        model.schedule = {
+            **model.schedule,
+            "interval": interval,
+        }
+
+        changed.append(model)
+
+    if exists(value=changed):
+        update_entries(
+            models=changed,
+            table_name=table_name,
+        )
+
+    log_info(
+        message=f"Rescheduled {len(changed)} of {len(models)} reviewed items in '{table_name}' table.",
+        name=f"{__NAME__}.reschedule_entries",
+    )
+
+    return len(changed)
+
+
+def schedule_reviews(
+    grades: list[str],
+    models: list[Model],
+    parameters: Optional[dict[str, Any]] = None,
+    reviewed_at: Optional[datetime] = None,
+) -> list[Model]:
+    """
+    Applies the grades of a review session to the reviewed items.
+
+    Updates the 'schedule', 'last_viewed_at', 'last_viewed_on' and 'next_view_on' of the
+    models in place. Nothing is written; the caller persists the models in bulk.
+
+    Args:
+        grades (list[str]): The grade of each model, e.g. "easy", "medium" or "hard".
+        models (list[Model]): The reviewed flashcards, notes or questions.
+        parameters (Optional[dict[str, Any]]): The scheduler parameters. Defaults to None (the configured ones).
+        reviewed_at (Optional[datetime]): The time of the review. Defaults to None (now).
+
+    Returns:
+        list[Model]: The updated models.
+
+    Raises:
+        ValueError: If a grade has no configured quality or the number of grades and models differ.
+    """
+
+    if len(grades) != len(models):
+        raise ValueError(f"Got {len(grades)} grades for {len(models)} models.")
+
+    parameters = parameters or get_scheduler_parameters()
+    reviewed_at = reviewed_at or get_now()
+
+    schedules: list[dict[str, Any]] = [
+        get_next_schedule(
+            grade=grade,
+            parameters=parameters,
+            schedule=model.schedule,
+        )
+        for (grade, model) in zip(grades, models)
+    ]
+
+    next_view_dates: list[str] = _get_iso_dates(
+        days=[schedule["interval"] for schedule in schedules],
+        ordinals=[reviewed_at.toordinal()] * len(schedules),
+    )
+
+    for (
+        model,
+        schedule,
+        next_view_on,
+    ) in zip(
+        models,
+        schedules,
+        next_view_dates,
+    ):
+        model.last_viewed_at = reviewed_at.isoformat()
+        model.last_viewed_on = reviewed_at.date().isoformat()
+        model.next_view_on = next_view_on
+        model.schedule = schedule
+
+    return models
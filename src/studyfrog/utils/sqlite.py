@@ -0,0 +1,719 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: SQLite storage backend keeping one SQL table per model type, with the JSON model payload in a column.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+
+from pathlib import Path
+from typing import Any, Final, Iterator, Optional
+
+from studyfrog.constants.directories import DATA_DIR
+from studyfrog.utils.common import exists
+from studyfrog.utils.journal import get_table_header, load_journaled_table
+from studyfrog.utils.logging import log_error, log_info
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "SQLITE_DB_FILE_NAME",
+    "SQLITE_INDEXED_COLUMNS",
+    "close_sqlite_connections",
+    "does_sqlite_table_exist",
+    "filter_sqlite_entries",
+    "get_sqlite_connection",
+    "get_sqlite_entries",
+    "get_sqlite_table_signature",
+    "iter_sqlite_entries",
+    "load_sqlite_table",
+    "migrate_json_tables_to_sqlite",
+    "save_sqlite_table",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "src.utils.sqlite"
+
+CONNECTIONS: Final[dict[str, sqlite3.Connection]] = {}
+
+# The (connection, table name) pairs whose SQL table and indexes have been created
+ENSURED_TABLES: Final[set[tuple[sqlite3.Connection, str]]] = set()
+
+LOCK: Final[threading.RLock] = threading.RLock()
+
+# The number of rows read per query and of IDs bound per 'IN (...)' clause
+SQLITE_BATCH_SIZE: Final[int] = 500
+
+SQLITE_DB_FILE_NAME: Final[str] = "studyfrog.db"
+
+# The identifiers of an entry, stored as they are and compared without case
+SQLITE_IDENTIFIER_COLUMNS: Final[tuple[str, ...]] = (
+    "key",
+    "uuid",
+)
+
+# The entry fields stored normalized, i.e. lowercased (see '_get_indexed_value')
+SQLITE_VALUE_COLUMNS: Final[tuple[str, ...]] = (
+    "difficulty",
+    "priority",
+    "next_view_on",
+)
+
+# The entry fields 'filter_entries' criteria are pushed down to SQL for
+SQLITE_INDEXED_COLUMNS: Final[tuple[str, ...]] = (
+    *SQLITE_IDENTIFIER_COLUMNS,
+    *SQLITE_VALUE_COLUMNS,
+)
+
+TABLE_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _ensure_sqlite_table(
+    connection: sqlite3.Connection,
+    table_name: str,
+) -> None:
+    """
+    Creates the SQL table of a model type and its indexes if they do not exist yet.
+
+    The statements only run once per connection and table.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+        table_name (str): The name of the table (e.g. "flashcards").
+
+    Returns:
+        None
+    """
+
+    if (
+        connection,
+        table_name,
+    ) in ENSURED_TABLES:
+        return
+
+    connection.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS "{table_name}" (
+            id INTEGER PRIMARY KEY,
+            key TEXT,
+            uuid TEXT,
+            difficulty TEXT,
+            priority TEXT,
+            next_view_on TEXT,
+            payload TEXT NOT NULL
+        )
+        """
+    )
+
+    for column in SQLITE_IDENTIFIER_COLUMNS:
+        connection.execute(
+            f'CREATE INDEX IF NOT EXISTS "ix_{table_name}_{column}_nocase" ON "{table_name}" ({column} COLLATE NOCASE)'
+        )
+
+    for column in SQLITE_VALUE_COLUMNS:
+        connection.execute(
+            f'CREATE INDEX IF NOT EXISTS "ix_{table_name}_{column}" ON "{table_name}" ({column})'
+        )
+
+    ENSURED_TABLES.add(
+        (
+            connection,
+            table_name,
+        )
+    )
+
+
+def _get_db_file(file: Path) -> Path:
+    """
+    Returns the database file backing a table file path.
+
+    All tables of a data directory share a single database file located in that directory.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+
+    Returns:
+        Path: The database file (e.g. ".../data/studyfrog.db").
+    """
+
+    return file.parent / SQLITE_DB_FILE_NAME
+
+
+def _get_entry_row(
+    entry: dict[str, Any],
+    id_: str,
+) -> tuple[Any, ...]:
+    """
+    Returns the row of an entry, extracting the indexed columns from its JSON payload.
+
+    Args:
+        entry (dict[str, Any]): The JSON entry as stored in the table data dictionary.
+        id_ (str): The ID of the entry.
+
+    Returns:
+        tuple[Any, ...]: The values of the 'id', indexed and 'payload' columns.
+    """
+
+    identifiable: dict[str, Any] = entry.get("identifiable") or {}
+
+    return (
+        int(id_),
+        identifiable.get("key"),
+        identifiable.get("uuid"),
+        *(
+            _get_indexed_value(value=entry[column]) if column in entry else None
+            for column in SQLITE_VALUE_COLUMNS
+        ),
+        json.dumps(
+            entry,
+            separators=(
+                ",",
+                ":",
+            ),
+        ),
+    )
+
+
+def _get_header_row(
+    connection: sqlite3.Connection,
+    table_name: str,
+) -> Optional[tuple[str]]:
+    """
+    Returns the header row of a table, creating its SQL table and indexes if the table exists.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+        table_name (str): The name of the table (e.g. "flashcards").
+
+    Returns:
+        Optional[tuple[str]]: The row holding the JSON header, or None if the table does not exist.
+    """
+
+    header_row: Optional[tuple[str]] = connection.execute(
+        "SELECT header FROM _tables WHERE name = ?",
+        (table_name,),
+    ).fetchone()
+
+    if exists(value=header_row):
+        _ensure_sqlite_table(
+            connection=connection,
+            table_name=table_name,
+        )
+
+    return header_row
+
+
+def _get_indexed_value(value: Any) -> str:
+    """
+    Returns the text stored in an indexed column for a JSON value.
+
+    The text is the lowercased string representation of the value, the same normalization
+    'filter_entries' compares entries with, so that criteria can be matched with plain
+    (index backed) equality.
+
+    Args:
+        value (Any): The JSON value of the field.
+
+    Returns:
+        str: The normalized value.
+    """
+
+    return str(value).lower()
+
+
+def _get_table_name(file: Path) -> str:
+    """
+    Returns the validated SQL table name for a table file path.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+
+    Returns:
+        str: The table name (e.g. "flashcards").
+
+    Raises:
+        ValueError: If the table name cannot safely be used as an SQL identifier.
+    """
+
+    if not TABLE_NAME_PATTERN.match(file.stem):
+        raise ValueError(f"Invalid SQLite table name '{file.stem}'")
+
+    return file.stem
+
+
+# ---------- Functions ---------- #
+
+
+def close_sqlite_connections() -> None:
+    """
+    Closes all open database connections.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    with LOCK:
+        for connection in CONNECTIONS.values():
+            connection.close()
+
+        CONNECTIONS.clear()
+        ENSURED_TABLES.clear()
+
+
+def does_sqlite_table_exist(file: Path) -> bool:
+    """
+    Returns True if a table exists in the database, without reading its entries.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+
+    Returns:
+        bool: True if the table exists, False otherwise.
+    """
+
+    table_name: str = _get_table_name(file=file)
+
+    with LOCK:
+        return exists(
+            value=_get_header_row(
+                connection=get_sqlite_connection(file=file),
+                table_name=table_name,
+            )
+        )
+
+
+def filter_sqlite_entries(
+    criteria: dict[str, Any],
+    file: Path,
+) -> Optional[dict[str, dict[str, Any]]]:
+    """
+    Reads the entries of a table matching the criteria on its indexed columns.
+
+    Only the criteria on 'SQLITE_INDEXED_COLUMNS' are matched in SQL, using their indexes.
+    The 'key' and 'uuid' criteria match the identifiers of the entries and are only matched
+    in SQL if they are strings. The returned entries are candidates, the remaining criteria
+    are left to the caller.
+
+    Args:
+        criteria (dict[str, Any]): The filtering criteria, matched case-insensitively.
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+
+    Returns:
+        Optional[dict[str, dict[str, Any]]]: The candidate entries, keyed by ID, in ID order,
+                                             or None if none of the criteria covers an indexed column.
+    """
+
+    conditions: list[str] = []
+    parameters: list[str] = []
+
+    for column in SQLITE_IDENTIFIER_COLUMNS:
+        if not isinstance(
+            criteria.get(column),
+            str,
+        ):
+            continue
+
+        conditions.append(f"{column} = ? COLLATE NOCASE")
+        parameters.append(criteria[column])
+
+    for column in SQLITE_VALUE_COLUMNS:
+        if column not in criteria:
+            continue
+
+        conditions.append(f"{column} = ?")
+        parameters.append(_get_indexed_value(value=criteria[column]))
+
+    if len(conditions) == 0:
+        return None
+
+    table_name: str = _get_table_name(file=file)
+
+    with LOCK:
+        connection: sqlite3.Connection = get_sqlite_connection(file=file)
+
+        if not exists(
+            value=_get_header_row(
+                connection=connection,
+                table_name=table_name,
+            )
+        ):
+            return {}
+
+        rows: list[tuple[int, str]] = connection.execute(
+            f'SELECT id, payload FROM "{table_name}" WHERE {" AND ".join(conditions)} ORDER BY id',
+            parameters,
+        ).fetchall()
+
+    return {str(id_): json.loads(payload) for (id_, payload) in rows}
+
+
+def get_sqlite_connection(file: Path) -> sqlite3.Connection:
+    """
+    Returns the (cached) connection to the database backing a table file path.
+
+    The connection is created on first use, in WAL mode, together with the
+    '_tables' table holding the header (metadata, counters and timestamps) of every table.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+
+    Returns:
+        sqlite3.Connection: The connection to the database.
+    """
+
+    db_file: Path = _get_db_file(file=file)
+
+    with LOCK:
+        if str(db_file) in CONNECTIONS:
+            return CONNECTIONS[str(db_file)]
+
+        db_file.parent.mkdir(
+            exist_ok=True,
+            parents=True,
+        )
+
+        connection: sqlite3.Connection = sqlite3.connect(
+            check_same_thread=False,
+            database=db_file,
+        )
+
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS _tables (
+                name TEXT PRIMARY KEY,
+                header TEXT NOT NULL,
+                version INTEGER NOT NULL
+            )
+            """
+        )
+        connection.commit()
+
+        CONNECTIONS[str(db_file)] = connection
+
+        return connection
+
+
+def get_sqlite_entries(
+    file: Path,
+    ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    """
+    Reads and decodes only the requested entries of a table.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+        ids (list[str]): The IDs of the entries to read.
+
+    Returns:
+        dict[str, dict[str, Any]]: The found entries, keyed by ID, in the requested order.
+    """
+
+    table_name: str = _get_table_name(file=file)
+
+    found: dict[str, dict[str, Any]] = {}
+
+    with LOCK:
+        connection: sqlite3.Connection = get_sqlite_connection(file=file)
+
+        if not exists(
+            value=_get_header_row(
+                connection=connection,
+                table_name=table_name,
+            )
+        ):
+            return {}
+
+        for start in range(
+            0,
+            len(ids),
+            SQLITE_BATCH_SIZE,
+        ):
+            batch: list[int] = [int(id_) for id_ in ids[start : start + SQLITE_BATCH_SIZE]]
+
+            for (
+                id_,
+                payload,
+            ) in connection.execute(
+                f'SELECT id, payload FROM "{table_name}" WHERE id IN ({", ".join("?" for _ in batch)})',
+                batch,
+            ):
+                found[str(id_)] = json.loads(payload)
+
+    return {str(id_): found[str(id_)] for id_ in ids if str(id_) in found}
+
+
+def get_sqlite_table_signature(file: Path) -> Optional[tuple[Any, ...]]:
+    """
+    Returns the signature of a table used to validate cached table data.
+
+    Every save increments the version of the table, including saves made by other processes.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+
+    Returns:
+        Optional[tuple[Any, ...]]: The database file and table version, or None if the table does not exist.
+    """
+
+    with LOCK:
+        row: Optional[tuple[int]] = (
+            get_sqlite_connection(file=file)
+            .execute(
+                "SELECT version FROM _tables WHERE name = ?",
+                (_get_table_name(file=file),),
+            )
+            .fetchone()
+        )
+
+    if not exists(value=row):
+        return None
+
+    return (
+        str(_get_db_file(file=file)),
+        row[0],
+    )
+
+
+def iter_sqlite_entries(
+    file: Path,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Streams the entries of a table in ID order.
+
+    The rows are read in batches of 'SQLITE_BATCH_SIZE', continuing after the last ID read,
+    and the window ('offset' and 'limit') is applied by the database.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+        limit (Optional[int]): The maximum number of entries to yield. Defaults to None (all).
+        offset (int): The number of entries to skip. Defaults to 0.
+
+    Yields:
+        tuple[str, dict[str, Any]]: The ID and the entry.
+    """
+
+    table_name: str = _get_table_name(file=file)
+
+    with LOCK:
+        if not exists(
+            value=_get_header_row(
+                connection=get_sqlite_connection(file=file),
+                table_name=table_name,
+            )
+        ):
+            return
+
+    after: int = -1
+
+    while limit is None or limit > 0:
+        size: int = SQLITE_BATCH_SIZE if limit is None else min(limit, SQLITE_BATCH_SIZE)
+
+        with LOCK:
+            rows: list[tuple[int, str]] = (
+                get_sqlite_connection(file=file)
+                .execute(
+                    f'SELECT id, payload FROM "{table_name}" WHERE id > ? ORDER BY id LIMIT ? OFFSET ?',
+                    (
+                        after,
+                        size,
+                        offset,
+                    ),
+                )
+                .fetchall()
+            )
+
+        for (
+            id_,
+            payload,
+        ) in rows:
+            yield (
+                str(id_),
+                json.loads(payload),
+            )
+
+        if len(rows) < size:
+            return
+
+        after = rows[-1][0]
+        offset = 0
+
+        if limit is not None:
+            limit -= len(rows)
+
+
+def load_sqlite_table(file: Path) -> Optional[dict[str, Any]]:
+    """
+    Loads a table from the database into the table data dictionary format of the JSON tables.
+
+    Args:
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+
+    Returns:
+        Optional[dict[str, Any]]: The table data dictionary, or None if the table does not exist.
+    """
+
+    table_name: str = _get_table_name(file=file)
+
+    with LOCK:
+        connection: sqlite3.Connection = get_sqlite_connection(file=file)
+
+        header_row: Optional[tuple[str]] = _get_header_row(
+            connection=connection,
+            table_name=table_name,
+        )
+
+        if not exists(value=header_row):
+            return None
+
+        rows: list[tuple[int, str]] = connection.execute(
+            f'SELECT id, payload FROM "{table_name}" ORDER BY id'
+        ).fetchall()
+
+    header: dict[str, Any] = json.loads(header_row[0])
+
+    table_data: dict[str, Any] = header["table"]
+
+    table_data["entries"] = {
+        "entries": {str(id_): json.loads(payload) for (id_, payload) in rows},
+        "total": header["total"],
+    }
+
+    return table_data
+
+
+def migrate_json_tables_to_sqlite(data_dir: Path = DATA_DIR) -> list[str]:
+    """
+    Imports all JSON tables (including pending journal records) of a data directory into the database.
+
+    Tables already present in the database are replaced by their JSON counterpart.
+    The JSON files themselves are left untouched.
+
+    Args:
+        data_dir (Path): The data directory containing the JSON tables. Defaults to DATA_DIR.
+
+    Returns:
+        list[str]: The names of the imported tables.
+
+    Raises:
+        Exception: If an exception is caught while importing a table.
+    """
+
+    migrated: list[str] = []
+
+    for file in sorted(data_dir.glob("*.json")):
+        try:
+            table_data: Optional[dict[str, Any]] = load_journaled_table(file=file)
+
+            if not exists(value=table_data):
+                continue
+
+            save_sqlite_table(
+                changes=None,
+                file=file,
+                table_data=table_data,
+            )
+
+            migrated.append(file.stem)
+
+            log_info(
+                message=f"Successfully migrated '{file.stem}' table ({table_data['entries']['total']} entries) to SQLite",
+                name=f"{__NAME__}.migrate_json_tables_to_sqlite",
+            )
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to migrate '{file.stem}' table to SQLite: {e}",
+                name=f"{__NAME__}.migrate_json_tables_to_sqlite",
+            )
+            raise e
+
+    return migrated
+
+
+def save_sqlite_table(
+    changes: Optional[list[dict[str, Any]]],
+    file: Path,
+    table_data: dict[str, Any],
+) -> None:
+    """
+    Persists changes to a table in a single database transaction.
+
+    Args:
+        changes (Optional[list[dict[str, Any]]]): The per-entry change records ('op', 'id'
+                                                  and 'entry') to apply. If None, all rows
+                                                  of the table are replaced.
+        file (Path): The table file (e.g. ".../data/flashcards.json").
+        table_data (dict[str, Any]): The complete table data dictionary after the changes.
+
+    Returns:
+        None
+    """
+
+    table_name: str = _get_table_name(file=file)
+
+    with LOCK:
+        connection: sqlite3.Connection = get_sqlite_connection(file=file)
+
+        with connection:
+            _ensure_sqlite_table(
+                connection=connection,
+                table_name=table_name,
+            )
+
+            if changes is None:
+                connection.execute(f'DELETE FROM "{table_name}"')
+
+                changes = [
+                    {
+                        "entry": entry,
+                        "id": id_,
+                        "op": "insert",
+                    }
+                    for (id_, entry) in table_data["entries"]["entries"].items()
+                ]
+
+            connection.executemany(
+                f'DELETE FROM "{table_name}" WHERE id = ?',
+                [(int(change["id"]),) for change in changes if change["op"] == "delete"],
+            )
+            connection.executemany(
+                f'INSERT OR REPLACE INTO "{table_name}" (id, key, uuid, difficulty, priority, next_view_on, payload) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [
+                    _get_entry_row(
+                        entry=change["entry"],
+                        id_=change["id"],
+                    )
+                    for change in changes
+                    if change["op"] in (
+                        "insert",
+                        "update",
+                    )
+                ],
+            )
+            connection.execute(
+                """
+                INSERT INTO _tables (name, header, version) VALUES (?, ?, 1)
+                ON CONFLICT(name) DO UPDATE SET header = excluded.header, version = version + 1
+                """,
+                (
+                    table_name,
+                    json.dumps(get_table_header(table_data=table_data)),
+                ),
+            )
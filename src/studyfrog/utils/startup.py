@@ -0,0 +1,155 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: Startup timing: measures the phases from importing the package until the dashboard is painted.
+
+The 'import' phase starts when this module is imported, which the package does before
+anything else. This module must therefore only import from the standard library.
+"""
+
+from __future__ import annotations
+
+import time
+
+from typing import Any, Final, Optional
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "end_startup_phase",
+    "format_startup_report",
+    "get_startup_report",
+    "reset_startup_report",
+    "start_startup_phase",
+]
+
+
+# ---------- Constants ---------- #
+
+STARTUP: Final[dict[str, Any]] = {
+    "ends": {},
+    "origin": time.perf_counter(),
+    "starts": {},
+}
+
+STARTUP["starts"]["import"] = STARTUP["origin"]
+
+
+# ---------- Functions ---------- #
+
+
+def end_startup_phase(phase: str) -> Optional[float]:
+    """
+    Ends a startup phase.
+
+    Only the first end of a phase is recorded, so phases that run again later
+    (e.g. the dashboard being shown again) do not distort the report.
+
+    Args:
+        phase (str): The name of the phase.
+
+    Returns:
+        Optional[float]: The duration of the phase in milliseconds, or None if it was not started or already ended.
+    """
+
+    if phase not in STARTUP["starts"] or phase in STARTUP["ends"]:
+        return None
+
+    STARTUP["ends"][phase] = time.perf_counter()
+
+    return (STARTUP["ends"][phase] - STARTUP["starts"][phase]) * 1000
+
+
+def format_startup_report() -> str:
+    """
+    Returns the startup report as a single line, e.g. for logging.
+
+    Args:
+        None
+
+    Returns:
+        str: The duration of every ended phase and the total duration.
+    """
+
+    report: dict[str, Any] = get_startup_report()
+
+    return ", ".join(
+        [
+            *[f"{phase['phase']}={phase['duration_ms']:.1f}ms" for phase in report["phases"]],
+            f"total={report['total_ms']:.1f}ms",
+        ]
+    )
+
+
+def get_startup_report() -> dict[str, Any]:
+    """
+    Returns the startup report.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Any]: The ended 'phases' in the order they started, each with its
+                        'phase', 'start_ms' (since the package was imported) and
+                        'duration_ms', and the 'total_ms' until the last phase ended.
+    """
+
+    origin: float = STARTUP["origin"]
+
+    phases: list[dict[str, Any]] = [
+        {
+            "duration_ms": (STARTUP["ends"][phase] - start) * 1000,
+            "phase": phase,
+            "start_ms": (start - origin) * 1000,
+        }
+        for (
+            phase,
+            start,
+        ) in sorted(
+            STARTUP["starts"].items(),
+            key=lambda item: item[1],
+        )
+        if phase in STARTUP["ends"]
+    ]
+
+    return {
+        "phases": phases,
+        "total_ms": (max(STARTUP["ends"].values(), default=origin) - origin) * 1000,
+    }
+
+
+def reset_startup_report() -> None:
+    """
+    Discards all recorded phases and restarts the report at the current time.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    STARTUP["ends"].clear()
+    STARTUP["starts"].clear()
+
+    STARTUP["origin"] = time.perf_counter()
+
+
+def start_startup_phase(phase: str) -> None:
+    """
+    Starts a startup phase.
+
+    Only the first start of a phase is recorded (see 'end_startup_phase').
+
+    Args:
+        phase (str): The name of the phase.
+
+    Returns:
+        None
+    """
+
+    STARTUP["starts"].setdefault(
+        phase,
+        time.perf_counter(),
+    )
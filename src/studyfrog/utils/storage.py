@@ -5,18 +5,24 @@ Date: 2025-12-10
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import os
+import threading
+
 from pathlib import Path
-from typing import Any, Final, Optional, Union
+from typing import Any, Callable, Final, Iterator, Optional, Union
 
 from studyfrog.constants.common import PATTERNS
 from studyfrog.constants.directories import DATA_DIR
 from studyfrog.constants.events import *
 from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
+from studyfrog.constants.storage import TABLE_INDEXES
 from studyfrog.models.factory import get_model
 from studyfrog.models.models import Model
+from studyfrog.models.proxies import IDENTIFIABLE_FIELDS, ModelProxy, get_model_proxy
 from studyfrog.utils.common import (
     exists,
-    flatten_dictionary,
     generate_model_key,
     generate_uuid4_str,
     get_now_iso_str,
@@ -24,14 +30,36 @@ from studyfrog.utils.common import (
     pluralize_word,
     search_string,
 )
-from studyfrog.utils.dispatcher import dispatch
-from studyfrog.utils.files import (
-    does_file_have_content,
-    ensure_file,
-    read_file_json,
-    write_file_json,
+from studyfrog.utils.config import get_config_value
+from studyfrog.utils.dispatcher import dispatch_lean, has_subscribers
+from studyfrog.utils.files import get_backup_file, read_file_json, write_file_json
+from studyfrog.utils.journal import (
+    compact_journal,
+    get_journal_file,
+    load_journaled_table,
+    save_journaled_table,
+)
+from studyfrog.utils.jsonl import (
+    convert_json_tables_to_jsonl,
+    convert_jsonl_tables_to_json,
+    does_jsonl_table_exist,
+    get_jsonl_entries,
+    get_jsonl_table_signature,
+    iter_jsonl_entries,
+    load_jsonl_table,
+    save_jsonl_table,
+)
+from studyfrog.utils.logging import is_log_level_enabled, log_error, log_info, log_warning
+from studyfrog.utils.sqlite import (
+    does_sqlite_table_exist,
+    filter_sqlite_entries,
+    get_sqlite_entries,
+    get_sqlite_table_signature,
+    iter_sqlite_entries,
+    load_sqlite_table,
+    migrate_json_tables_to_sqlite,
+    save_sqlite_table,
 )
-from studyfrog.utils.logging import log_error, log_info
 
 
 # ---------- Exports ---------- #
@@ -41,15 +69,27 @@ __all__: Final[list[str]] = [
     "add_entry_if_not_exist",
     "add_entries",
     "add_entries_if_not_exist",
+    "clear_table_cache",
+    "compact_table",
+    "compact_tables",
+    "convert_tables_to_json",
+    "convert_tables_to_jsonl",
     "count_entries",
+    "declare_table_index",
     "delete_entry",
     "delete_entries",
     "filter_entries",
     "get_all_entries",
     "get_entries",
     "get_entries_by_keys",
+    "get_entries_page",
     "get_entry",
     "get_entry_by_keys",
+    "get_storage_backend",
+    "get_table_cache_statistics",
+    "iter_entries",
+    "migrate_tables_to_sqlite",
+    "register_storage_backend",
     "update_entry",
     "update_entries",
 ]
@@ -59,9 +99,225 @@ __all__: Final[list[str]] = [
 
 __NAME__: Final[str] = "src.utils.storage"
 
+INDEXED_FIELDS: Final[dict[str, set[str]]] = {
+    table_name: set(fields) for (table_name, fields) in TABLE_INDEXES.items()
+}
+
+STORAGE_BACKENDS: Final[dict[str, dict[str, Callable[..., Any]]]] = {
+    "journal": {
+        "load": load_journaled_table,
+        "save": lambda changes, file, table_data: save_journaled_table(
+            changes=changes,
+            compaction_threshold=get_config_value(key="storage.journal_compaction_threshold"),
+            file=file,
+            table_data=table_data,
+        ),
+    },
+    "json": {
+        "load": load_journaled_table,
+        "save": lambda changes, file, table_data: compact_journal(
+            file=file,
+            table_data=table_data,
+        ),
+    },
+    "jsonl": {
+        "exists": does_jsonl_table_exist,
+        "get_entries": get_jsonl_entries,
+        "iter_entries": iter_jsonl_entries,
+        "load": load_jsonl_table,
+        "save": save_jsonl_table,
+        "signature": get_jsonl_table_signature,
+    },
+    "sqlite": {
+        "exists": does_sqlite_table_exist,
+        "filter_entries": filter_sqlite_entries,
+        "get_entries": get_sqlite_entries,
+        "iter_entries": iter_sqlite_entries,
+        "load": load_sqlite_table,
+        "save": save_sqlite_table,
+        "signature": get_sqlite_table_signature,
+    },
+}
+
+TABLE_CACHE: Final[dict[str, dict[str, Any]]] = {}
+
+TABLE_CACHE_STATISTICS: Final[dict[str, int]] = {
+    "hits": 0,
+    "invalidations": 0,
+    "misses": 0,
+    "writes": 0,
+}
+
+TABLE_LOCKS: Final[dict[str, threading.RLock]] = {}
+
 # ---------- Helper Functions ---------- #
 
 
+def _cache_table_data(
+    table_data: dict[str, Any],
+    table_name: str,
+    changes: Optional[list[dict[str, Any]]] = None,
+) -> None:
+    """
+    Stores the passed table data in the process-wide table cache.
+
+    The cached copy is tagged with the current signature (mtime and size) of the
+    table file, so that changes made to the file outside of this process can be
+    detected on the next read.
+
+    If the passed table data is the cached table data modified by 'changes', the
+    secondary indexes built for the table are updated incrementally. Otherwise
+    they are dropped and rebuilt on their next use.
+
+    Args:
+        table_data (dict[str, Any]): The parsed table data dictionary to cache.
+        table_name (str): The name of the table the data belongs to.
+        changes (Optional[list[dict[str, Any]]]): The per-entry changes applied to the
+                                                  cached table data, if known.
+
+    Returns:
+        None
+    """
+
+    file: Path = _get_table_file(table_name=table_name)
+
+    signature: Optional[tuple[Any, ...]] = _get_table_signature(file=file)
+
+    if not exists(value=signature):
+        TABLE_CACHE.pop(str(file), None)
+        return
+
+    cached: Optional[dict[str, Any]] = TABLE_CACHE.get(str(file))
+
+    indexes: dict[str, dict[str, Any]] = {}
+
+    if exists(value=cached) and cached["data"] is table_data and changes is not None:
+        indexes = cached["indexes"]
+
+        _update_table_indexes(
+            changes=changes,
+            indexes=indexes,
+        )
+
+    TABLE_CACHE[str(file)] = {
+        "data": table_data,
+        "indexes": indexes,
+        "signature": signature,
+    }
+
+
+def _build_table_index(
+    entries: dict[str, Any],
+    field: str,
+) -> dict[str, Any]:
+    """
+    Builds a secondary index over one field of the passed table entries.
+
+    Entries are indexed by the same normalized value 'filter_entries' compares
+    against (see '_get_index_key'). Entries that do not have the field are not indexed.
+
+    Args:
+        entries (dict[str, Any]): The entries of the table, keyed by ID.
+        field (str): The field to index.
+
+    Returns:
+        dict[str, Any]: The index, mapping 'values' (index key -> set of IDs) and
+                        'keys' (ID -> index key, used to update the index).
+    """
+
+    index: dict[str, Any] = {
+        "keys": {},
+        "values": {},
+    }
+
+    for (
+        id_,
+        entry,
+    ) in entries.items():
+        owner: dict[str, Any] = _get_field_owner(
+            entry=entry,
+            field=field,
+        )
+
+        if field not in owner:
+            continue
+
+        key: str = _get_index_key(value=owner[field])
+
+        index["keys"][id_] = key
+        index["values"].setdefault(key, set()).add(id_)
+
+    return index
+
+
+def _clone_entry(entry: Any) -> Any:
+    """
+    Returns a copy of a JSON entry that shares no mutable containers with the original.
+
+    Entries held in the table cache must never be aliased by the models built from them,
+    otherwise mutating a model (e.g. appending to its tags) would silently change the
+    cached table. Since table entries only ever contain JSON types, a recursive copy of
+    dictionaries and lists is sufficient and considerably cheaper than 'copy.deepcopy'.
+
+    Args:
+        entry (Any): The JSON value to copy.
+
+    Returns:
+        Any: The copied JSON value.
+    """
+
+    if isinstance(
+        entry,
+        dict,
+    ):
+        return {key: _clone_entry(entry=value) for (key, value) in entry.items()}
+
+    if isinstance(
+        entry,
+        list,
+    ):
+        return [_clone_entry(entry=value) for value in entry]
+
+    return entry
+
+
+def _entry_matches_criteria(
+    criteria: dict[str, Any],
+    entry: dict[str, Any],
+) -> bool:
+    """
+    Checks if a single JSON entry matches all filtering criteria.
+
+    Performs a case-insensitive comparison of the string representation of the
+    entry's value with the string representation of the value in the criteria.
+    Criteria on the identifiers ('id', 'key' and 'uuid') match the 'identifiable' part.
+
+    Args:
+        criteria (dict[str, Any]): The filtering criteria.
+        entry (dict[str, Any]): The JSON entry to check against the criteria.
+
+    Returns:
+        bool: True if the entry matches all criteria, False otherwise.
+    """
+
+    for (
+        key,
+        value,
+    ) in criteria.items():
+        owner: dict[str, Any] = _get_field_owner(
+            entry=entry,
+            field=key,
+        )
+
+        if key not in owner:
+            return False
+
+        if _get_index_key(value=owner[key]) != _get_index_key(value=value):
+            return False
+
+    return True
+
+
 def _decrement_table_counters(table_data: dict[str, Any]) -> None:
     """
     Decrements the table's 'next_id' and 'total' counters.
@@ -83,14 +339,39 @@ def _decrement_table_counters(table_data: dict[str, Any]) -> None:
     table_data["entries"]["total"] -= 1
 
 
+def _does_table_exist(table_name: str) -> bool:
+    """
+    Returns True if the passed table exists and has content.
+
+    Backends that read entries lazily provide their own 'exists' function, so that the
+    check does not load the whole table. All others load (and cache) the table data.
+
+    Args:
+        table_name (str): The name of the table.
+
+    Returns:
+        bool: True if the table exists, False otherwise.
+
+    Raises:
+        ValueError: If the table exists but cannot be parsed.
+    """
+
+    backend: dict[str, Callable[..., Any]] = _get_storage_backend_functions()
+
+    if "exists" in backend:
+        return backend["exists"](file=_get_table_file(table_name=table_name))
+
+    return exists(value=_load_table_data(table_name=table_name))
+
+
 def _ensure_table_json_with_content(table_name: str) -> None:
     """
     Ensures that the JSON file for a specific table contains the minimal required structure.
 
-    If the target JSON file is empty or does not exist, this function creates the file
-    at `DATA_DIR / table` and initializes it with the standard, empty table structure,
-    including metadata (timestamps, UUID, empty entries dictionary).
-    If the file already has content, the function returns immediately.
+    If the table is empty or does not exist, this function initializes it through the
+    configured storage backend (e.g. at `DATA_DIR / table`) with the standard, empty table
+    structure, including metadata (timestamps, UUID, empty entries dictionary).
+    If the table already has content, the function returns immediately.
 
     Args:
         table_name (str): The name of the table/collection (which is used as the filename)
@@ -104,11 +385,7 @@ def _ensure_table_json_with_content(table_name: str) -> None:
     """
 
     try:
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
-
-        if does_file_have_content(file=file):
+        if _does_table_exist(table_name=table_name):
             return
 
         data: dict[str, Any] = {
@@ -141,7 +418,7 @@ def _ensure_table_json_with_content(table_name: str) -> None:
             message=f"Caught an exception while attempting to ensure '{table_name}' table JSON file with content: {e}",
             name=f"{__NAME__}._ensure_table_json_with_content",
         )
-        dispatch(
+        dispatch_lean(
             event=DB_OPERATION_FAILURE,
             message=f"Caught an exception while attempting to ensure '{table_name}' table JSON file with content: {e}",
         )
@@ -152,6 +429,9 @@ def _ensure_table_json(table_name: str) -> None:
     """
     Ensures that a JSON table file exists.
 
+    If the table file exists but cannot be parsed (e.g. after a crash during a
+    non-atomic write), it is restored from its backup before anything else happens.
+
     Args:
         table_name (str): The name of the table.
 
@@ -163,11 +443,15 @@ def _ensure_table_json(table_name: str) -> None:
     """
 
     try:
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+        try:
+            _does_table_exist(table_name=table_name)
+        except ValueError as e:
+            log_warning(
+                message=f"Failed to parse '{table_name}' table, attempting to recover it from its backup: {e}",
+                name=f"{__NAME__}._ensure_table_json",
+            )
 
-        ensure_file(file=file)
+            _recover_table_json(table_name=table_name)
 
         _ensure_table_json_with_content(table_name=table_name)
     except Exception as e:
@@ -175,7 +459,7 @@ def _ensure_table_json(table_name: str) -> None:
             message=f"Caught an exception while attempting to ensure '{table_name}' table JSON file: {e}",
             name=f"{__NAME__}._ensure_table_json",
         )
-        dispatch(
+        dispatch_lean(
             event=DB_OPERATION_FAILURE,
             message=f"Caught an exception while attempting to ensure '{table_name}' table JSON file: {e}",
         )
@@ -213,6 +497,7 @@ def _get_add_event(model_type: str) -> str:
             "option": OPTION_ADDED,
             "priority": PRIORITY_ADDED,
             "question": QUESTION_ADDED,
+            "rehearsal_action": REHEARSAL_ACTION_ADDED,
             "rehearsal_run": REHEARSAL_RUN_ADDED,
             "rehearsal_run_item": REHEARSAL_RUN_ITEM_ADDED,
             "stack": STACK_ADDED,
@@ -230,6 +515,40 @@ def _get_add_event(model_type: str) -> str:
         raise e
 
 
+def _get_backend_candidates(
+    criteria: dict[str, Any],
+    table_name: str,
+) -> Optional[list[dict[str, Any]]]:
+    """
+    Returns the entries of a table that can match the criteria, as filtered by the backend.
+
+    Args:
+        criteria (dict[str, Any]): The filtering criteria.
+        table_name (str): The name of the table.
+
+    Returns:
+        Optional[list[dict[str, Any]]]: The candidate entries in ID order, or None if the table
+                                        is cached or the backend cannot filter on the criteria.
+    """
+
+    backend: dict[str, Callable[..., Any]] = _get_storage_backend_functions()
+
+    if "filter_entries" not in backend or exists(
+        value=_get_cached_table_data(table_name=table_name)
+    ):
+        return None
+
+    entries: Optional[dict[str, dict[str, Any]]] = backend["filter_entries"](
+        criteria=criteria,
+        file=_get_table_file(table_name=table_name),
+    )
+
+    if entries is None:
+        return None
+
+    return list(entries.values())
+
+
 def _get_bulk_add_event(model_type: str) -> str:
     """
     Retrieves the corresponding 'bulk added' notification event string for a given model type.
@@ -261,6 +580,7 @@ def _get_bulk_add_event(model_type: str) -> str:
             "option": OPTIONS_ADDED,
             "priority": PRIORITIES_ADDED,
             "question": QUESTIONS_ADDED,
+            "rehearsal_action": REHEARSAL_ACTIONS_ADDED,
             "rehearsal_run": REHEARSAL_RUNS_ADDED,
             "rehearsal_run_item": REHEARSAL_RUN_ITEMS_ADDED,
             "stack": STACKS_ADDED,
@@ -308,6 +628,7 @@ def _get_bulk_delete_event(model_type: str) -> str:
             "option": OPTIONS_DELETED,
             "priority": PRIORITIES_DELETED,
             "question": QUESTIONS_DELETED,
+            "rehearsal_action": REHEARSAL_ACTIONS_DELETED,
             "rehearsal_run": REHEARSAL_RUNS_DELETED,
             "rehearsal_run_item": REHEARSAL_RUN_ITEMS_DELETED,
             "stack": STACKS_DELETED,
@@ -355,6 +676,7 @@ def _get_bulk_get_event(model_type: str) -> str:
             "option": OPTIONS_RETRIEVED,
             "priority": PRIORITIES_RETRIEVED,
             "question": QUESTIONS_RETRIEVED,
+            "rehearsal_action": REHEARSAL_ACTIONS_RETRIEVED,
             "rehearsal_run": REHEARSAL_RUNS_RETRIEVED,
             "rehearsal_run_item": REHEARSAL_RUN_ITEMS_RETRIEVED,
             "stack": STACKS_RETRIEVED,
@@ -401,6 +723,7 @@ def _get_bulk_update_event(model_type: str) -> str:
             "option": OPTIONS_UPDATED,
             "priority": PRIORITIES_UPDATED,
             "question": QUESTIONS_UPDATED,
+            "rehearsal_action": REHEARSAL_ACTIONS_UPDATED,
             "rehearsal_run": REHEARSAL_RUNS_UPDATED,
             "rehearsal_run_item": REHEARSAL_RUN_ITEMS_UPDATED,
             "stack": STACKS_UPDATED,
@@ -447,6 +770,7 @@ def _get_delete_event(model_type: str) -> str:
             "option": OPTION_DELETED,
             "priority": PRIORITY_DELETED,
             "question": QUESTION_DELETED,
+            "rehearsal_action": REHEARSAL_ACTION_DELETED,
             "rehearsal_run": REHEARSAL_RUN_DELETED,
             "rehearsal_run_item": REHEARSAL_RUN_ITEM_DELETED,
             "stack": STACK_DELETED,
@@ -493,6 +817,7 @@ def _get_delete_all_event(model_type: str) -> str:
             "option": ALL_OPTIONS_DELETED,
             "priority": ALL_PRIORITIES_DELETED,
             "question": ALL_QUESTIONS_DELETED,
+            "rehearsal_action": ALL_REHEARSAL_ACTIONS_DELETED,
             "rehearsal_run": ALL_REHEARSAL_RUNS_DELETED,
             "rehearsal_run_item": ALL_REHEARSAL_RUN_ITEMS_DELETED,
             "stack": ALL_STACKS_DELETED,
@@ -539,6 +864,7 @@ def _get_get_all_event(model_type: str) -> str:
             "option": ALL_OPTIONS_RETRIEVED,
             "priority": ALL_PRIORITIES_RETRIEVED,
             "question": ALL_QUESTIONS_RETRIEVED,
+            "rehearsal_action": ALL_REHEARSAL_ACTIONS_RETRIEVED,
             "rehearsal_run": ALL_REHEARSAL_RUNS_RETRIEVED,
             "rehearsal_run_item": ALL_REHEARSAL_RUN_ITEMS_RETRIEVED,
             "stack": ALL_STACKS_RETRIEVED,
@@ -585,6 +911,7 @@ def _get_get_event(model_type: str) -> str:
             "option": OPTION_RETRIEVED,
             "priority": PRIORITY_RETRIEVED,
             "question": QUESTION_RETRIEVED,
+            "rehearsal_action": REHEARSAL_ACTION_RETRIEVED,
             "rehearsal_run": REHEARSAL_RUN_RETRIEVED,
             "rehearsal_run_item": REHEARSAL_RUN_ITEM_RETRIEVED,
             "stack": STACK_RETRIEVED,
@@ -601,6 +928,63 @@ def _get_get_event(model_type: str) -> str:
         raise e
 
 
+def _get_entry_model(
+    entry: dict[str, Any],
+    lazy: bool = False,
+) -> Union[Model, ModelProxy]:
+    """
+    Returns the model of a raw entry read from a table.
+
+    Args:
+        entry (dict[str, Any]): The raw entry.
+        lazy (bool): Whether to return a lazy proxy over the entry instead of building
+                     the model. Defaults to False.
+
+    Returns:
+        Union[Model, ModelProxy]: The model, or the proxy if 'lazy' is True.
+    """
+
+    if lazy:
+        return get_model_proxy(entry=entry)
+
+    return get_model(
+        type_=entry["metadata"]["type"],
+        **_clone_entry(entry=entry),
+    )
+
+
+def _get_entry_sort_key(
+    entry: dict[str, Any],
+    field: str,
+) -> tuple[bool, Any]:
+    """
+    Returns the key an entry is sorted by when ordering a table by a field.
+
+    The field is looked up on the entry itself and then on its 'identifiable' part, so
+    that entries can be ordered by 'id' as well. Entries without a value sort last.
+
+    Args:
+        entry (dict[str, Any]): The raw entry.
+        field (str): The field to order by.
+
+    Returns:
+        tuple[bool, Any]: Whether the value is missing and the value itself.
+    """
+
+    value: Any = entry.get(
+        field,
+        (entry.get("identifiable") or {}).get(field),
+    )
+
+    if field == "id" and value is not None:
+        value = int(value)
+
+    return (
+        value is None,
+        value if value is not None else 0,
+    )
+
+
 def _get_entry_unique_criteria(model: Model) -> dict[str, Any]:
     """
     Extract all fields from the model that are to be used for duplicate detection
@@ -627,151 +1011,790 @@ def _get_entry_unique_criteria(model: Model) -> dict[str, Any]:
     }
 
 
-def _get_update_event(model_type: str) -> str:
+def _get_field_owner(
+    entry: dict[str, Any],
+    field: str,
+) -> dict[str, Any]:
     """
-    Retrieves the corresponding 'updated' notification event string for a given model type.
+    Returns the part of a JSON entry that holds a field.
 
-    This function maps a lowercase model type identifier (e.g., 'flashcard', 'note')
-    to the specific dispatcher notification event (e.g., FLASHCARD_UPDATED, NOTE_UPDATED)
-    that should be broadcast after a successful single entry update operation.
+    The identifiers ('id', 'key' and 'uuid') are held by the 'identifiable' part of an
+    entry, all other fields by the entry itself.
 
     Args:
-        model_type (str): The name of the data model type (e.g., 'flashcard', 'subject').
-                          Case sensitivity is handled internally (converted to lowercase).
+        entry (dict[str, Any]): The JSON entry.
+        field (str): The field.
 
     Returns:
-        str: The constant string identifier of the corresponding broadcast notification event.
-
-    Raises:
-        KeyError: If the provided 'model_type' is not defined in the internal mapping.
+        dict[str, Any]: The entry or its 'identifiable' part.
     """
 
-    try:
-        return {
-            "answer": ANSWER_UPDATED,
-            "customfield": CUSTOMFIELD_UPDATED,
-            "difficulty": DIFFICULTY_UPDATED,
-            "flashcard": FLASHCARD_UPDATED,
-            "image": IMAGE_UPDATED,
-            "note": NOTE_UPDATED,
-            "option": OPTION_UPDATED,
-            "priority": PRIORITY_UPDATED,
-            "question": QUESTION_UPDATED,
-            "rehearsal_run": REHEARSAL_RUN_UPDATED,
-            "rehearsal_run_item": REHEARSAL_RUN_ITEM_UPDATED,
-            "stack": STACK_UPDATED,
-            "subject": SUBJECT_UPDATED,
-            "tag": TAG_UPDATED,
-            "teacher": TEACHER_UPDATED,
-            "user": USER_UPDATED,
-        }[model_type.lower()]
-    except KeyError as e:
-        log_error(
-            message=f"Caught a KeyError while attempting to get update event for '{model_type}' model: {e}"
-        )
-        log_error(message=f"No update event defined for '{model_type}' model")
-        raise e
+    if field in IDENTIFIABLE_FIELDS and field not in entry:
+        return entry.get("identifiable") or {}
 
+    return entry
 
-def _increment_table_counters(table_data: dict[str, Any]) -> None:
-    """
-    Increments the table's 'next_id' and 'total' counters.
 
-    The 'next_id' is incremented to prepare for the subsequent entry addition,
-    and 'total' reflects the current count of entries.
+def _get_index_key(value: Any) -> str:
+    """
+    Returns the normalized value used to compare (and index) entry fields in 'filter_entries'.
 
     Args:
-        table_data (dict[str, Any]): The table data dictionary containing the
-                                     'metadata' and 'entries' structures.
+        value (Any): The value of the field.
 
     Returns:
-        None
+        str: The lowercased string representation of the value.
     """
 
-    table_data["metadata"]["next_id"] += 1
-    table_data["entries"]["total"] += 1
+    return str(value).lower()
 
 
-def _insert_table_entry(
-    model_data: dict[str, Any],
+def _get_indexed_candidate_ids(
+    criteria: dict[str, Any],
     table_data: dict[str, Any],
-) -> None:
+    table_name: str,
+) -> Optional[set[str]]:
     """
-    Assigns an ID and key to the model and inserts it into the table's entries dictionary.
-
-    The ID is derived from the table's current 'next_id' counter.
+    Returns the IDs of the entries that can match the criteria, based on the table's secondary indexes.
 
     Args:
-        model_data (dict[str, Any]): The model dictionary to be inserted.
-                                     The 'id' and 'key' fields are added/overwritten here.
-        table_data (dict[str, Any]): The parent table data dictionary where the
-                                     model will be stored under the 'entries' key.
+        criteria (dict[str, Any]): The filtering criteria.
+        table_data (dict[str, Any]): The table data dictionary.
+        table_name (str): The name of the table.
 
     Returns:
-        None
+        Optional[set[str]]: The IDs of the candidate entries, or None if none of the
+                            criteria cover an indexed field.
     """
 
-    model_data["identifiable"]["id"] = table_data["metadata"]["next_id"]
-    model_data["identifiable"]["key"] = generate_model_key(
-        id_=model_data["identifiable"]["id"],
-        name=model_data["metadata"]["type"],
+    indexed_fields: set[str] = INDEXED_FIELDS.get(
+        _get_table_file(table_name=table_name).stem,
+        set(),
     )
 
-    table_data["entries"]["entries"][str(model_data["identifiable"]["id"])] = model_data
+    candidates: Optional[set[str]] = None
 
-    _increment_table_counters(table_data=table_data)
+    for (
+        key,
+        value,
+    ) in criteria.items():
+        if key not in indexed_fields:
+            continue
 
-    _update_metadata_field_list(
-        model=model_data,
-        table_data=table_data,
-    )
+        ids: set[str] = _get_table_index(
+            field=key,
+            table_data=table_data,
+            table_name=table_name,
+        )["values"].get(
+            _get_index_key(value=value),
+            set(),
+        )
 
+        candidates = set(ids) if candidates is None else candidates & ids
 
-def _save_table_data(
-    table_data: dict[str, Any],
-    table_name: str,
-) -> None:
+        if not candidates:
+            return set()
+
+    return candidates
+
+
+def _get_cached_table_data(table_name: str) -> Optional[dict[str, Any]]:
+    """
+    Returns the cached data of the passed table, without loading the table if it is not cached.
+
+    Args:
+        table_name (str): The name of the table.
+
+    Returns:
+        Optional[dict[str, Any]]: The cached table data dictionary, or None if the table
+                                  is not cached or was modified since it was cached.
     """
-    Saves the table data dictionary to the corresponding JSON file.
 
-    This function wraps the file writing operation and includes error handling
-    to dispatch a DB_OPERATION_FAILURE event if the file cannot be written.
+    file: Path = _get_table_file(table_name=table_name)
+
+    cached: Optional[dict[str, Any]] = TABLE_CACHE.get(str(file))
+
+    if not exists(value=cached) or cached["signature"] != _get_table_signature(file=file):
+        return None
+
+    TABLE_CACHE_STATISTICS["hits"] += 1
+
+    return cached["data"]
+
+
+def _get_page_event(model_type: str) -> str:
+    """
+    Retrieves the corresponding 'page retrieved' notification event string for a given model type.
 
     Args:
-        table_data (dict[str, Any]): The complete table data dictionary to save.
-        table_name (str): The name of the table/file (e.g., "flashcard.json").
+        model_type (str): The name of the data model type (e.g., 'flashcard', 'subject').
+                          Case sensitivity is handled internally (converted to lowercase).
 
     Returns:
-        None
+        str: The constant string identifier of the corresponding page broadcast notification event.
 
     Raises:
-        Exception: If an error occurs during file writing.
+        KeyError: If the provided 'model_type' is not defined in the internal mapping.
     """
 
     try:
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
-
-        _update_table_timestamps(table_data=table_data)
-
-        write_file_json(
-            data=table_data,
-            file=file,
-        )
-    except Exception as e:
+        return {
+            "answer": ANSWERS_PAGE_RETRIEVED,
+            "customfield": CUSTOMFIELDS_PAGE_RETRIEVED,
+            "difficulty": DIFFICULTIES_PAGE_RETRIEVED,
+            "flashcard": FLASHCARDS_PAGE_RETRIEVED,
+            "image": IMAGES_PAGE_RETRIEVED,
+            "note": NOTES_PAGE_RETRIEVED,
+            "option": OPTIONS_PAGE_RETRIEVED,
+            "priority": PRIORITIES_PAGE_RETRIEVED,
+            "question": QUESTIONS_PAGE_RETRIEVED,
+            "rehearsal_action": REHEARSAL_ACTIONS_PAGE_RETRIEVED,
+            "rehearsal_run": REHEARSAL_RUNS_PAGE_RETRIEVED,
+            "rehearsal_run_item": REHEARSAL_RUN_ITEMS_PAGE_RETRIEVED,
+            "stack": STACKS_PAGE_RETRIEVED,
+            "subject": SUBJECTS_PAGE_RETRIEVED,
+            "tag": TAGS_PAGE_RETRIEVED,
+            "teacher": TEACHERS_PAGE_RETRIEVED,
+            "user": USERS_PAGE_RETRIEVED,
+        }[model_type.lower()]
+    except KeyError as e:
         log_error(
-            message=f"Caught an exception while attempting to save '{table_name}' table data: {e}"
-        )
-        dispatch(
-            event=DB_OPERATION_FAILURE,
-            message=f"Caught an exception while attempting to save '{table_name}' table data: {e}",
+            message=f"Caught a KeyError while attempting to get page event for '{model_type}' model: {e}"
         )
         raise e
 
 
-def _update_metadata_field_list(
-    model: dict[str, Any],
+def _get_storage_backend_functions() -> dict[str, Callable[..., Any]]:
+    """
+    Returns the load and save functions of the configured storage backend.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Callable[..., Any]]: The 'load' and 'save' functions of the backend.
+
+    Raises:
+        KeyError: If the configured backend has not been registered.
+    """
+
+    try:
+        return STORAGE_BACKENDS[get_storage_backend()]
+    except KeyError as e:
+        log_error(
+            message=f"Caught a KeyError while attempting to get storage backend '{get_storage_backend()}': {e}",
+            name=f"{__NAME__}._get_storage_backend_functions",
+        )
+        raise e
+
+
+def _get_table_entries(
+    ids: list[str],
+    table_name: str,
+) -> dict[str, dict[str, Any]]:
+    """
+    Returns the raw entries of a table with the passed IDs.
+
+    If the table is not cached and the backend can read single entries ('get_entries'),
+    only the requested entries are read and decoded. Otherwise the table data is loaded.
+
+    Args:
+        ids (list[str]): The IDs of the entries to return.
+        table_name (str): The name of the table.
+
+    Returns:
+        dict[str, dict[str, Any]]: The found entries, keyed by ID, in the requested order.
+    """
+
+    backend: dict[str, Callable[..., Any]] = _get_storage_backend_functions()
+
+    table_data: Optional[dict[str, Any]] = _get_cached_table_data(table_name=table_name)
+
+    if not exists(value=table_data) and "get_entries" in backend:
+        return backend["get_entries"](
+            file=_get_table_file(table_name=table_name),
+            ids=ids,
+        )
+
+    if not exists(value=table_data):
+        table_data = _load_table_data(table_name=table_name)
+
+    entries: dict[str, Any] = table_data["entries"]["entries"]
+
+    return {id_: entries[id_] for id_ in ids if id_ in entries}
+
+
+def _get_table_file(table_name: str) -> Path:
+    """
+    Returns the path of the JSON file backing the passed table.
+
+    Args:
+        table_name (str): The name of the table (e.g., "flashcards" or "flashcards.json").
+
+    Returns:
+        Path: The path of the table file within the data directory.
+    """
+
+    return DATA_DIR / (f"{table_name}.json" if not table_name.endswith(".json") else table_name)
+
+
+def _get_table_file_signature(file: Path) -> Optional[tuple[int, int]]:
+    """
+    Returns the signature of a table file used to validate cached table data.
+
+    Args:
+        file (Path): The table file to get the signature of.
+
+    Returns:
+        Optional[tuple[int, int]]: The modification time (in nanoseconds) and size
+                                   of the file, or None if the file does not exist.
+    """
+
+    try:
+        stat: os.stat_result = os.stat(file)
+    except FileNotFoundError:
+        return None
+
+    return (
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+def _get_table_files_signature(file: Path) -> Optional[tuple[Any, ...]]:
+    """
+    Returns the signature of a file based table used to validate cached table data.
+
+    The signature covers both the JSON snapshot and the journal of the table, so that
+    appends to the journal made outside of this process invalidate the cache as well.
+
+    Args:
+        file (Path): The table file to get the signature of.
+
+    Returns:
+        Optional[tuple[Any, ...]]: The signatures of the table file and its journal,
+                                   or None if the table file does not exist.
+    """
+
+    signature: Optional[tuple[int, int]] = _get_table_file_signature(file=file)
+
+    if not exists(value=signature):
+        return None
+
+    return (
+        signature,
+        _get_table_file_signature(file=get_journal_file(file=file)),
+    )
+
+
+def _get_table_index(
+    field: str,
+    table_data: dict[str, Any],
+    table_name: str,
+) -> dict[str, Any]:
+    """
+    Returns the secondary index of a table field, building it on first use.
+
+    Indexes are kept alongside the cached table data and therefore share its lifetime.
+
+    Args:
+        field (str): The indexed field.
+        table_data (dict[str, Any]): The table data dictionary.
+        table_name (str): The name of the table.
+
+    Returns:
+        dict[str, Any]: The index (see '_build_table_index').
+    """
+
+    cached: Optional[dict[str, Any]] = TABLE_CACHE.get(str(_get_table_file(table_name=table_name)))
+
+    if not exists(value=cached) or cached["data"] is not table_data:
+        return _build_table_index(
+            entries=table_data["entries"]["entries"],
+            field=field,
+        )
+
+    if field not in cached["indexes"]:
+        cached["indexes"][field] = _build_table_index(
+            entries=table_data["entries"]["entries"],
+            field=field,
+        )
+
+    return cached["indexes"][field]
+
+
+def _get_table_lock(table_name: str) -> threading.RLock:
+    """
+    Returns the lock serializing all access to a table, creating it on first use.
+
+    Every public table operation holds the lock of its table, so operations dispatched
+    asynchronously (see 'dispatch_async') never interleave their reads and writes of
+    the same table. The lock is re-entrant, as operations call each other.
+
+    Args:
+        table_name (str): The name of the table.
+
+    Returns:
+        threading.RLock: The lock of the table.
+    """
+
+    lock: Optional[threading.RLock] = TABLE_LOCKS.get(table_name)
+
+    if lock is None:
+        lock = TABLE_LOCKS.setdefault(
+            table_name,
+            threading.RLock(),
+        )
+
+    return lock
+
+
+def _get_table_signature(file: Path) -> Optional[tuple[Any, ...]]:
+    """
+    Returns the signature of a table used to validate cached table data.
+
+    Backends that do not store tables as files provide their own 'signature' function,
+    all others are validated against the signature of the table file and its journal.
+
+    Args:
+        file (Path): The table file to get the signature of.
+
+    Returns:
+        Optional[tuple[Any, ...]]: The signature of the table, or None if the table does not exist.
+    """
+
+    return _get_storage_backend_functions().get(
+        "signature",
+        _get_table_files_signature,
+    )(file=file)
+
+
+def _get_update_event(model_type: str) -> str:
+    """
+    Retrieves the corresponding 'updated' notification event string for a given model type.
+
+    This function maps a lowercase model type identifier (e.g., 'flashcard', 'note')
+    to the specific dispatcher notification event (e.g., FLASHCARD_UPDATED, NOTE_UPDATED)
+    that should be broadcast after a successful single entry update operation.
+
+    Args:
+        model_type (str): The name of the data model type (e.g., 'flashcard', 'subject').
+                          Case sensitivity is handled internally (converted to lowercase).
+
+    Returns:
+        str: The constant string identifier of the corresponding broadcast notification event.
+
+    Raises:
+        KeyError: If the provided 'model_type' is not defined in the internal mapping.
+    """
+
+    try:
+        return {
+            "answer": ANSWER_UPDATED,
+            "customfield": CUSTOMFIELD_UPDATED,
+            "difficulty": DIFFICULTY_UPDATED,
+            "flashcard": FLASHCARD_UPDATED,
+            "image": IMAGE_UPDATED,
+            "note": NOTE_UPDATED,
+            "option": OPTION_UPDATED,
+            "priority": PRIORITY_UPDATED,
+            "question": QUESTION_UPDATED,
+            "rehearsal_action": REHEARSAL_ACTION_UPDATED,
+            "rehearsal_run": REHEARSAL_RUN_UPDATED,
+            "rehearsal_run_item": REHEARSAL_RUN_ITEM_UPDATED,
+            "stack": STACK_UPDATED,
+            "subject": SUBJECT_UPDATED,
+            "tag": TAG_UPDATED,
+            "teacher": TEACHER_UPDATED,
+            "user": USER_UPDATED,
+        }[model_type.lower()]
+    except KeyError as e:
+        log_error(
+            message=f"Caught a KeyError while attempting to get update event for '{model_type}' model: {e}"
+        )
+        log_error(message=f"No update event defined for '{model_type}' model")
+        raise e
+
+
+def _increment_table_counters(table_data: dict[str, Any]) -> None:
+    """
+    Increments the table's 'next_id' and 'total' counters.
+
+    The 'next_id' is incremented to prepare for the subsequent entry addition,
+    and 'total' reflects the current count of entries.
+
+    Args:
+        table_data (dict[str, Any]): The table data dictionary containing the
+                                     'metadata' and 'entries' structures.
+
+    Returns:
+        None
+    """
+
+    table_data["metadata"]["next_id"] += 1
+    table_data["entries"]["total"] += 1
+
+
+def _insert_table_entry(
+    model_data: dict[str, Any],
+    table_data: dict[str, Any],
+) -> None:
+    """
+    Assigns an ID and key to the model and inserts it into the table's entries dictionary.
+
+    The ID is derived from the table's current 'next_id' counter.
+
+    Args:
+        model_data (dict[str, Any]): The model dictionary to be inserted.
+                                     The 'id' and 'key' fields are added/overwritten here.
+        table_data (dict[str, Any]): The parent table data dictionary where the
+                                     model will be stored under the 'entries' key.
+
+    Returns:
+        None
+    """
+
+    model_data["identifiable"]["id"] = table_data["metadata"]["next_id"]
+    model_data["identifiable"]["key"] = generate_model_key(
+        id_=model_data["identifiable"]["id"],
+        name=model_data["metadata"]["type"],
+    )
+
+    table_data["entries"]["entries"][str(model_data["identifiable"]["id"])] = model_data
+
+    _increment_table_counters(table_data=table_data)
+
+    _update_metadata_field_list(
+        model=model_data,
+        table_data=table_data,
+    )
+
+
+def _invalidate_table_cache(table_name: str) -> None:
+    """
+    Removes the cached data of the passed table from the table cache.
+
+    This is called whenever a write operation fails half-way, since the cached
+    table data may then have been mutated without the change reaching the disk.
+
+    Args:
+        table_name (str): The name of the table to invalidate.
+
+    Returns:
+        None
+    """
+
+    TABLE_CACHE.pop(
+        str(_get_table_file(table_name=table_name)),
+        None,
+    )
+
+
+def _iter_ordered_table_entries(
+    limit: Optional[int],
+    offset: int,
+    order_by: Optional[str],
+    table_name: str,
+) -> Iterator[dict[str, Any]]:
+    """
+    Iterates over a window of the raw entries of a table, optionally ordered by a field.
+
+    Without 'order_by' the entries are streamed in table (insertion) order and the window
+    is passed on to the backend. With 'order_by' and a 'limit', only the first
+    'offset + limit' entries are kept while ordering.
+
+    Args:
+        limit (Optional[int]): The maximum number of entries to yield, or None for all.
+        offset (int): The number of entries to skip.
+        order_by (Optional[str]): The field to order by, prefixed with '-' for descending order.
+        table_name (str): The name of the table.
+
+    Yields:
+        dict[str, Any]: The entries within the window.
+    """
+
+    if not exists(value=order_by):
+        yield from _iter_table_entries(
+            limit=limit,
+            offset=offset,
+            table_name=table_name,
+        )
+
+        return
+
+    entries: Iterator[dict[str, Any]] = _iter_table_entries(table_name=table_name)
+
+    stop: Optional[int] = offset + limit if limit is not None else None
+
+    field: str = order_by.lstrip("-")
+
+    key: Callable[[dict[str, Any]], tuple[bool, Any]] = lambda entry: _get_entry_sort_key(
+        entry=entry,
+        field=field,
+    )
+
+    if stop is None:
+        entries = iter(
+            sorted(
+                entries,
+                key=key,
+                reverse=order_by.startswith("-"),
+            )
+        )
+    else:
+        entries = iter(
+            (heapq.nlargest if order_by.startswith("-") else heapq.nsmallest)(
+                stop,
+                entries,
+                key=key,
+            )
+        )
+
+    yield from itertools.islice(
+        entries,
+        offset,
+        stop,
+    )
+
+
+def _iter_table_entries(
+    table_name: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Iterator[dict[str, Any]]:
+    """
+    Iterates over a window of the raw entries of a table.
+
+    If the table is not cached and the backend can stream its entries ('iter_entries'),
+    the entries are decoded one at a time instead of loading the whole table, and the
+    window is applied by the backend. Cached entries are iterated over a snapshot, so
+    the table may be written to meanwhile.
+
+    Args:
+        table_name (str): The name of the table.
+        limit (Optional[int]): The maximum number of entries to yield. Defaults to None (all).
+        offset (int): The number of entries to skip. Defaults to 0.
+
+    Yields:
+        dict[str, Any]: The entries of the table.
+    """
+
+    backend: dict[str, Callable[..., Any]] = _get_storage_backend_functions()
+
+    table_data: Optional[dict[str, Any]] = _get_cached_table_data(table_name=table_name)
+
+    if not exists(value=table_data) and "iter_entries" in backend:
+        for (
+            _,
+            entry,
+        ) in backend["iter_entries"](
+            file=_get_table_file(table_name=table_name),
+            limit=limit,
+            offset=offset,
+        ):
+            yield entry
+
+        return
+
+    if not exists(value=table_data):
+        table_data = _load_table_data(table_name=table_name)
+
+    yield from itertools.islice(
+        list(table_data["entries"]["entries"].values()),
+        offset,
+        offset + limit if limit is not None else None,
+    )
+
+
+def _load_table_data(table_name: str) -> Optional[dict[str, Any]]:
+    """
+    Returns the parsed data of the passed table, using the table cache where possible.
+
+    The table file is only read and parsed if it is not cached yet or if its
+    signature (mtime and size) changed since it was cached, i.e. when the file
+    was modified outside of this process.
+
+    Args:
+        table_name (str): The name of the table to load.
+
+    Returns:
+        Optional[dict[str, Any]]: The table data dictionary, or None if the file has no content.
+    """
+
+    file: Path = _get_table_file(table_name=table_name)
+
+    signature: Optional[tuple[Any, ...]] = _get_table_signature(file=file)
+
+    cached: Optional[dict[str, Any]] = TABLE_CACHE.get(str(file))
+
+    if exists(value=cached) and cached["signature"] == signature:
+        TABLE_CACHE_STATISTICS["hits"] += 1
+
+        return cached["data"]
+
+    if exists(value=cached):
+        TABLE_CACHE_STATISTICS["invalidations"] += 1
+
+    TABLE_CACHE_STATISTICS["misses"] += 1
+
+    table_data: Optional[dict[str, Any]] = _get_storage_backend_functions()["load"](file=file)
+
+    if not exists(value=table_data):
+        TABLE_CACHE.pop(str(file), None)
+
+        return table_data
+
+    TABLE_CACHE[str(file)] = {
+        "data": table_data,
+        "indexes": {},
+        "signature": signature,
+    }
+
+    return table_data
+
+
+def _recover_table_json(table_name: str) -> None:
+    """
+    Restores a table file that cannot be parsed from its last good backup.
+
+    The unreadable file is kept next to the table file with a '.corrupt' suffix.
+
+    Args:
+        table_name (str): The name of the table to recover.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the table has no backup or the backup cannot be parsed either.
+    """
+
+    file: Path = _get_table_file(table_name=table_name)
+
+    table_data: Optional[dict[str, Any]] = read_file_json(file=get_backup_file(file=file))
+
+    if not exists(value=table_data):
+        raise ValueError(f"No backup available to recover '{table_name}' table from")
+
+    if file.exists():
+        os.replace(
+            file,
+            file.with_name(f"{file.name}.corrupt"),
+        )
+
+    write_file_json(
+        atomic=True,
+        data=table_data,
+        file=file,
+    )
+
+    _invalidate_table_cache(table_name=table_name)
+
+    log_warning(
+        message=f"Recovered '{table_name}' table from its backup",
+        name=f"{__NAME__}._recover_table_json",
+    )
+
+
+def _save_table_data(
+    table_data: dict[str, Any],
+    table_name: str,
+    changes: Optional[list[dict[str, Any]]] = None,
+) -> None:
+    """
+    Saves the table data dictionary using the configured storage backend.
+
+    This function wraps the write operation and includes error handling
+    to dispatch a DB_OPERATION_FAILURE event if the table cannot be written.
+
+    Args:
+        table_data (dict[str, Any]): The complete table data dictionary to save.
+        table_name (str): The name of the table/file (e.g., "flashcard.json").
+        changes (Optional[list[dict[str, Any]]]): The per-entry changes that lead to the
+                                                  passed table data, as journal records
+                                                  ('op', 'id' and 'entry'). If None, the
+                                                  table is written as a whole.
+
+    Returns:
+        None
+
+    Raises:
+        Exception: If an error occurs during file writing.
+    """
+
+    try:
+        _update_table_timestamps(table_data=table_data)
+
+        _get_storage_backend_functions()["save"](
+            changes=changes,
+            file=_get_table_file(table_name=table_name),
+            table_data=table_data,
+        )
+
+        _cache_table_data(
+            changes=changes,
+            table_data=table_data,
+            table_name=table_name,
+        )
+
+        TABLE_CACHE_STATISTICS["writes"] += 1
+    except Exception as e:
+        _invalidate_table_cache(table_name=table_name)
+
+        log_error(
+            message=f"Caught an exception while attempting to save '{table_name}' table data: {e}"
+        )
+        dispatch_lean(
+            event=DB_OPERATION_FAILURE,
+            message=f"Caught an exception while attempting to save '{table_name}' table data: {e}",
+        )
+        raise e
+
+
+def _update_table_indexes(
+    changes: list[dict[str, Any]],
+    indexes: dict[str, dict[str, Any]],
+) -> None:
+    """
+    Applies per-entry changes to the secondary indexes of a table.
+
+    Args:
+        changes (list[dict[str, Any]]): The changes ('op', 'id' and 'entry') to apply.
+        indexes (dict[str, dict[str, Any]]): The indexes of the table, keyed by field.
+
+    Returns:
+        None
+    """
+
+    for (
+        field,
+        index,
+    ) in indexes.items():
+        for change in changes:
+            id_: str = str(change["id"])
+
+            old_key: Optional[str] = index["keys"].pop(id_, None)
+
+            if old_key is not None:
+                index["values"][old_key].discard(id_)
+
+                if not index["values"][old_key]:
+                    del index["values"][old_key]
+
+            if change["op"] not in (
+                "insert",
+                "update",
+            ) or field not in change["entry"]:
+                continue
+
+            key: str = _get_index_key(value=change["entry"][field])
+
+            index["keys"][id_] = key
+            index["values"].setdefault(key, set()).add(id_)
+
+
+def _update_metadata_field_list(
+    model: dict[str, Any],
     table_data: dict[str, Any],
 ) -> None:
     """
@@ -847,48 +1870,59 @@ def add_entry(
         Exception: If the entry cannot be added.
     """
 
-    try:
-        _ensure_table_json(table_name=table_name)
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        table_data: dict[str, Any] = read_file_json(file=file)
+            model_data: dict[str, Any] = model.to_json_dict()
 
-        model_data: dict[str, Any] = model.to_json_dict()
+            _insert_table_entry(
+                model_data=model_data,
+                table_data=table_data,
+            )
 
-        _insert_table_entry(
-            model_data=model_data,
-            table_data=table_data,
-        )
+            _save_table_data(
+                changes=[
+                    {
+                        "entry": model_data,
+                        "id": str(model_data["identifiable"]["id"]),
+                        "op": "insert",
+                    }
+                ],
+                table_data=table_data,
+                table_name=table_name,
+            )
 
-        _save_table_data(
-            table_data=table_data,
-            table_name=table_name,
-        )
+            log_info(
+                message=f"Successfully added entry '{model_data["identifiable"]["key"]}' to '{table_name}' table"
+            )
 
-        log_info(
-            message=f"Successfully added entry '{model_data["identifiable"]["key"]}' to '{table_name}' table"
-        )
+            event: str = _get_add_event(model_type=model_data["metadata"]["type"])
 
-        dispatch(
-            event=_get_add_event(model_type=model_data["metadata"]["type"]),
-            **{
-                model_data["metadata"]["type"].lower(): get_model(
-                    type_=model_data["metadata"]["type"],
-                    **model_data,
-                ),
-            },
-            namespace=GLOBAL_NAMESPACE,
-        )
+            if has_subscribers(
+                event=event,
+                namespace=GLOBAL_NAMESPACE,
+            ):
+                dispatch_lean(
+                    event=event,
+                    **{
+                        model_data["metadata"]["type"].lower(): get_model(
+                            type_=model_data["metadata"]["type"],
+                            **_clone_entry(entry=model_data),
+                        ),
+                    },
+                    namespace=GLOBAL_NAMESPACE,
+                )
 
-        return model_data["identifiable"]["id"]
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to add entry to '{table_name}' table: {e}"
-        )
-        raise e
+            return model_data["identifiable"]["id"]
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to add entry to '{table_name}' table: {e}"
+            )
+            _invalidate_table_cache(table_name=table_name)
+            raise e
 
 
 def add_entry_if_not_exist(
@@ -912,178 +1946,349 @@ def add_entry_if_not_exist(
         Exception: If an exception is caught while adding the entry.
     """
 
-    try:
-        if force:
+    with _get_table_lock(table_name=table_name):
+        try:
+            if force:
+                return add_entry(
+                    model=model,
+                    table_name=table_name,
+                )
+
+            unique_criteria: dict[str, Any] = _get_entry_unique_criteria(model=model)
+
+            existing_entries: list[dict[str, Any]] = filter_entries(
+                table_name=table_name,
+                **unique_criteria,
+            )
+
+            if exists(value=existing_entries):
+                log_info(
+                    message=f"Skipping adding entry to '{table_name}' table: Duplicate found based on criteria: {unique_criteria}"
+                )
+                return None
+
             return add_entry(
                 model=model,
                 table_name=table_name,
             )
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to add entry to '{table_name}' table: {e}"
+            )
+            raise e
 
-        unique_criteria: dict[str, Any] = _get_entry_unique_criteria(model=model)
 
-        existing_entries: list[dict[str, Any]] = filter_entries(
-            table_name=table_name,
-            **unique_criteria,
-        )
+def add_entries(
+    models: list[Model],
+    table_name: str,
+) -> Optional[list[int]]:
+    """
+    Adds multiple models to the table in a single atomic operation.
 
-        if exists(value=existing_entries):
-            log_info(
-                message=f"Skipping adding entry to '{table_name}' table: Duplicate found based on criteria: {unique_criteria}"
+    This function processes a batch of models, assigns unique IDs and keys to each,
+    updates the table metadata counters, and saves the changes back to the JSON file.
+
+    Args:
+        models (list[Model]): A list of models to add to the table.
+        table_name (str): The name of the table to which to add the models.
+
+    Returns:
+        Optional[list[int]]: A list of IDs of the successfully added models.
+
+    Raises:
+        Exception: If an exception is caught while processing or saving the entries.
+    """
+
+    with _get_table_lock(table_name=table_name):
+        try:
+            if not exists(value=models):
+                log_info(message=f"Attempted to add 0 models to '{table_name}' table. Aborting...")
+                return []
+
+            _ensure_table_json(table_name=table_name)
+
+            table_data: dict[str, Any] = _load_table_data(table_name=table_name)
+
+            added_ids: list[int] = []
+            changes: list[dict[str, Any]] = []
+            model_type: str = ""
+
+            for model in models:
+                model_data: dict[str, Any] = model.to_json_dict()
+
+                _insert_table_entry(
+                    model_data=model_data,
+                    table_data=table_data,
+                )
+
+                added_ids.append(model_data["identifiable"]["id"])
+
+                changes.append(
+                    {
+                        "entry": model_data,
+                        "id": str(model_data["identifiable"]["id"]),
+                        "op": "insert",
+                    }
+                )
+
+                if not exists(value=model_type):
+                    model_type = model_data["metadata"]["type"]
+
+            _save_table_data(
+                changes=changes,
+                table_data=table_data,
+                table_name=table_name,
             )
-            return None
 
-        return add_entry(
-            model=model,
-            table_name=table_name,
-        )
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to add entry to '{table_name}' table: {e}"
-        )
-        raise e
+            if is_log_level_enabled(level="INFO"):
+                log_info(
+                    message=f"Successfully added {len(models)} models to '{table_name}' table. IDs: {added_ids}"
+                )
+
+            if exists(value=model_type) and has_subscribers(
+                event=_get_bulk_add_event(model_type=model_type),
+                namespace=GLOBAL_NAMESPACE,
+            ):
+                # Built from the inserted entries, which carry the assigned IDs and keys
+                dispatch_lean(
+                    event=_get_bulk_add_event(model_type=model_type),
+                    **{
+                        pluralize_word(word=model_type).lower(): [
+                            get_model(
+                                type_=model_type,
+                                **_clone_entry(entry=change["entry"]),
+                            )
+                            for change in changes
+                        ],
+                    },
+                    namespace=GLOBAL_NAMESPACE,
+                )
+
+            return added_ids
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to add {len(models)} models to '{table_name}' table: {e}"
+            )
+            _invalidate_table_cache(table_name=table_name)
+            raise e
+
+
+def add_entries_if_not_exist(
+    models: list[Model],
+    table_name: str,
+    force: bool = False,
+) -> list[Model]:
+    """
+    Adds a list of models to the table only if no duplicate
+    (based on all non-metadata fields) for the respective model
+    already exists.
+
+    Args:
+        models (list[Model]): The list of models to be added.
+        force (bool): Whether to force the addition of the entries even if a duplicate is found.
+        table_name (str): The name of the table (e.g., ‘flashcards’).
+
+    Returns:
+        list[dict[str, Any]]: A list of all entries actually added (with metadata).
+
+    Raises:
+        Exception: If an exception is caught while processing or saving the entries.
+    """
+
+    with _get_table_lock(table_name=table_name):
+        try:
+            if force:
+                return add_entries(
+                    models=models,
+                    table_name=table_name,
+                )
+
+            models_to_add: list[Model] = []
+
+            for model in models:
+                unique_criteria: dict[str, Any] = _get_entry_unique_criteria(model=model)
+
+                existing_models: list[Model] = filter_entries(
+                    table_name=table_name,
+                    **unique_criteria,
+                )
+
+                if exists(value=existing_models):
+                    log_info(
+                        message=f"Skipping adding model to '{table_name}' table: Duplicate found based on criteria: {unique_criteria}"
+                    )
+
+                    continue
+
+                models_to_add.append(model)
+
+            if not exists(value=models_to_add):
+                return []
+
+            return add_entries(
+                models=models_to_add,
+                table_name=table_name,
+            )
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to add models to '{table_name}' table: {e}"
+            )
+            raise e
+
+
+def clear_table_cache(table_name: Optional[str] = None) -> None:
+    """
+    Clears the process-wide table cache.
+
+    Args:
+        table_name (Optional[str]): The name of the table to drop from the cache.
+                                    If None, the whole cache and its statistics are reset.
+
+    Returns:
+        None
+    """
+
+    if exists(value=table_name):
+        _invalidate_table_cache(table_name=table_name)
+
+        return
+
+    TABLE_CACHE.clear()
 
+    for key in TABLE_CACHE_STATISTICS:
+        TABLE_CACHE_STATISTICS[key] = 0
 
-def add_entries(
-    models: list[Model],
-    table_name: str,
-) -> Optional[list[int]]:
+
+def compact_table(table_name: str) -> bool:
     """
-    Adds multiple models to the table in a single atomic operation.
+    Compacts the journal of a table into the table's JSON snapshot.
 
-    This function processes a batch of models, assigns unique IDs and keys to each,
-    updates the table metadata counters, and saves the changes back to the JSON file.
+    The table is rewritten as a whole through the configured storage backend, which for
+    the "json" and "journal" backends writes the snapshot and removes the journal.
 
     Args:
-        models (list[Model]): A list of models to add to the table.
-        table_name (str): The name of the table to which to add the models.
+        table_name (str): The name of the table to compact.
 
     Returns:
-        Optional[list[int]]: A list of IDs of the successfully added models.
+        bool: True if the table was compacted, False if it has no content.
 
     Raises:
-        Exception: If an exception is caught while processing or saving the entries.
+        Exception: If an exception is caught while reading or writing the table.
     """
 
-    try:
-        if not exists(value=models):
-            log_info(message=f"Attempted to add 0 models to '{table_name}' table. Aborting...")
-            return []
-
-        _ensure_table_json(table_name=table_name)
+    with _get_table_lock(table_name=table_name):
+        try:
+            table_data: Optional[dict[str, Any]] = _load_table_data(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            if not exists(value=table_data):
+                return False
 
-        table_data: dict[str, Any] = read_file_json(file=file)
+            _get_storage_backend_functions()["save"](
+                changes=None,
+                file=_get_table_file(table_name=table_name),
+                table_data=table_data,
+            )
 
-        added_ids: list[int] = []
-        model_type: str = ""
+            _cache_table_data(
+                table_data=table_data,
+                table_name=table_name,
+            )
 
-        for model in models:
-            model_data: dict[str, Any] = model.to_json_dict()
+            log_info(message=f"Successfully compacted '{table_name}' table")
 
-            _insert_table_entry(
-                model_data=model_data,
-                table_data=table_data,
+            return True
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to compact '{table_name}' table: {e}"
             )
+            _invalidate_table_cache(table_name=table_name)
+            raise e
 
-            added_ids.append(model_data["identifiable"]["id"])
 
-            if not exists(value=model_type):
-                model_type = model_data["metadata"]["type"]
+def compact_tables() -> list[str]:
+    """
+    Compacts the journals of all tables in the data directory into their JSON snapshots.
 
-        _save_table_data(
-            table_data=table_data,
-            table_name=table_name,
-        )
+    Args:
+        None
 
-        log_info(
-            message=f"Successfully added {len(models)} models to '{table_name}' table. IDs: {added_ids}"
-        )
+    Returns:
+        list[str]: The names of the tables that were compacted.
 
-        if exists(value=model_type):
-            model_datas: list[dict[str, Any]] = [model.to_json_dict() for model in models]
-            dispatch(
-                event=_get_bulk_add_event(model_type=model_type),
-                **{
-                    pluralize_word(word=model_type).lower(): [
-                        get_model(
-                            type_=model_type,
-                            **model_data,
-                        )
-                        for model_data in model_datas
-                    ],
-                },
-                namespace=GLOBAL_NAMESPACE,
-            )
+    Raises:
+        Exception: If an exception is caught while compacting a table.
+    """
 
-        return added_ids
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to add {len(models)} models to '{table_name}' table: {e}"
-        )
-        raise e
+    if not DATA_DIR.exists():
+        return []
 
+    return [
+        journal_file.stem
+        for journal_file in sorted(DATA_DIR.glob("*.journal"))
+        if compact_table(table_name=journal_file.stem)
+    ]
 
-def add_entries_if_not_exist(
-    models: list[Model],
-    table_name: str,
-    force: bool = False,
-) -> list[Model]:
+
+def convert_tables_to_json() -> list[str]:
     """
-    Adds a list of models to the table only if no duplicate
-    (based on all non-metadata fields) for the respective model
-    already exists.
+    Converts all JSON Lines tables in the data directory to JSON tables.
+
+    After the conversion, the "json" or "journal" backend can be selected by setting
+    the "storage.backend" config value. The JSON Lines tables are left untouched.
 
     Args:
-        models (list[Model]): The list of models to be added.
-        force (bool): Whether to force the addition of the entries even if a duplicate is found.
-        table_name (str): The name of the table (e.g., ‘flashcards’).
+        None
 
     Returns:
-        list[dict[str, Any]]: A list of all entries actually added (with metadata).
+        list[str]: The names of the converted tables.
 
     Raises:
-        Exception: If an exception is caught while processing or saving the entries.
+        Exception: If an exception is caught while converting a table.
     """
 
     try:
-        if force:
-            return add_entries(
-                models=models,
-                table_name=table_name,
-            )
+        converted: list[str] = convert_jsonl_tables_to_json(data_dir=DATA_DIR)
 
-        models_to_add: list[Model] = []
+        clear_table_cache()
 
-        for model in models:
-            unique_criteria: dict[str, Any] = _get_entry_unique_criteria(model=model)
+        log_info(message=f"Successfully converted {len(converted)} tables to JSON: {converted}")
 
-            existing_models: list[Model] = filter_entries(
-                table_name=table_name,
-                **unique_criteria,
-            )
+        return converted
+    except Exception as e:
+        log_error(message=f"Caught an exception while attempting to convert tables to JSON: {e}")
+        raise e
 
-            if exists(value=existing_models):
-                log_info(
-                    message=f"Skipping adding model to '{table_name}' table: Duplicate found based on criteria: {unique_criteria}"
-                )
 
-                continue
+def convert_tables_to_jsonl() -> list[str]:
+    """
+    Converts all JSON tables (including their journals) in the data directory to JSON Lines tables.
 
-            models_to_add.append(model)
+    After the conversion, the "jsonl" backend can be selected by setting the
+    "storage.backend" config value to "jsonl". The JSON tables are left untouched.
 
-        if not exists(value=models_to_add):
-            return []
+    Args:
+        None
 
-        return add_entries(
-            models=models_to_add,
-            table_name=table_name,
+    Returns:
+        list[str]: The names of the converted tables.
+
+    Raises:
+        Exception: If an exception is caught while converting a table.
+    """
+
+    try:
+        converted: list[str] = convert_json_tables_to_jsonl(data_dir=DATA_DIR)
+
+        clear_table_cache()
+
+        log_info(
+            message=f"Successfully converted {len(converted)} tables to JSON Lines: {converted}"
         )
+
+        return converted
     except Exception as e:
         log_error(
-            message=f"Caught an exception while attempting to add models to '{table_name}' table: {e}"
+            message=f"Caught an exception while attempting to convert tables to JSON Lines: {e}"
         )
         raise e
 
@@ -1105,25 +2310,46 @@ def count_entries(table_name: str) -> int:
         Exception: If an exception is caught while accessing or reading the table file.
     """
 
-    try:
-        _ensure_table_json(table_name=table_name)
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        table_data: dict[str, Any] = read_file_json(file=file)
+            count: int = table_data["entries"]["total"]
 
-        count: int = table_data["entries"]["total"]
+            log_info(message=f"Successfully retrieved total count ({count}) for '{table_name}' table")
 
-        log_info(message=f"Successfully retrieved total count ({count}) for '{table_name}' table")
+            return count
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to count entries in '{table_name}' table: {e}"
+            )
+            raise e
 
-        return count
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to count entries in '{table_name}' table: {e}"
-        )
-        raise e
+
+def declare_table_index(
+    field: str,
+    table_name: str,
+) -> None:
+    """
+    Declares a secondary index on a field of a table, in addition to those in TABLE_INDEXES.
+
+    The index is built on the first 'filter_entries' call covering the field and
+    maintained incrementally on every add, update and delete afterwards.
+
+    Args:
+        field (str): The field to index (e.g. "name").
+        table_name (str): The name of the table (e.g. "difficulties").
+
+    Returns:
+        None
+    """
+
+    INDEXED_FIELDS.setdefault(
+        _get_table_file(table_name=table_name).stem,
+        set(),
+    ).add(field)
 
 
 def delete_all_entries(table_name: str) -> bool:
@@ -1144,68 +2370,66 @@ def delete_all_entries(table_name: str) -> bool:
         Exception: If an exception is caught during the file initialization or event dispatch.
     """
 
-    try:
-        _ensure_table_json(table_name=table_name)
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            model_type: Optional[str] = None
 
-        model_type: Optional[str] = None
+            if exists(value=_load_table_data(table_name=table_name)):
+                try:
+                    table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        if does_file_have_content(file=file):
-            try:
-                table_data: dict[str, Any] = read_file_json(file=file)
+                    if not table_data["entries"]["total"] > 0:
+                        return
 
-                if not table_data["entries"]["total"] > 0:
-                    return
+                    first_entry: Optional[dict[str, Any]] = next(
+                        iter(table_data["entries"]["entries"].values()),
+                        None,
+                    )
 
-                first_entry: Optional[dict[str, Any]] = next(
-                    iter(table_data["entries"]["entries"].values()),
-                    None,
-                )
+                    if not exists(value=first_entry):
+                        return
 
-                if not exists(value=first_entry):
-                    return
+                    model_type = first_entry["metadata"]["type"]
 
-                model_type = first_entry["metadata"]["type"]
+                    table_data["entries"] = {
+                        "entries": {},
+                        "total": 0,
+                    }
 
-                table_data["entries"] = {
-                    "entries": {},
-                    "total": 0,
-                }
+                    table_data["metadata"]["fields"] = {
+                        "fields": [],
+                        "total": 0,
+                    }
 
-                table_data["metadata"]["fields"] = {
-                    "fields": [],
-                    "total": 0,
-                }
+                    table_data["next_id"] = 0
 
-                table_data["next_id"] = 0
+                    _save_table_data(
+                        table_data=table_data,
+                        table_name=table_name,
+                    )
+                except Exception:
+                    pass
 
-                _save_table_data(
-                    table_data=table_data,
-                    table_name=table_name,
-                )
-            except Exception:
-                pass
+            _ensure_table_json_with_content(table_name=table_name)
 
-        _ensure_table_json_with_content(table_name=table_name)
+            log_info(message=f"Successfully deleted all entries and reset table '{table_name}'.")
 
-        log_info(message=f"Successfully deleted all entries and reset table '{table_name}'.")
+            if exists(value=model_type):
+                dispatch_lean(
+                    event=_get_delete_all_event(model_type=model_type),
+                    namespace=GLOBAL_NAMESPACE,
+                    **{},
+                )
 
-        if exists(value=model_type):
-            dispatch(
-                event=_get_delete_all_event(model_type=model_type),
-                namespace=GLOBAL_NAMESPACE,
-                **{},
+            return True
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to delete all entries from '{table_name}' table: {e}"
             )
-
-        return True
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to delete all entries from '{table_name}' table: {e}"
-        )
-        raise e
+            _invalidate_table_cache(table_name=table_name)
+            raise e
 
 
 def delete_entries(
@@ -1230,87 +2454,94 @@ def delete_entries(
         Exception: If an exception is caught while accessing, reading, or writing the table file.
     """
 
-    try:
-        if not exists(value=ids):
-            log_info(
-                message=f"Attempted to delete 0 entries from '{table_name}' table. Aborting..."
-            )
-            return False
+    with _get_table_lock(table_name=table_name):
+        try:
+            if not exists(value=ids):
+                log_info(
+                    message=f"Attempted to delete 0 entries from '{table_name}' table. Aborting..."
+                )
+                return False
 
-        _ensure_table_json(table_name=table_name)
+            _ensure_table_json(table_name=table_name)
 
-        entry_id_strs: list[str] = [str(i) for i in ids]
+            entry_id_strs: list[str] = [str(i) for i in ids]
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        table_data: dict[str, Any] = read_file_json(file=file)
+            deleted_entries: list[dict[str, Any]] = []
 
-        deleted_entries: list[dict[str, Any]] = []
+            changes: list[dict[str, Any]] = []
 
-        model_type: str = ""
+            model_type: str = ""
 
-        all_entries: dict[str, Any] = table_data["entries"]["entries"]
+            all_entries: dict[str, Any] = table_data["entries"]["entries"]
 
-        available_ids: list[str] = (
-            table_data["metadata"]["available_ids"]
-            if exists(value=table_data["metadata"]["available_ids"])
-            else []
-        )
+            available_ids: list[str] = (
+                table_data["metadata"]["available_ids"]
+                if exists(value=table_data["metadata"]["available_ids"])
+                else []
+            )
 
-        for id_str in entry_id_strs:
-            deleted_entry: Optional[dict[str, Any]] = all_entries.pop(id_str, None)
+            for id_str in entry_id_strs:
+                deleted_entry: Optional[dict[str, Any]] = all_entries.pop(id_str, None)
 
-            if not exists(value=deleted_entry):
-                continue
+                if not exists(value=deleted_entry):
+                    continue
 
-            deleted_entries.append(deleted_entry)
+                deleted_entries.append(deleted_entry)
 
-            available_ids.append(id_str)
+                changes.append(
+                    {
+                        "id": id_str,
+                        "op": "delete",
+                    }
+                )
 
-            if not exists(value=model_type):
-                continue
+                available_ids.append(id_str)
 
-            model_type = deleted_entry["metadata"]["type"]
+                if not exists(value=model_type):
+                    model_type = deleted_entry["metadata"]["type"]
 
-        count_deleted: int = len(deleted_entries)
+            count_deleted: int = len(deleted_entries)
 
-        if count_deleted == 0:
-            log_info(
-                message=f"Attempted to delete {len(ids)} entries from '{table_name}' table, but none were found."
-            )
-            return False
+            if count_deleted == 0:
+                log_info(
+                    message=f"Attempted to delete {len(ids)} entries from '{table_name}' table, but none were found."
+                )
+                return False
 
-        for _ in range(count_deleted):
-            _decrement_table_counters(table_data=table_data)
+            for _ in range(count_deleted):
+                _decrement_table_counters(table_data=table_data)
 
-        table_data["metadata"]["available_ids"] = available_ids
+            table_data["metadata"]["available_ids"] = available_ids
 
-        _save_table_data(
-            table_data=table_data,
-            table_name=table_name,
-        )
+            _save_table_data(
+                changes=changes,
+                table_data=table_data,
+                table_name=table_name,
+            )
 
-        log_info(
-            message=f"Successfully deleted {count_deleted} entries from '{table_name}' table. IDs deleted: {[e['id'] for e in deleted_entries]}"
-        )
+            if is_log_level_enabled(level="INFO"):
+                log_info(
+                    message=f"Successfully deleted {count_deleted} entries from '{table_name}' table. IDs deleted: {[e['identifiable']['id'] for e in deleted_entries]}"
+                )
 
-        if exists(value=model_type):
-            dispatch(
-                event=_get_bulk_delete_event(model_type=model_type),
-                namespace=GLOBAL_NAMESPACE,
-                **{
-                    pluralize_word(word=model_type).lower(): deleted_entries,
-                },
-            )
+            if exists(value=model_type):
+                dispatch_lean(
+                    event=_get_bulk_delete_event(model_type=model_type),
+                    namespace=GLOBAL_NAMESPACE,
+                    **{
+                        pluralize_word(word=model_type).lower(): deleted_entries,
+                    },
+                )
 
-        return True
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to delete entries from '{table_name}' table: {e}"
-        )
-        raise e
+            return True
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to delete entries from '{table_name}' table: {e}"
+            )
+            _invalidate_table_cache(table_name=table_name)
+            raise e
 
 
 def delete_entry(
@@ -1336,79 +2567,90 @@ def delete_entry(
         Exception: If an exception is caught while accessing, reading, or writing the table file.
     """
 
-    try:
-        _ensure_table_json(table_name=table_name)
-
-        entry_id_str: str = str(id_)
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
-
-        table_data: dict[str, Any] = read_file_json(file=file)
+            entry_id_str: str = str(id_)
 
-        deleted_entry: Optional[dict[str, Any]] = table_data["entries"]["entries"].pop(
-            entry_id_str,
-            None,
-        )
+            table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        available_ids: list[str] = (
-            table_data["metadata"]["available_ids"]
-            if exists(value=table_data["metadata"]["available_ids"])
-            else []
-        )
+            deleted_entry: Optional[dict[str, Any]] = table_data["entries"]["entries"].pop(
+                entry_id_str,
+                None,
+            )
 
-        if not exists(value=deleted_entry):
-            log_info(
-                message=f"Attempted to delete entry with ID '{entry_id_str}' from '{table_name}' table, but it was not found."
+            available_ids: list[str] = (
+                table_data["metadata"]["available_ids"]
+                if exists(value=table_data["metadata"]["available_ids"])
+                else []
             )
 
-            return False
+            if not exists(value=deleted_entry):
+                log_info(
+                    message=f"Attempted to delete entry with ID '{entry_id_str}' from '{table_name}' table, but it was not found."
+                )
 
-        available_ids.append(entry_id_str)
+                return False
 
-        table_data["metadata"]["available_ids"] = available_ids
+            available_ids.append(entry_id_str)
 
-        _decrement_table_counters(table_data=table_data)
+            table_data["metadata"]["available_ids"] = available_ids
 
-        _save_table_data(
-            table_data=table_data,
-            table_name=table_name,
-        )
+            _decrement_table_counters(table_data=table_data)
 
-        log_info(message=f"Successfully deleted entry '{entry_id_str}' from '{table_name}' table")
+            _save_table_data(
+                changes=[
+                    {
+                        "id": entry_id_str,
+                        "op": "delete",
+                    }
+                ],
+                table_data=table_data,
+                table_name=table_name,
+            )
 
-        model_type: str = deleted_entry["metadata"]["type"]
+            log_info(message=f"Successfully deleted entry '{entry_id_str}' from '{table_name}' table")
 
-        dispatch(
-            event=_get_delete_event(model_type=model_type),
-            namespace=GLOBAL_NAMESPACE,
-            **{
-                model_type.lower(): deleted_entry,
-            },
-        )
+            model_type: str = deleted_entry["metadata"]["type"]
 
-        return True
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to delete entry '{id_}' from '{table_name}' table: {e}"
-        )
-        raise e
+            dispatch_lean(
+                event=_get_delete_event(model_type=model_type),
+                namespace=GLOBAL_NAMESPACE,
+                **{
+                    model_type.lower(): deleted_entry,
+                },
+            )
+
+            return True
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to delete entry '{id_}' from '{table_name}' table: {e}"
+            )
+            _invalidate_table_cache(table_name=table_name)
+            raise e
 
 
 def filter_entries(
     table_name: str,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> Optional[list[Model]]:
     """
     Retrieves entries from a table that match specific criteria provided as keyword arguments.
 
-    This function loads all entries from the specified table and filters them
-    using a helper function that performs case-insensitive containment matching.
+    If the table is not cached and the backend can filter on some of the criteria itself
+    ('filter_entries'), only the entries it returns are checked. Otherwise, if any of the
+    criteria covers a field with a secondary index (see 'declare_table_index'), only the
+    entries found in the index are checked, and all entries are scanned if none does.
+    Entries are matched on their stored JSON data using a case-insensitive comparison,
+    and models are only built for the matching entries.
     It dispatches a single-entry or bulk-retrieved event based on the result count.
 
     Args:
         table_name (str): The name of the table/collection to filter.
+        lazy (bool): Whether to return lazy model proxies (see 'ModelProxy') instead of
+                     models. Defaults to False.
         **kwargs: Arbitrary keyword arguments (key/value pairs) used as filtering criteria.
                   An entry must match ALL criteria to be included. Matching is case-insensitive.
 
@@ -1421,95 +2663,92 @@ def filter_entries(
         Exception: If an exception is caught while accessing or reading the table file.
     """
 
-    def _matches_filter(
-        criteria: dict[str, Any],
-        entry: Model,
-    ) -> bool:
-        """
-        Internal helper function to check if a single entry matches all filtering criteria.
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
 
-        Performs a case-insensitive check for containment (the value in the entry
-        must contain the string value provided in the criteria).
+            criteria: dict[str, Any] = {
+                key: value for (key, value) in kwargs.items() if key.lower() != "table_name"
+            }
 
-        Args:
-            criteria (dict[str, Any]): The filtering criteria.
-            entry (Model): The entry to check against the criteria.
+            candidates: Optional[list[dict[str, Any]]] = _get_backend_candidates(
+                criteria=criteria,
+                table_name=table_name,
+            )
 
-        Returns:
-            bool: True if the entry matches all criteria, False otherwise.
-        """
+            if candidates is None:
+                table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        for (
-            outer_key,
-            outer_value,
-        ) in criteria.items():
-            if outer_key.lower() == "table_name":
-                continue
+                all_entries: dict[str, Any] = table_data["entries"]["entries"]
 
-            if outer_key not in entry.to_json_dict().keys():
-                return False
+                candidate_ids: Optional[set[str]] = _get_indexed_candidate_ids(
+                    criteria=criteria,
+                    table_data=table_data,
+                    table_name=table_name,
+                )
 
-            entry_value = entry.to_json_dict()[outer_key]
+                candidates = (
+                    list(all_entries.values())
+                    if candidate_ids is None
+                    else [all_entries[id_] for id_ in sorted(candidate_ids, key=int)]
+                )
 
-            return str(entry_value).lower() == str(outer_value).lower()
+            filtered_entries: list[Model] = [
+                _get_entry_model(
+                    entry=entry,
+                    lazy=lazy,
+                )
+                for entry in candidates
+                if _entry_matches_criteria(
+                    criteria=criteria,
+                    entry=entry,
+                )
+            ]
 
-    try:
-        all_entries: Optional[list[Model]] = get_all_entries(table_name=table_name)
+            count: int = len(filtered_entries)
 
-        if not exists(value=all_entries):
-            return []
+            if count == 0:
+                log_info(
+                    message=f"No entries found in '{table_name}' table matching filter criteria: {kwargs}"
+                )
 
-        filtered_entries: list[Model] = list(
-            filter(
-                lambda entry: _matches_filter(
-                    criteria=kwargs,
-                    entry=entry,
-                ),
-                all_entries,
-            )
-        )
+                return []
 
-        count: int = len(filtered_entries)
+            model_type: str = filtered_entries[0].type_
 
-        if count == 0:
             log_info(
-                message=f"No entries found in '{table_name}' table matching filter criteria: {kwargs}"
+                message=f"Successfully filtered {count} entries from '{table_name}' table matching criteria: {kwargs}"
             )
 
-            return []
-
-        model_type: str = filtered_entries[0].type_
-
-        log_info(
-            message=f"Successfully filtered {count} entries from '{table_name}' table matching criteria: {kwargs}"
-        )
+            if count == 1:
+                dispatch_lean(
+                    event=_get_get_event(model_type=model_type),
+                    namespace=GLOBAL_NAMESPACE,
+                    **{
+                        pluralize_word(word=model_type).lower(): filtered_entries[0],
+                    },
+                )
+            elif count > 1:
+                dispatch_lean(
+                    event=_get_bulk_get_event(model_type=model_type),
+                    namespace=GLOBAL_NAMESPACE,
+                    **{
+                        pluralize_word(word=model_type).lower(): filtered_entries,
+                    },
+                )
 
-        if count == 1:
-            dispatch(
-                event=_get_get_event(model_type=model_type),
-                namespace=GLOBAL_NAMESPACE,
-                **{
-                    pluralize_word(word=model_type).lower(): filtered_entries[0],
-                },
-            )
-        elif count > 1:
-            dispatch(
-                event=_get_bulk_get_event(model_type=model_type),
-                namespace=GLOBAL_NAMESPACE,
-                **{
-                    pluralize_word(word=model_type).lower(): filtered_entries,
-                },
+            return filtered_entries
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to filter entries from '{table_name}' table with criteria {kwargs}: {e}"
             )
-
-        return filtered_entries
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to filter entries from '{table_name}' table with criteria {kwargs}: {e}"
-        )
-        raise e
+            raise e
 
 
-def get_all_entries(table_name: str) -> Optional[list[Model]]:
+def get_all_entries(
+    table_name: str,
+    lazy: bool = False,
+) -> Optional[list[Model]]:
     """
     Retrieves all models contained within a specified table.
 
@@ -1519,6 +2758,8 @@ def get_all_entries(table_name: str) -> Optional[list[Model]]:
 
     Args:
         table_name (str): The name of the table/collection from which to retrieve all models.
+        lazy (bool): Whether to return lazy model proxies (see 'ModelProxy') instead of
+                     models. Defaults to False.
 
     Returns:
         Optional[list[Model]]: A list of all model objects from the table,
@@ -1527,55 +2768,45 @@ def get_all_entries(table_name: str) -> Optional[list[Model]]:
 
     Raises:
         Exception: If an exception is caught while accessing or reading the table file.
-    """
-
-    try:
-        _ensure_table_json(table_name=table_name)
-
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
-
-        table_data: dict[str, Any] = read_file_json(file=file)
-
-        all_entries_dict: dict[str, Any] = table_data["entries"]["entries"]
+    """
 
-        retrieved_entries: list[dict[str, Any]] = list(all_entries_dict.values())
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
 
-        count: int = len(retrieved_entries)
+            models: list[Model] = [
+                _get_entry_model(
+                    entry=entry,
+                    lazy=lazy,
+                )
+                for entry in _iter_table_entries(table_name=table_name)
+            ]
 
-        if count <= 0:
-            log_info(message=f"Table '{table_name}' contains no entries. Returning empty list.")
+            if len(models) <= 0:
+                log_info(message=f"Table '{table_name}' contains no entries. Returning empty list.")
 
-            return []
+                return []
 
-        model_type: str = retrieved_entries[0]["metadata"]["type"]
+            model_type: str = models[0].type_
 
-        models: list[Model] = [
-            get_model(
-                type_=model_type,
-                **entry,
+            dispatch_lean(
+                event=_get_get_all_event(model_type=model_type),
+                namespace=GLOBAL_NAMESPACE,
+                **{f"all_{pluralize_word(word=model_type).lower()}": models},
             )
-            for entry in retrieved_entries
-        ]
-
-        dispatch(
-            event=_get_get_all_event(model_type=model_type),
-            namespace=GLOBAL_NAMESPACE,
-            **{f"all_{pluralize_word(word=model_type).lower()}": models},
-        )
 
-        return models
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to get all entries from '{table_name}' table: {e}"
-        )
-        raise e
+            return models
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to get all entries from '{table_name}' table: {e}"
+            )
+            raise e
 
 
 def get_entries(
     ids: list[Union[int, str]],
     table_name: str,
+    lazy: bool = False,
 ) -> Optional[list[Model]]:
     """
     Retrieves multiple models from a specified table based on a list of unique IDs.
@@ -1587,6 +2818,8 @@ def get_entries(
     Args:
         ids (list[Union[int, str]]): A list of unique IDs (primary keys) of the models to retrieve.
         table_name (str): The name of the table/collection where the models are stored.
+        lazy (bool): Whether to return lazy model proxies (see 'ModelProxy') instead of
+                     models. Defaults to False.
 
     Returns:
         Optional[list[Model]]: A list of model objects containing the model data,
@@ -1597,75 +2830,62 @@ def get_entries(
         Exception: If an exception is caught while accessing or reading the table file.
     """
 
-    try:
-        if not exists(value=ids):
-            log_info(
-                message=f"Attempted to get 0 entries from '{table_name}' table. Returning empty list."
-            )
+    with _get_table_lock(table_name=table_name):
+        try:
+            if not exists(value=ids):
+                log_info(
+                    message=f"Attempted to get 0 entries from '{table_name}' table. Returning empty list."
+                )
 
-            return []
+                return []
 
-        _ensure_table_json(table_name=table_name)
+            _ensure_table_json(table_name=table_name)
 
-        entry_id_strs: list[str] = [str(id_) for id_ in ids]
+            entry_id_strs: list[str] = [str(id_) for id_ in ids]
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            entries: dict[str, dict[str, Any]] = _get_table_entries(
+                ids=entry_id_strs,
+                table_name=table_name,
+            )
 
-        table_data: dict[str, Any] = read_file_json(file=file)
+            retrieved_entries: list[dict[str, Any]] = [
+                entries[id_str] for id_str in entry_id_strs if id_str in entries
+            ]
 
-        retrieved_entries: list[dict[str, Any]] = []
+            model_type: str = retrieved_entries[0]["metadata"]["type"] if retrieved_entries else ""
 
-        model_type: str = ""
+            count: int = len(retrieved_entries)
 
-        all_entries_dict: dict[str, Any] = dict(table_data["entries"]["entries"])
+            if count <= 0:
+                log_info(message=f"No entries found for the requested IDs in '{table_name}' table")
 
-        for id_str in entry_id_strs:
-            entry: Optional[dict[str, Any]] = all_entries_dict.get(id_str)
+                return []
 
-            if not exists(value=entry):
-                continue
+            log_info(
+                message=f"Successfully retrieved {count} out of {len(ids)} requested entries from '{table_name}' table"
+            )
 
-            retrieved_entries.append(entry)
+            models: list[Model] = [
+                _get_entry_model(
+                    entry=entry,
+                    lazy=lazy,
+                )
+                for entry in retrieved_entries
+            ]
 
             if exists(value=model_type):
-                continue
-
-            model_type = entry["metadata"]["type"]
-
-        count: int = len(retrieved_entries)
-
-        if count <= 0:
-            log_info(message=f"No entries found for the requested IDs in '{table_name}' table")
-
-            return []
-
-        log_info(
-            message=f"Successfully retrieved {count} out of {len(ids)} requested entries from '{table_name}' table"
-        )
-
-        models: list[Model] = [
-            get_model(
-                type_=model_type,
-                **entry,
-            )
-            for entry in retrieved_entries
-        ]
+                dispatch_lean(
+                    event=_get_bulk_get_event(model_type=model_type),
+                    namespace=GLOBAL_NAMESPACE,
+                    **{pluralize_word(word=model_type).lower(): models},
+                )
 
-        if exists(value=model_type):
-            dispatch(
-                event=_get_bulk_get_event(model_type=model_type),
-                namespace=GLOBAL_NAMESPACE,
-                **{pluralize_word(word=model_type).lower(): models},
+            return models
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to get entries from '{table_name}' table: {e}"
             )
-
-        return models
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to get entries from '{table_name}' table: {e}"
-        )
-        raise e
+            raise e
 
 
 def get_entries_by_keys(
@@ -1692,27 +2912,29 @@ def get_entries_by_keys(
         Exception: If an exception is caught while accessing or reading the table file.
     """
 
-    try:
-        return get_entries(
-            ids=[
-                search_string(
-                    pattern=PATTERNS["MODEL_KEY"],
-                    string=key,
-                )
-                for key in keys
-            ],
-            table_name=table_name,
-        )
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to get entries by keys from '{table_name}' table: {e}"
-        )
-        raise e
+    with _get_table_lock(table_name=table_name):
+        try:
+            return get_entries(
+                ids=[
+                    search_string(
+                        pattern=PATTERNS["MODEL_KEY"],
+                        string=key,
+                    )
+                    for key in keys
+                ],
+                table_name=table_name,
+            )
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to get entries by keys from '{table_name}' table: {e}"
+            )
+            raise e
 
 
 def get_entry(
     id_: Union[int, str],
     table_name: str,
+    lazy: bool = False,
 ) -> Optional[Model]:
     """
     Retrieves a single model from a specified table by its unique ID.
@@ -1724,6 +2946,8 @@ def get_entry(
     Args:
         id_ (Union[int, str]): The unique ID (primary key) of the model to retrieve.
         table_name (str): The name of the table/collection where the model is stored.
+        lazy (bool): Whether to return a lazy model proxy (see 'ModelProxy') instead of
+                     the model. Defaults to False.
 
     Returns:
         Optional[dict[str, Any]]: The dictionary containing the model data, or None if the model is not found.
@@ -1732,45 +2956,43 @@ def get_entry(
         Exception: If an exception is caught while accessing or reading the table file.
     """
 
-    try:
-        _ensure_table_json(table_name=table_name)
-
-        entry_id_str: str = str(id_)
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
-
-        table_data: dict[str, Any] = read_file_json(file=file)
+            entry_id_str: str = str(id_)
 
-        entry: Optional[dict[str, Any]] = table_data["entries"]["entries"].get(entry_id_str)
+            entry: Optional[dict[str, Any]] = _get_table_entries(
+                ids=[entry_id_str],
+                table_name=table_name,
+            ).get(entry_id_str)
 
-        if not exists(value=entry):
-            log_info(message=f"Entry with ID '{entry_id_str}' not found in '{table_name}' table")
+            if not exists(value=entry):
+                log_info(message=f"Entry with ID '{entry_id_str}' not found in '{table_name}' table")
 
-            return None
+                return None
 
-        log_info(message=f"Successfully retrieved entry '{entry_id_str}' from '{table_name}' table")
+            log_info(message=f"Successfully retrieved entry '{entry_id_str}' from '{table_name}' table")
 
-        model_type: str = entry["metadata"]["type"]
+            model_type: str = entry["metadata"]["type"]
 
-        model: Model = get_model(
-            type_=model_type,
-            **flatten_dictionary(dictionary=entry),
-        )
+            model: Model = _get_entry_model(
+                entry=entry,
+                lazy=lazy,
+            )
 
-        dispatch(
-            event=_get_get_event(model_type=model_type),
-            namespace=GLOBAL_NAMESPACE,
-            **{model_type.lower(): model},
-        )
+            dispatch_lean(
+                event=_get_get_event(model_type=model_type),
+                namespace=GLOBAL_NAMESPACE,
+                **{model_type.lower(): model},
+            )
 
-        return model
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to get entry '{id_}' from '{table_name}' table: {e}"
-        )
-        raise e
+            return model
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to get entry '{id_}' from '{table_name}' table: {e}"
+            )
+            raise e
 
 
 def get_entry_by_key(
@@ -1795,21 +3017,309 @@ def get_entry_by_key(
         Exception: If an exception is caught while accessing or reading the table file.
     """
 
+    with _get_table_lock(table_name=table_name):
+        try:
+            return get_entry(
+                id_=search_string(
+                    pattern=PATTERNS["MODEL_ID"],
+                    string=key,
+                ),
+                table_name=table_name,
+            )
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to get entry '{key}' from '{table_name}' table: {e}"
+            )
+            raise e
+
+
+def get_entries_page(
+    table_name: str,
+    limit: int = 50,
+    offset: int = 0,
+    order_by: Optional[str] = None,
+    lazy: bool = False,
+) -> dict[str, Any]:
+    """
+    Retrieves a single page of models from a specified table.
+
+    Only the models on the requested page are created. A successful retrieval dispatches
+    the '..._PAGE_RETRIEVED' notification event, allowing views to render the first page
+    right away and request further pages as they are needed.
+
+    Args:
+        table_name (str): The name of the table/collection from which to retrieve the page.
+        limit (int): The maximum number of models on the page. Defaults to 50.
+        offset (int): The number of models to skip. Defaults to 0.
+        order_by (Optional[str]): The field to order by, prefixed with '-' for descending
+                                  order. Defaults to None (insertion order).
+        lazy (bool): Whether to return lazy model proxies (see 'ModelProxy') instead of
+                     models. Defaults to False.
+
+    Returns:
+        dict[str, Any]: The page, with the 'entries' (list of models), 'has_more', 'limit',
+                        'next_offset' and 'offset' keys.
+
+    Raises:
+        Exception: If an exception is caught while accessing or reading the table file.
+    """
+
+    with _get_table_lock(table_name=table_name):
+        try:
+            _ensure_table_json(table_name=table_name)
+
+            entries: list[dict[str, Any]] = list(
+                _iter_ordered_table_entries(
+                    limit=limit + 1,
+                    offset=offset,
+                    order_by=order_by,
+                    table_name=table_name,
+                )
+            )
+
+            models: list[Model] = [
+                _get_entry_model(
+                    entry=entry,
+                    lazy=lazy,
+                )
+                for entry in entries[:limit]
+            ]
+
+            page: dict[str, Any] = {
+                "entries": models,
+                "has_more": len(entries) > limit,
+                "limit": limit,
+                "next_offset": offset + len(models),
+                "offset": offset,
+            }
+
+            log_info(
+                message=f"Successfully retrieved {len(models)} entries from '{table_name}' table, starting at offset {offset}"
+            )
+
+            if len(models) <= 0:
+                return page
+
+            model_type: str = models[0].type_
+
+            dispatch_lean(
+                event=_get_page_event(model_type=model_type),
+                has_more=page["has_more"],
+                namespace=GLOBAL_NAMESPACE,
+                next_offset=page["next_offset"],
+                offset=offset,
+                **{pluralize_word(word=model_type.lower()): models},
+            )
+
+            return page
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to get page of entries from '{table_name}' table: {e}"
+            )
+            raise e
+
+
+def get_storage_backend() -> str:
+    """
+    Returns the name of the configured storage backend.
+
+    The backend is read from the "storage.backend" config value. "json" rewrites the
+    whole table file on every write, "journal" appends the changes to a journal file
+    next to the table file and only periodically rewrites the table file. "jsonl" stores
+    one entry per line with an offset index, so that single entries can be read without
+    decoding the whole table. "sqlite" stores all tables in a single SQLite database.
+
+    Args:
+        None
+
+    Returns:
+        str: The name of the storage backend.
+    """
+
+    return get_config_value(
+        default="json",
+        key="storage.backend",
+    )
+
+
+def get_table_cache_statistics() -> dict[str, Any]:
+    """
+    Returns the hit, miss, invalidation and write counters of the table cache.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Any]: A copy of the counters, extended by the number of cached tables
+                        and the hit ratio of all reads served so far.
+    """
+
+    reads: int = TABLE_CACHE_STATISTICS["hits"] + TABLE_CACHE_STATISTICS["misses"]
+
+    return {
+        **TABLE_CACHE_STATISTICS,
+        "hit_ratio": TABLE_CACHE_STATISTICS["hits"] / reads if reads > 0 else 0.0,
+        "tables": len(TABLE_CACHE),
+    }
+
+
+def iter_entries(
+    table_name: str,
+    batch_size: int = 100,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    lazy: bool = False,
+) -> Iterator[list[Model]]:
+    """
+    Iterates over the models of a specified table in batches.
+
+    Models are only created for the batch currently being consumed. Unlike
+    'get_all_entries', no notification events are dispatched.
+
+    Args:
+        table_name (str): The name of the table/collection to iterate over.
+        batch_size (int): The maximum number of models per batch. Defaults to 100.
+        offset (int): The number of models to skip. Defaults to 0.
+        limit (Optional[int]): The maximum number of models to yield in total.
+                               Defaults to None (all models).
+        order_by (Optional[str]): The field to order by, prefixed with '-' for descending
+                                  order. Defaults to None (insertion order).
+        lazy (bool): Whether to yield lazy model proxies (see 'ModelProxy') instead of
+                     models. Defaults to False.
+
+    Yields:
+        list[Model]: The next batch of models.
+
+    Raises:
+        ValueError: If 'batch_size' is not positive.
+        Exception: If an exception is caught while accessing or reading the table file.
+    """
+
+    if batch_size <= 0:
+        raise ValueError(f"Batch size must be positive, got {batch_size}")
+
     try:
-        return get_entry(
-            id_=search_string(
-                pattern=PATTERNS["MODEL_ID"],
-                string=key,
-            ),
+        _ensure_table_json(table_name=table_name)
+
+        entries: Iterator[dict[str, Any]] = _iter_ordered_table_entries(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
             table_name=table_name,
         )
+
+        while batch := list(
+            itertools.islice(
+                entries,
+                batch_size,
+            )
+        ):
+            yield [
+                _get_entry_model(
+                    entry=entry,
+                    lazy=lazy,
+                )
+                for entry in batch
+            ]
     except Exception as e:
         log_error(
-            message=f"Caught an exception while attempting to get entry '{key}' from '{table_name}' table: {e}"
+            message=f"Caught an exception while attempting to iterate over entries of '{table_name}' table: {e}"
         )
         raise e
 
 
+def migrate_tables_to_sqlite() -> list[str]:
+    """
+    Imports all JSON tables in the data directory into the SQLite database.
+
+    After the migration, the "sqlite" backend can be selected by setting the
+    "storage.backend" config value to "sqlite". The JSON tables are left untouched.
+
+    Args:
+        None
+
+    Returns:
+        list[str]: The names of the imported tables.
+
+    Raises:
+        Exception: If an exception is caught while importing a table.
+    """
+
+    try:
+        migrated: list[str] = migrate_json_tables_to_sqlite(data_dir=DATA_DIR)
+
+        clear_table_cache()
+
+        log_info(message=f"Successfully migrated {len(migrated)} tables to SQLite: {migrated}")
+
+        return migrated
+    except Exception as e:
+        log_error(message=f"Caught an exception while attempting to migrate tables to SQLite: {e}")
+        raise e
+
+
+def register_storage_backend(
+    load: Callable[..., Optional[dict[str, Any]]],
+    name: str,
+    save: Callable[..., None],
+    signature: Optional[Callable[..., Optional[tuple[Any, ...]]]] = None,
+    exists_: Optional[Callable[..., bool]] = None,
+    get_entries: Optional[Callable[..., dict[str, dict[str, Any]]]] = None,
+    iter_entries: Optional[Callable[..., Iterator[tuple[str, dict[str, Any]]]]] = None,
+    filter_entries_: Optional[Callable[..., Optional[dict[str, dict[str, Any]]]]] = None,
+) -> None:
+    """
+    Registers a storage backend that can then be selected via the "storage.backend" config value.
+
+    Args:
+        load (Callable[..., Optional[dict[str, Any]]]): Called with 'file' and returning the
+                                                        table data dictionary, or None if
+                                                        the table has no content.
+        name (str): The name of the backend.
+        save (Callable[..., None]): Called with 'changes', 'file' and 'table_data' and
+                                    persisting the passed table data.
+        signature (Optional[Callable[..., Optional[tuple[Any, ...]]]]): Called with 'file' and
+                                    returning a value that changes whenever the table changes,
+                                    or None if the table does not exist. Defaults to the
+                                    signature of the table file and its journal.
+        exists_ (Optional[Callable[..., bool]]): Called with 'file' and returning whether
+                                    the table has content, without loading it.
+        get_entries (Optional[Callable[..., dict[str, dict[str, Any]]]]): Called with 'file'
+                                    and 'ids' and returning only the requested entries.
+        iter_entries (Optional[Callable[..., Iterator[tuple[str, dict[str, Any]]]]]): Called
+                                    with 'file', 'limit' and 'offset' and yielding the ID and
+                                    entry of every entry within the window.
+        filter_entries_ (Optional[Callable[..., Optional[dict[str, dict[str, Any]]]]]): Called
+                                    with 'criteria' and 'file' and returning the entries that
+                                    can match the criteria, keyed by ID, or None if it cannot
+                                    filter on any of them.
+
+    Returns:
+        None
+    """
+
+    STORAGE_BACKENDS[name] = {
+        "load": load,
+        "save": save,
+    }
+
+    for (
+        key,
+        function,
+    ) in (
+        ("exists", exists_),
+        ("filter_entries", filter_entries_),
+        ("get_entries", get_entries),
+        ("iter_entries", iter_entries),
+        ("signature", signature),
+    ):
+        if exists(value=function):
+            STORAGE_BACKENDS[name][key] = function
+
+    clear_table_cache()
+
+
 def update_entry(
     model: Model,
     table_name: str,
@@ -1835,59 +3345,68 @@ def update_entry(
         Exception: If an exception is caught while accessing, reading, or writing the table file.
     """
 
-    try:
-        if not exists(value=model.id):
-            raise ValueError("The provided model must contain an 'id' key for update operations.")
-
-        _ensure_table_json(table_name=table_name)
+    with _get_table_lock(table_name=table_name):
+        try:
+            if not exists(value=model.id):
+                raise ValueError("The provided model must contain an 'id' key for update operations.")
 
-        entry_id_str: str = str(model.id)
+            _ensure_table_json(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            entry_id_str: str = str(model.id)
 
-        table_data: dict[str, Any] = read_file_json(file=file)
+            table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        all_entries: dict[str, Any] = table_data["entries"]["entries"]
+            all_entries: dict[str, Any] = table_data["entries"]["entries"]
 
-        if entry_id_str not in all_entries:
-            log_info(
-                message=f"Attempted to update entry with ID '{entry_id_str}' in '{table_name}' table, but it was not found."
+            if entry_id_str not in all_entries:
+                log_info(
+                    message=f"Attempted to update entry with ID '{entry_id_str}' in '{table_name}' table, but it was not found."
+                )
+                return None
+
+            all_entries[entry_id_str] = model.to_json_dict()
+
+            _save_table_data(
+                changes=[
+                    {
+                        "entry": all_entries[entry_id_str],
+                        "id": entry_id_str,
+                        "op": "update",
+                    }
+                ],
+                table_data=table_data,
+                table_name=table_name,
             )
-            return None
-
-        all_entries[entry_id_str] = model.to_json_dict()
 
-        _save_table_data(
-            table_data=table_data,
-            table_name=table_name,
-        )
+            log_info(message=f"Successfully updated entry '{entry_id_str}' in '{table_name}' table")
 
-        log_info(message=f"Successfully updated entry '{entry_id_str}' in '{table_name}' table")
+            model_type: str = model.to_json_dict()["metadata"]["type"]
 
-        model_type: str = model.to_json_dict()["metadata"]["type"]
-
-        dispatch(
-            event=_get_update_event(model_type=model_type),
-            namespace=GLOBAL_NAMESPACE,
-            **{
-                model_type.lower(): get_model(
-                    type_=model_type,
-                    **model.to_json_dict(),
-                ),
-            },
-        )
+            if has_subscribers(
+                event=_get_update_event(model_type=model_type),
+                namespace=GLOBAL_NAMESPACE,
+            ):
+                dispatch_lean(
+                    event=_get_update_event(model_type=model_type),
+                    namespace=GLOBAL_NAMESPACE,
+                    **{
+                        model_type.lower(): get_model(
+                            type_=model_type,
+                            **model.to_json_dict(),
+                        ),
+                    },
+                )
 
-        return get_model(
-            type_=model_type,
-            **model.to_json_dict(),
-        )
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to update entry '{model.id}' in '{table_name}' table: {e}"
-        )
-        raise e
+            return get_model(
+                type_=model_type,
+                **model.to_json_dict(),
+            )
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to update entry '{model.id}' in '{table_name}' table: {e}"
+            )
+            _invalidate_table_cache(table_name=table_name)
+            raise e
 
 
 def update_entries(
@@ -1916,84 +3435,96 @@ def update_entries(
         Exception: If an exception is caught while accessing, reading, or writing the table file.
     """
 
-    try:
-        if not exists(value=models):
-            log_info(message=f"Attempted to update 0 entries in '{table_name}' table. Aborting...")
-            return []
+    with _get_table_lock(table_name=table_name):
+        try:
+            if not exists(value=models):
+                log_info(message=f"Attempted to update 0 entries in '{table_name}' table. Aborting...")
+                return []
 
-        _ensure_table_json(table_name=table_name)
+            _ensure_table_json(table_name=table_name)
 
-        file: Path = DATA_DIR / (
-            f"{table_name}.json" if not table_name.endswith(".json") else table_name
-        )
+            table_data: dict[str, Any] = _load_table_data(table_name=table_name)
 
-        table_data: dict[str, Any] = read_file_json(file=file)
+            all_entries: dict[str, Any] = table_data["entries"]["entries"]
 
-        all_entries: dict[str, Any] = table_data["entries"]["entries"]
+            updated_models: list[Model] = []
 
-        updated_models: list[Model] = []
+            changes: list[dict[str, Any]] = []
 
-        model_type: str = ""
+            model_type: str = ""
 
-        for model in models:
-            if not exists(value=model.id):
-                raise ValueError("A model in the batch update list must contain an 'id' key.")
+            for model in models:
+                if not exists(value=model.id):
+                    raise ValueError("A model in the batch update list must contain an 'id' key.")
 
-            model_id_str: str = str(model.id)
+                model_id_str: str = str(model.id)
 
-            if model_id_str not in all_entries:
-                log_info(
-                    message=f"Model with ID '{model_id_str}' skipped during batch update for '{table_name}' table, as it was not found."
-                )
-                continue
+                if model_id_str not in all_entries:
+                    log_info(
+                        message=f"Model with ID '{model_id_str}' skipped during batch update for '{table_name}' table, as it was not found."
+                    )
+                    continue
 
-            all_entries[model_id_str] = model.to_json_dict()
+                all_entries[model_id_str] = model.to_json_dict()
 
-            updated_models.append(model)
+                changes.append(
+                    {
+                        "entry": all_entries[model_id_str],
+                        "id": model_id_str,
+                        "op": "update",
+                    }
+                )
 
-            if exists(value=model_type):
-                continue
+                updated_models.append(model)
 
-            model_type = model.type_
+                if exists(value=model_type):
+                    continue
 
-        count_updated: int = len(updated_models)
+                model_type = model.type_
 
-        if count_updated == 0:
-            log_info(message=f"No existing models were updated in '{table_name}' table.")
+            count_updated: int = len(updated_models)
 
-            return []
+            if count_updated == 0:
+                log_info(message=f"No existing models were updated in '{table_name}' table.")
 
-        _save_table_data(
-            table_data=table_data,
-            table_name=table_name,
-        )
+                return []
+
+            _save_table_data(
+                changes=changes,
+                table_data=table_data,
+                table_name=table_name,
+            )
 
-        log_info(message=f"Successfully updated {count_updated} models in '{table_name}' table.")
+            log_info(message=f"Successfully updated {count_updated} models in '{table_name}' table.")
 
-        if exists(value=model_type):
-            dispatch(
+            if exists(value=model_type) and has_subscribers(
                 event=_get_bulk_update_event(model_type=model_type),
                 namespace=GLOBAL_NAMESPACE,
-                **{
-                    pluralize_word(word=model_type).lower(): [
-                        get_model(
-                            type_=model_type,
-                            **model.to_json_dict(),
-                        )
-                        for model in updated_models
-                    ],
-                },
-            )
+            ):
+                dispatch_lean(
+                    event=_get_bulk_update_event(model_type=model_type),
+                    namespace=GLOBAL_NAMESPACE,
+                    **{
+                        pluralize_word(word=model_type).lower(): [
+                            get_model(
+                                type_=model_type,
+                                **model.to_json_dict(),
+                            )
+                            for model in updated_models
+                        ],
+                    },
+                )
 
-        return [
-            get_model(
-                type_=model_type,
-                **model.to_json_dict(),
+            return [
+                get_model(
+                    type_=model_type,
+                    **model.to_json_dict(),
+                )
+                for model in updated_models
+            ]
+        except Exception as e:
+            log_error(
+                message=f"Caught an exception while attempting to update batch models in '{table_name}' table: {e}"
             )
-            for model in updated_models
-        ]
-    except Exception as e:
-        log_error(
-            message=f"Caught an exception while attempting to update batch models in '{table_name}' table: {e}"
-        )
-        raise e
+            _invalidate_table_cache(table_name=table_name)
+            raise e
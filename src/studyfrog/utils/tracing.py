@@ -0,0 +1,591 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-16
+Description: In-memory tracing of the dispatcher: call counts, latency histograms and the call tree of nested dispatches.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, Final, Optional
+
+from studyfrog.constants.directories import LOGS_DIR
+from studyfrog.utils.common import get_now_str
+from studyfrog.utils.files import write_file_json
+from studyfrog.utils.logging import log_error, log_info
+
+
+# ---------- Exports ---------- #
+
+__all__: Final[list[str]] = [
+    "begin_dispatch_span",
+    "begin_subscriber_span",
+    "disable_dispatch_tracing",
+    "dump_dispatch_trace",
+    "enable_dispatch_tracing",
+    "end_dispatch_span",
+    "end_subscriber_span",
+    "get_dispatch_trace",
+    "reset_dispatch_trace",
+]
+
+
+# ---------- Constants ---------- #
+
+__NAME__: Final[str] = "utils.tracing"
+
+BUCKETS_PER_OCTAVE: Final[int] = 4
+
+EVENTS: Final[dict[str, dict[str, Any]]] = {}
+
+LOCK: Final[threading.Lock] = threading.Lock()
+
+PERCENTILES: Final[tuple[int, ...]] = (
+    50,
+    95,
+    99,
+)
+
+STACKS: Final[threading.local] = threading.local()
+
+SUBSCRIBERS: Final[dict[tuple[str, str], dict[str, Any]]] = {}
+
+TRACE: Final[dict[str, Any]] = {
+    "enabled": False,
+    "sample_rate": 1.0,
+}
+
+TREE: Final[dict[str, dict[str, Any]]] = {}
+
+
+# ---------- Helper Functions ---------- #
+
+
+def _get_bucket(duration: float) -> int:
+    """
+    Returns the histogram bucket of a duration.
+
+    Buckets grow logarithmically, with four buckets per doubling of the duration in
+    microseconds, so every bucket spans roughly 19% of its lower bound.
+
+    Args:
+        duration (float): The duration in seconds.
+
+    Returns:
+        int: The index of the bucket.
+    """
+
+    microseconds: float = duration * 1_000_000
+
+    if microseconds <= 1:
+        return 0
+
+    return math.ceil(math.log2(microseconds) * BUCKETS_PER_OCTAVE)
+
+
+def _get_percentile(
+    statistics: dict[str, Any],
+    percentile: int,
+) -> float:
+    """
+    Returns the approximate percentile (in milliseconds) of the durations recorded in a histogram.
+
+    The percentile is the upper bound of the bucket it falls into, capped by the
+    longest duration recorded.
+
+    Args:
+        statistics (dict[str, Any]): The recorded statistics, with their 'buckets'.
+        percentile (int): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile in milliseconds.
+    """
+
+    rank: int = max(
+        1,
+        math.ceil(statistics["count"] * percentile / 100),
+    )
+
+    seen: int = 0
+
+    for bucket in sorted(statistics["buckets"]):
+        seen += statistics["buckets"][bucket]
+
+        if seen >= rank:
+            return min(
+                2 ** (bucket / BUCKETS_PER_OCTAVE) / 1000,
+                statistics["max"] * 1000,
+            )
+
+    return statistics["max"] * 1000
+
+
+def _get_stack() -> list[dict[str, Any]]:
+    """
+    Returns the stack of open dispatch spans of the current thread.
+
+    Args:
+        None
+
+    Returns:
+        list[dict[str, Any]]: The open dispatch spans, innermost last.
+    """
+
+    stack: Optional[list[dict[str, Any]]] = getattr(
+        STACKS,
+        "stack",
+        None,
+    )
+
+    if stack is None:
+        stack = []
+
+        STACKS.stack = stack
+
+    return stack
+
+
+def _get_statistics() -> dict[str, Any]:
+    """
+    Returns empty statistics to record durations in.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Any]: The statistics, with their 'buckets', 'count', 'max' and 'total'.
+    """
+
+    return {
+        "buckets": {},
+        "count": 0,
+        "max": 0.0,
+        "total": 0.0,
+    }
+
+
+def _get_summary(statistics: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the summary (in milliseconds) of recorded statistics.
+
+    Args:
+        statistics (dict[str, Any]): The recorded statistics.
+
+    Returns:
+        dict[str, Any]: The call count, the total, mean and longest duration and the percentiles.
+    """
+
+    summary: dict[str, Any] = {
+        "count": statistics["count"],
+        "max_ms": statistics["max"] * 1000,
+        "mean_ms": statistics["total"] * 1000 / max(statistics["count"], 1),
+        "total_ms": statistics["total"] * 1000,
+    }
+
+    for percentile in PERCENTILES:
+        summary[f"p{percentile}_ms"] = _get_percentile(
+            percentile=percentile,
+            statistics=statistics,
+        )
+
+    return summary
+
+
+def _get_tree_node() -> dict[str, Any]:
+    """
+    Returns an empty node of the call tree.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Any]: The node, with its 'children', 'count', 'max' and 'total'.
+    """
+
+    return {
+        "children": {},
+        "count": 0,
+        "max": 0.0,
+        "total": 0.0,
+    }
+
+
+def _get_tree_summary(nodes: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Returns the summary (in milliseconds) of the nodes of the call tree, slowest first.
+
+    Args:
+        nodes (dict[str, dict[str, Any]]): The nodes, by event or subscriber name.
+
+    Returns:
+        list[dict[str, Any]]: The summarized nodes and their summarized children.
+    """
+
+    return [
+        {
+            "children": _get_tree_summary(nodes=node["children"]),
+            "count": node["count"],
+            "max_ms": node["max"] * 1000,
+            "name": name,
+            "total_ms": node["total"] * 1000,
+        }
+        for (
+            name,
+            node,
+        ) in sorted(
+            nodes.items(),
+            key=lambda item: item[1]["total"],
+            reverse=True,
+        )
+    ]
+
+
+def _record(
+    duration: float,
+    node: Optional[dict[str, Any]],
+    statistics: dict[str, Any],
+) -> None:
+    """
+    Records a duration in statistics and the matching node of the call tree.
+
+    Args:
+        duration (float): The duration in seconds.
+        node (Optional[dict[str, Any]]): The node of the call tree. Defaults to None.
+        statistics (dict[str, Any]): The statistics to record the duration in.
+
+    Returns:
+        None
+    """
+
+    bucket: int = _get_bucket(duration=duration)
+
+    with LOCK:
+        statistics["buckets"][bucket] = statistics["buckets"].get(bucket, 0) + 1
+        statistics["count"] += 1
+        statistics["max"] = max(
+            statistics["max"],
+            duration,
+        )
+        statistics["total"] += duration
+
+        if node is None:
+            return
+
+        node["count"] += 1
+        node["max"] = max(
+            node["max"],
+            duration,
+        )
+        node["total"] += duration
+
+
+# ---------- Functions ---------- #
+
+
+def begin_dispatch_span(event: str) -> dict[str, Any]:
+    """
+    Opens the span of a dispatch on the current thread.
+
+    Whether a dispatch is sampled is decided once per outermost dispatch: nested
+    dispatches follow their parent, so sampled call trees are always complete.
+
+    Args:
+        event (str): The (uppercased) event being dispatched.
+
+    Returns:
+        dict[str, Any]: The span, to pass to 'begin_subscriber_span' and 'end_dispatch_span'.
+    """
+
+    stack: list[dict[str, Any]] = _get_stack()
+
+    if stack:
+        parent: dict[str, Any] = stack[-1]
+        sampled: bool = parent["sampled"]
+        nodes: dict[str, dict[str, Any]] = (
+            parent["subscriber"]["children"] if parent["subscriber"] is not None else TREE
+        )
+    else:
+        sampled = TRACE["sample_rate"] >= 1 or random.random() < TRACE["sample_rate"]
+        nodes = TREE
+
+    span: dict[str, Any] = {
+        "event": event,
+        "node": None,
+        "sampled": sampled,
+        "start": time.perf_counter(),
+        "subscriber": None,
+    }
+
+    if sampled:
+        with LOCK:
+            span["node"] = nodes.setdefault(
+                event,
+                _get_tree_node(),
+            )
+
+    stack.append(span)
+
+    return span
+
+
+def begin_subscriber_span(
+    name: str,
+    span: dict[str, Any],
+) -> float:
+    """
+    Marks the call of a subscribed function within a dispatch span.
+
+    Dispatches made by the function are recorded as its children in the call tree.
+
+    Args:
+        name (str): The name of the subscribed function.
+        span (dict[str, Any]): The span of the dispatch.
+
+    Returns:
+        float: The start of the call, to pass to 'end_subscriber_span'.
+    """
+
+    with LOCK:
+        span["subscriber"] = span["node"]["children"].setdefault(
+            name,
+            _get_tree_node(),
+        )
+
+    return time.perf_counter()
+
+
+def disable_dispatch_tracing() -> None:
+    """
+    Disables the tracing of dispatches. Recorded statistics are kept.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    TRACE["enabled"] = False
+
+    log_info(
+        message="Disabled dispatch tracing.",
+        name=f"{__NAME__}.disable_dispatch_tracing",
+    )
+
+
+def dump_dispatch_trace(file: Optional[Path] = None) -> Optional[Path]:
+    """
+    Writes the report of the recorded dispatches (see 'get_dispatch_trace') to a JSON file.
+
+    Args:
+        file (Optional[Path]): The file to write to. Defaults to None, in which case a
+                               timestamped file in the logs directory is used.
+
+    Returns:
+        Optional[Path]: The file written to, or None if writing failed.
+    """
+
+    if file is None:
+        file = LOGS_DIR / f"dispatch_trace_{get_now_str(format='%Y%m%d_%H%M%S')}.json"
+
+    try:
+        if not write_file_json(
+            data=get_dispatch_trace(),
+            file=file,
+        ):
+            return None
+
+        log_info(
+            message=f"Dumped the dispatch trace to '{file}'.",
+            name=f"{__NAME__}.dump_dispatch_trace",
+        )
+
+        return file
+    except Exception as e:
+        log_error(
+            message=f"Caught an exception while dumping the dispatch trace to '{file}': {e}",
+            name=f"{__NAME__}.dump_dispatch_trace",
+        )
+
+        return None
+
+
+def enable_dispatch_tracing(sample_rate: float = 1.0) -> None:
+    """
+    Enables the tracing of dispatches.
+
+    Args:
+        sample_rate (float): The share of outermost dispatches to record, between 0 and 1.
+                             Defaults to 1.0 (every dispatch).
+
+    Returns:
+        None
+    """
+
+    TRACE["sample_rate"] = min(
+        max(
+            sample_rate,
+            0.0,
+        ),
+        1.0,
+    )
+    TRACE["enabled"] = True
+
+    log_info(
+        message=f"Enabled dispatch tracing (sample rate: {TRACE['sample_rate']}).",
+        name=f"{__NAME__}.enable_dispatch_tracing",
+    )
+
+
+def end_dispatch_span(span: dict[str, Any]) -> None:
+    """
+    Closes the span of a dispatch and records its duration, if sampled.
+
+    Args:
+        span (dict[str, Any]): The span of the dispatch.
+
+    Returns:
+        None
+    """
+
+    stack: list[dict[str, Any]] = _get_stack()
+
+    if stack and stack[-1] is span:
+        stack.pop()
+
+    if not span["sampled"]:
+        return
+
+    with LOCK:
+        statistics: dict[str, Any] = EVENTS.setdefault(
+            span["event"],
+            _get_statistics(),
+        )
+
+    _record(
+        duration=time.perf_counter() - span["start"],
+        node=span["node"],
+        statistics=statistics,
+    )
+
+
+def end_subscriber_span(
+    name: str,
+    span: dict[str, Any],
+    start: float,
+) -> None:
+    """
+    Records the duration of the call of a subscribed function within a dispatch span.
+
+    Args:
+        name (str): The name of the subscribed function.
+        span (dict[str, Any]): The span of the dispatch.
+        start (float): The start of the call, as returned by 'begin_subscriber_span'.
+
+    Returns:
+        None
+    """
+
+    node: Optional[dict[str, Any]] = span["subscriber"]
+
+    span["subscriber"] = None
+
+    with LOCK:
+        statistics: dict[str, Any] = SUBSCRIBERS.setdefault(
+            (
+                span["event"],
+                name,
+            ),
+            _get_statistics(),
+        )
+
+    _record(
+        duration=time.perf_counter() - start,
+        node=node,
+        statistics=statistics,
+    )
+
+
+def get_dispatch_trace() -> dict[str, Any]:
+    """
+    Returns the report of the recorded dispatches.
+
+    Events and their subscribed functions are listed slowest (by total duration)
+    first, with their call count and their total, mean, longest and p50/p95/p99
+    durations in milliseconds. The call tree lists nested dispatches below the
+    subscribed function that made them.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, Any]: The report, with its 'events' and 'tree'.
+    """
+
+    with LOCK:
+        events: list[dict[str, Any]] = [
+            {
+                **_get_summary(statistics=statistics),
+                "event": event,
+                "subscribers": [
+                    {
+                        **_get_summary(statistics=subscriber),
+                        "name": name,
+                    }
+                    for (
+                        (
+                            subscribed_event,
+                            name,
+                        ),
+                        subscriber,
+                    ) in SUBSCRIBERS.items()
+                    if subscribed_event == event
+                ],
+            }
+            for (
+                event,
+                statistics,
+            ) in EVENTS.items()
+        ]
+
+        tree: list[dict[str, Any]] = _get_tree_summary(nodes=TREE)
+
+    for event in events:
+        event["subscribers"].sort(
+            key=lambda subscriber: subscriber["total_ms"],
+            reverse=True,
+        )
+
+    events.sort(
+        key=lambda event: event["total_ms"],
+        reverse=True,
+    )
+
+    return {
+        "enabled": TRACE["enabled"],
+        "events": events,
+        "sample_rate": TRACE["sample_rate"],
+        "tree": tree,
+    }
+
+
+def reset_dispatch_trace() -> None:
+    """
+    Discards all recorded statistics and the call tree.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    with LOCK:
+        EVENTS.clear()
+        SUBSCRIBERS.clear()
+        TREE.clear()
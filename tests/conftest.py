@@ -18,10 +18,14 @@ if str(SRC_ROOT) not in sys.path:
 def reset_dispatcher_state():
     from studyfrog.utils import dispatcher
 
+    dispatcher.OWNERS.clear()
     dispatcher.SUBSCRIBERS.clear()
+    dispatcher.SUBSCRIPTIONS.clear()
     dispatcher.UUIDS.clear()
 
     yield
 
+    dispatcher.OWNERS.clear()
     dispatcher.SUBSCRIBERS.clear()
+    dispatcher.SUBSCRIPTIONS.clear()
     dispatcher.UUIDS.clear()
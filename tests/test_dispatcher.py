@@ -57,3 +57,293 @@ def test_dispatch_returns_warning_for_unknown_event() -> None:
 
     assert result["status"] == "WARNING"
     assert "not found" in result["message"]
+
+
+def test_subscriptions_are_kept_sorted_across_subscribe_and_unsubscribe() -> None:
+    from studyfrog.utils.dispatcher import SUBSCRIPTIONS
+
+    def first() -> None: ...
+
+    def second() -> None: ...
+
+    def third() -> None: ...
+
+    first_id = subscribe(event="sorted", function=first, namespace="test", persistent=True, priority=5)
+    subscribe(event="sorted", function=second, namespace="test", persistent=True, priority=5)
+    third_id = subscribe(event="sorted", function=third, namespace="test", persistent=True, priority=50)
+
+    assert [subscription["function"]["name"] for subscription in SUBSCRIPTIONS["SORTED"]["TEST"]] == [
+        "third",
+        "first",
+        "second",
+    ]
+
+    unsubscribe(third_id)
+    unsubscribe(first_id)
+
+    assert [subscription["function"]["name"] for subscription in SUBSCRIPTIONS["SORTED"]["TEST"]] == ["second"]
+
+    dispatch(event="sorted", namespace="test")
+
+    assert "SORTED" in SUBSCRIPTIONS
+
+
+def test_dispatch_lean_calls_subscribers_without_report() -> None:
+    from studyfrog.utils.dispatcher import SUBSCRIPTIONS, dispatch_lean
+
+    calls: list[tuple[int, str]] = []
+
+    def handler(value: int, label: str) -> str:
+        calls.append((value, label))
+        return "ignored"
+
+    def failing_handler(value: int, label: str) -> None:
+        raise RuntimeError(label)
+
+    subscribe(event="lean", function=failing_handler, namespace="test", priority=10)
+    subscribe(event="lean", function=handler, namespace="test")
+
+    assert dispatch_lean(1, event="lean", namespace="test", label="first") is None
+    assert dispatch_lean(2, event="lean", namespace="test", label="second") is None
+    assert dispatch_lean(event="missing", namespace="test") is None
+
+    assert calls == [(1, "first")]
+    assert "LEAN" not in SUBSCRIPTIONS
+
+
+def test_dispatch_async_marshals_callbacks_to_the_scheduling_loop() -> None:
+    import threading
+
+    from studyfrog.utils.dispatcher import (
+        dispatch_async,
+        dispatch_lean,
+        process_dispatch_callbacks,
+        schedule_dispatch_callbacks,
+        shutdown_dispatch_executor,
+    )
+
+    class Widget:
+        def __init__(self) -> None:
+            self.scheduled: list[int] = []
+
+        def after(self, interval, function) -> None:
+            self.scheduled.append(interval)
+
+    threads: dict[str, str] = {}
+    results: list[dict] = []
+
+    def worker(value: int) -> int:
+        threads["worker"] = threading.current_thread().name
+
+        dispatch_lean(event="async_done", namespace="test", value=value)
+
+        return value * 2
+
+    def notified(value: int) -> None:
+        threads["notified"] = threading.current_thread().name
+
+    subscribe(event="async_work", function=worker, namespace="test", persistent=True)
+    subscribe(event="async_done", function=notified, namespace="test", persistent=True)
+
+    widget = Widget()
+
+    try:
+        schedule_dispatch_callbacks(widget=widget, interval=10)
+
+        future = dispatch_async(event="async_work", namespace="test", callback=results.append, value=21)
+
+        assert future.result(timeout=5)["worker"][0]["result"] == 42
+        assert results == []
+        assert "notified" not in threads
+
+        process_dispatch_callbacks()
+
+        assert results[0]["worker"][0]["result"] == 42
+        assert threads["worker"] != threading.main_thread().name
+        assert threads["notified"] == threading.main_thread().name
+        assert widget.scheduled == [10]
+    finally:
+        shutdown_dispatch_executor()
+
+    future = dispatch_async(event="async_work", namespace="test", callback=results.append, value=1)
+
+    assert future.result(timeout=5)["worker"][0]["result"] == 2
+
+    shutdown_dispatch_executor()
+
+    assert results[-1]["worker"][0]["result"] == 2
+
+
+def test_batch_coalesces_calls_of_opted_in_subscribers() -> None:
+    from studyfrog.utils.dispatcher import batch, dispatch_lean
+
+    coalesced: list[dict] = []
+    immediate: list[int] = []
+
+    def on_added(**kwargs) -> None:
+        coalesced.append(kwargs)
+
+    def on_added_immediately(card: int, cards: list[int]) -> None:
+        immediate.append(card)
+
+    subscribe(event="card_added", function=on_added, namespace="test", persistent=True, coalesce=True)
+    subscribe(event="card_added", function=on_added_immediately, namespace="test", persistent=True)
+
+    with batch():
+        dispatch(event="card_added", namespace="test", card=1, cards=[1])
+
+        with batch():
+            dispatch_lean(event="card_added", namespace="test", card=2, cards=[2, 3])
+
+        assert coalesced == []
+
+        dispatch_lean(event="card_added", namespace="test", card=4, cards=[])
+
+    assert immediate == [1, 2, 4]
+    assert coalesced == [{"card": [1, 2, 4], "cards": [1, 2, 3]}]
+
+    dispatch_lean(event="card_added", namespace="test", card=5, cards=[5])
+
+    assert coalesced[-1] == {"card": [5], "cards": [5]}
+
+
+def test_coalescing_window_merges_dispatches(monkeypatch) -> None:
+    import time
+
+    from studyfrog.utils import config, dispatcher
+    from studyfrog.utils.dispatcher import COALESCED, dispatch_lean
+
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(config.CONFIG, "dispatcher", {"coalesce_window": 20})
+
+    calls: list[list[str]] = []
+
+    subscribe(
+        event="stack_updated",
+        function=lambda stack: calls.append(stack),
+        namespace="test",
+        coalesce=True,
+    )
+
+    # The window is read on subscribe, not on every dispatch
+    def fail_get_config_value(**kwargs):
+        raise AssertionError("config read on dispatch")
+
+    monkeypatch.setattr(dispatcher, "get_config_value", fail_get_config_value)
+
+    for key in ("STACK_1", "STACK_2", "STACK_1"):
+        dispatch_lean(event="stack_updated", namespace="test", stack=key)
+
+    deadline = time.monotonic() + 5
+
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert calls == [["STACK_1", "STACK_2", "STACK_1"]]
+    assert COALESCED == {}
+
+    dispatch_lean(event="stack_updated", namespace="test", stack="STACK_3")
+
+    time.sleep(0.1)
+
+    assert len(calls) == 1
+
+
+class _Widget:
+    def __init__(self) -> None:
+        self.alive = True
+        self.bindings: list = []
+
+    def bind(self, sequence, command, add) -> None:
+        self.bindings.append((sequence, command, add))
+
+    def destroy(self) -> None:
+        self.alive = False
+
+        for sequence, command, _ in self.bindings:
+            if sequence == "<Destroy>":
+                command(None)
+
+    def winfo_exists(self) -> bool:
+        return self.alive
+
+
+def test_weak_subscriptions_are_pruned_once_their_handler_is_collected() -> None:
+    import gc
+
+    from studyfrog.utils.dispatcher import UUIDS, get_subscription_leak_report
+
+    calls: list[int] = []
+
+    class Handler:
+        def on_event(self, value: int) -> None:
+            calls.append(value)
+
+    handler = Handler()
+
+    uuid = subscribe(
+        event="weak_event",
+        function=handler.on_event,
+        namespace="test",
+        persistent=True,
+        weak=True,
+    )
+
+    dispatch(event="weak_event", namespace="test", value=1)
+
+    del handler
+    gc.collect()
+
+    assert [entry["uuid"] for entry in get_subscription_leak_report()] == [uuid]
+
+    dispatch(event="weak_event", namespace="test", value=2)
+
+    assert calls == [1]
+    assert uuid not in UUIDS
+    assert get_subscription_leak_report() == []
+
+
+def test_owner_groups_are_unsubscribed_with_their_owner() -> None:
+    from studyfrog.utils.dispatcher import OWNERS, UUIDS, unsubscribe_owner
+
+    widget = _Widget()
+
+    widget_uuids = [
+        subscribe(event=event, function=lambda: None, namespace="test", owner=widget)
+        for event in ("first_event", "second_event")
+    ]
+    named_uuid = subscribe(event="first_event", function=lambda: None, namespace="test", owner="view")
+
+    assert len(widget.bindings) == 1
+
+    widget.destroy()
+
+    assert not any(uuid in UUIDS for uuid in widget_uuids)
+    assert named_uuid in UUIDS
+
+    assert unsubscribe_owner(owner="view") == 1
+    assert UUIDS == {}
+    assert OWNERS == {}
+
+
+def test_leak_report_lists_handlers_holding_destroyed_widgets() -> None:
+    from studyfrog.utils.dispatcher import get_subscription_leak_report, prune_subscriptions
+
+    widget = _Widget()
+
+    def on_event() -> None:
+        widget.winfo_exists()
+
+    uuid = subscribe(event="leaky_event", function=on_event, namespace="test", persistent=True)
+
+    assert get_subscription_leak_report() == []
+
+    widget.alive = False
+
+    report = get_subscription_leak_report()
+
+    assert [(entry["uuid"], entry["reason"]) for entry in report] == [
+        (uuid, "captured widget destroyed")
+    ]
+    assert prune_subscriptions() == 1
+    assert get_subscription_leak_report() == []
@@ -5,6 +5,7 @@ from studyfrog.utils.files import (
     does_file_exist,
     does_file_have_content,
     ensure_file,
+    get_backup_file,
     read_file_json,
     read_file_text,
     write_file_json,
@@ -41,3 +42,34 @@ def test_file_helpers_round_trip(tmp_path) -> None:
     payload = {"name": "StudyFrog", "kind": "test"}
     assert write_file_json(payload, json_file) is True
     assert read_file_json(json_file) == payload
+
+
+def test_atomic_write_keeps_previous_version_as_backup(tmp_path) -> None:
+    json_file = tmp_path / "data" / "sample.json"
+
+    assert write_file_json({"version": 1}, json_file, atomic=True, backup=True) is True
+    assert get_backup_file(json_file).exists() is False
+
+    assert write_file_json({"version": 2}, json_file, atomic=True, backup=True) is True
+
+    assert read_file_json(json_file) == {"version": 2}
+    assert read_file_json(get_backup_file(json_file)) == {"version": 1}
+    assert sorted(path.name for path in json_file.parent.iterdir()) == [
+        "sample.json",
+        "sample.json.bak",
+    ]
+
+
+def test_atomic_write_keeps_the_mode_of_the_replaced_file(tmp_path) -> None:
+    import stat
+
+    text_file = tmp_path / "data" / "sample.txt"
+
+    assert write_file_text("first", text_file) is True
+
+    text_file.chmod(0o644)
+
+    assert write_file_text("second", text_file, atomic=True) is True
+
+    assert read_file_text(text_file) == "second"
+    assert stat.S_IMODE(text_file.stat().st_mode) == 0o644
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import importlib
+import subprocess
+import sys
+
+from pathlib import Path
 
 import pytest
 
@@ -12,15 +16,58 @@ import pytest
         "studyfrog.constants.defaults",
         "studyfrog.models.factory",
         "studyfrog.models.models",
+        "studyfrog.models.proxies",
         "studyfrog.utils.common",
+        "studyfrog.utils.config",
         "studyfrog.utils.directories",
         "studyfrog.utils.dispatcher",
         "studyfrog.utils.files",
+        "studyfrog.utils.journal",
+        "studyfrog.utils.jsonl",
+        "studyfrog.utils.lazy",
         "studyfrog.utils.logging",
+        "studyfrog.utils.reference_cache",
+        "studyfrog.utils.rehearsal_buffer",
+        "studyfrog.utils.review_queue",
+        "studyfrog.utils.scheduler",
+        "studyfrog.utils.sqlite",
+        "studyfrog.utils.startup",
         "studyfrog.utils.storage",
+        "studyfrog.utils.tracing",
     ],
 )
 def test_core_modules_import(module_name: str) -> None:
     module = importlib.import_module(module_name)
 
     assert module is not None
+
+
+def test_importing_storage_does_not_load_the_gui() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, studyfrog.utils.storage; "
+            "print(sorted(m for m in sys.modules if 'tkinter' in m or m.startswith('studyfrog.gui')))",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1] / "src",
+        text=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_packages_resolve_exports_lazily() -> None:
+    import studyfrog.utils as utils
+
+    from studyfrog.utils.storage import get_entry
+
+    assert utils.get_entry is get_entry
+    assert "get_entry" in vars(utils)
+    assert "get_entry" in dir(utils)
+    assert utils.lazy.__name__ == "studyfrog.utils.lazy"
+
+    with pytest.raises(AttributeError):
+        utils.does_not_exist
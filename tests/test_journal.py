@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from studyfrog.models.factory import get_difficulty_model, get_model
+from studyfrog.utils.files import read_file_json
+from studyfrog.utils.journal import (
+    append_journal_records,
+    get_journal_file,
+    read_journal_records,
+    replay_journal_records,
+)
+from studyfrog.utils.storage import (
+    add_entry,
+    compact_table,
+    delete_entry,
+    get_all_entries,
+    get_entry,
+    update_entry,
+)
+
+
+def _use_journal_backend(monkeypatch, tmp_path, compaction_threshold: int = 1000):
+    from studyfrog.utils import config, storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(
+        config.CONFIG,
+        "storage",
+        {
+            "backend": "journal",
+            "journal_compaction_threshold": compaction_threshold,
+        },
+    )
+
+    storage.clear_table_cache()
+
+    return tmp_path / "data" / "difficulties.json"
+
+
+def test_journal_records_replay_and_skip_truncated_tail(tmp_path) -> None:
+    table_file = tmp_path / "difficulties.json"
+
+    append_journal_records(
+        file=table_file,
+        records=[
+            {"entry": {"name": "easy"}, "id": "0", "op": "insert"},
+            {"entry": {"name": "hard"}, "id": "1", "op": "insert"},
+            {"id": "0", "op": "delete"},
+            {"op": "header", "table": {"metadata": {"next_id": 2}}, "total": 1},
+        ],
+    )
+
+    with get_journal_file(file=table_file).open("a", encoding="utf-8") as handle:
+        handle.write('{"entry": {"name": "med')
+
+    records = read_journal_records(file=table_file)
+
+    table_data = replay_journal_records(
+        records=records,
+        table_data={"entries": {"entries": {}, "total": 0}, "metadata": {"next_id": 0}},
+    )
+
+    assert len(records) == 4
+    assert table_data["entries"] == {"entries": {"1": {"name": "hard"}}, "total": 1}
+    assert table_data["metadata"]["next_id"] == 2
+
+
+def test_journal_backend_appends_and_rebuilds_state_on_load(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import storage
+
+    table_file = _use_journal_backend(monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    easy_id = add_entry(
+        model=get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+        table_name="difficulties",
+    )
+    hard_id = add_entry(
+        model=get_difficulty_model(display_name="Hard", name="hard", value=1.0),
+        table_name="difficulties",
+    )
+
+    hard = get_entry(id_=hard_id, table_name="difficulties")
+
+    update_entry(
+        model=get_model(
+            type_=hard.type_,
+            **{**hard.to_json_dict(), "display_name": "Very hard"},
+        ),
+        table_name="difficulties",
+    )
+    delete_entry(id_=easy_id, table_name="difficulties")
+
+    snapshot = read_file_json(table_file)
+
+    assert snapshot["entries"]["total"] == 0
+    assert len(read_journal_records(file=table_file)) == 8
+
+    storage.clear_table_cache()
+
+    entries = get_all_entries(table_name="difficulties")
+
+    assert [entry.display_name for entry in entries] == ["Very hard"]
+
+    assert compact_table(table_name="difficulties") is True
+    assert get_journal_file(file=table_file).exists() is False
+    assert read_file_json(table_file)["entries"]["total"] == 1
+
+
+def test_journal_backend_compacts_at_threshold(tmp_path, monkeypatch) -> None:
+    table_file = _use_journal_backend(
+        compaction_threshold=4,
+        monkeypatch=monkeypatch,
+        tmp_path=tmp_path,
+    )
+
+    for name in ("easy", "medium", "hard"):
+        add_entry(
+            model=get_difficulty_model(display_name=name.title(), name=name, value=0.5),
+            table_name="difficulties",
+        )
+
+    assert read_file_json(table_file)["entries"]["total"] == 2
+    assert len(read_journal_records(file=table_file)) == 2
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from studyfrog.models.factory import get_difficulty_model, get_model
+from studyfrog.utils.jsonl import (
+    JSONL_INDEXES,
+    get_jsonl_entries,
+    iter_jsonl_entries,
+    load_jsonl_table,
+)
+from studyfrog.utils.storage import (
+    add_entries,
+    convert_tables_to_json,
+    convert_tables_to_jsonl,
+    count_entries,
+    delete_entry,
+    get_all_entries,
+    get_entries,
+    get_entry,
+    update_entry,
+)
+
+
+def _use_backend(backend: str, monkeypatch, tmp_path) -> None:
+    from studyfrog.utils import config, storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(config.CONFIG, "storage", {"backend": backend})
+
+    storage.clear_table_cache()
+
+
+def _add_difficulties() -> list[int]:
+    return add_entries(
+        models=[
+            get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+            get_difficulty_model(display_name="Medium", name="medium", value=0.5),
+            get_difficulty_model(display_name="Hard", name="hard", value=1.0),
+        ],
+        table_name="difficulties",
+    )
+
+
+def test_jsonl_backend_round_trip_appends_records(tmp_path, monkeypatch) -> None:
+    _use_backend(backend="jsonl", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    ids = _add_difficulties()
+
+    hard = get_entry(id_=ids[2], table_name="difficulties")
+
+    update_entry(
+        model=get_model(type_=hard.type_, **{**hard.to_json_dict(), "display_name": "Very hard"}),
+        table_name="difficulties",
+    )
+    delete_entry(id_=ids[0], table_name="difficulties")
+
+    file = tmp_path / "data" / "difficulties.json"
+
+    assert file.exists() is False
+    assert file.with_suffix(".jsonl").read_text(encoding="utf-8").count("\n") > 3
+    assert count_entries(table_name="difficulties") == 2
+
+    table_data = load_jsonl_table(file=file)
+
+    assert sorted(table_data["entries"]["entries"]) == [str(ids[1]), str(ids[2])]
+    assert table_data["entries"]["entries"][str(ids[2])]["display_name"] == "Very hard"
+
+
+def test_jsonl_entries_stay_in_id_order_after_an_update(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import storage
+
+    _use_backend(backend="jsonl", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    ids = _add_difficulties()
+
+    easy = get_entry(id_=ids[0], table_name="difficulties")
+
+    update_entry(
+        model=get_model(type_=easy.type_, **{**easy.to_json_dict(), "display_name": "Very easy"}),
+        table_name="difficulties",
+    )
+
+    storage.clear_table_cache()
+
+    file = tmp_path / "data" / "difficulties.json"
+
+    assert [id_ for (id_, _) in iter_jsonl_entries(file=file)] == [str(id_) for id_ in ids]
+    assert list(load_jsonl_table(file=file)["entries"]["entries"]) == [str(id_) for id_ in ids]
+    assert [entry.display_name for entry in get_all_entries(table_name="difficulties")] == [
+        "Very easy",
+        "Medium",
+        "Hard",
+    ]
+    assert [id_ for (id_, _) in iter_jsonl_entries(file=file, limit=1, offset=1)] == [str(ids[1])]
+
+
+def test_jsonl_get_entries_decodes_only_requested_records(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import storage
+
+    _use_backend(backend="jsonl", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    ids = _add_difficulties()
+
+    storage.clear_table_cache()
+    JSONL_INDEXES.clear()
+
+    file = tmp_path / "data" / "difficulties.json"
+
+    assert list(get_jsonl_entries(file=file, ids=[str(ids[1]), "999"])) == [str(ids[1])]
+    assert [model.name for model in get_entries(ids=[ids[2], ids[0]], table_name="difficulties")] == [
+        "hard",
+        "easy",
+    ]
+    assert get_entry(id_=ids[1], table_name="difficulties").name == "medium"
+    assert storage.get_table_cache_statistics()["tables"] == 0
+
+    assert [id_ for (id_, _) in iter_jsonl_entries(file=file)] == [str(id_) for id_ in ids]
+    assert [model.name for model in get_all_entries(table_name="difficulties")] == [
+        "easy",
+        "medium",
+        "hard",
+    ]
+    assert storage.get_table_cache_statistics()["tables"] == 0
+
+
+def test_jsonl_index_picks_up_records_appended_elsewhere(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import storage
+
+    _use_backend(backend="jsonl", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    ids = _add_difficulties()
+
+    file = tmp_path / "data" / "difficulties.json"
+
+    get_jsonl_entries(file=file, ids=[str(ids[0])])
+
+    with file.with_suffix(".jsonl").open(mode="a", encoding="utf-8") as handle:
+        handle.write(f'{{"id":"{ids[0]}","op":"delete"}}\n')
+
+    storage.clear_table_cache()
+
+    assert get_jsonl_entries(file=file, ids=[str(ids[0])]) == {}
+    assert get_entry(id_=ids[0], table_name="difficulties") is None
+
+
+def test_convert_tables_between_json_and_jsonl(tmp_path, monkeypatch) -> None:
+    _use_backend(backend="journal", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    ids = _add_difficulties()
+
+    assert convert_tables_to_jsonl() == ["difficulties"]
+
+    _use_backend(backend="jsonl", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    assert [model.name for model in get_all_entries(table_name="difficulties")] == [
+        "easy",
+        "medium",
+        "hard",
+    ]
+
+    delete_entry(id_=ids[1], table_name="difficulties")
+
+    (tmp_path / "data" / "difficulties.json").unlink()
+    (tmp_path / "data" / "difficulties.journal").unlink(missing_ok=True)
+
+    assert convert_tables_to_json() == ["difficulties"]
+
+    _use_backend(backend="json", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    assert count_entries(table_name="difficulties") == 2
+    assert [model.name for model in get_all_entries(table_name="difficulties")] == [
+        "easy",
+        "hard",
+    ]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from studyfrog.utils import logging
+from studyfrog.utils.logging import (
+    configure_logging,
+    flush_logs,
+    is_log_level_enabled,
+    log_debug,
+    log_info,
+    log_warning,
+    set_log_level,
+    set_module_log_level,
+    start_log_writer,
+    stop_log_writer,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_logging_state():
+    yield
+
+    stop_log_writer()
+
+    logging._close_log_file(sink="json")
+    logging._close_log_file(sink="text")
+    logging.MODULE_LEVELS.clear()
+    logging.SETTINGS["configured"] = False
+
+
+def test_messages_below_the_minimum_level_are_never_formatted(capsys) -> None:
+    formatted: list[str] = []
+
+    class Message:
+        def __str__(self) -> str:
+            formatted.append("message")
+            return "message"
+
+    set_log_level(level="WARNING")
+
+    log_debug(message=Message())
+    log_info(message=Message())
+    log_warning(message=Message(), name="tests")
+
+    captured = capsys.readouterr()
+
+    assert formatted == ["message"]
+    assert captured.out == ""
+    assert "[WARNING] - [TESTS] - message;" in captured.err
+    assert is_log_level_enabled(level="INFO") is False
+    assert is_log_level_enabled(level="ERROR") is True
+
+
+def test_background_writer_writes_queued_messages_in_order(capsys) -> None:
+    set_log_level(level="TRACE")
+
+    start_log_writer()
+
+    for index in range(50):
+        log_info(message=f"line {index}")
+
+    assert flush_logs() is True
+
+    lines = capsys.readouterr().out.splitlines()
+
+    assert [line.split(" - ")[-1] for line in lines] == [
+        f"line {index};{logging.RESET}" for index in range(50)
+    ]
+
+    stop_log_writer()
+
+    assert logging.LOG_WRITER is None
+
+
+def test_file_sink_rotates_under_the_configured_size(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import config
+
+    log_file = tmp_path / "logs" / "studyfrog.log"
+
+    monkeypatch.setattr(logging, "LOG_FILE", log_file)
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(
+        config.CONFIG,
+        "logging",
+        {"file": True, "file_backups": 2, "file_max_bytes": 200, "level": "INFO"},
+    )
+
+    configure_logging()
+
+    for index in range(20):
+        log_info(message=f"entry {index:02d}")
+
+    logging._close_log_file()
+
+    files = sorted(path.name for path in log_file.parent.iterdir())
+
+    assert files == ["studyfrog.log", "studyfrog.log.1", "studyfrog.log.2"]
+    assert "\033[" not in log_file.with_name("studyfrog.log.1").read_text(encoding="utf-8")
+    assert "entry 19" in log_file.read_text(encoding="utf-8") + log_file.with_name(
+        "studyfrog.log.1"
+    ).read_text(encoding="utf-8")
+
+
+def test_module_levels_apply_to_the_most_specific_module(capsys) -> None:
+    set_log_level(level="INFO")
+    set_module_log_level(level="WARNING", module="src.utils.storage")
+    set_module_log_level(level="INFO", module="utils.storage.load")
+
+    log_info(message="dropped", name="src.utils.storage.add_entry")
+    log_info(message="kept", name="src.utils.storage.load_table")
+    log_info(message="also kept", name="utils.dispatcher")
+    log_warning(message="warned", name="src.utils.storage.add_entry")
+
+    captured = capsys.readouterr()
+
+    assert "dropped" not in captured.out
+    assert "also kept" in captured.out
+    assert "warned" in captured.err
+    assert is_log_level_enabled(level="INFO", name="src.utils.storage") is False
+    assert is_log_level_enabled(level="INFO", name="utils.storage.load") is True
+
+    set_module_log_level(level=None, module="utils.storage")
+
+    assert is_log_level_enabled(level="INFO", name="src.utils.storage") is True
+
+
+def test_json_sink_writes_one_object_per_record(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import config
+
+    json_file = tmp_path / "logs" / "studyfrog.jsonl"
+
+    monkeypatch.setattr(logging, "JSON_LOG_FILE", json_file)
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(
+        config.CONFIG,
+        "logging",
+        {"json": True, "level": "INFO", "levels": {"tests": "ERROR"}},
+    )
+
+    configure_logging()
+
+    log_info(message="Saved entries", name="src.utils.storage.add_entries", count=2)
+    log_info(message="Silenced by the module level")
+    log_warning(message={"key": "FLASHCARD_1"}, name="utils.dispatcher")
+
+    logging._close_log_file(sink="json")
+
+    records = [json.loads(line) for line in json_file.read_text(encoding="utf-8").splitlines()]
+
+    assert [record["module"] for record in records] == [
+        "src.utils.storage.add_entries",
+        "utils.dispatcher",
+    ]
+    assert records[0]["kwargs"] == {"count": 2}
+    assert records[0]["level"] == "INFO"
+    assert records[0]["message"] == "Saved entries"
+    assert records[1]["message"] == {"key": "FLASHCARD_1"}
+    assert "timestamp" in records[0]
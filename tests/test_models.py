@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from studyfrog.models.factory import get_flashcard_model, get_model
+
+
+def test_models_are_slotted_and_share_field_metadata() -> None:
+    first = get_flashcard_model(back="Answer", front="Question", tags=["exam"])
+    second = get_flashcard_model(back="Other answer", front="Other question")
+
+    assert not hasattr(first, "__dict__")
+    assert first._metadata._fields is second._metadata._fields
+    assert first.fields["values"][:3] == ["self", "back", "front"]
+    assert first.fields["total"] == len(first.fields["values"])
+
+    first.fields["values"].append("mutated")
+    first.to_dict()["metadata"]["fields"]["values"].clear()
+
+    assert "mutated" not in second.fields["values"]
+    assert second.to_json_dict()["metadata"]["fields"]["total"] == len(
+        second.to_json_dict()["metadata"]["fields"]["values"]
+    )
+
+
+def test_model_dictionaries_are_sorted_and_json_safe() -> None:
+    model = get_flashcard_model(back="Answer", front="Question", id_=3, key="FLASHCARD_3")
+
+    dictionary = model.to_dict()
+    json_dictionary = model.to_json_dict()
+
+    assert list(dictionary) == sorted(dictionary)
+    assert list(json_dictionary["metadata"]) == sorted(json_dictionary["metadata"])
+    assert dictionary["identifiable"]["uuid"] == model.uuid
+    assert json_dictionary["identifiable"] == {"id": 3, "key": "FLASHCARD_3", "uuid": str(model.uuid)}
+    assert json_dictionary["metadata"]["created_on"] == model.created_on.isoformat()
+    assert get_model(type_=model.type_, **json_dictionary) == model
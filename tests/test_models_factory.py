@@ -37,3 +37,46 @@ def test_get_model_converts_string_dates_and_uuid_capable_fields() -> None:
 
 def test_invalid_model_type_returns_none() -> None:
     assert get_model(type_="not_a_model") is None
+
+
+def test_get_model_round_trips_stored_dictionary_through_cached_plan() -> None:
+    from studyfrog.models.factory import MODEL_PLANS
+
+    model = get_flashcard_model(back="Answer", front="Question", id_=7, key="FLASHCARD_7")
+
+    first = get_model(type_="flashcard", **model.to_json_dict())
+    second = get_model(type_="FLASHCARD", **model.to_json_dict())
+
+    assert MODEL_PLANS["flashcard"]["model"] is FlashcardModel
+    assert first.to_json_dict() == model.to_json_dict()
+    assert second == first
+    assert first.id == 7
+    assert first.uuid == model.uuid
+
+
+def test_get_model_uses_factory_for_rehearsal_runs() -> None:
+    model = get_model(
+        type_="rehearsal_run",
+        filter_by_difficulty_enabled=True,
+        stacks=["STACK_1"],
+    )
+
+    assert model.type_ == "REHEARSAL_RUN"
+    assert model.to_json_dict()["configuration"]["filter_by_difficulty_enabled"] is True
+
+
+def test_get_model_keeps_stored_rehearsal_run_configuration() -> None:
+    stored = get_model(
+        type_="rehearsal_run",
+        filter_by_priority="PRIORITY_1",
+        filter_by_priority_enabled=True,
+        stacks=["STACK_1"],
+    ).to_json_dict()
+
+    model = get_model(
+        type_="rehearsal_run",
+        **stored,
+    )
+
+    assert model.configuration["filter_by_priority"] == "PRIORITY_1"
+    assert model.configuration["filter_by_priority_enabled"] is True
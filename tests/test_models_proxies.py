@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import uuid
+
+from datetime import datetime
+
+from studyfrog.models.factory import get_difficulty_model
+from studyfrog.models.proxies import get_model_proxy, is_model_proxy
+
+
+def test_model_proxy_reads_fields_without_building_model() -> None:
+    model = get_difficulty_model(display_name="Easy", id_=1, key="DIFFICULTY_1", name="easy", value=0.25)
+
+    proxy = get_model_proxy(entry=model.to_json_dict())
+
+    assert is_model_proxy(value=proxy)
+    assert proxy.name == "easy"
+    assert proxy.key == "DIFFICULTY_1"
+    assert proxy.id == 1
+    assert proxy.type_ == "DIFFICULTY"
+    assert proxy.is_hydrated is False
+
+    assert isinstance(proxy.uuid, uuid.UUID)
+    assert proxy.uuid == model.uuid
+    assert isinstance(proxy.created_at, datetime)
+    assert proxy.is_hydrated is False
+
+
+def test_model_proxy_upgrades_to_model_on_demand() -> None:
+    model = get_difficulty_model(display_name="Easy", id_=1, key="DIFFICULTY_1", name="easy", value=0.25)
+
+    entry = model.to_json_dict()
+    proxy = get_model_proxy(entry=entry)
+
+    assert proxy.to_json_dict() == entry
+    assert proxy.to_json_dict() is not entry
+
+    full = proxy.to_model()
+
+    assert proxy.is_hydrated is True
+    assert proxy.to_model() is full
+    assert full.to_json_dict() == entry
+    assert proxy == model
+    assert proxy.to_dict() == model.to_dict()
+
+
+def test_storage_lazy_reads_return_proxies(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.clear_table_cache()
+
+    ids = storage.add_entries(
+        models=[
+            get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+            get_difficulty_model(display_name="Hard", name="hard", value=1.0),
+        ],
+        table_name="difficulties",
+    )
+
+    proxies = storage.get_all_entries(lazy=True, table_name="difficulties")
+
+    assert all(is_model_proxy(value=proxy) for proxy in proxies)
+    assert [proxy.name for proxy in proxies] == ["easy", "hard"]
+    assert storage.get_entry(id_=ids[1], lazy=True, table_name="difficulties").value == 1.0
+    assert [proxy.id for proxy in storage.filter_entries(lazy=True, name="hard", table_name="difficulties")] == [
+        ids[1]
+    ]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pytest
+
+from studyfrog.constants.events import (
+    ALL_DIFFICULTIES_DELETED,
+    DIFFICULTIES_DELETED,
+    DIFFICULTIES_UPDATED,
+    DIFFICULTY_ADDED,
+    DIFFICULTY_DELETED,
+)
+from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
+from studyfrog.models.factory import get_difficulty_model, get_tag_model
+from studyfrog.utils import reference_cache, storage
+from studyfrog.utils.dispatcher import subscribe
+
+
+@pytest.fixture(autouse=True)
+def isolated_reference_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    reference_cache.clear_reference_cache()
+
+    storage.add_entries(
+        models=[
+            get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+            get_difficulty_model(display_name="Hard", name="hard", value=0.75),
+        ],
+        table_name="difficulties",
+    )
+    storage.add_entries(
+        models=[get_tag_model(value="python")],
+        table_name="tags",
+    )
+
+    yield
+
+    reference_cache.clear_reference_cache()
+
+
+def test_reference_lookups_read_each_table_once(monkeypatch) -> None:
+    reads: list[str] = []
+    get_all_entries = reference_cache.get_all_entries
+
+    def counting_get_all_entries(**kwargs):
+        reads.append(kwargs["table_name"])
+        return get_all_entries(**kwargs)
+
+    monkeypatch.setattr(reference_cache, "get_all_entries", counting_get_all_entries)
+
+    assert reference_cache.warm_reference_cache() == 3
+    assert sorted(reads) == ["difficulties", "priorities", "subjects", "tags", "teachers"]
+
+    reads.clear()
+
+    assert reference_cache.get_reference_key(name="easy", table_name="difficulties") == "DIFFICULTY_0"
+    assert reference_cache.get_reference_key(name="Hard", table_name="difficulties") == "DIFFICULTY_1"
+    assert reference_cache.get_reference_key(name="python", table_name="tags") == "TAG_0"
+    assert reference_cache.get_reference_key(name="medium", table_name="difficulties") is None
+    assert reference_cache.get_reference_model(key="DIFFICULTY_1", table_name="difficulties").value == 0.75
+    assert reference_cache.get_reference_model(name="easy", table_name="difficulties").key == "DIFFICULTY_0"
+    assert reads == []
+
+    with pytest.raises(KeyError):
+        reference_cache.get_reference_key(name="easy", table_name="flashcards")
+
+
+def test_reference_cache_follows_storage_notifications() -> None:
+    events = {
+        ALL_DIFFICULTIES_DELETED: reference_cache.clear_reference_cache,
+        DIFFICULTIES_UPDATED: reference_cache.update_reference_cache,
+        DIFFICULTY_ADDED: reference_cache.update_reference_cache,
+        DIFFICULTY_DELETED: reference_cache.remove_from_reference_cache,
+    }
+
+    for (event, function) in events.items():
+        subscribe(
+            event=event,
+            function=function,
+            namespace=GLOBAL_NAMESPACE,
+            persistent=True,
+        )
+
+    assert reference_cache.get_reference_key(name="easy", table_name="difficulties") == "DIFFICULTY_0"
+
+    storage.add_entry(
+        model=get_difficulty_model(display_name="Medium", name="medium", value=0.5),
+        table_name="difficulties",
+    )
+
+    assert reference_cache.get_reference_key(name="medium", table_name="difficulties") == "DIFFICULTY_2"
+
+    storage.update_entries(
+        models=[
+            get_difficulty_model(
+                display_name="Simple",
+                id_=0,
+                key="DIFFICULTY_0",
+                name="simple",
+                value=0.25,
+            )
+        ],
+        table_name="difficulties",
+    )
+
+    assert reference_cache.get_reference_key(name="easy", table_name="difficulties") is None
+    assert reference_cache.get_reference_key(name="Easy", table_name="difficulties") is None
+    assert reference_cache.get_reference_key(name="simple", table_name="difficulties") == "DIFFICULTY_0"
+
+    storage.delete_entry(id_=1, table_name="difficulties")
+
+    assert reference_cache.get_reference_model(key="DIFFICULTY_1", table_name="difficulties") is None
+    assert reference_cache.get_reference_key(name="hard", table_name="difficulties") is None
+
+    storage.delete_all_entries(table_name="difficulties")
+
+    assert reference_cache.get_reference_models(table_name="difficulties") == []
+
+
+def test_reference_cache_drops_bulk_deleted_models() -> None:
+    subscribe(
+        event=DIFFICULTIES_DELETED,
+        function=reference_cache.remove_from_reference_cache,
+        namespace=GLOBAL_NAMESPACE,
+        persistent=True,
+    )
+
+    assert reference_cache.get_reference_key(name="easy", table_name="difficulties") == "DIFFICULTY_0"
+
+    assert storage.delete_entries(ids=[0, 1], table_name="difficulties")
+
+    assert reference_cache.get_reference_key(name="easy", table_name="difficulties") is None
+    assert reference_cache.get_reference_key(name="Hard", table_name="difficulties") is None
+    assert reference_cache.get_reference_models(table_name="difficulties") == []
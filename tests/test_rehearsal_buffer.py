@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import pytest
+
+from studyfrog.models.factory import get_flashcard_model, get_rehearsal_run_model
+from studyfrog.utils import config, rehearsal_buffer, storage
+from studyfrog.utils.journal import get_journal_file
+
+
+@pytest.fixture(autouse=True)
+def isolated_rehearsal_buffer(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(
+        rehearsal_buffer,
+        "REHEARSAL_BUFFER_DB_JSON",
+        tmp_path / "data" / "rehearsal_buffer.json",
+    )
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(config.CONFIG, "rehearsal", {"flush_interval": 0})
+
+    storage.add_entries(
+        models=[get_flashcard_model(back=f"B{index}", front=f"F{index}") for index in range(2)],
+        table_name="flashcards",
+    )
+    storage.add_entry(
+        model=get_rehearsal_run_model(stacks=["STACK_0"]),
+        table_name="rehearsal_runs",
+    )
+
+    rehearsal_buffer.clear_rehearsal_buffer()
+
+    yield
+
+    rehearsal_buffer.clear_rehearsal_buffer()
+
+
+def _start_run_with_grade(grade: str) -> None:
+    rehearsal_buffer.start_rehearsal_buffer(
+        run=storage.get_entry(id_=0, table_name="rehearsal_runs"),
+    )
+
+    for key in ("FLASHCARD_0", "FLASHCARD_1"):
+        rehearsal_buffer.record_rehearsal_item(item=key)
+        rehearsal_buffer.record_rehearsal_action(item=key, message=f"Showed {key}")
+
+    rehearsal_buffer.record_rehearsal_grade(
+        difficulty="DIFFICULTY_0",
+        grade=grade,
+        model=storage.get_entry(id_=0, table_name="flashcards"),
+    )
+
+
+def test_flush_writes_once_per_table_and_schedules_a_grade_once(monkeypatch) -> None:
+    writes: list[tuple[str, str, int]] = []
+
+    for name in ("add_entries", "update_entries"):
+        function = getattr(rehearsal_buffer, name)
+
+        def counting(function=function, name=name, **kwargs):
+            writes.append((name, kwargs["table_name"], len(kwargs["models"])))
+            return function(**kwargs)
+
+        monkeypatch.setattr(rehearsal_buffer, name, counting)
+
+    _start_run_with_grade(grade="medium")
+
+    assert writes == []
+
+    assert rehearsal_buffer.flush_rehearsal_buffer()
+
+    assert writes == [
+        ("add_entries", "rehearsal_actions", 2),
+        ("add_entries", "rehearsal_run_items", 2),
+        ("update_entries", "rehearsal_runs", 1),
+        ("update_entries", "flashcards", 1),
+    ]
+
+    writes.clear()
+
+    # Flushing again without changes does not write anything
+    assert rehearsal_buffer.flush_rehearsal_buffer()
+    assert writes == []
+
+    rehearsal_buffer.record_rehearsal_grade(
+        difficulty="DIFFICULTY_1",
+        grade="medium",
+        model=storage.get_entry(id_=0, table_name="flashcards"),
+    )
+
+    assert rehearsal_buffer.flush_rehearsal_buffer(final=True)
+    assert writes == [
+        ("update_entries", "rehearsal_run_items", 1),
+        ("update_entries", "rehearsal_runs", 1),
+        ("update_entries", "flashcards", 1),
+    ]
+
+    flashcard = storage.get_entry(id_=0, table_name="flashcards")
+
+    # The regrade replaces the grade written by the first flush instead of adding to it
+    assert flashcard.schedule["repetitions"] == 1
+    assert flashcard.difficulty == "DIFFICULTY_1"
+
+    run = storage.get_entry(id_=0, table_name="rehearsal_runs")
+    items = storage.get_all_entries(table_name="rehearsal_run_items")
+
+    assert run.items == {"items": ["REHEARSAL_RUN_ITEM_0", "REHEARSAL_RUN_ITEM_1"], "total": 2}
+    assert [item.result for item in items] == ["medium", None]
+    assert [item.actions for item in items] == [["REHEARSAL_ACTION_0"], ["REHEARSAL_ACTION_1"]]
+    assert not get_journal_file(file=rehearsal_buffer.REHEARSAL_BUFFER_DB_JSON).exists()
+    assert not rehearsal_buffer.flush_rehearsal_buffer()
+
+
+def test_recover_rehearsal_buffer_writes_the_journaled_changes() -> None:
+    _start_run_with_grade(grade="easy")
+
+    # Simulates a crash: the buffer in memory is lost, the journal is kept
+    rehearsal_buffer._reset_rehearsal_buffer()
+
+    assert storage.get_entry(id_=0, table_name="flashcards").schedule == {}
+
+    assert rehearsal_buffer.recover_rehearsal_buffer()
+
+    flashcard = storage.get_entry(id_=0, table_name="flashcards")
+
+    assert flashcard.schedule["repetitions"] == 1
+    assert flashcard.difficulty == "DIFFICULTY_0"
+    assert storage.get_entry(id_=0, table_name="rehearsal_runs").items["total"] == 2
+    assert storage.count_entries(table_name="rehearsal_actions") == 2
+    assert not rehearsal_buffer.recover_rehearsal_buffer()
+
+
+def test_failed_action_write_keeps_the_actions_buffered(monkeypatch) -> None:
+    _start_run_with_grade(grade="easy")
+
+    add_entries = rehearsal_buffer.add_entries
+
+    def failing(**kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(rehearsal_buffer, "add_entries", failing)
+
+    with pytest.raises(OSError):
+        rehearsal_buffer.flush_rehearsal_buffer()
+
+    monkeypatch.setattr(rehearsal_buffer, "add_entries", add_entries)
+
+    assert rehearsal_buffer.flush_rehearsal_buffer(final=True)
+    assert storage.count_entries(table_name="rehearsal_actions") == 2
+    assert [item.actions for item in storage.get_all_entries(table_name="rehearsal_run_items")] == [
+        ["REHEARSAL_ACTION_0"],
+        ["REHEARSAL_ACTION_1"],
+    ]
+
+
+def test_recovery_after_a_crash_mid_flush_does_not_add_rows_twice(monkeypatch) -> None:
+    _start_run_with_grade(grade="easy")
+
+    write_rehearsal_run = rehearsal_buffer._write_rehearsal_run
+
+    def crashing(final):
+        raise OSError("crash")
+
+    monkeypatch.setattr(rehearsal_buffer, "_write_rehearsal_run", crashing)
+
+    # The actions and run items are added, the journal is not rewritten
+    with pytest.raises(OSError):
+        rehearsal_buffer.flush_rehearsal_buffer()
+
+    monkeypatch.setattr(rehearsal_buffer, "_write_rehearsal_run", write_rehearsal_run)
+
+    rehearsal_buffer._reset_rehearsal_buffer()
+
+    assert rehearsal_buffer.recover_rehearsal_buffer()
+    assert storage.count_entries(table_name="rehearsal_actions") == 2
+    assert storage.count_entries(table_name="rehearsal_run_items") == 2
+    assert storage.get_entry(id_=0, table_name="rehearsal_runs").items == {
+        "items": ["REHEARSAL_RUN_ITEM_0", "REHEARSAL_RUN_ITEM_1"],
+        "total": 2,
+    }
+
+
+def test_periodic_flush_runs_on_the_main_thread(monkeypatch) -> None:
+    import threading
+
+    from studyfrog.utils import dispatcher
+
+    monkeypatch.setitem(config.CONFIG, "rehearsal", {"flush_interval": 0.01})
+    monkeypatch.setattr(dispatcher, "CALLBACKS_SCHEDULED", True)
+
+    _start_run_with_grade(grade="easy")
+
+    timer = rehearsal_buffer.REHEARSAL_BUFFER["timer"]
+    timer.join(timeout=5)
+
+    # The timer thread only queued the flush for the Tk loop
+    assert rehearsal_buffer.REHEARSAL_BUFFER["dirty"]
+    assert storage.count_entries(table_name="rehearsal_run_items") == 0
+
+    threads: list[threading.Thread] = []
+
+    monkeypatch.setattr(
+        rehearsal_buffer,
+        "flush_rehearsal_buffer",
+        lambda function=rehearsal_buffer.flush_rehearsal_buffer: (
+            threads.append(threading.current_thread()) or function()
+        ),
+    )
+
+    assert dispatcher.process_dispatch_callbacks() == 1
+    assert threads == [threading.main_thread()]
+    assert not rehearsal_buffer.REHEARSAL_BUFFER["dirty"]
+    assert storage.count_entries(table_name="rehearsal_run_items") == 2
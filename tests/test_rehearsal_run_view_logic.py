@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from studyfrog.constants.events import GET_FLASHCARDS_FROM_DB, GET_NOTES_FROM_DB
+from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
+from studyfrog.gui.logic import rehearsal_run_view_logic as logic
+from studyfrog.models.factory import (
+    get_difficulty_model,
+    get_flashcard_model,
+    get_note_model,
+    get_rehearsal_run_model,
+)
+from studyfrog.utils import config, reference_cache, rehearsal_buffer, storage
+from studyfrog.utils.dispatcher import subscribe
+
+
+def test_stack_items_are_loaded_per_table_and_filtered_in_memory(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.add_entries(
+        models=[
+            get_flashcard_model(back="B0", difficulty="DIFFICULTY_1", front="F0"),
+            get_flashcard_model(back="B1", difficulty="DIFFICULTY_2", front="F1"),
+            get_flashcard_model(back="B2", difficulty="DIFFICULTY_1", front="F2"),
+        ],
+        table_name="flashcards",
+    )
+    storage.add_entries(
+        models=[get_note_model(difficulty="DIFFICULTY_1", text="T0", title="N0")],
+        table_name="notes",
+    )
+
+    calls: list[list] = []
+
+    def get_entries(**kwargs):
+        calls.append(kwargs["ids"])
+        return storage.get_entries(**kwargs)
+
+    for event in (GET_FLASHCARDS_FROM_DB, GET_NOTES_FROM_DB):
+        subscribe(
+            event=event,
+            function=get_entries,
+            namespace=GLOBAL_NAMESPACE,
+            persistent=True,
+        )
+
+    keys = ["FLASHCARD_0", "FLASHCARD_1", "NOTE_0", "FLASHCARD_2", "FLASHCARD_9"]
+
+    logic.STACK_ITEM_KEYS.clear()
+    logic.STACK_ITEM_KEYS.extend(keys)
+    logic.STACK_ITEMS.clear()
+
+    logic._load_stack_items_from_db(keys=keys)
+    logic._filter_stack_items_by_difficulty(difficulty_key="DIFFICULTY_1")
+
+    assert sorted(calls) == [["0"], ["0", "1", "2", "9"]]
+    assert logic.STACK_ITEM_KEYS == ["FLASHCARD_0", "NOTE_0", "FLASHCARD_2"]
+    assert logic._get_stack_item(key="FLASHCARD_2").front == "F2"
+    assert len(calls) == 2
+
+    logic.STACK_ITEM_KEYS.clear()
+    logic.STACK_ITEMS.clear()
+
+
+def test_graded_stack_items_are_buffered_and_saved_in_bulk(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(
+        rehearsal_buffer,
+        "REHEARSAL_BUFFER_DB_JSON",
+        tmp_path / "data" / "rehearsal_buffer.json",
+    )
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(config.CONFIG, "rehearsal", {"flush_interval": 0})
+
+    storage.add_entries(
+        models=[
+            get_flashcard_model(back="B0", front="F0"),
+            get_flashcard_model(back="B1", front="F1"),
+        ],
+        table_name="flashcards",
+    )
+    storage.add_entries(
+        models=[get_note_model(text="T0", title="N0")],
+        table_name="notes",
+    )
+    storage.add_entries(
+        models=[
+            get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+            get_difficulty_model(display_name="Medium", name="medium", value=0.5),
+        ],
+        table_name="difficulties",
+    )
+    storage.add_entry(
+        model=get_rehearsal_run_model(stacks=["STACK_0"]),
+        table_name="rehearsal_runs",
+    )
+
+    calls: list[tuple[str, int]] = []
+    update_entries = rehearsal_buffer.update_entries
+
+    def counting_update_entries(**kwargs):
+        calls.append((kwargs["table_name"], len(kwargs["models"])))
+        return update_entries(**kwargs)
+
+    monkeypatch.setattr(rehearsal_buffer, "update_entries", counting_update_entries)
+
+    reference_cache.clear_reference_cache()
+    logic.STACK_ITEMS.clear()
+    logic.STACK_ITEMS.update(
+        {
+            "FLASHCARD_0": storage.get_entry(id_=0, table_name="flashcards"),
+            "FLASHCARD_1": storage.get_entry(id_=1, table_name="flashcards"),
+            "NOTE_0": storage.get_entry(id_=0, table_name="notes"),
+        }
+    )
+
+    rehearsal_buffer.start_rehearsal_buffer(
+        run=storage.get_entry(id_=0, table_name="rehearsal_runs"),
+    )
+
+    logic._set_stack_item_grade(grade="hard", key="FLASHCARD_0")
+    logic._set_stack_item_grade(grade="medium", key="NOTE_0")
+    logic._set_stack_item_grade(grade="easy", key="FLASHCARD_1")
+    logic._set_stack_item_grade(grade="medium", key="FLASHCARD_0")
+
+    # Nothing is written while the run is in progress
+    assert calls == []
+    assert storage.get_entry(id_=0, table_name="flashcards").schedule == {}
+
+    assert rehearsal_buffer.flush_rehearsal_buffer(final=True)
+
+    assert sorted(calls) == [("flashcards", 2), ("notes", 1), ("rehearsal_runs", 1)]
+    assert rehearsal_buffer.REHEARSAL_BUFFER["entries"] == {}
+
+    flashcard = storage.get_entry(id_=0, table_name="flashcards")
+
+    assert flashcard.schedule["repetitions"] == 1
+    assert flashcard.difficulty == "DIFFICULTY_1"
+    assert flashcard.last_viewed_on is not None
+    assert flashcard.next_view_on is not None
+    assert storage.count_entries(table_name="rehearsal_actions") == 4
+
+    reference_cache.clear_reference_cache()
+    logic.STACK_ITEMS.clear()
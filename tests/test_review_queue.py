@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from studyfrog.constants.events import (
+    FLASHCARD_DELETED,
+    FLASHCARDS_ADDED,
+    FLASHCARDS_DELETED,
+    FLASHCARDS_UPDATED,
+    NOTES_ADDED,
+)
+from studyfrog.constants.namespaces import GLOBAL_NAMESPACE
+from studyfrog.models.factory import (
+    get_difficulty_model,
+    get_flashcard_model,
+    get_note_model,
+    get_priority_model,
+    get_stack_model,
+)
+from studyfrog.utils import reference_cache, review_queue, storage
+from studyfrog.utils.dispatcher import subscribe
+
+
+@pytest.fixture(autouse=True)
+def isolated_due_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(review_queue, "DUE_INDEX_DB_JSON", tmp_path / "data" / "due_index.json")
+
+    reference_cache.clear_reference_cache()
+    review_queue.clear_due_index()
+
+    storage.add_entries(
+        models=[
+            get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+            get_difficulty_model(display_name="Hard", name="hard", value=0.75),
+        ],
+        table_name="difficulties",
+    )
+    storage.add_entries(
+        models=[
+            get_priority_model(display_name="Low", name="low", value=0.25),
+            get_priority_model(display_name="High", name="high", value=0.75),
+        ],
+        table_name="priorities",
+    )
+
+    yield
+
+    review_queue.clear_due_index()
+
+
+def test_build_review_queue_orders_due_items_by_priority_and_difficulty() -> None:
+    storage.add_entries(
+        models=[
+            get_flashcard_model(
+                back="B",
+                front="low easy",
+                next_view_on="2026-10-10",
+                priority="PRIORITY_0",
+                difficulty="DIFFICULTY_0",
+            ),
+            get_flashcard_model(
+                back="B",
+                front="high easy",
+                next_view_on="2026-10-16",
+                priority="PRIORITY_1",
+                difficulty="DIFFICULTY_0",
+            ),
+            get_flashcard_model(
+                back="B",
+                front="high hard",
+                next_view_on="2026-10-15",
+                priority="PRIORITY_1",
+                difficulty="DIFFICULTY_1",
+            ),
+            get_flashcard_model(
+                back="B",
+                front="tomorrow",
+                next_view_on="2026-10-17",
+                priority="PRIORITY_1",
+                difficulty="DIFFICULTY_1",
+            ),
+            get_flashcard_model(
+                back="B",
+                front="high hard overdue",
+                next_view_on="2026-10-01",
+                priority="PRIORITY_1",
+                difficulty="DIFFICULTY_1",
+            ),
+        ],
+        table_name="flashcards",
+    )
+    storage.add_entries(
+        models=[get_note_model(text="T", title="unranked", next_view_on="2026-10-01")],
+        table_name="notes",
+    )
+    storage.add_entry(
+        model=get_stack_model(items={"items": ["FLASHCARD_0", "NOTE_0"], "total": 2}, name="S"),
+        table_name="stacks",
+    )
+
+    today = date(2026, 10, 16)
+
+    assert review_queue.build_review_queue(date=today) == [
+        "FLASHCARD_4",
+        "FLASHCARD_2",
+        "FLASHCARD_1",
+        "FLASHCARD_0",
+        "NOTE_0",
+    ]
+    assert review_queue.build_review_queue(date=today, limit=2) == ["FLASHCARD_4", "FLASHCARD_2"]
+    assert review_queue.build_review_queue(date=today, stacks=["STACK_0"]) == [
+        "FLASHCARD_0",
+        "NOTE_0",
+    ]
+    assert review_queue.count_due_items(date=date(2026, 10, 17)) == 6
+    assert review_queue.build_review_queue(date=date(2026, 9, 30)) == []
+
+
+def test_due_index_follows_storage_notifications_and_is_persisted(monkeypatch) -> None:
+    for event in (FLASHCARDS_ADDED, FLASHCARDS_UPDATED, NOTES_ADDED):
+        subscribe(
+            event=event,
+            function=review_queue.update_due_index,
+            namespace=GLOBAL_NAMESPACE,
+            persistent=True,
+        )
+
+    subscribe(
+        event=FLASHCARD_DELETED,
+        function=review_queue.remove_from_due_index,
+        namespace=GLOBAL_NAMESPACE,
+        persistent=True,
+    )
+
+    # Loads (and builds) the empty index before the items are added
+    assert review_queue.build_review_queue(date=date(2026, 10, 16)) == []
+
+    storage.add_entries(
+        models=[
+            get_flashcard_model(back="B0", front="F0", next_view_on="2026-10-20"),
+            get_flashcard_model(back="B1", front="F1", next_view_on="2026-10-12"),
+        ],
+        table_name="flashcards",
+    )
+    storage.add_entries(
+        models=[get_note_model(text="T", title="N", next_view_on="2026-10-30")],
+        table_name="notes",
+    )
+
+    assert review_queue.build_review_queue(date=date(2026, 10, 16)) == ["FLASHCARD_1"]
+
+    models = storage.get_all_entries(table_name="flashcards")
+    models[0].next_view_on = "2026-10-14"
+    storage.update_entries(models=models, table_name="flashcards")
+    storage.delete_entry(id_=1, table_name="flashcards")
+
+    assert review_queue.build_review_queue(date=date(2026, 10, 16)) == ["FLASHCARD_0"]
+
+    def fail_iter_entries(**kwargs):
+        raise AssertionError("The persisted index should be loaded, not rebuilt.")
+
+    monkeypatch.setattr(review_queue, "iter_entries", fail_iter_entries)
+
+    review_queue.clear_due_index()
+
+    assert review_queue.build_review_queue(date=date(2026, 10, 31)) == ["FLASHCARD_0", "NOTE_0"]
+
+
+def test_due_index_follows_bulk_deletes() -> None:
+    subscribe(
+        event=FLASHCARDS_ADDED,
+        function=review_queue.update_due_index,
+        namespace=GLOBAL_NAMESPACE,
+        persistent=True,
+    )
+    subscribe(
+        event=FLASHCARDS_DELETED,
+        function=review_queue.remove_from_due_index,
+        namespace=GLOBAL_NAMESPACE,
+        persistent=True,
+    )
+
+    assert review_queue.build_review_queue(date=date(2026, 10, 16)) == []
+
+    storage.add_entries(
+        models=[
+            get_flashcard_model(back=f"B{index}", front=f"F{index}", next_view_on="2026-10-12")
+            for index in range(4)
+        ],
+        table_name="flashcards",
+    )
+
+    assert review_queue.count_due_items(date=date(2026, 10, 16)) == 4
+
+    assert storage.delete_entries(ids=[0, 1], table_name="flashcards")
+
+    assert review_queue.build_review_queue(date=date(2026, 10, 16)) == [
+        "FLASHCARD_2",
+        "FLASHCARD_3",
+    ]
+
+    # The persisted index no longer holds the deleted items either
+    review_queue.clear_due_index()
+
+    assert review_queue.count_due_items(date=date(2026, 10, 16)) == 2
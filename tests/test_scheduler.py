@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from studyfrog.models.factory import get_flashcard_model, get_question_model
+from studyfrog.utils import config, scheduler, storage
+
+
+def test_get_next_schedule_grows_stability_and_lapses_on_failing_grade() -> None:
+    schedule = None
+    intervals: list[int] = []
+
+    for grade in ("medium", "medium", "medium"):
+        schedule = scheduler.get_next_schedule(grade=grade, schedule=schedule)
+        intervals.append(schedule["interval"])
+
+    assert intervals == [1, 6, 15]
+    assert schedule["repetitions"] == 3
+
+    lapsed = scheduler.get_next_schedule(grade="hard", schedule=schedule)
+
+    assert lapsed["lapses"] == 1
+    assert lapsed["repetitions"] == 0
+    assert lapsed["ease"] < schedule["ease"]
+    assert lapsed["interval"] == 3
+
+    with pytest.raises(ValueError):
+        scheduler.get_next_schedule(grade="unknown")
+
+
+def test_schedule_reviews_sets_review_dates() -> None:
+    models = [
+        get_flashcard_model(back="B", front="F"),
+        get_question_model(text="Q"),
+    ]
+
+    scheduler.schedule_reviews(
+        grades=["easy", "hard"],
+        models=models,
+        reviewed_at=datetime(2026, 10, 16, 12, 30),
+    )
+
+    assert [model.last_viewed_on for model in models] == ["2026-10-16", "2026-10-16"]
+    assert [model.next_view_on for model in models] == ["2026-10-17", "2026-10-17"]
+    assert models[1].to_json_dict()["schedule"]["lapses"] == 1
+
+
+def test_reschedule_entries_updates_changed_items_in_one_write(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    models = [get_flashcard_model(back=f"B{index}", front=f"F{index}") for index in range(3)]
+
+    scheduler.schedule_reviews(
+        grades=["medium", "medium", "medium"],
+        models=models,
+        reviewed_at=datetime(2026, 10, 1),
+    )
+    scheduler.schedule_reviews(
+        grades=["medium", "medium", "medium"],
+        models=models,
+        reviewed_at=datetime(2026, 10, 2),
+    )
+    models.append(get_flashcard_model(back="B", front="never reviewed"))
+
+    storage.add_entries(models=models, table_name="flashcards")
+
+    writes: list[int] = []
+    update_entries = scheduler.update_entries
+
+    def counting_update_entries(**kwargs):
+        writes.append(len(kwargs["models"]))
+        return update_entries(**kwargs)
+
+    monkeypatch.setattr(scheduler, "update_entries", counting_update_entries)
+
+    assert scheduler.reschedule_entries(table_name="flashcards") == 0
+    assert writes == []
+
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(config.CONFIG, "scheduler", {"desired_retention": 0.8})
+
+    assert scheduler.reschedule_entries(table_name="flashcards") == 3
+    assert writes == [3]
+
+    entries = storage.get_all_entries(table_name="flashcards")
+
+    # A stability of 6 days at 90% retention is reached after 12.7 days at 80%
+    assert [entry.next_view_on for entry in entries] == ["2026-10-15"] * 3 + [None]
+    assert entries[0].schedule["interval"] == 13
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from studyfrog.models.factory import get_difficulty_model, get_flashcard_model, get_model
+from studyfrog.utils.dispatcher import subscribe
+from studyfrog.utils.sqlite import SQLITE_DB_FILE_NAME, close_sqlite_connections, get_sqlite_connection
+from studyfrog.utils.storage import (
+    add_entries,
+    add_entry,
+    count_entries,
+    delete_entry,
+    filter_entries,
+    get_entries,
+    get_entries_page,
+    get_entry,
+    migrate_tables_to_sqlite,
+    update_entry,
+)
+
+
+def _use_backend(backend: str, monkeypatch, tmp_path) -> None:
+    from studyfrog.utils import config, storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(config, "CONFIG_LOADED", True)
+    monkeypatch.setitem(config.CONFIG, "storage", {"backend": backend})
+
+    storage.clear_table_cache()
+
+
+def test_sqlite_backend_round_trip_keeps_models_and_events(tmp_path, monkeypatch) -> None:
+    from studyfrog.constants.events import DIFFICULTY_UPDATED
+
+    _use_backend(backend="sqlite", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    received = []
+
+    subscribe(
+        event=DIFFICULTY_UPDATED,
+        function=lambda **kwargs: received.append(kwargs["difficulty"]),
+    )
+
+    ids = add_entries(
+        models=[
+            get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+            get_difficulty_model(display_name="Hard", name="hard", value=1.0),
+        ],
+        table_name="difficulties",
+    )
+
+    hard = get_entry(id_=ids[1], table_name="difficulties")
+
+    update_entry(
+        model=get_model(type_=hard.type_, **{**hard.to_json_dict(), "display_name": "Very hard"}),
+        table_name="difficulties",
+    )
+    delete_entry(id_=ids[0], table_name="difficulties")
+
+    assert received[0].type_ == "DIFFICULTY"
+    assert received[0].display_name == "Very hard"
+    assert count_entries(table_name="difficulties") == 1
+    assert (tmp_path / "data" / SQLITE_DB_FILE_NAME).exists()
+    assert (tmp_path / "data" / "difficulties.json").exists() is False
+
+    rows = (
+        get_sqlite_connection(file=tmp_path / "data" / "difficulties.json")
+        .execute('SELECT id, key FROM "difficulties"')
+        .fetchall()
+    )
+
+    assert rows == [(1, hard.key)]
+
+    close_sqlite_connections()
+
+
+def test_migrate_tables_to_sqlite_imports_json_tables(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import storage
+
+    _use_backend(backend="json", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    add_entry(
+        model=get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+        table_name="difficulties",
+    )
+
+    assert migrate_tables_to_sqlite() == ["difficulties"]
+
+    monkeypatch.setitem(storage.get_config_value(key="storage"), "backend", "sqlite")
+
+    entries = filter_entries(table_name="difficulties", name="easy")
+
+    assert [entry.display_name for entry in entries] == ["Easy"]
+
+    indexes = {
+        row[0]
+        for row in get_sqlite_connection(file=tmp_path / "data" / "difficulties.json").execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'difficulties'"
+        )
+    }
+
+    assert "ix_difficulties_next_view_on" in indexes
+
+    close_sqlite_connections()
+
+
+def test_sqlite_backend_reads_without_loading_the_table(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import storage
+
+    _use_backend(backend="sqlite", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    add_entries(
+        models=[
+            get_flashcard_model(back="B", front=f"F{index}", difficulty=f"DIFFICULTY_{index % 2}")
+            for index in range(5)
+        ],
+        table_name="flashcards",
+    )
+
+    storage.clear_table_cache()
+
+    def fail_load(file):
+        raise AssertionError(f"'{file.stem}' table was loaded in full")
+
+    monkeypatch.setitem(storage.STORAGE_BACKENDS["sqlite"], "load", fail_load)
+
+    hard = filter_entries(table_name="flashcards", difficulty="difficulty_1")
+    page = get_entries_page(limit=2, offset=1, table_name="flashcards")
+
+    assert [entry.front for entry in hard] == ["F1", "F3"]
+    assert [entry.front for entry in page["entries"]] == ["F1", "F2"]
+    assert page["has_more"] is True
+    assert [entry.front for entry in get_entries(ids=[4, 0], table_name="flashcards")] == ["F4", "F0"]
+
+    plan = " ".join(
+        str(row)
+        for row in get_sqlite_connection(file=tmp_path / "data" / "flashcards.json").execute(
+            'EXPLAIN QUERY PLAN SELECT id FROM "flashcards" WHERE difficulty = ?',
+            ("difficulty_1",),
+        )
+    )
+
+    assert "ix_flashcards_difficulty" in plan
+
+    by_key = filter_entries(table_name="flashcards", key="flashcard_2")
+    by_uuid = filter_entries(table_name="flashcards", uuid=str(by_key[0].uuid).upper())
+
+    assert [entry.front for entry in by_key] == ["F2"]
+    assert [entry.key for entry in by_uuid] == ["FLASHCARD_2"]
+
+    plan = " ".join(
+        str(row)
+        for row in get_sqlite_connection(file=tmp_path / "data" / "flashcards.json").execute(
+            'EXPLAIN QUERY PLAN SELECT id FROM "flashcards" WHERE key = ? COLLATE NOCASE',
+            ("flashcard_2",),
+        )
+    )
+
+    assert "ix_flashcards_key_nocase" in plan
+
+    close_sqlite_connections()
+
+
+def test_sqlite_tables_are_created_once_per_connection(tmp_path, monkeypatch) -> None:
+    from studyfrog.utils import sqlite
+
+    _use_backend(backend="sqlite", monkeypatch=monkeypatch, tmp_path=tmp_path)
+
+    add_entries(
+        models=[get_difficulty_model(display_name="Easy", name="easy", value=0.25)],
+        table_name="difficulties",
+    )
+
+    connection = get_sqlite_connection(file=tmp_path / "data" / "difficulties.json")
+    statements = []
+
+    connection.set_trace_callback(statements.append)
+
+    for _ in range(3):
+        sqlite.get_sqlite_entries(file=tmp_path / "data" / "difficulties.json", ids=["0"])
+        sqlite.filter_sqlite_entries(criteria={"key": "DIFFICULTY_0"}, file=tmp_path / "data" / "difficulties.json")
+
+    connection.set_trace_callback(None)
+
+    assert not [statement for statement in statements if "CREATE" in statement]
+
+    close_sqlite_connections()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from studyfrog.utils.startup import (
+    end_startup_phase,
+    format_startup_report,
+    get_startup_report,
+    reset_startup_report,
+    start_startup_phase,
+)
+
+
+def test_startup_report_lists_ended_phases_in_start_order() -> None:
+    reset_startup_report()
+
+    start_startup_phase(phase="run_pre_start_tasks")
+    start_startup_phase(phase="ensure_defaults")
+    start_startup_phase(phase="never_ended")
+
+    assert end_startup_phase(phase="ensure_defaults") >= 0
+    assert end_startup_phase(phase="ensure_defaults") is None
+    assert end_startup_phase(phase="run_pre_start_tasks") >= 0
+    assert end_startup_phase(phase="never_started") is None
+
+    report = get_startup_report()
+
+    assert [phase["phase"] for phase in report["phases"]] == [
+        "run_pre_start_tasks",
+        "ensure_defaults",
+    ]
+    assert report["total_ms"] >= report["phases"][0]["duration_ms"]
+    assert format_startup_report().startswith("run_pre_start_tasks=")
+    assert "total=" in format_startup_report()
@@ -53,3 +53,298 @@ def test_get_entry_returns_none_for_missing_id(tmp_path, monkeypatch) -> None:
     )
 
     assert missing is None
+
+
+def test_table_cache_serves_repeated_reads_from_memory(tmp_path, monkeypatch) -> None:
+    from studyfrog.models.factory import get_difficulty_model
+    from studyfrog.utils import storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.clear_table_cache()
+
+    entry_id = add_entry(
+        model=get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+        table_name="difficulties",
+    )
+
+    first = get_entry(id_=entry_id, table_name="difficulties")
+    second = get_entry(id_=entry_id, table_name="difficulties")
+
+    statistics = storage.get_table_cache_statistics()
+
+    assert first is not None and second is not None
+    assert first.name == second.name == "easy"
+    assert statistics["writes"] >= 1
+    assert statistics["hits"] >= 2
+    assert statistics["tables"] == 1
+
+
+def test_table_cache_detects_external_modification(tmp_path, monkeypatch) -> None:
+    import json
+    import os
+
+    from studyfrog.models.factory import get_difficulty_model
+    from studyfrog.utils import storage
+
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(storage, "DATA_DIR", data_dir)
+
+    storage.clear_table_cache()
+
+    entry_id = add_entry(
+        model=get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+        table_name="difficulties",
+    )
+
+    assert get_entry(id_=entry_id, table_name="difficulties").name == "easy"
+
+    table_file = data_dir / "difficulties.json"
+    table_data = json.loads(table_file.read_text(encoding="utf-8"))
+    table_data["entries"]["entries"][str(entry_id)]["name"] = "renamed"
+    table_file.write_text(json.dumps(table_data, indent=4), encoding="utf-8")
+
+    stat = table_file.stat()
+    os.utime(table_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_entry(id_=entry_id, table_name="difficulties").name == "renamed"
+    assert storage.get_table_cache_statistics()["invalidations"] == 1
+
+
+def test_cached_entries_are_not_aliased_by_models(tmp_path, monkeypatch) -> None:
+    from studyfrog.models.factory import get_flashcard_model
+    from studyfrog.utils import storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.clear_table_cache()
+
+    entry_id = add_entry(
+        model=get_flashcard_model(front="Question", back="Answer", tags=["a"]),
+        table_name="flashcards",
+    )
+
+    flashcard = get_entry(id_=entry_id, table_name="flashcards")
+    flashcard.tags.append("b")
+
+    assert get_entry(id_=entry_id, table_name="flashcards").tags == ["a"]
+
+
+def test_corrupt_table_is_recovered_from_backup(tmp_path, monkeypatch) -> None:
+    from studyfrog.models.factory import get_difficulty_model
+    from studyfrog.utils import storage
+
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(storage, "DATA_DIR", data_dir)
+
+    storage.clear_table_cache()
+
+    easy_id = add_entry(
+        model=get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+        table_name="difficulties",
+    )
+    add_entry(
+        model=get_difficulty_model(display_name="Hard", name="hard", value=1.0),
+        table_name="difficulties",
+    )
+
+    table_file = data_dir / "difficulties.json"
+    table_file.write_text('{"entries": {"entries": {"0": {"na', encoding="utf-8")
+
+    assert get_entry(id_=easy_id, table_name="difficulties").name == "easy"
+    assert storage.count_entries(table_name="difficulties") == 1
+    assert (data_dir / "difficulties.json.corrupt").exists()
+
+
+def test_filter_entries_uses_incrementally_maintained_index(tmp_path, monkeypatch) -> None:
+    from studyfrog.models.factory import get_difficulty_model, get_model
+    from studyfrog.utils import storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.clear_table_cache()
+
+    easy_id, hard_id = storage.add_entries(
+        models=[
+            get_difficulty_model(display_name="Easy", name="easy", value=0.25),
+            get_difficulty_model(display_name="Hard", name="hard", value=1.0),
+        ],
+        table_name="difficulties",
+    )
+
+    assert [entry.id for entry in storage.filter_entries(table_name="difficulties", name="EASY")] == [
+        easy_id
+    ]
+
+    cached = storage.TABLE_CACHE[str(tmp_path / "data" / "difficulties.json")]
+
+    assert cached["indexes"]["name"]["values"] == {"easy": {str(easy_id)}, "hard": {str(hard_id)}}
+
+    hard = get_entry(id_=hard_id, table_name="difficulties")
+    storage.update_entry(
+        model=get_model(type_=hard.type_, **{**hard.to_json_dict(), "name": "easy"}),
+        table_name="difficulties",
+    )
+    storage.delete_entry(id_=easy_id, table_name="difficulties")
+
+    assert cached["indexes"]["name"]["values"] == {"easy": {str(hard_id)}}
+    assert [entry.id for entry in storage.filter_entries(table_name="difficulties", name="easy")] == [
+        hard_id
+    ]
+    assert storage.filter_entries(table_name="difficulties", name="easy", value=0.25) == []
+
+
+def test_iter_entries_and_get_entries_page(tmp_path, monkeypatch) -> None:
+    from studyfrog.constants.events import DIFFICULTIES_PAGE_RETRIEVED
+    from studyfrog.models.factory import get_difficulty_model
+    from studyfrog.utils import storage
+    from studyfrog.utils.dispatcher import subscribe
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.clear_table_cache()
+
+    storage.add_entries(
+        models=[
+            get_difficulty_model(display_name=f"D{value}", name=f"d{value}", value=value)
+            for value in (3, 1, 4, 5, 2)
+        ],
+        table_name="difficulties",
+    )
+
+    batches = list(storage.iter_entries(batch_size=2, table_name="difficulties"))
+
+    assert [[model.value for model in batch] for batch in batches] == [[3, 1], [4, 5], [2]]
+    assert [
+        model.value
+        for batch in storage.iter_entries(
+            batch_size=10,
+            limit=3,
+            offset=1,
+            order_by="-value",
+            table_name="difficulties",
+        )
+        for model in batch
+    ] == [4, 3, 2]
+
+    received = []
+
+    subscribe(
+        event=DIFFICULTIES_PAGE_RETRIEVED,
+        function=lambda **kwargs: received.append(kwargs),
+    )
+
+    page = storage.get_entries_page(limit=2, offset=2, order_by="value", table_name="difficulties")
+
+    assert [model.value for model in page["entries"]] == [3, 4]
+    assert page["has_more"] is True
+    assert page["next_offset"] == 4
+    assert received[0]["offset"] == 2
+    assert [model.value for model in received[0]["difficulties"]] == [3, 4]
+
+    last_page = storage.get_entries_page(limit=2, offset=4, order_by="value", table_name="difficulties")
+
+    assert [model.value for model in last_page["entries"]] == [5]
+    assert last_page["has_more"] is False
+
+
+def test_asynchronous_writes_to_the_same_table_do_not_interleave(tmp_path, monkeypatch) -> None:
+    from studyfrog.models.factory import get_difficulty_model
+    from studyfrog.utils import storage
+    from studyfrog.utils.dispatcher import dispatch_async, shutdown_dispatch_executor, subscribe
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.clear_table_cache()
+
+    subscribe(event="add_difficulty_async", function=storage.add_entry, persistent=True)
+
+    try:
+        futures = [
+            dispatch_async(
+                event="add_difficulty_async",
+                model=get_difficulty_model(display_name=f"D{value}", name=f"d{value}", value=value),
+                table_name="difficulties",
+            )
+            for value in range(40)
+        ]
+
+        ids = [future.result(timeout=10)["add_entry"][0]["result"] for future in futures]
+    finally:
+        shutdown_dispatch_executor()
+
+    assert len(set(ids)) == 40
+
+    storage.clear_table_cache()
+
+    assert storage.count_entries(table_name="difficulties") == 40
+    assert sorted(model.value for model in storage.get_all_entries(table_name="difficulties")) == list(
+        range(40)
+    )
+
+
+def test_notification_payloads_are_only_built_for_subscribed_events(tmp_path, monkeypatch) -> None:
+    from studyfrog.constants.events import DIFFICULTIES_ADDED
+    from studyfrog.models.factory import get_difficulty_model
+    from studyfrog.utils import storage
+    from studyfrog.utils.dispatcher import has_subscribers, subscribe
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    storage.clear_table_cache()
+
+    built: list[str] = []
+    get_model = storage.get_model
+
+    def counting_get_model(**kwargs):
+        built.append(kwargs["type_"])
+        return get_model(**kwargs)
+
+    monkeypatch.setattr(storage, "get_model", counting_get_model)
+
+    def add_difficulties() -> None:
+        storage.add_entries(
+            models=[
+                get_difficulty_model(display_name=f"D{value}", name=f"d{value}", value=value)
+                for value in range(3)
+            ],
+            table_name="difficulties",
+        )
+
+    assert has_subscribers(event=DIFFICULTIES_ADDED) is False
+
+    add_difficulties()
+
+    assert built == []
+
+    received: list[list] = []
+
+    subscribe(event=DIFFICULTIES_ADDED, function=lambda **kwargs: received.extend(kwargs.values()))
+
+    assert has_subscribers(event=DIFFICULTIES_ADDED) is True
+
+    add_difficulties()
+
+    assert built == ["DIFFICULTY"] * 3
+    assert [model.name for model in received[0]] == ["d0", "d1", "d2"]
+
+
+def test_delete_entries_logs_the_deleted_ids(tmp_path, monkeypatch) -> None:
+    from studyfrog.models.factory import get_flashcard_model
+    from studyfrog.utils import storage
+
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path / "data")
+
+    messages: list[str] = []
+
+    monkeypatch.setattr(storage, "is_log_level_enabled", lambda **kwargs: True)
+    monkeypatch.setattr(storage, "log_info", lambda message, **kwargs: messages.append(message))
+
+    storage.add_entries(
+        models=[get_flashcard_model(back=f"B{index}", front=f"F{index}") for index in range(3)],
+        table_name="flashcards",
+    )
+
+    assert storage.delete_entries(ids=[0, 2], table_name="flashcards")
+    assert "IDs deleted: [0, 2]" in messages[-1]
+    assert storage.count_entries(table_name="flashcards") == 1
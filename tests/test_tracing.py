@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from studyfrog.utils.dispatcher import dispatch, dispatch_lean, subscribe
+from studyfrog.utils.tracing import (
+    disable_dispatch_tracing,
+    dump_dispatch_trace,
+    enable_dispatch_tracing,
+    get_dispatch_trace,
+    reset_dispatch_trace,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_tracing_state():
+    reset_dispatch_trace()
+
+    yield
+
+    disable_dispatch_tracing()
+    reset_dispatch_trace()
+
+
+def _subscribe_nested_events() -> None:
+    def on_retrieved(entry: str) -> None:
+        return None
+
+    def get_from_db(key: str) -> str:
+        dispatch_lean(entry=key, event="entry_retrieved", namespace="test")
+        return key
+
+    subscribe(event="entry_retrieved", function=on_retrieved, namespace="test", persistent=True)
+    subscribe(event="get_entry_from_db", function=get_from_db, namespace="test", persistent=True)
+
+
+def test_tracing_records_counts_percentiles_and_call_tree() -> None:
+    _subscribe_nested_events()
+
+    enable_dispatch_tracing()
+
+    for index in range(10):
+        dispatch(event="get_entry_from_db", key=f"ENTRY_{index}", namespace="test")
+
+    trace = get_dispatch_trace()
+    events = {event["event"]: event for event in trace["events"]}
+
+    assert events["GET_ENTRY_FROM_DB"]["count"] == 10
+    assert events["ENTRY_RETRIEVED"]["count"] == 10
+    assert [subscriber["name"] for subscriber in events["GET_ENTRY_FROM_DB"]["subscribers"]] == [
+        "get_from_db"
+    ]
+    assert events["GET_ENTRY_FROM_DB"]["subscribers"][0]["count"] == 10
+
+    statistics = events["GET_ENTRY_FROM_DB"]
+
+    assert 0 < statistics["p50_ms"] <= statistics["p95_ms"] <= statistics["p99_ms"]
+    assert statistics["p99_ms"] <= statistics["max_ms"]
+
+    assert [node["name"] for node in trace["tree"]] == ["GET_ENTRY_FROM_DB"]
+    assert trace["tree"][0]["children"][0]["name"] == "get_from_db"
+    assert trace["tree"][0]["children"][0]["children"][0]["name"] == "ENTRY_RETRIEVED"
+    assert trace["tree"][0]["children"][0]["children"][0]["count"] == 10
+
+
+def test_tracing_samples_whole_call_trees_and_stays_off_by_default() -> None:
+    _subscribe_nested_events()
+
+    dispatch(event="get_entry_from_db", key="ENTRY_1", namespace="test")
+
+    assert get_dispatch_trace()["events"] == []
+
+    enable_dispatch_tracing(sample_rate=0.0)
+
+    dispatch(event="get_entry_from_db", key="ENTRY_1", namespace="test")
+
+    assert get_dispatch_trace()["events"] == []
+    assert get_dispatch_trace()["tree"] == []
+
+
+def test_dump_dispatch_trace_writes_json(tmp_path) -> None:
+    _subscribe_nested_events()
+
+    enable_dispatch_tracing()
+
+    dispatch(event="get_entry_from_db", key="ENTRY_1", namespace="test")
+
+    file = dump_dispatch_trace(file=tmp_path / "trace.json")
+
+    assert file == tmp_path / "trace.json"
+
+    data = json.loads(file.read_text(encoding="utf-8"))
+
+    assert data["enabled"] is True
+    assert {event["event"] for event in data["events"]} == {"ENTRY_RETRIEVED", "GET_ENTRY_FROM_DB"}